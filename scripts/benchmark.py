@@ -0,0 +1,565 @@
+#!/usr/bin/env python3
+"""
+Performance benchmarks for Boxarr internals.
+
+Runs against an in-process mock Radarr (httpx.MockTransport), so no real
+Radarr instance or network access is needed.
+
+Usage:
+    python scripts/benchmark.py sync --movies 5000 --changed 10
+    python scripts/benchmark.py memory --movies 25000
+    python scripts/benchmark.py probe --sizes 1000 5000 20000 --latency-ms 20
+    python scripts/benchmark.py policy --movies 10 --batches 10000
+    python scripts/benchmark.py regenerate --weeks 156 --movies 5000
+"""
+
+import argparse
+import gc
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import httpx
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.core import radarr as radarr_module  # noqa: E402
+from src.core.auto_add_policy import (  # noqa: E402
+    get_auto_add_policy,
+    reset_auto_add_policy,
+)
+from src.core.boxoffice import BoxOfficeMovie, MatchResult  # noqa: E402
+from src.core.json_generator import WeeklyDataGenerator  # noqa: E402
+from src.core.json_stream import JSONArrayParser  # noqa: E402
+from src.core.library import LibraryIndex  # noqa: E402
+from src.core.models import MovieStatus  # noqa: E402
+from src.core.radarr import RadarrService  # noqa: E402
+from src.utils.config import settings  # noqa: E402
+
+
+def make_movie(movie_id: int) -> Dict[str, Any]:
+    """Build a /api/v3/movie record roughly the size of a real one."""
+    return {
+        "id": movie_id,
+        "title": f"Benchmark Movie {movie_id}",
+        "originalTitle": f"Benchmark Movie {movie_id}",
+        "sortTitle": f"benchmark movie {movie_id}",
+        "tmdbId": 100000 + movie_id,
+        "imdbId": f"tt{1000000 + movie_id}",
+        "year": 1980 + movie_id % 45,
+        "status": "released",
+        "overview": "A synthetic overview used to size benchmark payloads. " * 8,
+        "hasFile": movie_id % 3 != 0,
+        "monitored": True,
+        "isAvailable": True,
+        "qualityProfileId": 1 + movie_id % 4,
+        "rootFolderPath": "/movies",
+        "path": f"/movies/Benchmark Movie {movie_id}",
+        "runtime": 90 + movie_id % 60,
+        "genres": ["Action", "Drama", "Thriller"],
+        "tags": [1],
+        "images": [
+            {
+                "coverType": kind,
+                "url": f"/MediaCover/{movie_id}/{kind}.jpg",
+                "remoteUrl": f"https://image.tmdb.org/t/p/original/{movie_id}{kind}.jpg",
+            }
+            for kind in ("poster", "fanart")
+        ],
+        "alternateTitles": [
+            {"title": f"Alt Title {movie_id} {n}", "sourceType": "tmdb"}
+            for n in range(3)
+        ],
+        "ratings": {
+            "imdb": {"votes": 1000 + movie_id, "value": 7.1, "type": "user"},
+            "tmdb": {"votes": 500 + movie_id, "value": 6.9, "type": "user"},
+        },
+        "movieFile": {
+            "id": movie_id,
+            "relativePath": f"Benchmark Movie {movie_id} (2020) Bluray-1080p.mkv",
+            "size": 8_000_000_000,
+            "quality": {"quality": {"id": 7, "name": "Bluray-1080p"}},
+            "mediaInfo": {
+                "audioCodec": "DTS",
+                "audioChannels": 5.1,
+                "videoCodec": "x264",
+                "resolution": "1920x1080",
+                "runTime": "1:52:00",
+            },
+        },
+    }
+
+
+PROFILES = ("SD", "HD-720p", "HD-1080p", "Ultra-HD")
+
+
+class MockRadarr:
+    """Serves a synthetic library and counts response bytes."""
+
+    def __init__(
+        self,
+        movies: int,
+        changed: int,
+        latency: float = 0.0,
+        bandwidth: Optional[float] = None,
+    ):
+        """
+        Create a library of ``movies`` records, ``changed`` of them recently.
+
+        ``latency`` (seconds per request) and ``bandwidth`` (bytes per
+        second) simulate the network between Boxarr and Radarr.
+        """
+        self.library = [make_movie(i) for i in range(1, movies + 1)]
+        self.library_body = json.dumps(self.library).encode()
+        self.changed_ids = list(range(1, changed + 1))
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.bytes = 0
+        self.requests = 0
+
+    def reset(self) -> None:
+        """Zero the counters."""
+        self.bytes = 0
+        self.requests = 0
+
+    def _respond(self, payload: Any, body: Optional[bytes] = None) -> httpx.Response:
+        body = body if body is not None else json.dumps(payload).encode()
+        self.bytes += len(body)
+        self.requests += 1
+        delay = self.latency + (len(body) / self.bandwidth if self.bandwidth else 0)
+        if delay:
+            time.sleep(delay)
+        return httpx.Response(
+            200, content=body, headers={"Content-Type": "application/json"}
+        )
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        """httpx.MockTransport handler."""
+        path = request.url.path
+        if path == "/api/v3/movie" and "tmdbId" in request.url.params:
+            position = int(request.url.params["tmdbId"]) - 100001
+            found = 0 <= position < len(self.library)
+            return self._respond([self.library[position]] if found else [])
+        if path == "/api/v3/movie":
+            return self._respond(self.library, self.library_body)
+        if path == "/api/v3/history/since":
+            return self._respond(
+                [
+                    {"movieId": i, "eventType": "downloadFolderImported"}
+                    for i in self.changed_ids
+                ]
+            )
+        if path.startswith("/api/v3/movie/"):
+            return self._respond(self.library[int(path.rsplit("/", 1)[1]) - 1])
+        if path == "/api/v3/qualityProfile":
+            return self._respond(
+                [{"id": i, "name": name} for i, name in enumerate(PROFILES, 1)]
+            )
+        return httpx.Response(404)
+
+
+def _timed(func: Callable[[], Any], repeat: int) -> List[float]:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def bench_sync(args: argparse.Namespace) -> None:
+    """Compare full refetch against incremental sync for one refresh."""
+    radarr = MockRadarr(args.movies, args.changed)
+    client = httpx.Client(
+        base_url="http://radarr.bench", transport=httpx.MockTransport(radarr.handler)
+    )
+    service = RadarrService(
+        url="http://radarr.bench", api_key="bench", http_client=client
+    )
+
+    print(f"Library: {args.movies} movies, {args.changed} changed per refresh")
+    results = {}
+    for mode in ("full", "incremental"):
+        settings.radarr_library_sync_mode = mode
+        service.bust_cache()
+        service.get_library_index()  # initial full load
+        radarr.reset()
+
+        samples = _timed(
+            lambda: service.get_library_index(ignore_cache=True), args.repeat
+        )
+        results[mode] = (radarr.bytes / args.repeat, radarr.requests / args.repeat)
+        best = min(samples) * 1000
+        print(
+            f"  {mode:<12} {results[mode][0] / 1024:>10.1f} KiB/refresh  "
+            f"{results[mode][1]:>6.0f} requests  {best:>8.1f} ms (best of {args.repeat})"
+        )
+
+    full_bytes, inc_bytes = results["full"][0], results["incremental"][0]
+    if inc_bytes:
+        print(f"  incremental transfers {full_bytes / inc_bytes:.0f}x fewer bytes")
+    print(f"  sync stats: {radarr_module.get_library_cache_stats()['sync']}")
+    service.bust_cache()
+
+
+@dataclass
+class LegacyRadarrMovie:
+    """The pre-compaction movie record, which kept the whole payload."""
+
+    id: int
+    title: str
+    tmdbId: int
+    imdbId: Optional[str] = None
+    year: Optional[int] = None
+    status: Optional[MovieStatus] = None
+    overview: Optional[str] = None
+    hasFile: bool = False
+    monitored: bool = True
+    isAvailable: bool = False
+    qualityProfileId: Optional[int] = None
+    rootFolderPath: Optional[str] = None
+    movieFile: Optional[Dict] = None
+    images: List[Dict] = field(default_factory=list)
+    genres: List[str] = field(default_factory=list)
+    runtime: Optional[int] = None
+    _raw_data: Optional[Dict] = field(default=None, repr=False)
+
+
+def parse_legacy(data: Dict[str, Any]) -> LegacyRadarrMovie:
+    """Parse a movie the way RadarrService did before compaction."""
+    return LegacyRadarrMovie(
+        id=data["id"],
+        title=data["title"],
+        tmdbId=data.get("tmdbId", 0),
+        imdbId=data.get("imdbId"),
+        year=data.get("year"),
+        status=MovieStatus(data["status"]) if "status" in data else None,
+        overview=data.get("overview"),
+        hasFile=data.get("hasFile", False),
+        monitored=data.get("monitored", True),
+        isAvailable=data.get("isAvailable", False),
+        qualityProfileId=data.get("qualityProfileId"),
+        rootFolderPath=data.get("rootFolderPath"),
+        movieFile=data.get("movieFile"),
+        images=data.get("images", []),
+        genres=data.get("genres", []),
+        runtime=data.get("runtime"),
+        _raw_data=data,
+    )
+
+
+def _retained_bytes(body: bytes, parse: Callable[[Dict[str, Any]], Any]) -> int:
+    """Bytes still allocated after parsing ``body`` and dropping the JSON."""
+    gc.collect()
+    tracemalloc.start()
+    data = json.loads(body)
+    movies = [parse(item) for item in data]
+    del data
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del movies
+    return retained
+
+
+def _peak_bytes(load: Callable[[], Any]) -> int:
+    """Peak bytes allocated while ``load`` runs."""
+    gc.collect()
+    tracemalloc.start()
+    result = load()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del result
+    return peak
+
+
+def _streamed_index(service: RadarrService, body: bytes) -> LibraryIndex:
+    """Index ``body`` the way the streaming fetch does, in 64 KiB chunks."""
+    index = LibraryIndex()
+    parser = JSONArrayParser()
+    for start in range(0, len(body), 65536):
+        service._index_movies(index, parser.feed(body[start : start + 65536]))
+    service._index_movies(index, parser.close())
+    return index
+
+
+def bench_memory(args: argparse.Namespace) -> None:
+    """Compare resident size of the legacy and compact movie records."""
+    service = RadarrService(url="http://radarr.bench", api_key="bench")
+    body = json.dumps([make_movie(i) for i in range(1, args.movies + 1)]).encode()
+
+    print(f"Library: {args.movies} movies, {len(body) / 1024**2:.1f} MiB of JSON")
+    legacy = _retained_bytes(body, parse_legacy)
+    compact = _retained_bytes(
+        body, lambda data: service._parse_movie(data, with_overview=False)
+    )
+    for name, size in (("legacy", legacy), ("compact", compact)):
+        print(
+            f"  {name:<12} {size / 1024**2:>10.1f} MiB  "
+            f"{size / args.movies:>8.0f} bytes/movie"
+        )
+    print(f"  compact records use {legacy / compact:.1f}x less memory")
+
+    decoded = _peak_bytes(
+        lambda: LibraryIndex(
+            service._parse_movie(data, with_overview=False) for data in json.loads(body)
+        )
+    )
+    streamed = _peak_bytes(lambda: _streamed_index(service, body))
+    print("  peak while building the index:")
+    for name, size in (("decode all", decoded), ("streamed", streamed)):
+        print(f"  {name:<12} {size / 1024**2:>10.1f} MiB")
+    service.close()
+
+
+def bench_probe(args: argparse.Namespace) -> None:
+    """Find where filtered per-movie queries stop beating a full download."""
+    settings.radarr_library_sync_mode = "full"
+    settings.radarr_probe_threshold = max(args.counts)
+    print(
+        f"Simulated network: {args.latency_ms:.0f} ms/request, {args.mbps:.0f} Mbit/s; "
+        f"{settings.radarr_bulk_add_concurrency} concurrent probes"
+    )
+    for size in args.sizes:
+        radarr = MockRadarr(
+            size, 0, latency=args.latency_ms / 1000, bandwidth=args.mbps * 125_000
+        )
+        client = httpx.Client(
+            base_url="http://radarr.bench",
+            transport=httpx.MockTransport(radarr.handler),
+        )
+        service = RadarrService(
+            url="http://radarr.bench", api_key="bench", http_client=client
+        )
+        full = min(
+            _timed(lambda: service.get_library_index(ignore_cache=True), args.repeat)
+        )
+        print(f"Library: {size} movies, full download {full * 1000:.1f} ms")
+
+        crossover = None
+        for count in args.counts:
+            ids = [100001 + i * size // count for i in range(count)]
+            probe = min(
+                _timed(
+                    lambda: service.find_movies_by_tmdb_ids(ids, fresh=True),
+                    args.repeat,
+                )
+            )
+            faster = "probe" if probe < full else "full"
+            print(f"  {count:>5} movies: probes {probe * 1000:>8.1f} ms  -> {faster}")
+            if crossover is None and probe >= full:
+                crossover = count
+        if crossover is None:
+            print(f"  probes win for every tested count (up to {max(args.counts)})")
+        else:
+            print(f"  crossover at about {crossover} movies")
+        service.bust_cache()
+        service.close()
+
+
+def filter_legacy(  # noqa: C901
+    match_results: List[MatchResult], top_year: int
+) -> List[int]:
+    """The per-movie settings lookups and list scans the policy replaced."""
+    unmatched = [r for r in match_results if not r.is_matched]
+    limit = settings.boxarr_features_auto_add_limit
+    if limit < len(unmatched):
+        unmatched = sorted(unmatched, key=lambda r: r.box_office_movie.rank)[:limit]
+    accepted = []
+    for result in unmatched:
+        bom = result.box_office_movie
+        if not bom.tmdb_id:
+            continue
+        if settings.boxarr_features_auto_add_ignore_rereleases:
+            if bom.year and bom.year < top_year - 1:
+                continue
+        movie_genres = bom.genres or []
+        if settings.boxarr_features_auto_add_genre_filter_enabled:
+            if settings.boxarr_features_auto_add_genre_filter_mode == "whitelist":
+                whitelist = settings.boxarr_features_auto_add_genre_whitelist
+                if whitelist and not any(g in whitelist for g in movie_genres):
+                    continue
+            else:
+                blacklist = settings.boxarr_features_auto_add_genre_blacklist
+                if blacklist and any(g in blacklist for g in movie_genres):
+                    continue
+        if settings.boxarr_features_auto_add_rating_filter_enabled:
+            ratings = settings.boxarr_features_auto_add_rating_whitelist
+            if ratings and bom.certification and bom.certification not in ratings:
+                continue
+        accepted.append(bom.tmdb_id)
+    return accepted
+
+
+def bench_policy(args: argparse.Namespace) -> None:
+    """Compare inline auto-add filtering with the compiled policy."""
+    settings.boxarr_features_auto_add_limit = 10
+    settings.boxarr_features_auto_add_ignore_rereleases = True
+    settings.boxarr_features_auto_add_genre_filter_enabled = True
+    settings.boxarr_features_auto_add_genre_filter_mode = "blacklist"
+    settings.boxarr_features_auto_add_genre_blacklist = [
+        "Horror",
+        "Documentary",
+        "Music",
+        "TV Movie",
+        "War",
+        "Western",
+    ]
+    settings.boxarr_features_auto_add_rating_filter_enabled = True
+    settings.boxarr_features_auto_add_rating_whitelist = ["G", "PG", "PG-13", "R"]
+    reset_auto_add_policy()
+
+    genres = ["Action", "Comedy", "Drama", "Horror", "Thriller", "Science Fiction"]
+    chart = [
+        MatchResult(
+            BoxOfficeMovie(
+                rank=rank,
+                title=f"Movie {rank}",
+                tmdb_id=rank,
+                year=2020 + rank % 6,
+                genres=genres[rank % 6 :] + genres[: rank % 3],
+                certification=("PG-13", "R", "NC-17")[rank % 3],
+            )
+        )
+        for rank in range(1, args.movies + 1)
+    ]
+
+    def compiled() -> List[Any]:
+        return [d for d in get_auto_add_policy().evaluate(chart, 2025) if d.accepted]
+
+    assert [d.result.box_office_movie.tmdb_id for d in compiled()] == filter_legacy(
+        chart, 2025
+    )
+    print(f"Chart: {args.movies} unmatched movies, {args.batches} evaluations")
+    for name, func in (
+        ("inline", lambda: filter_legacy(chart, 2025)),
+        ("compiled", compiled),
+    ):
+        best = min(_timed(lambda: [func() for _ in range(args.batches)], args.repeat))
+        print(f"  {name:<10} {best / args.batches * 1e6:>8.1f} us per chart")
+
+
+class _Job:
+    """Stand-in for a queued job's progress reporting."""
+
+    def report(self, message: str, progress: Any = None, total: Any = None) -> None:
+        pass
+
+
+def bench_regenerate(args: argparse.Namespace) -> None:
+    """Compare one update-week call per week with bulk regeneration."""
+    from src.api.routes.scheduler import _update_week
+
+    radarr = MockRadarr(args.movies, 0, latency=args.latency_ms / 1000)
+    client = httpx.Client(
+        base_url="http://radarr.bench", transport=httpx.MockTransport(radarr.handler)
+    )
+
+    def service() -> RadarrService:
+        return RadarrService(
+            url="http://radarr.bench", api_key="bench", http_client=client
+        )
+
+    settings.boxarr_features_auto_add = False
+    settings.boxarr_data_directory = Path(tempfile.mkdtemp(prefix="boxarr-bench-"))
+    generator = WeeklyDataGenerator()
+    weeks = []
+    for n in range(args.weeks):
+        year, week = 2022 + n // 52, n % 52 + 1
+        weeks.append((year, week))
+        # Half of each chart is in the library; every movie has a poster
+        chart = [
+            MatchResult(
+                BoxOfficeMovie(
+                    rank=rank,
+                    title=f"Chart Movie {n}-{rank}",
+                    tmdb_id=(
+                        100001 + (n * 3 + rank) % args.movies
+                        if rank % 2
+                        else 900000 + n * 10 + rank
+                    ),
+                    poster="https://image.tmdb.org/poster.jpg",
+                    genres=["Action", "Drama"],
+                )
+            )
+            for rank in range(1, 11)
+        ]
+        generator.generate_weekly_data(chart, year, week, enrich_posters=False)
+
+    print(
+        f"Weeks: {args.weeks} stored, library: {args.movies} movies, "
+        f"{args.latency_ms:.0f} ms per Radarr request"
+    )
+
+    def per_week() -> None:
+        for year, week in weeks:
+            _update_week(year, week, service(), _Job())
+
+    def bulk() -> None:
+        WeeklyDataGenerator(service()).regenerate_weeks()
+
+    for name, func in (("per-week", per_week), ("bulk", bulk)):
+        service().bust_cache()
+        radarr_module._metadata_cache.clear()
+        radarr.reset()
+        started = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - started
+        print(
+            f"  {name:<10} {elapsed:>8.2f} s  {radarr.requests:>5} requests  "
+            f"{radarr.bytes / 1024:>10.1f} KiB"
+        )
+
+
+def main() -> int:
+    """Parse arguments and run the selected benchmark."""
+    parser = argparse.ArgumentParser(description="Boxarr performance benchmarks")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    sync = sub.add_parser("sync", help="full refetch vs incremental library sync")
+    sync.add_argument("--movies", type=int, default=5000)
+    sync.add_argument("--changed", type=int, default=10)
+    sync.add_argument("--repeat", type=int, default=3)
+    sync.set_defaults(func=bench_sync)
+
+    memory = sub.add_parser("memory", help="legacy vs compact movie records")
+    memory.add_argument("--movies", type=int, default=25000)
+    memory.set_defaults(func=bench_memory)
+
+    probe = sub.add_parser("probe", help="per-movie tmdbId queries vs full download")
+    probe.add_argument("--sizes", type=int, nargs="+", default=[1000, 5000, 20000])
+    probe.add_argument(
+        "--counts", type=int, nargs="+", default=[1, 5, 10, 25, 50, 100, 200]
+    )
+    probe.add_argument("--latency-ms", type=float, default=20.0)
+    probe.add_argument("--mbps", type=float, default=100.0)
+    probe.add_argument("--repeat", type=int, default=3)
+    probe.set_defaults(func=bench_probe)
+
+    policy = sub.add_parser("policy", help="inline vs compiled auto-add filters")
+    policy.add_argument("--movies", type=int, default=10)
+    policy.add_argument("--batches", type=int, default=10000)
+    policy.add_argument("--repeat", type=int, default=3)
+    policy.set_defaults(func=bench_policy)
+
+    regenerate = sub.add_parser(
+        "regenerate", help="update-week per week vs bulk regeneration"
+    )
+    regenerate.add_argument("--weeks", type=int, default=156)
+    regenerate.add_argument("--movies", type=int, default=5000)
+    regenerate.add_argument("--latency-ms", type=float, default=20.0)
+    regenerate.set_defaults(func=bench_regenerate)
+
+    args = parser.parse_args()
+    args.func(args)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -10,6 +10,7 @@ from datetime import datetime, timedelta
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.utils.config import settings
+from src.core.history import get_history_store
 from src.core.scheduler import BoxarrScheduler
 from apscheduler.triggers.cron import CronTrigger
 import pytz
@@ -150,45 +151,28 @@ def check_history():
     print("SCHEDULER HISTORY")
     print("="*60)
     
-    history_dir = Path(settings.boxarr_data_directory) / "history"
+    runs = get_history_store().recent(5)
     
-    if not history_dir.exists():
-        print("⚠️  No history directory found - scheduler may not have run yet")
+    if not runs:
+        print("⚠️  No history found - scheduler has not completed any runs")
         return False
     
-    history_files = sorted(history_dir.glob("*.json"), reverse=True)[:5]
+    print(f"Found {len(runs)} recent run(s):")
     
-    if not history_files:
-        print("⚠️  No history files found - scheduler has not completed any runs")
-        return False
-    
-    print(f"Found {len(history_files)} recent run(s):")
-    
-    import json
-    for file_path in history_files:
-        try:
-            with open(file_path) as f:
-                data = json.load(f)
-            
-            timestamp = data.get("timestamp", "Unknown")
-            matched = data.get("matched_count", 0)
-            total = data.get("total_count", 0)
-            
-            # Parse timestamp
-            if timestamp != "Unknown":
-                run_time = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-                time_ago = datetime.now(run_time.tzinfo) - run_time
-                days = time_ago.days
-                hours = time_ago.seconds // 3600
-                
-                print(f"\n  ✓ {run_time.strftime('%Y-%m-%d %H:%M:%S')}")
-                print(f"    {days} days, {hours} hours ago")
-                print(f"    Matched {matched}/{total} movies")
-            
-        except Exception as e:
-            print(f"  ❌ Error reading {file_path.name}: {e}")
+    for run in runs:
+        data = run.data
+        matched = data.get("matched_count", 0)
+        total = data.get("total_count", 0)
+        
+        time_ago = datetime.now() - run.run_at
+        days = time_ago.days
+        hours = time_ago.seconds // 3600
+        
+        print(f"\n  ✓ {run.run_at.strftime('%Y-%m-%d %H:%M:%S')} ({run.week})")
+        print(f"    {days} days, {hours} hours ago")
+        print(f"    Matched {matched}/{total} movies")
     
-    return len(history_files) > 0
+    return True
 
 
 def check_logs():
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Replay sample Radarr Connect webhook payloads against Boxarr.
+
+By default the bundled fixtures in tests/fixtures/webhooks are posted to a
+running Boxarr instance, in file name order.
+
+Usage:
+    python scripts/replay-webhooks.py
+    python scripts/replay-webhooks.py --url http://nas:8888 --token secret
+    python scripts/replay-webhooks.py path/to/payload.json ...
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import List
+
+import httpx
+
+FIXTURES = Path(__file__).parent.parent / "tests" / "fixtures" / "webhooks"
+
+
+def replay(url: str, files: List[Path], token: str = "") -> int:
+    """Post each payload and print Boxarr's response; return failure count."""
+    endpoint = url.rstrip("/") + "/api/webhooks/radarr"
+    params = {"token": token} if token else None
+    failures = 0
+
+    with httpx.Client(timeout=30) as client:
+        for path in files:
+            payload = json.loads(path.read_text())
+            try:
+                response = client.post(endpoint, json=payload, params=params)
+            except httpx.HTTPError as e:
+                print(f"❌ {path.name}: {e}")
+                failures += 1
+                continue
+
+            marker = "✅" if response.is_success else "❌"
+            print(
+                f"{marker} {path.name} [{payload.get('eventType')}] -> "
+                f"{response.status_code} {response.text}"
+            )
+            if not response.is_success:
+                failures += 1
+
+    return failures
+
+
+def main() -> int:
+    """Parse arguments and replay payloads."""
+    parser = argparse.ArgumentParser(description="Replay Radarr webhook payloads")
+    parser.add_argument("files", nargs="*", type=Path, help="payload JSON files")
+    parser.add_argument("--url", default="http://localhost:8888", help="Boxarr URL")
+    parser.add_argument("--token", default="", help="radarr.webhook_secret value")
+    args = parser.parse_args()
+
+    files = args.files or sorted(FIXTURES.glob("*.json"))
+    if not files:
+        print(f"No payloads found in {FIXTURES}")
+        return 1
+    return 1 if replay(args.url, files, args.token) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
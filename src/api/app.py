@@ -2,16 +2,20 @@
 
 from typing import Optional
 
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from uvicorn.middleware.proxy_headers import ProxyHeadersMiddleware
 
 from .. import __version__
-from ..core.radarr import RadarrService
+from ..core.async_radarr import AsyncRadarrService
+from ..core.http_clients import aclose_client_registry, get_client_registry
+from ..core.jobs import get_job_queue
+from ..core.radarr import restore_library_snapshot
 from ..core.scheduler import BoxarrScheduler
 from ..utils.config import settings
 from ..utils.logger import get_logger
+from .dependencies import get_async_radarr_service
 from .routes import (
     admin_router,
     boxoffice_router,
@@ -19,6 +23,7 @@ from .routes import (
     movies_router,
     scheduler_router,
     web_router,
+    webhooks_router,
 )
 
 logger = get_logger(__name__)
@@ -70,6 +75,7 @@ def create_app(scheduler: Optional[BoxarrScheduler] = None) -> FastAPI:
     app.include_router(movies_router)
     app.include_router(scheduler_router)
     app.include_router(web_router)
+    app.include_router(webhooks_router)
 
     # Store scheduler instance if provided
     if scheduler:
@@ -85,6 +91,13 @@ def create_app(scheduler: Optional[BoxarrScheduler] = None) -> FastAPI:
         """Initialize application on startup."""
         logger.info("Boxarr API starting up...")
 
+        # Shared connection pools for outbound API calls
+        app.state.http_clients = get_client_registry()
+
+        # Serve the last saved library right away and re-read Radarr behind it
+        if restore_library_snapshot():
+            await AsyncRadarrService().get_library_index()
+
         # Start scheduler if configured and enabled
         if scheduler and settings.boxarr_scheduler_enabled:
             scheduler.start()
@@ -100,14 +113,24 @@ def create_app(scheduler: Optional[BoxarrScheduler] = None) -> FastAPI:
             scheduler.stop()
             logger.info("Scheduler stopped")
 
+        # Stop queued update jobs before their clients are closed
+        await get_job_queue().shutdown()
+
+        # Close pooled HTTP clients after the scheduler can no longer use them
+        await aclose_client_registry()
+        app.state.http_clients = None
+
     @app.get("/api/health")
-    async def health_check():
+    async def health_check(
+        radarr_service: Optional[AsyncRadarrService] = Depends(
+            get_async_radarr_service
+        ),
+    ):
         """Simple health check endpoint."""
         radarr_connected = False
-        if settings.radarr_api_key:
+        if radarr_service:
             try:
-                with RadarrService() as r:
-                    radarr_connected = r.test_connection()
+                radarr_connected = await radarr_service.test_connection()
             except Exception:
                 radarr_connected = False
 
@@ -0,0 +1,44 @@
+"""FastAPI dependencies shared by the route modules."""
+
+from typing import Optional
+
+from fastapi import Request
+
+from ..core import async_radarr as async_radarr_core
+from ..core import radarr as radarr_core
+from ..core.http_clients import HTTPClientRegistry, get_client_registry
+from ..utils.config import settings
+
+
+def get_http_clients(request: Request) -> HTTPClientRegistry:
+    """Get the pooled client registry created at application startup."""
+    registry = getattr(request.app.state, "http_clients", None)
+    return registry if registry is not None else get_client_registry()
+
+
+def get_radarr_service(request: Request) -> Optional[radarr_core.RadarrService]:
+    """
+    Provide a RadarrService bound to the shared connection pool.
+
+    Returns None when Radarr is not configured so routes can keep their
+    own "not configured" responses. The pooled client belongs to the
+    registry, so nothing needs closing when the request ends.
+    """
+    if not settings.radarr_api_key:
+        return None
+    return radarr_core.RadarrService(registry=get_http_clients(request))
+
+
+async def get_async_radarr_service(
+    request: Request,
+) -> Optional[async_radarr_core.AsyncRadarrService]:
+    """
+    Provide an AsyncRadarrService bound to the shared asyncio pool.
+
+    Like ``get_radarr_service`` this returns None when Radarr is not
+    configured. Declared ``async`` so FastAPI resolves it on the event
+    loop rather than in its threadpool, which the loop-bound client needs.
+    """
+    if not settings.radarr_api_key:
+        return None
+    return async_radarr_core.AsyncRadarrService(registry=get_http_clients(request))
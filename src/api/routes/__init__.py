@@ -6,6 +6,7 @@ from .config import router as config_router
 from .movies import router as movies_router
 from .scheduler import router as scheduler_router
 from .web import router as web_router
+from .webhooks import router as webhooks_router
 
 __all__ = [
     "admin_router",
@@ -14,4 +15,5 @@ __all__ = [
     "movies_router",
     "scheduler_router",
     "web_router",
+    "webhooks_router",
 ]
@@ -6,13 +6,24 @@ from collections import defaultdict
 from pathlib import Path
 from typing import Any, AsyncGenerator, Dict, List, Optional
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
-from ...core.radarr import RadarrService
+from ...core.async_boxoffice import get_trakt_cache_stats
+from ...core.boxoffice import get_trakt_rate_limiter
+from ...core.history import get_history_store
+from ...core.metrics import get_request_stats
+from ...core.radarr import (
+    RadarrService,
+    get_library_cache_stats,
+    get_lookup_cache_stats,
+    get_metadata_cache_stats,
+)
+from ...core.scheduler import get_update_lock_stats
 from ...utils.config import settings
 from ...utils.logger import get_logger
+from ..dependencies import get_radarr_service
 
 logger = get_logger(__name__)
 router = APIRouter(prefix="/api/admin", tags=["admin"])
@@ -48,6 +59,21 @@ class RepairProgress(BaseModel):
     errors: List[str] = []
 
 
+@router.get("/cache-stats")
+async def get_cache_stats():
+    """Get hit/miss/refresh counters for the shared Radarr caches."""
+    return {
+        "library": get_library_cache_stats(),
+        "lookups": get_lookup_cache_stats(),
+        "metadata": get_metadata_cache_stats(),
+        "trakt_rate_limit": get_trakt_rate_limiter().stats(),
+        "trakt_responses": get_trakt_cache_stats(),
+        "requests": get_request_stats(),
+        "update_lock": get_update_lock_stats(),
+        "history": get_history_store().stats(),
+    }
+
+
 @router.get("/check-missing-metadata", response_model=MissingMetadataCheck)
 async def check_missing_metadata():
     """Check for movies with missing TMDB metadata."""
@@ -124,16 +150,18 @@ async def check_missing_metadata():
 
 
 @router.post("/repair-missing-metadata")
-async def repair_missing_metadata(request: RepairRequest):
+async def repair_missing_metadata(
+    request: RepairRequest,
+    radarr_service: Optional[RadarrService] = Depends(get_radarr_service),
+):
     """Repair missing TMDB metadata for movies with streaming progress updates."""
 
     async def generate_progress() -> AsyncGenerator[str, None]:
         try:
-            if not settings.radarr_api_key:
+            if radarr_service is None:
                 yield f"data: {json.dumps({'error': 'Radarr not configured'})}\n\n"
                 return
 
-            radarr_service = RadarrService()
             weekly_pages_dir = Path(settings.boxarr_data_directory) / "weekly_pages"
 
             # Phase 1: Collect unique movies missing data
@@ -5,13 +5,15 @@ from datetime import datetime
 from pathlib import Path
 from typing import List, Optional
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
 
-from ...core.boxoffice import BoxOfficeService, match_box_office_to_radarr
-from ...core.radarr import RadarrService
+from ...core.async_boxoffice import AsyncBoxOfficeService
+from ...core.async_radarr import AsyncRadarrService
+from ...core.boxoffice import match_box_office_to_radarr
 from ...utils.config import settings
 from ...utils.logger import get_logger
+from ..dependencies import get_async_radarr_service
 
 logger = get_logger(__name__)
 router = APIRouter(prefix="/api/boxoffice", tags=["boxoffice"])
@@ -33,7 +35,9 @@ class BoxOfficeMovieResponse(BaseModel):
 
 
 @router.get("/current", response_model=List[BoxOfficeMovieResponse])
-async def get_current_box_office():
+async def get_current_box_office(
+    radarr_service: Optional[AsyncRadarrService] = Depends(get_async_radarr_service),
+):
     """Get current week's box office with Radarr matching."""
     try:
         if not settings.trakt_client_id:
@@ -42,14 +46,15 @@ async def get_current_box_office():
             )
 
         # Fetch current box office from Trakt
-        boxoffice_service = BoxOfficeService()
-        movies = boxoffice_service.fetch_box_office()
+        async with AsyncBoxOfficeService() as boxoffice_service:
+            movies = await boxoffice_service.fetch_box_office()
 
         # Match with Radarr if configured
         results = []
-        if settings.radarr_api_key:
-            radarr_service = RadarrService()
-            match_results = match_box_office_to_radarr(movies, radarr_service)
+        if radarr_service is not None:
+            # Load the library without blocking the loop, then match in memory
+            library = await radarr_service.get_library_index()
+            match_results = match_box_office_to_radarr(movies, library)
 
             for result in match_results:
                 bom = result.box_office_movie
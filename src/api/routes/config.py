@@ -8,7 +8,10 @@ from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, Field
 
 from ... import __version__
-from ...core.radarr import RadarrService
+from ...core.auto_add_policy import reset_auto_add_policy
+from ...core.boxoffice import reset_trakt_rate_limiter
+from ...core.http_clients import get_client_registry
+from ...core.radarr import RadarrService, invalidate_radarr_metadata
 from ...utils.config import RootFolderConfig, RootFolderMapping, Settings, settings
 from ...utils.logger import get_logger
 
@@ -27,6 +30,38 @@ class ConfigResponse(BaseModel):
     auto_add: bool
 
 
+# Radarr keys the settings form owns but leaves out of a save when cleared
+_OPTIONAL_FORM_KEYS = (
+    "quality_profile_upgrade",
+    "minimum_availability",
+    "root_folder_config",
+)
+
+
+def _merge_config(existing: Dict[str, Any], updates: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Merge the settings form's values over the existing local.yaml contents.
+
+    Keys the form does not know about (the webhook secret, cache and HTTP
+    tunables, ...) are kept so a save from the UI never silently drops them.
+
+    Args:
+        existing: Parsed local.yaml (may be empty)
+        updates: Values built from the settings form
+
+    Returns:
+        New merged configuration dict
+    """
+    merged = dict(existing)
+    for key, value in updates.items():
+        current = merged.get(key)
+        if isinstance(value, dict) and isinstance(current, dict):
+            merged[key] = _merge_config(current, value)
+        else:
+            merged[key] = value
+    return merged
+
+
 class TestConfigRequest(BaseModel):
     """Test configuration request model."""
 
@@ -107,24 +142,30 @@ async def get_configuration():
 async def test_configuration(config: TestConfigRequest):
     """Test Radarr connection and return profiles/folders."""
     try:
-        test_service = RadarrService(url=config.url, api_key=config.api_key)
-
-        if not test_service.test_connection():
-            return {
-                "success": False,
-                "message": "Could not connect to Radarr. Check URL and API key.",
-            }
+        # Use a short-lived client so untested URLs/keys don't stay pooled
+        http_client = get_client_registry().unpooled_radarr_client(
+            config.url, config.api_key
+        )
+        with RadarrService(
+            url=config.url, api_key=config.api_key, http_client=http_client
+        ) as test_service:
+            if not test_service.test_connection():
+                return {
+                    "success": False,
+                    "message": "Could not connect to Radarr. Check URL and API key.",
+                }
 
-        # Get profiles and folders
-        profiles = test_service.get_quality_profiles()
-        folders = test_service.get_root_folders()
+            # Get fresh profiles and folders, not what Boxarr has cached
+            invalidate_radarr_metadata()
+            profiles = test_service.get_quality_profiles()
+            folders = test_service.get_root_folders()
 
-        # Get Radarr version
-        try:
-            status = test_service.get_system_status()
-            version = status.get("version", "Unknown")
-        except Exception:
-            version = "Unknown"
+            # Get Radarr version
+            try:
+                status = test_service.get_system_status()
+                version = status.get("version", "Unknown")
+            except Exception:
+                version = "Unknown"
 
         return {
             "success": True,
@@ -251,7 +292,7 @@ async def save_configuration(config: SaveConfigRequest):
                     "mappings": normalized_existing,
                 }
 
-        config_data = {
+        config_data: Dict[str, Any] = {
             "trakt": {"client_id": config.trakt_client_id},
             "radarr": radarr_config,
             "boxarr": {
@@ -281,10 +322,20 @@ async def save_configuration(config: SaveConfigRequest):
             },
         }
 
-        # Save to local.yaml
+        # Save to local.yaml, keeping settings the form does not manage
         config_path = Path(settings.boxarr_data_directory) / "local.yaml"
         import yaml
 
+        existing: Dict[str, Any] = {}
+        if config_path.exists():
+            with open(config_path) as f:
+                existing = yaml.safe_load(f) or {}
+        existing_radarr = existing.get("radarr")
+        if isinstance(existing_radarr, dict):
+            for key in _OPTIONAL_FORM_KEYS:
+                existing_radarr.pop(key, None)
+        config_data = _merge_config(existing, config_data)
+
         with open(config_path, "w") as f:
             yaml.dump(config_data, f, default_flow_style=False)
 
@@ -293,9 +344,19 @@ async def save_configuration(config: SaveConfigRequest):
         # Save old scheduler settings BEFORE reloading
         old_scheduler_enabled = settings.boxarr_scheduler_enabled
         old_cron = settings.boxarr_scheduler_cron
+        radarr_changed = (
+            str(settings.radarr_url).rstrip("/") != config.radarr_url.rstrip("/")
+            or settings.radarr_api_key != config.radarr_api_key
+        )
 
         # Reload settings
         Settings.reload_from_file(config_path)
+        invalidate_radarr_metadata()
+        if radarr_changed:
+            # Library deltas from another instance must not patch this one
+            test_service.bust_cache()
+        reset_trakt_rate_limiter()
+        reset_auto_add_policy()
 
         # Reload scheduler if it's running and schedule changed
         try:
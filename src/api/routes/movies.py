@@ -2,17 +2,23 @@
 
 import json
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncGenerator, Dict, List, Optional
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
-from ...core.json_generator import WeeklyDataGenerator
+from ...core.async_radarr import AsyncRadarrService
+from ...core.exceptions import RadarrNotFoundError
+from ...core.json_generator import WeeklyDataGenerator, reconstruct_box_office_movies
+from ...core.library import LibraryIndex
 from ...core.models import MovieStatus
 from ...core.radarr import RadarrService
 from ...core.root_folder_manager import RootFolderManager
 from ...utils.config import settings
 from ...utils.logger import get_logger
+from ..dependencies import get_async_radarr_service
 
 logger = get_logger(__name__)
 router = APIRouter(prefix="/api/movies", tags=["movies"])
@@ -44,6 +50,14 @@ class UpgradeResponse(BaseModel):
     new_profile: Optional[str] = None
 
 
+class BulkUpgradeRequest(BaseModel):
+    """Bulk upgrade request: Radarr movie IDs and/or a stored week."""
+
+    movie_ids: List[int] = []
+    year: Optional[int] = None
+    week: Optional[int] = None
+
+
 class AddMovieRequest(BaseModel):
     """Add movie request model."""
 
@@ -53,18 +67,30 @@ class AddMovieRequest(BaseModel):
     tmdb_id: Optional[int] = None
 
 
+async def _fetch_root_folder_paths(radarr_service: AsyncRadarrService) -> List[str]:
+    """Fetch root folder paths, falling back to the configured default."""
+    try:
+        return await radarr_service.get_root_folder_paths()
+    except Exception as e:
+        logger.error(f"Failed to fetch root folders from Radarr: {e}")
+        return [str(settings.radarr_root_folder)]
+
+
 @router.get("/root-folders/available")
-async def get_available_root_folders():
+async def get_available_root_folders(
+    radarr_service: Optional[AsyncRadarrService] = Depends(get_async_radarr_service),
+):
     """Get list of available root folders from Radarr."""
     try:
-        if not settings.radarr_api_key:
+        if radarr_service is None:
             return {"folders": [], "mappings_enabled": False}
 
-        radarr_service = RadarrService()
-        root_folder_manager = RootFolderManager(radarr_service)
-
-        folders = root_folder_manager.get_available_root_folders()
-        stats = root_folder_manager.get_folder_stats()
+        # One /rootFolder call serves both the path list and the stats
+        root_folders = await radarr_service.get_root_folders()
+        folders = [f["path"] for f in root_folders if "path" in f] or [
+            str(settings.radarr_root_folder)
+        ]
+        stats = RootFolderManager.build_folder_stats(root_folders)
 
         return {
             "folders": folders,
@@ -77,14 +103,18 @@ async def get_available_root_folders():
 
 
 @router.post("/root-folders/suggest")
-async def suggest_root_folder(genres: List[str]):
+async def suggest_root_folder(
+    genres: List[str],
+    radarr_service: Optional[AsyncRadarrService] = Depends(get_async_radarr_service),
+):
     """Suggest a root folder based on genres."""
     try:
-        if not settings.radarr_api_key:
+        if radarr_service is None:
             return {"suggested": None, "reason": "Radarr not configured"}
 
-        radarr_service = RadarrService()
-        root_folder_manager = RootFolderManager(radarr_service)
+        root_folder_manager = RootFolderManager(
+            root_folders=await _fetch_root_folder_paths(radarr_service)
+        )
 
         suggested = root_folder_manager.suggest_folder_for_genres(genres)
 
@@ -99,14 +129,16 @@ async def suggest_root_folder(genres: List[str]):
 
 
 @router.get("/{movie_id}")
-async def get_movie_details(movie_id: int):
+async def get_movie_details(
+    movie_id: int,
+    radarr_service: Optional[AsyncRadarrService] = Depends(get_async_radarr_service),
+):
     """Get detailed information about a movie."""
     try:
-        if not settings.radarr_api_key:
+        if radarr_service is None:
             raise HTTPException(status_code=400, detail="Radarr not configured")
 
-        radarr_service = RadarrService()
-        movie = radarr_service.get_movie(movie_id)
+        movie = await radarr_service.get_movie(movie_id)
 
         if not movie:
             raise HTTPException(status_code=404, detail="Movie not found")
@@ -132,15 +164,17 @@ async def get_movie_details(movie_id: int):
 
 
 @router.post("/status")
-async def get_movies_status(request: MovieStatusRequest):
+async def get_movies_status(
+    request: MovieStatusRequest,
+    radarr_service: Optional[AsyncRadarrService] = Depends(get_async_radarr_service),
+):
     """Get status for multiple movies (for dynamic updates)."""
     try:
-        if not settings.radarr_api_key:
+        if radarr_service is None:
             return {"statuses": {}}
 
-        radarr_service = RadarrService()
-        all_movies = radarr_service.get_all_movies()
-        profiles = radarr_service.get_quality_profiles()
+        library = await radarr_service.get_library_index()
+        profiles = await radarr_service.get_quality_profiles()
         profiles_by_id = {p.id: p.name for p in profiles}
         # Determine upgrade profile id once
         upgrade_profile_id = None
@@ -149,14 +183,11 @@ async def get_movies_status(request: MovieStatusRequest):
                 upgrade_profile_id = p.id
                 break
 
-        # Create lookup dict
-        movie_dict = {movie.id: movie for movie in all_movies}
-
         # Get status for requested movies (filtering out None values)
         statuses = {}
         for movie_id in request.movie_ids:
-            if movie_id and movie_id in movie_dict:
-                movie = movie_dict[movie_id]
+            movie = library.get_by_id(movie_id) if movie_id else None
+            if movie is not None:
                 profile_name = profiles_by_id.get(movie.qualityProfileId, "Unknown")
 
                 # Derive display status, color, icon
@@ -203,10 +234,13 @@ async def get_movies_status(request: MovieStatusRequest):
 
 
 @router.post("/{movie_id}/upgrade", response_model=UpgradeResponse)
-async def upgrade_movie_quality(movie_id: int):
+async def upgrade_movie_quality(
+    movie_id: int,
+    radarr_service: Optional[AsyncRadarrService] = Depends(get_async_radarr_service),
+):
     """Upgrade movie to higher quality profile."""
     try:
-        if not settings.radarr_api_key:
+        if radarr_service is None:
             raise HTTPException(status_code=400, detail="Radarr not configured")
 
         if not settings.boxarr_features_quality_upgrade:
@@ -215,15 +249,8 @@ async def upgrade_movie_quality(movie_id: int):
                 message="Quality upgrade feature is disabled",
             )
 
-        radarr_service = RadarrService()
-
-        # Get current movie
-        movie = radarr_service.get_movie(movie_id)
-        if not movie:
-            raise HTTPException(status_code=404, detail="Movie not found")
-
         # Get profiles
-        profiles = radarr_service.get_quality_profiles()
+        profiles = await radarr_service.get_quality_profiles()
         upgrade_profile = next(
             (p for p in profiles if p.name == settings.radarr_quality_profile_upgrade),
             None,
@@ -235,14 +262,17 @@ async def upgrade_movie_quality(movie_id: int):
                 message=f"Upgrade profile '{settings.radarr_quality_profile_upgrade}' not found",
             )
 
-        # Update quality profile
-        updated_movie = radarr_service.update_movie_quality_profile(
-            movie_id, upgrade_profile.id
-        )
+        # Update quality profile (fetches the full movie payload once)
+        try:
+            updated_movie = await radarr_service.upgrade_movie_quality(
+                movie_id, upgrade_profile.id
+            )
+        except RadarrNotFoundError:
+            raise HTTPException(status_code=404, detail="Movie not found")
 
         if updated_movie:
             # Trigger search for new quality
-            radarr_service.trigger_movie_search(movie_id)
+            await radarr_service.trigger_movie_search(movie_id)
 
             return UpgradeResponse(
                 success=True,
@@ -261,22 +291,147 @@ async def upgrade_movie_quality(movie_id: int):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _bulk_upgrade_ids(request: BulkUpgradeRequest) -> List[int]:
+    """Requested Radarr IDs plus those of the movies stored for the week."""
+    movie_ids = list(request.movie_ids)
+    if request.year is None or request.week is None:
+        return movie_ids
+
+    week_key = f"{request.year}W{request.week:02d}"
+    json_file = (
+        Path(settings.boxarr_data_directory) / "weekly_pages" / f"{week_key}.json"
+    )
+    if not json_file.exists():
+        raise HTTPException(
+            status_code=404, detail=f"No stored data for week {week_key}"
+        )
+    with open(json_file) as f:
+        data = json.load(f)
+    return movie_ids + [
+        m["radarr_id"] for m in data.get("movies", []) if m.get("radarr_id")
+    ]
+
+
+def _upgrade_candidates(
+    index: LibraryIndex, movie_ids: List[int], upgrade_profile_id: int
+) -> List[int]:
+    """Movies that can move to the upgrade profile (same rule as can_upgrade)."""
+    eligible = []
+    for movie_id in dict.fromkeys(movie_ids):
+        movie = index.get_by_id(movie_id)
+        if movie and movie.qualityProfileId not in (None, upgrade_profile_id):
+            eligible.append(movie_id)
+    return eligible
+
+
+@router.post("/upgrade-bulk")
+async def upgrade_movies_bulk(
+    request: BulkUpgradeRequest,
+    radarr_service: Optional[AsyncRadarrService] = Depends(get_async_radarr_service),
+):
+    """Upgrade many movies at once with streaming progress updates.
+
+    Eligible movies are switched to the upgrade profile with one movie
+    editor request, then searched for with one batched search command.
+    """
+    # Resolved before streaming so an unknown week is a real 404
+    requested = await run_in_threadpool(_bulk_upgrade_ids, request)
+
+    def event(**data: Any) -> str:
+        return f"data: {json.dumps(data)}\n\n"
+
+    async def generate_progress() -> AsyncGenerator[str, None]:
+        try:
+            if radarr_service is None:
+                yield event(error="Radarr not configured")
+                return
+            if not settings.boxarr_features_quality_upgrade:
+                yield event(error="Quality upgrade feature is disabled")
+                return
+
+            yield event(stage="resolving", message="Finding movies to upgrade...")
+            upgrade_profile = await radarr_service.get_quality_profile_by_name(
+                settings.radarr_quality_profile_upgrade
+            )
+            if not upgrade_profile:
+                name = settings.radarr_quality_profile_upgrade
+                yield event(error=f"Upgrade profile '{name}' not found")
+                return
+
+            eligible = _upgrade_candidates(
+                await radarr_service.get_library_index(), requested, upgrade_profile.id
+            )
+            skipped = len(set(requested)) - len(eligible)
+
+            if not eligible:
+                yield event(
+                    stage="complete",
+                    success=True,
+                    message="No movies need upgrading",
+                    upgraded=0,
+                    skipped=skipped,
+                )
+                return
+
+            message = f"Switching {len(eligible)} movies to '{upgrade_profile.name}'..."
+            yield event(
+                stage="updating", progress=0, total=len(eligible), message=message
+            )
+            await radarr_service.update_movies_quality_profile(
+                eligible, upgrade_profile.id
+            )
+
+            message = f"Searching for {len(eligible)} upgraded movies..."
+            yield event(
+                stage="searching",
+                progress=len(eligible),
+                total=len(eligible),
+                message=message,
+            )
+            searched = await radarr_service.trigger_movies_search(eligible)
+            errors = [] if searched else ["Radarr did not accept the search command"]
+
+            yield event(
+                stage="complete",
+                success=True,
+                message=f"Upgraded {len(eligible)} movies to '{upgrade_profile.name}'",
+                upgraded=len(eligible),
+                skipped=skipped,
+                movie_ids=eligible,
+                errors=errors,
+            )
+        except Exception as e:
+            logger.error(f"Error upgrading movies: {e}")
+            yield event(error=str(e))
+
+    return StreamingResponse(
+        generate_progress(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",  # Disable Nginx buffering
+        },
+    )
+
+
 @router.post("/add")
-async def add_movie_to_radarr(request: AddMovieRequest):
+async def add_movie_to_radarr(
+    request: AddMovieRequest,
+    radarr_service: Optional[AsyncRadarrService] = Depends(get_async_radarr_service),
+):
     """Add a movie to Radarr and regenerate affected weeks."""
     try:
-        if not settings.radarr_api_key:
+        if radarr_service is None:
             raise HTTPException(status_code=400, detail="Radarr not configured")
 
-        radarr_service = RadarrService()
-
         # Determine title from request
         req_title = request.title or request.movie_title
         if not req_title:
             return {"success": False, "message": "No movie title provided"}
 
         # Search for movie on TMDB
-        search_results = radarr_service.search_movie_tmdb(req_title)
+        search_results = await radarr_service.search_movie(req_title)
         if not search_results:
             return {"success": False, "message": "Movie not found on TMDB"}
 
@@ -289,7 +444,9 @@ async def add_movie_to_radarr(request: AddMovieRequest):
             )
 
         # Determine root folder based on genres
-        root_folder_manager = RootFolderManager(radarr_service)
+        root_folder_manager = RootFolderManager(
+            root_folders=await _fetch_root_folder_paths(radarr_service)
+        )
 
         # Get genres from movie data
         genres = movie_data.get("genres", [])
@@ -300,24 +457,21 @@ async def add_movie_to_radarr(request: AddMovieRequest):
             movie_title=movie_data.get("title", "Unknown"),
         )
 
-        # Before adding, check if this TMDB ID already exists in Radarr (fresh library)
+        # Before adding, check if this TMDB ID already exists in Radarr
+        # (a filtered query, not a full library download)
+        already = None
         try:
-            existing_movies = radarr_service.get_all_movies(ignore_cache=True)
-            tmdb_id = (
-                int(movie_data.get("tmdbId")) if movie_data.get("tmdbId") else None
+            tmdb_id = int(movie_data["tmdbId"])
+            existing = await radarr_service.find_movies_by_tmdb_ids(
+                [tmdb_id], fresh=True
             )
-        except Exception:
-            existing_movies = []
-            tmdb_id = movie_data.get("tmdbId")
-
-        if tmdb_id is not None:
-            already = next((m for m in existing_movies if m.tmdbId == tmdb_id), None)
-        else:
-            already = None
+            already = existing.get(tmdb_id)
+        except Exception as e:
+            logger.warning(f"Duplicate check failed, adding anyway: {e}")
 
         if already:
             # Regenerate affected weeks so UI reflects correct status immediately
-            regenerate_weeks_with_movie(req_title)
+            await run_in_threadpool(regenerate_weeks_with_movie, req_title)
 
             return {
                 "success": True,
@@ -326,7 +480,7 @@ async def add_movie_to_radarr(request: AddMovieRequest):
             }
 
         # Add movie
-        result = radarr_service.add_movie(
+        result = await radarr_service.add_movie(
             tmdb_id=movie_data["tmdbId"],
             quality_profile_id=None,  # Uses default from settings
             root_folder=root_folder,
@@ -336,7 +490,7 @@ async def add_movie_to_radarr(request: AddMovieRequest):
 
         if result:
             # Find and regenerate weeks containing this movie
-            regenerate_weeks_with_movie(req_title)
+            await run_in_threadpool(regenerate_weeks_with_movie, req_title)
 
             return {
                 "success": True,
@@ -385,7 +539,9 @@ async def add_movie_to_radarr(request: AddMovieRequest):
             return {"success": False, "message": "Unexpected error", "error": error_msg}
 
 
-def regenerate_weeks_with_movie(movie_title: str):
+def regenerate_weeks_with_movie(
+    movie_title: str, radarr_service: Optional[RadarrService] = None
+):
     """Find and regenerate all weeks containing a specific movie.
 
     Reconstructs BoxOfficeMovie objects from stored JSON and re-matches
@@ -394,13 +550,15 @@ def regenerate_weeks_with_movie(movie_title: str):
     from ...core.boxoffice import BoxOfficeMovie, match_box_office_to_radarr
 
     weekly_pages_dir = Path(settings.boxarr_data_directory) / "weekly_pages"
-    radarr_service = RadarrService()
+    radarr_service = radarr_service or RadarrService()
     generator = WeeklyDataGenerator(radarr_service)
 
-    # Bust cache so recently added movies are visible
-    radarr_service.bust_cache()
+    # Recently added movies are already in the cached library (adds and
+    # duplicate checks insert them), so it is not reloaded here
 
-    # Search all metadata files
+    # Search all metadata files, then generate the affected weeks together
+    # so posters shared between them are looked up once
+    weeks = []
     for json_file in weekly_pages_dir.glob("*.json"):
         try:
             with open(json_file) as f:
@@ -421,49 +579,20 @@ def regenerate_weeks_with_movie(movie_title: str):
                 )
 
                 # Reconstruct BoxOfficeMovie objects from stored JSON
-                box_office_movies = _reconstruct_movies_from_json(metadata)
+                box_office_movies = reconstruct_box_office_movies(metadata)
 
                 # Re-match against current Radarr library
                 match_results = match_box_office_to_radarr(
                     box_office_movies, radarr_service
                 )
 
-                # Generate updated data file
-                generator.generate_weekly_data(match_results, year, week)
+                weeks.append((match_results, year, week))
         except Exception as e:
             logger.error(f"Error processing {json_file}: {e}")
             continue
 
-
-def _reconstruct_movies_from_json(metadata: dict) -> list:
-    """Reconstruct BoxOfficeMovie objects from stored JSON metadata."""
-    from ...core.boxoffice import BoxOfficeMovie
-
-    movies = []
-    for m in metadata.get("movies", []):
-        genres_raw = m.get("genres")
-        if isinstance(genres_raw, str) and genres_raw:
-            genres_list = [g.strip() for g in genres_raw.split(",")]
-        elif isinstance(genres_raw, list):
-            genres_list = genres_raw
-        else:
-            genres_list = None
-
-        movies.append(
-            BoxOfficeMovie(
-                rank=m.get("rank", 0),
-                title=m.get("title", "Unknown"),
-                year=m.get("year"),
-                revenue=m.get("revenue"),
-                tmdb_id=m.get("tmdb_id"),
-                imdb_id=m.get("imdb_id"),
-                overview=m.get("overview"),
-                runtime=m.get("runtime"),
-                certification=m.get("certification"),
-                genres=genres_list,
-                released=m.get("released"),
-                rating=m.get("rating"),
-                poster=m.get("poster"),
-            )
-        )
-    return movies
+    if weeks:
+        try:
+            generator.generate_weeks(weeks)
+        except Exception as e:
+            logger.error(f"Error regenerating weeks after adding {movie_title}: {e}")
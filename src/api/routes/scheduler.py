@@ -1,21 +1,33 @@
 """Scheduler management routes."""
 
+import asyncio
 import json
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, List, Optional, Tuple, cast
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
+from ...core.auto_add_policy import AutoAddDecision, get_auto_add_policy
+from ...core.history import get_history_store
+from ...core.jobs import Job, JobPriority, get_job_queue
+from ...core.json_generator import WeeklyDataGenerator, reconstruct_box_office_movies
+from ...core.radarr import MovieAddRequest, MovieAddResult, RadarrService
 from ...core.root_folder_manager import RootFolderManager
 from ...core.scheduler import BoxarrScheduler
 from ...utils.config import settings
 from ...utils.logger import get_logger
+from ..dependencies import get_radarr_service
 
 logger = get_logger(__name__)
 router = APIRouter(prefix="/api/scheduler", tags=["scheduler"])
 
+# Seconds between progress checks when streaming job events
+JOB_EVENT_INTERVAL = 0.5
+
 # Module-level scheduler instance
 _scheduler: Optional[BoxarrScheduler] = None
 
@@ -25,7 +37,6 @@ def get_scheduler() -> BoxarrScheduler:
     global _scheduler
     if not _scheduler:
         from ...core.boxoffice import BoxOfficeService
-        from ...core.radarr import RadarrService
 
         _scheduler = BoxarrScheduler(
             boxoffice_service=(
@@ -43,27 +54,20 @@ class TriggerResponse(BaseModel):
     message: str
     movies_found: Optional[int] = None
     movies_added: Optional[int] = None
+    job_id: Optional[str] = None
+    status: Optional[str] = None
+    coalesced: Optional[bool] = None
 
 
 @router.post("/trigger", response_model=TriggerResponse)
 async def trigger_update():
-    """Manually trigger box office update."""
-    try:
-        scheduler = get_scheduler()
-        result = await scheduler.update_box_office()
-
-        # Handle added_movies which is a list
-        added_movies = result.get("added_movies", [])
-        movies_added_count = len(added_movies) if isinstance(added_movies, list) else 0
+    """Queue a box office update and return its job ID at once.
 
-        return TriggerResponse(
-            success=True,
-            message="Box office update completed",
-            movies_found=result.get(
-                "total_count"
-            ),  # Fixed: was "total_movies" but scheduler returns "total_count"
-            movies_added=movies_added_count,
-        )
+    A trigger while an update is queued or running joins that job.
+    """
+    try:
+        job, coalesced = get_scheduler().queue_update(JobPriority.MANUAL)
+        return TriggerResponse(**_queued_response(job, coalesced, "Box office update"))
     except Exception as e:
         logger.error(f"Error triggering update: {e}")
         return TriggerResponse(
@@ -150,25 +154,21 @@ async def get_scheduler_status():
         # Get last run info from history
         last_run_info = None
         try:
-            history_dir = Path(settings.boxarr_data_directory) / "history"
-            if history_dir.exists():
-                history_files = sorted(history_dir.glob("*_latest.json"), reverse=True)
-                if history_files:
-                    with open(history_files[0]) as f:
-                        data = json.load(f)
-                        timestamp = data.get("timestamp")
-                        if timestamp:
-                            from datetime import datetime
-
-                            last_run_time = datetime.fromisoformat(
-                                timestamp.replace("Z", "+00:00")
-                            )
-                            last_run_info = {
-                                "timestamp": last_run_time.isoformat(),
-                                "success": True,
-                                "matched_count": data.get("matched_count", 0),
-                                "total_count": data.get("total_count", 0),
-                            }
+            last_run = get_history_store().last()
+            if last_run:
+                data = last_run.data
+                timestamp = data.get("timestamp")
+                if timestamp:
+                    last_run_time = datetime.fromisoformat(
+                        timestamp.replace("Z", "+00:00")
+                    )
+                    last_run_info = {
+                        "timestamp": last_run_time.isoformat(),
+                        "success": True,
+                        "matched_count": data.get("matched_count", 0),
+                        "total_count": data.get("total_count", 0),
+                        "metrics": data.get("metrics"),
+                    }
         except Exception as e:
             logger.debug(f"Could not get last run info: {e}")
 
@@ -196,56 +196,30 @@ async def get_scheduler_status():
 async def get_scheduler_history():
     """Get scheduler run history."""
     try:
-        history_dir = Path(settings.boxarr_data_directory) / "history"
-        if not history_dir.exists():
-            return {"runs": []}
-
-        # Get all history files
-        history_files = sorted(history_dir.glob("*.json"), reverse=True)[:20]
-
         runs = []
-        for file_path in history_files:
-            # Parse filename for timestamp
-            # Format: YYYYWW_YYYYMMDD_HHMMSS.json
-            parts = file_path.stem.split("_")
-            if len(parts) >= 3:
-                date_str = parts[1]
-                time_str = parts[2]
-
-                try:
-                    run_time = datetime.strptime(
-                        f"{date_str}_{time_str}", "%Y%m%d_%H%M%S"
-                    )
-
-                    # Read result
-                    import json
-
-                    with open(file_path) as f:
-                        result = json.load(f)
+        for run in get_history_store().recent(20):
+            result = run.data
 
-                    # Handle added_movies which could be a list or count
-                    added_movies = result.get("added_movies", [])
-                    added_count = (
-                        len(added_movies)
-                        if isinstance(added_movies, list)
-                        else added_movies
-                    )
+            # Handle added_movies which could be a list or count
+            added_movies = result.get("added_movies", [])
+            added_count = (
+                len(added_movies) if isinstance(added_movies, list) else added_movies
+            )
 
-                    runs.append(
-                        {
-                            "timestamp": run_time.isoformat(),
-                            "week": parts[0],
-                            "success": result.get("success", False),
-                            "movies_found": result.get(
-                                "total_count", result.get("total_movies")
-                            ),
-                            "movies_added": added_count,
-                            "error": result.get("error"),
-                        }
-                    )
-                except Exception as e:
-                    logger.warning(f"Error parsing history file {file_path}: {e}")
-                    continue
+            runs.append(
+                {
+                    "timestamp": run.run_at.isoformat(timespec="seconds"),
+                    "week": run.week,
+                    "success": result.get("success", False),
+                    "movies_found": result.get(
+                        "total_count", result.get("total_movies")
+                    ),
+                    "movies_added": added_count,
+                    "error": result.get("error"),
+                    # Per-stage timings and Radarr/Trakt request counts
+                    "metrics": result.get("metrics"),
+                }
+            )
 
         return {"runs": runs}
     except Exception as e:
@@ -261,175 +235,264 @@ class UpdateWeekRequest(BaseModel):
 
 
 @router.post("/update-week")
-async def update_specific_week(request: UpdateWeekRequest):
-    """Re-match a specific historical week against current Radarr library.
+async def update_specific_week(
+    request: UpdateWeekRequest,
+    radarr_service: Optional[RadarrService] = Depends(get_radarr_service),
+):
+    """Queue a re-match of a historical week against current Radarr library.
 
     Since Trakt only returns current-week data, historical weeks are
     regenerated by reconstructing BoxOfficeMovie objects from stored JSON
-    and re-matching against the current Radarr library.
+    and re-matching against the current Radarr library. The work runs on
+    the job queue; poll ``/api/scheduler/jobs/{job_id}`` for the result.
     """
     year = request.year
     week = request.week
-    try:
-        # Validate inputs
-        if year < 2000 or year > datetime.now().year:
-            raise HTTPException(status_code=400, detail="Invalid year")
-        if week < 1 or week > 53:
-            raise HTTPException(status_code=400, detail="Invalid week number")
-
-        from ...core.boxoffice import (
-            BoxOfficeMovie,
-            MatchResult,
-            match_box_office_to_radarr,
-        )
-        from ...core.json_generator import WeeklyDataGenerator
-        from ...core.radarr import RadarrService
-
-        # Check if JSON file exists for this week
-        json_file = (
-            Path(settings.boxarr_data_directory)
-            / "weekly_pages"
-            / f"{year}W{week:02d}.json"
+    if year < 2000 or year > datetime.now().year:
+        raise HTTPException(status_code=400, detail="Invalid year")
+    if week < 1 or week > 53:
+        raise HTTPException(status_code=400, detail="Invalid week number")
+
+    async def run(job: Job) -> Dict[str, Any]:
+        return await run_in_threadpool(
+            _update_week, year, week, radarr_service, job
         )
 
-        if not json_file.exists():
-            return {
-                "success": False,
-                "message": (
-                    f"No stored data for week {year}W{week:02d}. "
-                    f"Historical data cannot be fetched from Trakt."
-                ),
-            }
+    job, coalesced = get_job_queue().submit(
+        "update_week", run, key=f"update_week:{year}W{week:02d}"
+    )
+    return _queued_response(job, coalesced, f"Update of week {year}W{week:02d}")
+
+
+def _update_week(
+    year: int, week: int, radarr_service: Optional[RadarrService], job: Job
+) -> Dict[str, Any]:
+    """Re-match and regenerate one stored week (runs in a worker thread)."""
+    from ...core.boxoffice import (
+        MatchResult,
+        match_box_office_to_radarr,
+        rematch_unmatched,
+        unmatched_tmdb_ids,
+    )
+
+    # Check if JSON file exists for this week
+    json_file = (
+        Path(settings.boxarr_data_directory) / "weekly_pages" / f"{year}W{week:02d}.json"
+    )
+
+    if not json_file.exists():
+        return {
+            "success": False,
+            "message": (
+                f"No stored data for week {year}W{week:02d}. "
+                f"Historical data cannot be fetched from Trakt."
+            ),
+        }
 
-        # Read stored JSON
-        with open(json_file) as f:
-            metadata = json.load(f)
+    # Read stored JSON
+    with open(json_file) as f:
+        metadata = json.load(f)
 
-        # Reconstruct BoxOfficeMovie objects from stored JSON
-        from .movies import _reconstruct_movies_from_json
+    # Reconstruct BoxOfficeMovie objects from stored JSON
+    box_office_movies = reconstruct_box_office_movies(metadata)
 
-        box_office_movies = _reconstruct_movies_from_json(metadata)
+    if not box_office_movies:
+        return {
+            "success": False,
+            "message": f"No movie data in stored file for week {year}W{week:02d}",
+        }
 
-        if not box_office_movies:
-            return {
-                "success": False,
-                "message": f"No movie data in stored file for week {year}W{week:02d}",
-            }
+    # Match with Radarr
+    match_results = []
+    add_results: List[MovieAddResult] = []
+    decisions: List[AutoAddDecision] = []
 
-        # Match with Radarr
-        match_results = []
-        added_count = 0
+    if radarr_service is not None:
+        # Re-match against current Radarr library by TMDB ID
+        job.report(f"Matching {len(box_office_movies)} movies against Radarr")
+        match_results = match_box_office_to_radarr(box_office_movies, radarr_service)
 
-        if settings.radarr_api_key:
-            radarr_service = RadarrService()
+        # Auto-add if enabled — use Trakt data from stored JSON
+        if settings.boxarr_features_auto_add:
+            decisions, add_results = _auto_add_for_week(
+                match_results, year, radarr_service, job
+            )
 
-            # Re-match against current Radarr library by TMDB ID
-            match_results = match_box_office_to_radarr(
-                box_office_movies, radarr_service
+            # Re-check the unmatched movies if we added any
+            if any(r.added for r in add_results):
+                found = radarr_service.find_movies_by_tmdb_ids(
+                    unmatched_tmdb_ids(match_results)
+                )
+                match_results = rematch_unmatched(match_results, found)
+    else:
+        # No Radarr, create unmatched results
+        match_results = [
+            MatchResult(box_office_movie=movie) for movie in box_office_movies
+        ]
+
+    # Generate data file
+    job.report(f"Generating week {year}W{week:02d}")
+    generator = WeeklyDataGenerator(radarr_service=radarr_service)
+    generator.generate_weekly_data(match_results, year, week)
+
+    return {
+        "success": True,
+        "message": f"Updated week {year}W{week:02d}",
+        "movies_found": len(box_office_movies),
+        "movies_added": sum(1 for r in add_results if r.added),
+        "add_results": [r.to_dict() for r in add_results],
+        "auto_add_decisions": [d.to_dict() for d in decisions],
+    }
+
+
+def _auto_add_for_week(
+    match_results: List[Any], year: int, radarr_service: RadarrService, job: Job
+) -> Tuple[List[AutoAddDecision], List[MovieAddResult]]:
+    """Auto-add the unmatched movies of a week that pass the policy."""
+    decisions = get_auto_add_policy().evaluate(match_results, year)
+
+    root_folder_manager = RootFolderManager(radarr_service)
+
+    to_add: List[MovieAddRequest] = []
+    for decision in decisions:
+        if not decision.accepted:
+            continue
+        bom = decision.result.box_office_movie
+        to_add.append(
+            MovieAddRequest(
+                # Accepted movies always have a TMDB ID
+                tmdb_id=cast(int, bom.tmdb_id),
+                root_folder=root_folder_manager.determine_root_folder(
+                    genres=bom.genres or [],
+                    movie_title=bom.title,
+                ),
+                title=bom.title,
             )
+        )
 
-            # Auto-add if enabled — use Trakt data from stored JSON
-            if settings.boxarr_features_auto_add:
-                unmatched = [r for r in match_results if not r.is_matched]
-
-                limit = settings.boxarr_features_auto_add_limit
-                if limit < len(unmatched):
-                    unmatched = sorted(
-                        unmatched, key=lambda r: r.box_office_movie.rank
-                    )[:limit]
-
-                root_folder_manager = RootFolderManager(radarr_service)
-
-                for result in unmatched:
-                    bom = result.box_office_movie
-                    if not bom.tmdb_id:
-                        continue
-
-                    # Re-release filter using Trakt year
-                    if settings.boxarr_features_auto_add_ignore_rereleases:
-                        if bom.year and bom.year < (year - 1):
-                            continue
-
-                    # Genre filter using Trakt genres
-                    movie_genres = bom.genres or []
-                    if settings.boxarr_features_auto_add_genre_filter_enabled:
-                        if (
-                            settings.boxarr_features_auto_add_genre_filter_mode
-                            == "whitelist"
-                        ):
-                            whitelist = (
-                                settings.boxarr_features_auto_add_genre_whitelist
-                            )
-                            if whitelist and not any(
-                                g in whitelist for g in movie_genres
-                            ):
-                                continue
-                        else:
-                            blacklist = (
-                                settings.boxarr_features_auto_add_genre_blacklist
-                            )
-                            if blacklist and any(
-                                g in blacklist for g in movie_genres
-                            ):
-                                continue
-
-                    # Rating filter using Trakt certification
-                    if settings.boxarr_features_auto_add_rating_filter_enabled:
-                        rating_whitelist = (
-                            settings.boxarr_features_auto_add_rating_whitelist
-                        )
-                        if (
-                            rating_whitelist
-                            and bom.certification
-                            and bom.certification not in rating_whitelist
-                        ):
-                            continue
-
-                    # Determine root folder
-                    chosen_root = root_folder_manager.determine_root_folder(
-                        genres=movie_genres,
-                        movie_title=bom.title,
-                    )
+    if to_add:
+        job.report(f"Adding {len(to_add)} movies to Radarr")
+    add_results: List[MovieAddResult] = []
+    try:
+        add_results = radarr_service.add_movies_bulk(to_add, search_for_movie=True)
+    except Exception as e:
+        logger.warning(f"Failed to auto-add {len(to_add)} movies: {e}")
+    return decisions, add_results
 
-                    try:
-                        movie = radarr_service.add_movie(
-                            tmdb_id=bom.tmdb_id,
-                            quality_profile_id=None,
-                            root_folder=chosen_root,
-                            monitored=True,
-                            search_for_movie=True,
-                        )
-                        if movie:
-                            added_count += 1
-                    except Exception as e:
-                        logger.warning(f"Failed to auto-add {bom.title}: {e}")
-
-                # Re-match if we added movies
-                if added_count > 0:
-                    radarr_service.bust_cache()
-                    match_results = match_box_office_to_radarr(
-                        box_office_movies, radarr_service
-                    )
-        else:
-            # No Radarr, create unmatched results
-            match_results = [
-                MatchResult(box_office_movie=movie) for movie in box_office_movies
-            ]
-
-        # Generate data file
-        generator = WeeklyDataGenerator(
-            radarr_service=radarr_service if settings.radarr_api_key else None
-        )
-        generator.generate_weekly_data(match_results, year, week)
 
+class RegenerateWeeksRequest(BaseModel):
+    """Request model for regenerating stored weeks."""
+
+    year: Optional[int] = None
+
+
+@router.post("/regenerate-weeks")
+async def regenerate_weeks(
+    request: Optional[RegenerateWeeksRequest] = None,
+    radarr_service: Optional[RadarrService] = Depends(get_radarr_service),
+):
+    """Queue a re-match of every stored week against the current Radarr library.
+
+    All weeks (or those of ``year``) are regenerated from one library and
+    quality profile snapshot. The work runs on the job queue behind manual
+    and scheduled updates; stream ``/api/scheduler/jobs/{job_id}/events``
+    for progress.
+    """
+    year = request.year if request else None
+    if year is not None and (year < 2000 or year > datetime.now().year):
+        raise HTTPException(status_code=400, detail="Invalid year")
+
+    async def run(job: Job) -> Dict[str, Any]:
+        return await run_in_threadpool(_regenerate_weeks, year, radarr_service, job)
+
+    job, coalesced = get_job_queue().submit(
+        "regenerate_weeks",
+        run,
+        key=f"regenerate_weeks:{year or 'all'}",
+        priority=JobPriority.BACKGROUND,
+    )
+    label = f"Regeneration of {year} weeks" if year else "Regeneration of all weeks"
+    return _queued_response(job, coalesced, label)
+
+
+def _regenerate_weeks(
+    year: Optional[int], radarr_service: Optional[RadarrService], job: Job
+) -> Dict[str, Any]:
+    """Regenerate stored weeks (runs in a worker thread)."""
+    generator = WeeklyDataGenerator(radarr_service=radarr_service)
+    summary = generator.regenerate_weeks(year=year, progress=job.report)
+    if not summary["weeks"]:
         return {
-            "success": True,
-            "message": f"Updated week {year}W{week:02d}",
-            "movies_found": len(box_office_movies),
-            "movies_added": added_count,
+            "success": False,
+            "message": "No stored weeks to regenerate",
+            **summary,
         }
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error updating week: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    return {
+        "success": True,
+        "message": (
+            f"Regenerated {summary['weeks']} weeks "
+            f"({summary['written']} changed, {summary['unchanged']} unchanged)"
+        ),
+        **summary,
+    }
+
+
+def _queued_response(job: Job, coalesced: bool, label: str) -> Dict[str, Any]:
+    """Response for a request that was handed to the job queue."""
+    return {
+        "success": True,
+        "message": (
+            f"{label} already {job.status.value}" if coalesced else f"{label} queued"
+        ),
+        "job_id": job.id,
+        "status": job.status.value,
+        "coalesced": coalesced,
+    }
+
+
+def _get_job_or_404(job_id: str) -> Job:
+    """Look up a job, raising 404 if it is unknown."""
+    job = get_job_queue().get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+
+@router.get("/jobs")
+async def list_jobs():
+    """List recent update jobs, newest first."""
+    return {"jobs": [job.to_dict() for job in get_job_queue().list()]}
+
+
+@router.get("/jobs/{job_id}")
+async def get_job(job_id: str):
+    """Get the status, progress and (once finished) result of a job."""
+    return _get_job_or_404(job_id).to_dict()
+
+
+@router.get("/jobs/{job_id}/events")
+async def stream_job(job_id: str):
+    """Stream a job's progress as server-sent events until it finishes."""
+    job = _get_job_or_404(job_id)
+
+    async def generate_progress():
+        version = -1
+        while True:
+            # Read ``finished`` first so the last event shows the final state
+            finished = job.finished
+            if job.version != version:
+                version = job.version
+                yield f"data: {json.dumps(job.to_dict(), default=str)}\n\n"
+            if finished:
+                break
+            await asyncio.sleep(JOB_EVENT_INTERVAL)
+
+    return StreamingResponse(
+        generate_progress(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",  # Disable Nginx buffering
+        },
+    )
@@ -0,0 +1,71 @@
+"""Inbound webhook routes."""
+
+import hmac
+from typing import Any, Dict, Optional
+
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request
+
+from ...core.async_radarr import AsyncRadarrService
+from ...core.json_generator import WeeklyDataGenerator
+from ...core.radarr import RadarrMovie, RadarrService
+from ...core.webhooks import handle_radarr_webhook
+from ...utils.config import settings
+from ...utils.logger import get_logger
+from ..dependencies import get_async_radarr_service
+
+logger = get_logger(__name__)
+router = APIRouter(prefix="/api/webhooks", tags=["webhooks"])
+
+
+def _check_secret(request: Request) -> None:
+    """Reject the request unless it carries the configured webhook secret."""
+    secret = settings.radarr_webhook_secret
+    if not secret:
+        return
+    supplied = request.query_params.get("token") or request.headers.get(
+        "X-Boxarr-Token", ""
+    )
+    if not hmac.compare_digest(supplied.encode(), secret.encode()):
+        raise HTTPException(status_code=401, detail="Invalid webhook token")
+
+
+def _update_week_statuses(tmdb_id: int, movie: Optional[RadarrMovie]) -> None:
+    """Rewrite the movie's Radarr status in stored weeks."""
+    try:
+        radarr_service = RadarrService() if settings.radarr_api_key else None
+        WeeklyDataGenerator(radarr_service).apply_movie_update(tmdb_id, movie)
+    except Exception as e:
+        logger.error(f"Failed to update week statuses for TMDB {tmdb_id}: {e}")
+
+
+@router.post("/radarr")
+async def radarr_webhook(
+    request: Request,
+    background_tasks: BackgroundTasks,
+    radarr_service: Optional[AsyncRadarrService] = Depends(get_async_radarr_service),
+) -> Dict[str, Any]:
+    """
+    Receive Radarr Connect webhook events.
+
+    Download, MovieAdded, MovieDelete and MovieFileDelete update the cached
+    library immediately; stored week pages are patched in the background.
+    """
+    _check_secret(request)
+
+    try:
+        payload = await request.json()
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid JSON payload")
+    if not isinstance(payload, dict):
+        raise HTTPException(status_code=400, detail="Invalid JSON payload")
+
+    try:
+        result = await handle_radarr_webhook(payload, radarr_service)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+    movie = result.pop("movie", None)
+    if result.get("handled") and result.get("tmdb_id"):
+        # Sync background tasks run in the threadpool after the response
+        background_tasks.add_task(_update_week_statuses, result["tmdb_id"], movie)
+    return {"success": True, **result}
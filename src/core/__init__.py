@@ -1,5 +1,8 @@
 """Core business logic for Boxarr."""
 
+from .async_boxoffice import AsyncBoxOfficeService
+from .async_radarr import AsyncRadarrService
+from .auto_add_policy import AutoAddDecision, AutoAddPolicy, get_auto_add_policy
 from .boxoffice import BoxOfficeMovie, BoxOfficeService, MatchResult, match_box_office_to_radarr
 from .exceptions import (
     BoxarrException,
@@ -9,24 +12,43 @@ from .exceptions import (
     RadarrConnectionError,
     RadarrError,
     RadarrNotFoundError,
+    RadarrTimeoutError,
     SchedulerError,
 )
-from .radarr import MovieStatus, QualityProfile, RadarrMovie, RadarrService
+from .library import LibraryIndex
+from .radarr import (
+    MovieAddRequest,
+    MovieAddResult,
+    MovieAddStatus,
+    MovieStatus,
+    QualityProfile,
+    RadarrMovie,
+    RadarrService,
+)
 from .scheduler import BoxarrScheduler
 
 __all__ = [
     # Services
     "BoxOfficeService",
+    "AsyncBoxOfficeService",
     "RadarrService",
+    "AsyncRadarrService",
     "BoxarrScheduler",
     # Data classes
     "BoxOfficeMovie",
     "RadarrMovie",
     "QualityProfile",
     "MovieStatus",
+    "MovieAddRequest",
+    "MovieAddResult",
+    "MovieAddStatus",
     "MatchResult",
+    "LibraryIndex",
+    "AutoAddPolicy",
+    "AutoAddDecision",
     # Functions
     "match_box_office_to_radarr",
+    "get_auto_add_policy",
     # Exceptions
     "BoxarrException",
     "ConfigurationError",
@@ -35,5 +57,6 @@ __all__ = [
     "RadarrConnectionError",
     "RadarrAuthenticationError",
     "RadarrNotFoundError",
+    "RadarrTimeoutError",
     "SchedulerError",
 ]
@@ -0,0 +1,255 @@
+"""Asyncio Trakt client for use from FastAPI handlers and the scheduler."""
+
+import asyncio
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+import httpx
+
+from ..utils.config import settings
+from ..utils.logger import get_logger
+from .boxoffice import (
+    BoxOfficeMovie,
+    TraktRateLimiter,
+    get_trakt_rate_limiter,
+    parse_trakt_box_office,
+)
+from .exceptions import BoxOfficeError
+from .http_cache import CachedResponse, HTTPResponseCache
+from .http_clients import HTTPClientRegistry, get_client_registry
+from .metrics import record_request
+
+logger = get_logger(__name__)
+
+# Status codes worth retrying: rate limited, or Trakt/Cloudflare trouble
+_RETRYABLE_STATUS = {429, 500, 502, 503, 504, 520, 521, 522}
+
+# A Trakt request: (path, query parameters)
+TraktRequest = Tuple[str, Optional[Dict[str, Any]]]
+
+# The box office chart changes weekly, so polling dashboards and the
+# scheduler are answered locally and only revalidate once the entry is stale
+_response_cache = HTTPResponseCache(
+    path=lambda: settings.boxarr_data_directory / "trakt_http_cache.sqlite3",
+    max_age=lambda: float(settings.trakt_cache_max_age_seconds),
+)
+
+
+def get_trakt_cache_stats() -> Dict[str, Any]:
+    """Get hit/miss/revalidation counters for the Trakt response cache."""
+    return _response_cache.stats()
+
+
+class AsyncBoxOfficeService:
+    """
+    Non-blocking counterpart of BoxOfficeService.
+
+    Every request draws from the process-wide TraktRateLimiter, so this
+    client and the blocking one share one budget, and waits for tokens,
+    Retry-After pauses and retry backoff are awaited rather than slept.
+    Responses go through an on-disk HTTP cache: fresh entries are served
+    without a request, stale ones are revalidated with ETag/Last-Modified
+    and served as-is if Trakt cannot be reached. Independent endpoints can
+    be fetched concurrently with ``get_many``.
+    """
+
+    MAX_RETRIES = 3
+    INITIAL_BACKOFF = 1  # seconds
+
+    def __init__(
+        self,
+        client_id: Optional[str] = None,
+        api_url: Optional[str] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
+        rate_limiter: Optional[TraktRateLimiter] = None,
+        cache: Optional[HTTPResponseCache] = None,
+        registry: Optional[HTTPClientRegistry] = None,
+    ):
+        """
+        Initialize async Trakt box office service.
+
+        Args:
+            client_id: Trakt API client ID (defaults to config)
+            api_url: Trakt API base URL (defaults to config)
+            http_client: Optional async HTTP client for testing; closed with
+                the service
+            rate_limiter: Token bucket to draw from (defaults to the shared one)
+            cache: Response cache (defaults to the shared on-disk one)
+            registry: Client registry to draw the pooled client from
+                (defaults to the process-wide registry)
+        """
+        self.client_id = client_id or settings.trakt_client_id
+        self.api_url = (api_url or settings.trakt_api_url).rstrip("/")
+        self.rate_limiter = rate_limiter or get_trakt_rate_limiter()
+        self.cache = cache or _response_cache
+        # Bounds get_many(); the token bucket paces requests over time
+        self._in_flight = asyncio.Semaphore(settings.trakt_max_concurrency)
+
+        self._owns_client = http_client is not None
+        self._client = http_client
+        self._registry = registry
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """
+        HTTP client for Trakt, fetched from the registry on first request.
+
+        Answers served from the response cache never need one, so they pay
+        for neither a client nor a connection pool.
+        """
+        if self._client is None:
+            pool = self._registry or get_client_registry()
+            self._client = pool.async_trakt_client(self.client_id)
+        return self._client
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit - close HTTP client."""
+        await self.close()
+
+    async def close(self) -> None:
+        """Close HTTP client unless it is shared through the client registry."""
+        if self._client is not None and self._owns_client:
+            await self._client.aclose()
+
+    async def get_json(
+        self, path: str, params: Optional[Mapping[str, Any]] = None
+    ) -> Any:
+        """
+        GET a Trakt endpoint, retrying transient failures.
+
+        Args:
+            path: Endpoint path, e.g. ``/movies/boxoffice``
+            params: Query parameters
+
+        Returns:
+            Decoded JSON response
+
+        Raises:
+            BoxOfficeError: If the request fails after all retries or with a
+                non-retryable status and nothing is cached
+        """
+        url = f"{self.api_url}{path}"
+        key = self.cache.key_for(url, params)
+        # SQLite reads and writes run in a worker thread, off the event loop
+        if self.cache.in_memory(key):
+            cached = self.cache.get(key)
+        else:
+            cached = await asyncio.to_thread(self.cache.get, key)
+        if cached is not None and self.cache.is_fresh(cached):
+            return cached.data
+
+        try:
+            return await self._request(path, params, key, cached)
+        except BoxOfficeError as e:
+            if cached is None:
+                logger.error(str(e))
+                raise
+            logger.warning(f"{e}; serving cached response")
+            return cached.data
+
+    async def _request(
+        self,
+        path: str,
+        params: Optional[Mapping[str, Any]],
+        key: str,
+        cached: Optional[CachedResponse],
+    ) -> Any:
+        """
+        Send a (conditional, if ``cached`` is given) GET with retries.
+
+        Args:
+            path: Endpoint path
+            params: Query parameters
+            key: Response cache key
+            cached: Stale cached response to revalidate
+
+        Returns:
+            Decoded JSON response
+
+        Raises:
+            BoxOfficeError: If every attempt fails
+        """
+        headers = cached.validators() if cached is not None else {}
+        last_error: Optional[Exception] = None
+        for attempt in range(self.MAX_RETRIES):
+            wait = self.rate_limiter.reserve()
+            if wait > 0:
+                logger.debug(f"Waiting {wait:.2f}s for the Trakt rate limit")
+                await asyncio.sleep(wait)
+            try:
+                async with self._in_flight:
+                    response = await self.client.get(
+                        f"{self.api_url}{path}", params=params, headers=headers
+                    )
+                record_request("trakt", response)
+                self.rate_limiter.update(response.headers)
+                if response.status_code == 304 and cached is not None:
+                    renewed = await asyncio.to_thread(
+                        self.cache.revalidated, key, cached, response.headers
+                    )
+                    return renewed.data
+                response.raise_for_status()
+                data = response.json()
+                await asyncio.to_thread(self.cache.put, key, data, response.headers)
+                return data
+            except httpx.HTTPStatusError as e:
+                last_error = e
+                if e.response.status_code not in _RETRYABLE_STATUS:
+                    break
+            except (httpx.HTTPError, ValueError) as e:
+                last_error = e
+
+            if attempt < self.MAX_RETRIES - 1:
+                # Retry-After from a 429 outranks our own schedule
+                backoff = max(
+                    self.INITIAL_BACKOFF * (2**attempt), self.rate_limiter.backoff()
+                )
+                logger.warning(
+                    f"Trakt request {path} failed (attempt {attempt + 1}/"
+                    f"{self.MAX_RETRIES}): {last_error}. Retrying in {backoff:.1f}s..."
+                )
+                await asyncio.sleep(backoff)
+
+        raise BoxOfficeError(f"Failed to fetch {path} from Trakt: {last_error}")
+
+    async def get_many(self, requests: Mapping[str, TraktRequest]) -> Dict[str, Any]:
+        """
+        Fetch several Trakt endpoints concurrently.
+
+        A failing endpoint does not cancel the others; its entry holds the
+        BoxOfficeError instead of data.
+
+        Args:
+            requests: Name -> (path, query parameters)
+
+        Returns:
+            Name -> decoded JSON response or BoxOfficeError
+        """
+        names = list(requests)
+        results = await asyncio.gather(
+            *(self.get_json(*requests[name]) for name in names),
+            return_exceptions=True,
+        )
+        for name, result in zip(names, results):
+            if isinstance(result, BaseException) and not isinstance(
+                result, BoxOfficeError
+            ):
+                raise result
+        return dict(zip(names, results))
+
+    async def fetch_box_office(self) -> List[BoxOfficeMovie]:
+        """
+        Fetch current weekend box office from Trakt API.
+
+        Returns:
+            List of BoxOfficeMovie objects (top 10)
+
+        Raises:
+            BoxOfficeError: If fetching fails after all retries
+        """
+        logger.info(f"Fetching box office data from Trakt API: {self.api_url}")
+        data = await self.get_json("/movies/boxoffice", {"extended": "full"})
+        return parse_trakt_box_office(data)
@@ -0,0 +1,811 @@
+"""Asyncio Radarr client for use from FastAPI handlers and the scheduler."""
+
+import asyncio
+from typing import Any, Dict, List, Optional, Set, Tuple, cast
+
+import httpx
+
+from ..utils.config import settings
+from ..utils.logger import get_logger
+from .exceptions import (
+    RadarrAuthenticationError,
+    RadarrError,
+    RadarrNotFoundError,
+    RadarrTimeoutError,
+)
+from .http_clients import HTTPClientRegistry, get_client_registry
+from .json_stream import JSONArrayParser
+from .library import LibraryIndex, LibrarySnapshot, apply_library_delta
+from .metrics import record_request
+from .radarr import (
+    MovieAddRequest,
+    MovieAddResult,
+    QualityProfile,
+    RadarrMovie,
+    RadarrServiceBase,
+    _AddLookup,
+    _changed_movie_ids,
+    _coerce_id,
+    _delta_too_large,
+    _library_cache,
+    _library_sync,
+    _lookup_cache,
+    _plan_library_sync,
+)
+
+logger = get_logger(__name__)
+
+
+class AsyncRadarrService(RadarrServiceBase):
+    """
+    Non-blocking counterpart of RadarrService.
+
+    Mirrors the blocking service's method names and shares its library and
+    profile caches, so a page served by either sees the same data. Calls
+    never tie up a worker thread while Radarr responds.
+    """
+
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        api_key: Optional[str] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
+        registry: Optional[HTTPClientRegistry] = None,
+    ):
+        """
+        Initialize async Radarr service.
+
+        Must be created inside a running event loop unless ``http_client``
+        is given, since pooled async clients are bound to their loop.
+
+        Args:
+            url: Radarr URL (defaults to config)
+            api_key: Radarr API key (defaults to config)
+            http_client: Optional async HTTP client for testing; closed with
+                the service
+            registry: Client registry to draw the pooled client from
+                (defaults to the process-wide registry)
+        """
+        super().__init__(url, api_key)
+
+        self._owns_client = http_client is not None
+        pool = registry or get_client_registry()
+        self.client = http_client or pool.async_radarr_client(self.url, self.api_key)
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
+
+    async def close(self) -> None:
+        """Close HTTP client unless it is shared through the client registry."""
+        if self.client and self._owns_client:
+            await self.client.aclose()
+
+    async def _make_request(
+        self, method: str, endpoint: str, **kwargs
+    ) -> httpx.Response:
+        """
+        Make HTTP request to Radarr API.
+
+        Args:
+            method: HTTP method
+            endpoint: API endpoint
+            **kwargs: Additional request arguments
+
+        Returns:
+            HTTP response
+
+        Raises:
+            RadarrError: On API errors
+        """
+        try:
+            response = await self.client.request(method, endpoint, **kwargs)
+            record_request("radarr", response)
+            self._check_response(response, endpoint)
+            return response
+        except RadarrError:
+            raise
+        except Exception as e:
+            raise self._translate_error(e) from e
+
+    async def test_connection(self) -> bool:
+        """
+        Test connection to Radarr.
+
+        Returns:
+            True if connection successful
+        """
+        try:
+            response = await self._make_request("GET", "/api/v3/system/status")
+            return response.status_code == 200
+        except Exception:
+            return False
+
+    async def get_all_movies(self, ignore_cache: bool = False) -> List[RadarrMovie]:
+        """
+        Get all movies from Radarr.
+
+        Returns:
+            List of RadarrMovie objects
+        """
+        index = await self.get_library_index(ignore_cache)
+        return cast(List[RadarrMovie], index.movies)
+
+    async def get_library_index(self, ignore_cache: bool = False) -> LibraryIndex:
+        """
+        Get the indexed Radarr library.
+
+        Args:
+            ignore_cache: Force a fresh fetch from Radarr
+
+        Returns:
+            LibraryIndex over the current library
+        """
+        return await _library_cache.aget(self._fetch_library, force=ignore_cache)
+
+    async def _fetch_library(self) -> LibrarySnapshot:
+        """Refresh the library, incrementally when configured and possible."""
+        mode, since = _plan_library_sync()
+        started_at = _library_sync.started()
+        if mode == "incremental" and since:
+            try:
+                delta = await self._fetch_library_delta(since, started_at)
+                if delta is not None:
+                    return delta
+            except RadarrError as e:
+                _library_sync.record_failure()
+                logger.warning(f"Incremental library sync failed, doing full: {e}")
+
+        index = await self._stream_library()
+        _library_sync.record("full", started_at)
+        logger.info(f"Fetched {len(index)} movies from Radarr")
+        return index
+
+    async def _stream_library(self) -> LibraryIndex:
+        """
+        Download the full library, indexing movies as the body arrives.
+
+        Returns:
+            Index of every movie in Radarr
+        """
+        endpoint = "/api/v3/movie"
+        index = LibraryIndex()
+        parser = JSONArrayParser()
+        try:
+            async with self.client.stream("GET", endpoint) as response:
+                if response.is_error:
+                    await response.aread()
+                self._check_response(response, endpoint)
+                async for chunk in response.aiter_bytes():
+                    self._index_movies(index, parser.feed(chunk))
+            record_request("radarr", response)
+            self._index_movies(index, parser.close())
+        except RadarrError:
+            raise
+        except Exception as e:
+            raise self._translate_error(e) from e
+        return index
+
+    async def _fetch_library_delta(
+        self, since: str, started_at: float
+    ) -> Optional[List[RadarrMovie]]:
+        """
+        Patch the cached library with movies changed since the last sync.
+
+        Changed movies are re-fetched concurrently, up to
+        ``radarr.bulk_add_concurrency`` at a time.
+
+        Args:
+            since: ISO-8601 UTC timestamp to read history from
+            started_at: Sync start time to record on success
+
+        Returns:
+            Updated movie list, or None when so many movies changed that a
+            full download is cheaper
+        """
+        response = await self._make_request(
+            "GET", "/api/v3/history/since", params={"date": since}
+        )
+        changed_ids = _changed_movie_ids(response.json())
+        if _delta_too_large(changed_ids, since):
+            return None
+        changed = sorted(changed_ids)
+        limit = asyncio.Semaphore(settings.radarr_bulk_add_concurrency)
+
+        async def refresh(movie_id: int) -> Optional[RadarrMovie]:
+            async with limit:
+                try:
+                    return await self.get_movie(movie_id)
+                except RadarrNotFoundError:
+                    return None
+
+        refreshed = await asyncio.gather(*(refresh(i) for i in changed))
+        updates = dict(zip(changed, refreshed))
+
+        movies = apply_library_delta(_library_cache.index.movies, updates)
+        removed = sum(1 for movie in refreshed if movie is None)
+        _library_sync.record("incremental", started_at, len(changed) - removed, removed)
+        logger.debug(f"Incremental library sync: {len(changed)} changed since {since}")
+        return cast(List[RadarrMovie], movies)
+
+    async def get_tags(self) -> List[Dict[str, Any]]:
+        """Fetch all tags from Radarr (cached)."""
+        cached = self._cached_metadata("tags")
+        if cached is not None:
+            return cast(List[Dict[str, Any]], cached)
+        try:
+            response = await self._make_request("GET", "/api/v3/tag")
+        except RadarrError as e:
+            return cast(List[Dict[str, Any]], self._fallback_metadata("tags", e))
+        data = response.json()
+        return self._store_metadata("tags", data if isinstance(data, list) else [])
+
+    async def get_tag_by_label(self, label: str) -> Optional[Dict[str, Any]]:
+        """Find a tag by its label (case-insensitive)."""
+        try:
+            return self._find_tag(await self.get_tags(), label)
+        except Exception:
+            return None
+
+    async def create_tag(self, label: str) -> Optional[int]:
+        """Create a new tag and return its ID."""
+        response = await self._make_request(
+            "POST", "/api/v3/tag", json={"label": label}
+        )
+        tag = response.json()
+        self._record_created_tag(tag)
+        if isinstance(tag, dict):
+            return _coerce_id(tag.get("id"))
+        return None
+
+    async def ensure_tag(self, label: str) -> Optional[int]:
+        """Ensure a tag with given label exists in Radarr and return its ID."""
+        existing = await self.get_tag_by_label(label)
+        if existing and isinstance(existing, dict):
+            return _coerce_id(existing.get("id"))
+        try:
+            return await self.create_tag(label)
+        except Exception as e:
+            logger.warning(f"Failed to create tag '{label}': {e}")
+            return None
+
+    async def get_movie(self, movie_id: int) -> RadarrMovie:
+        """
+        Get specific movie by ID.
+
+        Args:
+            movie_id: Radarr movie ID
+
+        Returns:
+            RadarrMovie object
+        """
+        return self._parse_movie(await self.get_movie_raw(movie_id))
+
+    async def get_movie_raw(self, movie_id: int) -> Dict[str, Any]:
+        """
+        Get the complete Radarr payload for one movie.
+
+        Args:
+            movie_id: Radarr movie ID
+
+        Returns:
+            Raw movie dict, as required by PUT /movie
+        """
+        response = await self._make_request("GET", f"/api/v3/movie/{movie_id}")
+        return cast(Dict[str, Any], response.json())
+
+    async def search_movie(self, term: str, **kwargs) -> List[Dict[str, Any]]:
+        """
+        Search for movies using Radarr's search.
+
+        Args:
+            term: Search term
+            **kwargs: Additional request arguments (e.g. ``timeout``)
+
+        Returns:
+            List of search results (served from the lookup cache when fresh)
+        """
+        # The cache is SQLite-backed; keep its disk I/O off the event loop
+        cached = await asyncio.to_thread(_lookup_cache.get, term)
+        if cached is not None:
+            return cached
+
+        response = await self._make_request(
+            "GET", "/api/v3/movie/lookup", params={"term": term}, **kwargs
+        )
+        result = response.json()
+        if not isinstance(result, list):
+            return []
+        await asyncio.to_thread(_lookup_cache.put, term, result)
+        return result
+
+    async def add_movie(
+        self,
+        tmdb_id: int,
+        quality_profile_id: Optional[int] = None,
+        root_folder: Optional[str] = None,
+        monitored: bool = True,
+        search_for_movie: Optional[bool] = None,
+    ) -> RadarrMovie:
+        """
+        Add movie to Radarr.
+
+        Args:
+            tmdb_id: TMDB ID of movie
+            quality_profile_id: Quality profile ID
+            root_folder: Root folder path
+            monitored: Whether to monitor movie
+            search_for_movie: Whether to search for movie immediately
+
+        Returns:
+            Added movie
+        """
+        search_results = await self.search_movie(f"tmdb:{tmdb_id}")
+        if not search_results:
+            raise RadarrNotFoundError(f"Movie with TMDB ID {tmdb_id} not found")
+
+        if quality_profile_id is None:
+            quality_profile_id = self._default_profile_id(
+                await self.get_quality_profiles()
+            )
+
+        if root_folder is None:
+            root_folder = str(settings.radarr_root_folder)
+
+        if search_for_movie is None:
+            search_for_movie = settings.radarr_search_for_movie
+
+        movie_data = self._build_add_payload(
+            search_results[0],
+            quality_profile_id,
+            root_folder,
+            monitored,
+            search_for_movie,
+            await self._auto_tag_id(),
+        )
+
+        response = await self._make_request("POST", "/api/v3/movie", json=movie_data)
+        added_movie = self._parse_movie(response.json())
+
+        logger.info(f"Added movie to Radarr: {added_movie.title}")
+        self._remember_added([added_movie])
+        return added_movie
+
+    async def add_movies_bulk(
+        self,
+        requests: List[MovieAddRequest],
+        monitored: bool = True,
+        search_for_movie: Optional[bool] = None,
+    ) -> List[MovieAddResult]:
+        """
+        Add several movies to Radarr at once.
+
+        See ``RadarrService.add_movies_bulk``: concurrent lookups, one
+        ``/api/v3/movie/import`` request, bounded-concurrency single adds
+        as the fallback.
+
+        Args:
+            requests: Movies to add
+            monitored: Whether to monitor added movies
+            search_for_movie: Whether to search for movies immediately
+
+        Returns:
+            One result per request, in request order
+        """
+        if not requests:
+            return []
+        if search_for_movie is None:
+            search_for_movie = settings.radarr_search_for_movie
+
+        limit = asyncio.Semaphore(settings.radarr_bulk_add_concurrency)
+        lookups = await asyncio.gather(
+            *(self._lookup_for_add(request, limit) for request in requests)
+        )
+
+        # Profiles and the tag are only needed if something can be added
+        found = any(isinstance(info, dict) for info in lookups)
+        in_library = await self._library_tmdb_ids(
+            self._found_tmdb_ids(requests, list(lookups))
+        )
+        default_profile_id = 1
+        if found and any(r.quality_profile_id is None for r in requests):
+            default_profile_id = self._default_profile_id(
+                await self.get_quality_profiles()
+            )
+
+        results, pending = self._prepare_bulk_add(
+            requests,
+            list(lookups),
+            in_library,
+            default_profile_id,
+            monitored,
+            search_for_movie,
+            await self._auto_tag_id() if found else None,
+        )
+        if pending:
+            try:
+                response = await self._make_request(
+                    "POST",
+                    "/api/v3/movie/import",
+                    json=[p for _, p in pending],
+                    **self._add_request_options(),
+                )
+                added = self._import_results(pending, response.json())
+            except RadarrAuthenticationError:
+                raise
+            except RadarrTimeoutError as e:
+                # The import may still complete, so the cached library
+                # cannot be patched reliably
+                self.bust_cache()
+                added = self._timed_out_adds(pending, e)
+            except RadarrError as e:
+                logger.info(f"Bulk import unavailable, adding one by one: {e}")
+                added = await asyncio.gather(
+                    *(self._add_single(item, limit) for item in pending)
+                )
+            for position, result in added:
+                results[position] = result
+            self._remember_added([result.movie for _, result in added if result.movie])
+        return self._finish_bulk_add(results)
+
+    async def _library_tmdb_ids(self, tmdb_ids: List[int]) -> Set[int]:
+        """Which of ``tmdb_ids`` are in the library (see the blocking service)."""
+        if not tmdb_ids:
+            return set()
+        try:
+            return self._present_tmdb_ids(await self.find_movies_by_tmdb_ids(tmdb_ids))
+        except RadarrError as e:
+            logger.warning(f"Could not check library before adding: {e}")
+            return set()
+
+    async def _lookup_for_add(
+        self, request: MovieAddRequest, limit: asyncio.Semaphore
+    ) -> _AddLookup:
+        """Look up one movie for a bulk add, capturing errors."""
+        async with limit:
+            try:
+                found = await self.search_movie(
+                    f"tmdb:{request.tmdb_id}", **self._add_request_options()
+                )
+            except RadarrError as e:
+                return e
+        return found[0] if found else None
+
+    async def _add_single(
+        self, item: Tuple[int, Dict[str, Any]], limit: asyncio.Semaphore
+    ) -> Tuple[int, MovieAddResult]:
+        """POST one pending payload, keeping its request position."""
+        position, payload = item
+        async with limit:
+            try:
+                response = await self._make_request(
+                    "POST", "/api/v3/movie", json=payload, **self._add_request_options()
+                )
+            except RadarrError as e:
+                return position, self._single_add_result(payload, e)
+        return position, self._single_add_result(payload, response.json())
+
+    async def _auto_tag_id(self) -> Optional[int]:
+        """ID of the auto-tag for added movies, creating it if needed."""
+        try:
+            label = self._auto_tag_label()
+            return await self.ensure_tag(label) if label else None
+        except Exception as e:
+            logger.warning(f"Auto-tagging skipped due to error: {e}")
+            return None
+
+    async def update_movie(self, movie: RadarrMovie) -> RadarrMovie:
+        """
+        Update movie in Radarr.
+
+        Args:
+            movie: Movie to update
+
+        Returns:
+            Updated movie
+        """
+        current = await self.get_movie_raw(movie.id)
+        movie_dict = self._build_update_payload(movie, current)
+
+        response = await self._make_request(
+            "PUT", f"/api/v3/movie/{movie.id}", json=movie_dict
+        )
+
+        updated_movie = self._parse_movie(response.json())
+        logger.info(f"Updated movie in Radarr: {updated_movie.title}")
+        return updated_movie
+
+    async def upgrade_movie_quality(
+        self, movie_id: int, quality_profile_id: int
+    ) -> RadarrMovie:
+        """
+        Upgrade movie quality profile.
+
+        Args:
+            movie_id: Movie ID
+            quality_profile_id: New quality profile ID
+
+        Returns:
+            Updated movie
+        """
+        movie_dict = await self.get_movie_raw(movie_id)
+        movie_dict["qualityProfileId"] = quality_profile_id
+        response = await self._make_request(
+            "PUT", f"/api/v3/movie/{movie_id}", json=movie_dict
+        )
+
+        updated_movie = self._parse_movie(response.json())
+        logger.info(f"Updated movie in Radarr: {updated_movie.title}")
+        return updated_movie
+
+    async def delete_movie(self, movie_id: int, delete_files: bool = False) -> None:
+        """
+        Delete movie from Radarr.
+
+        Args:
+            movie_id: Movie ID to delete
+            delete_files: Whether to delete files
+        """
+        params = {"deleteFiles": str(delete_files).lower()}
+        await self._make_request("DELETE", f"/api/v3/movie/{movie_id}", params=params)
+        logger.info(f"Deleted movie {movie_id} from Radarr")
+
+    async def get_quality_profiles(
+        self, ignore_cache: bool = False
+    ) -> List[QualityProfile]:
+        """
+        Get quality profiles from Radarr.
+
+        Returns:
+            List of QualityProfile objects
+        """
+        cached = None if ignore_cache else self._cached_metadata("profiles")
+        if cached is not None:
+            return self._parse_quality_profiles(cached)
+
+        try:
+            response = await self._make_request("GET", "/api/v3/qualityProfile")
+        except RadarrError as e:
+            return self._parse_quality_profiles(self._fallback_metadata("profiles", e))
+        profiles = self._parse_quality_profiles(
+            self._store_metadata("profiles", response.json())
+        )
+
+        self._quality_profiles = profiles
+        return profiles
+
+    async def get_quality_profile_by_name(self, name: str) -> Optional[QualityProfile]:
+        """
+        Get quality profile by name.
+
+        Args:
+            name: Profile name
+
+        Returns:
+            QualityProfile or None if not found
+        """
+        return self._find_profile_by_name(await self.get_quality_profiles(), name)
+
+    def bust_cache(self) -> None:
+        """Invalidate the in-memory movie cache so the next call fetches fresh data."""
+        _library_cache.invalidate()
+        _library_sync.reset()
+
+    async def find_movie_by_tmdb_id(self, tmdb_id: int) -> Optional[RadarrMovie]:
+        """
+        Look up a movie in the Radarr library by TMDB ID.
+
+        Args:
+            tmdb_id: TMDB ID to search for
+
+        Returns:
+            RadarrMovie if found, None otherwise
+        """
+        index = await self.get_library_index()
+        return cast(Optional[RadarrMovie], index.get_by_tmdb_id(tmdb_id))
+
+    async def find_movie_by_imdb_id(self, imdb_id: str) -> Optional[RadarrMovie]:
+        """
+        Look up a movie in the Radarr library by IMDb ID.
+
+        Args:
+            imdb_id: IMDb ID (e.g. "tt1877830")
+
+        Returns:
+            RadarrMovie if found, None otherwise
+        """
+        index = await self.get_library_index()
+        return cast(Optional[RadarrMovie], index.get_by_imdb_id(imdb_id))
+
+    async def find_movie_by_id(self, movie_id: int) -> Optional[RadarrMovie]:
+        """
+        Look up a movie in the cached Radarr library by Radarr ID.
+
+        Args:
+            movie_id: Radarr movie ID
+
+        Returns:
+            RadarrMovie if found, None otherwise
+        """
+        index = await self.get_library_index()
+        return cast(Optional[RadarrMovie], index.get_by_id(movie_id))
+
+    async def search_movie_by_title(self, title: str) -> Optional[RadarrMovie]:
+        """
+        Search for movie in library by title.
+
+        Args:
+            title: Movie title to search
+
+        Returns:
+            First matching movie or None
+        """
+        index = await self.get_library_index()
+        return cast(Optional[RadarrMovie], index.find_by_title(title))
+
+    async def find_movies_by_tmdb_ids(
+        self, tmdb_ids: List[int], fresh: bool = False
+    ) -> Dict[int, Optional[RadarrMovie]]:
+        """
+        Look up several movies in the Radarr library by TMDB ID.
+
+        See ``RadarrService.find_movies_by_tmdb_ids``: small sets are
+        probed with ``/api/v3/movie?tmdbId=`` instead of a full download.
+
+        Args:
+            tmdb_ids: TMDB IDs to look up
+            fresh: Ignore the cached library (e.g. duplicate checks)
+
+        Returns:
+            TMDB ID -> movie, or None when not in the library
+        """
+        ids = list(dict.fromkeys(tmdb_ids))
+        if not ids:
+            return {}
+        plan, index = self._tmdb_lookup_plan(len(ids), fresh)
+        if plan == "probe":
+            limit = asyncio.Semaphore(settings.radarr_bulk_add_concurrency)
+            found = await asyncio.gather(
+                *(self._probe_tmdb_id(tmdb_id, limit) for tmdb_id in ids)
+            )
+            return self._remember_probed(dict(zip(ids, found)))
+        if index is None:
+            index = await self.get_library_index(ignore_cache=fresh)
+        return {tmdb_id: index.get_by_tmdb_id(tmdb_id) for tmdb_id in ids}
+
+    async def _probe_tmdb_id(
+        self, tmdb_id: int, limit: asyncio.Semaphore
+    ) -> Optional[RadarrMovie]:
+        """Fetch one movie with a filtered library query."""
+        async with limit:
+            response = await self._make_request(
+                "GET", "/api/v3/movie", params={"tmdbId": tmdb_id}
+            )
+        return self._probe_result(tmdb_id, response.json())
+
+    async def get_system_status(self) -> Dict[str, Any]:
+        """
+        Get Radarr system status.
+
+        Returns:
+            System status information
+        """
+        cached = self._cached_metadata("system_status")
+        if cached is not None:
+            return cast(Dict[str, Any], cached)
+        try:
+            response = await self._make_request("GET", "/api/v3/system/status")
+        except RadarrError as e:
+            return cast(Dict[str, Any], self._fallback_metadata("system_status", e))
+        result = response.json()
+        return self._store_metadata(
+            "system_status", result if isinstance(result, dict) else {}
+        )
+
+    async def get_root_folders(self) -> List[Dict[str, Any]]:
+        """
+        Get root folders configured in Radarr.
+
+        Returns:
+            List of root folder configurations
+        """
+        cached = self._cached_metadata("root_folders")
+        if cached is not None:
+            return cast(List[Dict[str, Any]], cached)
+        try:
+            response = await self._make_request("GET", "/api/v3/rootFolder")
+        except RadarrError as e:
+            return cast(
+                List[Dict[str, Any]], self._fallback_metadata("root_folders", e)
+            )
+        result = response.json()
+        return self._store_metadata(
+            "root_folders", result if isinstance(result, list) else []
+        )
+
+    async def get_root_folder_paths(self) -> List[str]:
+        """
+        Get just the paths of configured root folders.
+
+        Returns:
+            List of root folder paths
+        """
+        folders = await self.get_root_folders()
+        return [f["path"] for f in folders if "path" in f]
+
+    async def update_movie_quality_profile(
+        self, movie_id: int, profile_id: int
+    ) -> RadarrMovie:
+        """
+        Update a movie's quality profile.
+
+        Args:
+            movie_id: Movie ID in Radarr
+            profile_id: New quality profile ID
+
+        Returns:
+            Updated movie object
+
+        Raises:
+            RadarrError: If update fails
+        """
+        return await self.upgrade_movie_quality(movie_id, profile_id)
+
+    async def update_movies_quality_profile(
+        self, movie_ids: List[int], profile_id: int
+    ) -> List[RadarrMovie]:
+        """
+        Switch several movies to a quality profile in one request.
+
+        Args:
+            movie_ids: Movie IDs in Radarr
+            profile_id: New quality profile ID
+
+        Returns:
+            Updated movies as reported by Radarr
+        """
+        if not movie_ids:
+            return []
+        response = await self._make_request(
+            "PUT",
+            "/api/v3/movie/editor",
+            json={"movieIds": list(movie_ids), "qualityProfileId": profile_id},
+        )
+        return self._apply_editor_response(list(movie_ids), response)
+
+    async def trigger_movie_search(self, movie_id: int) -> bool:
+        """
+        Trigger a search for a specific movie in Radarr.
+
+        Args:
+            movie_id: Movie ID in Radarr
+
+        Returns:
+            True if command was successfully sent
+        """
+        return await self.trigger_movies_search([movie_id])
+
+    async def trigger_movies_search(self, movie_ids: List[int]) -> bool:
+        """
+        Trigger one search command covering several movies.
+
+        Args:
+            movie_ids: Movie IDs in Radarr
+
+        Returns:
+            True if command was successfully sent
+        """
+        try:
+            command_data = {"name": "MoviesSearch", "movieIds": list(movie_ids)}
+            response = await self._make_request(
+                "POST", "/api/v3/command", json=command_data
+            )
+            result = response.json()
+            return result.get("status") in ["queued", "started", "completed"]
+        except Exception as e:
+            logger.error(f"Failed to trigger search for movies {movie_ids}: {e}")
+            return False
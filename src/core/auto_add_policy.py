@@ -0,0 +1,220 @@
+"""Compiled auto-add filters shared by scheduled runs and week updates."""
+
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple
+
+from ..utils.config import Settings, get_settings
+from .boxoffice import BoxOfficeMovie, MatchResult
+
+# Decision codes, stable for the API
+ACCEPTED = "accepted"
+OVER_LIMIT = "over_limit"
+NO_TMDB_ID = "no_tmdb_id"
+RERELEASE = "rerelease"
+GENRE_NOT_ALLOWED = "genre_not_allowed"
+GENRE_EXCLUDED = "genre_excluded"
+RATING_NOT_ALLOWED = "rating_not_allowed"
+
+
+def _normalize(values: Iterable[str]) -> FrozenSet[str]:
+    """Case-insensitive form of genre or rating names."""
+    return frozenset(_fold(values))
+
+
+def _fold(values: Iterable[str]) -> Iterator[str]:
+    """Lazily normalize names, for set tests that need no set of their own."""
+    return (v.lower().strip() for v in values if v and v.strip())
+
+
+@dataclass(slots=True)
+class AutoAddDecision:
+    """Whether one unmatched movie is auto-added, and why."""
+
+    result: MatchResult
+    code: str
+    reason: str
+
+    @property
+    def accepted(self) -> bool:
+        """Whether the movie passed every filter."""
+        return self.code == ACCEPTED
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize for API responses."""
+        bom = self.result.box_office_movie
+        return {
+            "rank": bom.rank,
+            "title": bom.title,
+            "tmdb_id": bom.tmdb_id,
+            "accepted": self.accepted,
+            "code": self.code,
+            "reason": self.reason,
+        }
+
+
+@dataclass(frozen=True)
+class AutoAddPolicy:
+    """
+    Auto-add filters compiled from settings.
+
+    Genre and rating lists are normalized into frozensets once, so checking
+    a movie is a few set operations rather than re-reading settings and
+    scanning lists for every candidate. Disabled or empty filters compile
+    to ``None``/empty sets and are skipped entirely. The sorted lists
+    quoted in rejection reasons are formatted once here too.
+    """
+
+    limit: int
+    ignore_rereleases: bool = False
+    genre_mode: Optional[str] = None  # "whitelist", "blacklist" or None
+    genres: FrozenSet[str] = frozenset()
+    ratings: FrozenSet[str] = frozenset()
+    _genres_text: str = field(init=False, repr=False, compare=False)
+    _ratings_text: str = field(init=False, repr=False, compare=False)
+    _over_limit_reason: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Pre-format the parts of rejection reasons that never change."""
+        object.__setattr__(self, "_genres_text", str(sorted(self.genres)))
+        object.__setattr__(self, "_ratings_text", str(sorted(self.ratings)))
+        object.__setattr__(
+            self, "_over_limit_reason", f"outside the top {self.limit} unmatched"
+        )
+
+    @classmethod
+    def from_settings(cls, config: Settings) -> "AutoAddPolicy":
+        """
+        Compile the auto-add options of a settings instance.
+
+        Args:
+            config: Settings to compile
+
+        Returns:
+            Compiled policy
+        """
+        genre_mode: Optional[str] = None
+        genres: FrozenSet[str] = frozenset()
+        if config.boxarr_features_auto_add_genre_filter_enabled:
+            if config.boxarr_features_auto_add_genre_filter_mode == "whitelist":
+                genres = _normalize(config.boxarr_features_auto_add_genre_whitelist)
+                genre_mode = "whitelist" if genres else None
+            else:
+                genres = _normalize(config.boxarr_features_auto_add_genre_blacklist)
+                genre_mode = "blacklist" if genres else None
+
+        ratings: FrozenSet[str] = frozenset()
+        if config.boxarr_features_auto_add_rating_filter_enabled:
+            ratings = _normalize(config.boxarr_features_auto_add_rating_whitelist)
+
+        return cls(
+            limit=config.boxarr_features_auto_add_limit,
+            ignore_rereleases=config.boxarr_features_auto_add_ignore_rereleases,
+            genre_mode=genre_mode,
+            genres=genres,
+            ratings=ratings,
+        )
+
+    def check(self, movie: BoxOfficeMovie, top_year: int) -> Tuple[str, str]:
+        """
+        Apply the filters to one movie.
+
+        Args:
+            movie: Box office movie (Trakt metadata)
+            top_year: Year of the chart, for the re-release cutoff
+
+        Returns:
+            Decision code and a human-readable reason
+        """
+        if not movie.tmdb_id:
+            return NO_TMDB_ID, "no TMDB ID available for add"
+
+        cutoff = top_year - 1
+        if self.ignore_rereleases and movie.year and movie.year < cutoff:
+            return (
+                RERELEASE,
+                f"release year {movie.year} older than cutoff {cutoff}",
+            )
+
+        if self.genre_mode:
+            # isdisjoint consumes the generator; no per-movie set is built
+            disjoint = self.genres.isdisjoint(_fold(movie.genres or ()))
+            if self.genre_mode == "whitelist" and disjoint:
+                return (
+                    GENRE_NOT_ALLOWED,
+                    f"genres {movie.genres or []} not in whitelist "
+                    f"{self._genres_text}",
+                )
+            if self.genre_mode == "blacklist" and not disjoint:
+                excluded = sorted(self.genres.intersection(_fold(movie.genres or ())))
+                return (
+                    GENRE_EXCLUDED,
+                    f"contains blacklisted genre(s) {excluded}",
+                )
+
+        if self.ratings and movie.certification:
+            rating = movie.certification.lower().strip()
+            if rating and rating not in self.ratings:
+                return (
+                    RATING_NOT_ALLOWED,
+                    f"rating '{movie.certification}' not in allowed ratings "
+                    f"{self._ratings_text}",
+                )
+
+        return ACCEPTED, "passed all auto-add filters"
+
+    def evaluate(
+        self, match_results: List[MatchResult], top_year: int
+    ) -> List[AutoAddDecision]:
+        """
+        Decide which unmatched movies of a chart to auto-add.
+
+        Only the top ``limit`` unmatched movies by rank are considered;
+        movies filtered out are not replaced by lower-ranked ones.
+
+        Args:
+            match_results: Match results for the whole chart
+            top_year: Year of the chart, for the re-release cutoff
+
+        Returns:
+            One decision per unmatched movie, in rank order
+        """
+        unmatched = sorted(
+            (r for r in match_results if not r.is_matched),
+            key=lambda r: r.box_office_movie.rank,
+        )
+        decisions = [
+            AutoAddDecision(result, *self.check(result.box_office_movie, top_year))
+            for result in unmatched[: self.limit]
+        ]
+        decisions.extend(
+            AutoAddDecision(result, OVER_LIMIT, self._over_limit_reason)
+            for result in unmatched[self.limit :]
+        )
+        return decisions
+
+
+_policy_lock = threading.Lock()
+_compiled: Optional[Tuple[Settings, AutoAddPolicy]] = None
+
+
+def get_auto_add_policy() -> AutoAddPolicy:
+    """
+    Get the policy compiled from the current settings.
+
+    The policy is compiled once per settings instance, so a configuration
+    reload (which replaces the instance) recompiles it on next use.
+    """
+    global _compiled
+    config = get_settings()
+    with _policy_lock:
+        if _compiled is None or _compiled[0] is not config:
+            _compiled = (config, AutoAddPolicy.from_settings(config))
+        return _compiled[1]
+
+
+def reset_auto_add_policy() -> None:
+    """Drop the compiled policy (call after auto-add settings change)."""
+    global _compiled
+    with _policy_lock:
+        _compiled = None
@@ -1,8 +1,12 @@
 """Trakt API client for fetching weekly box office data."""
 
+import json
+import threading
 import time
 from dataclasses import asdict, dataclass, field
-from typing import Dict, List, Optional
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, List, Mapping, Optional
 
 import httpx
 
@@ -95,6 +99,258 @@ def match_box_office_to_radarr(
     return results
 
 
+def unmatched_tmdb_ids(match_results: List[MatchResult]) -> List[int]:
+    """TMDB IDs of the movies that did not match anything in Radarr."""
+    return [
+        r.box_office_movie.tmdb_id
+        for r in match_results
+        if not r.is_matched and r.box_office_movie.tmdb_id
+    ]
+
+
+def rematch_unmatched(
+    match_results: List[MatchResult], found: Mapping[int, Optional[object]]
+) -> List[MatchResult]:
+    """
+    Re-check unmatched movies against freshly looked up Radarr movies.
+
+    Lets callers confirm a handful of just-added movies without
+    re-matching (and reloading) the whole library.
+
+    Args:
+        match_results: Existing match results
+        found: TMDB ID -> Radarr movie or None (see ``find_movies_by_tmdb_ids``)
+
+    Returns:
+        Match results with newly found movies matched
+    """
+    return [
+        (
+            result
+            if result.is_matched or not result.box_office_movie.tmdb_id
+            else MatchResult(
+                box_office_movie=result.box_office_movie,
+                radarr_movie=found.get(result.box_office_movie.tmdb_id),
+            )
+        )
+        for result in match_results
+    ]
+
+
+def trakt_headers(client_id: str) -> Dict[str, str]:
+    """Headers every Trakt API request carries."""
+    return {
+        "Content-Type": "application/json",
+        "trakt-api-version": "2",
+        "trakt-api-key": client_id,
+    }
+
+
+def _seconds_until(value: str) -> Optional[float]:
+    """Seconds from now until an ISO-8601 or HTTP date, or None if unparsable."""
+    try:
+        when = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return (when - datetime.now(timezone.utc)).total_seconds()
+
+
+class TraktRateLimiter:
+    """
+    Token bucket shared by every Trakt client in the process.
+
+    Starts from the configured budget and then follows what Trakt reports:
+    the ``X-Ratelimit`` header resets the limit, period and remaining
+    tokens, and ``Retry-After`` (or an exhausted limit's ``until``) pauses
+    every caller until the given time. Callers reserve a token and are told
+    how long to wait, so the blocking client sleeps and the async client
+    awaits without holding a thread.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize a full bucket.
+
+        Args:
+            clock: Monotonic time source (overridable for tests)
+        """
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._limit = float(settings.trakt_rate_limit_requests)
+        self._period = float(settings.trakt_rate_limit_period_seconds)
+        self._tokens = self._limit
+        self._updated = clock()
+        self._blocked_until = 0.0
+        self._counters = {"requests": 0, "throttled": 0, "retry_after": 0}
+
+    def _refill(self, now: float) -> None:
+        """Add the tokens earned since the last update (lock held)."""
+        rate = self._limit / self._period
+        self._tokens = min(self._limit, self._tokens + (now - self._updated) * rate)
+        self._updated = now
+
+    def reserve(self) -> float:
+        """
+        Take a token, borrowing against future refills if none are left.
+
+        Returns:
+            Seconds the caller must wait before sending its request
+        """
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self._tokens -= 1
+            self._counters["requests"] += 1
+            wait = max(0.0, self._blocked_until - now)
+            if self._tokens < 0:
+                wait = max(wait, -self._tokens * self._period / self._limit)
+            if wait > 0:
+                self._counters["throttled"] += 1
+            return wait
+
+    def backoff(self) -> float:
+        """Seconds left on a Retry-After pause (0 when not paused)."""
+        with self._lock:
+            return max(0.0, self._blocked_until - self._clock())
+
+    def update(self, headers: Mapping[str, Any]) -> None:
+        """
+        Apply Trakt's rate-limit headers from a response.
+
+        Args:
+            headers: Response headers
+        """
+        ratelimit = headers.get("X-Ratelimit")
+        retry_after = headers.get("Retry-After")
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            if isinstance(ratelimit, str):
+                self._apply_ratelimit(ratelimit, now)
+            if isinstance(retry_after, str):
+                delay = (
+                    float(retry_after)
+                    if retry_after.strip().isdigit()
+                    else _seconds_until(retry_after)
+                )
+                if delay is not None and delay > 0:
+                    self._blocked_until = max(self._blocked_until, now + delay)
+                    self._counters["retry_after"] += 1
+                    logger.warning(f"Trakt asked to retry after {delay:.0f}s")
+
+    def _apply_ratelimit(self, header: str, now: float) -> None:
+        """Sync the bucket with an ``X-Ratelimit`` JSON header (lock held)."""
+        try:
+            info = json.loads(header)
+            limit = float(info["limit"])
+            period = float(info["period"])
+            remaining = float(info["remaining"])
+        except (ValueError, KeyError, TypeError):
+            logger.debug(f"Ignoring malformed X-Ratelimit header: {header!r}")
+            return
+        if limit > 0 and period > 0:
+            self._limit, self._period = limit, period
+        # Requests still in flight were already taken from our own count
+        self._tokens = min(self._tokens, remaining)
+        if remaining <= 0 and isinstance(info.get("until"), str):
+            delay = _seconds_until(info["until"])
+            if delay is not None and delay > 0:
+                self._blocked_until = max(self._blocked_until, now + delay)
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters and the current bucket state."""
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            return {
+                **self._counters,
+                "limit": self._limit,
+                "period_seconds": self._period,
+                "tokens": round(self._tokens, 3),
+                "paused_seconds": round(max(0.0, self._blocked_until - now), 3),
+            }
+
+
+_rate_limiter: Optional[TraktRateLimiter] = None
+_rate_limiter_lock = threading.Lock()
+
+
+def get_trakt_rate_limiter() -> TraktRateLimiter:
+    """Get the process-wide Trakt rate limiter, creating it on first use."""
+    global _rate_limiter
+    with _rate_limiter_lock:
+        if _rate_limiter is None:
+            _rate_limiter = TraktRateLimiter()
+        return _rate_limiter
+
+
+def reset_trakt_rate_limiter() -> None:
+    """Discard the shared limiter so the next one picks up current settings."""
+    global _rate_limiter
+    with _rate_limiter_lock:
+        _rate_limiter = None
+
+
+def parse_trakt_box_office(data: list) -> List[BoxOfficeMovie]:
+    """
+    Parse Trakt API box office response into BoxOfficeMovie objects.
+
+    Args:
+        data: JSON response from Trakt /movies/boxoffice endpoint
+
+    Returns:
+        List of BoxOfficeMovie objects
+    """
+    movies = []
+    rank = 1
+
+    for entry in data[:10]:  # Top 10 only
+        movie_data = entry.get("movie", {})
+        ids = movie_data.get("ids", {})
+        revenue = entry.get("revenue")
+
+        tmdb_id = ids.get("tmdb")
+        if tmdb_id is None:
+            logger.warning(
+                f"Skipping '{movie_data.get('title', 'Unknown')}' - no TMDB ID available"
+            )
+            continue
+
+        genres = movie_data.get("genres")
+
+        movie = BoxOfficeMovie(
+            rank=rank,
+            title=movie_data.get("title", "Unknown"),
+            year=movie_data.get("year"),
+            revenue=revenue,
+            tmdb_id=tmdb_id,
+            imdb_id=ids.get("imdb"),
+            trakt_id=ids.get("trakt"),
+            trakt_slug=ids.get("slug"),
+            overview=movie_data.get("overview"),
+            runtime=movie_data.get("runtime"),
+            certification=movie_data.get("certification"),
+            genres=genres if isinstance(genres, list) else None,
+            released=movie_data.get("released"),
+            rating=movie_data.get("rating"),
+        )
+        movies.append(movie)
+        rank += 1
+
+        logger.debug(f"Parsed movie: #{movie.rank} {movie.title} (TMDB: {movie.tmdb_id})")
+
+    if not movies:
+        raise BoxOfficeError("No movies found in Trakt box office data")
+
+    logger.info(f"Successfully parsed {len(movies)} movies from Trakt box office")
+    return movies
+
+
 class BoxOfficeService:
     """Service for fetching box office data from Trakt API."""
 
@@ -106,6 +362,7 @@ class BoxOfficeService:
         client_id: Optional[str] = None,
         api_url: Optional[str] = None,
         http_client: Optional[httpx.Client] = None,
+        rate_limiter: Optional[TraktRateLimiter] = None,
     ):
         """
         Initialize Trakt box office service.
@@ -114,16 +371,14 @@ class BoxOfficeService:
             client_id: Trakt API client ID (defaults to config)
             api_url: Trakt API base URL (defaults to config)
             http_client: Optional HTTP client for testing
+            rate_limiter: Token bucket to draw from (defaults to the shared one)
         """
         self.client_id = client_id or settings.trakt_client_id
         self.api_url = (api_url or settings.trakt_api_url).rstrip("/")
+        self.rate_limiter = rate_limiter or get_trakt_rate_limiter()
 
         self.client = http_client or httpx.Client(
-            headers={
-                "Content-Type": "application/json",
-                "trakt-api-version": "2",
-                "trakt-api-key": self.client_id,
-            },
+            headers=trakt_headers(self.client_id),
             timeout=30.0,
         )
 
@@ -159,13 +414,21 @@ class BoxOfficeService:
         last_error = None
         for attempt in range(self.MAX_RETRIES):
             try:
+                wait = self.rate_limiter.reserve()
+                if wait > 0:
+                    time.sleep(wait)
                 response = self.client.get(url)
+                self.rate_limiter.update(response.headers)
                 response.raise_for_status()
                 return self._parse_trakt_response(response.json())
             except httpx.HTTPError as e:
                 last_error = e
                 if attempt < self.MAX_RETRIES - 1:
-                    backoff = self.INITIAL_BACKOFF * (2**attempt)
+                    # Retry-After from a 429 outranks our own schedule
+                    backoff = max(
+                        self.INITIAL_BACKOFF * (2**attempt),
+                        self.rate_limiter.backoff(),
+                    )
                     logger.warning(
                         f"Trakt API request failed (attempt {attempt + 1}/{self.MAX_RETRIES}): {e}. "
                         f"Retrying in {backoff}s..."
@@ -194,55 +457,5 @@ class BoxOfficeService:
         )
 
     def _parse_trakt_response(self, data: list) -> List[BoxOfficeMovie]:
-        """
-        Parse Trakt API box office response into BoxOfficeMovie objects.
-
-        Args:
-            data: JSON response from Trakt /movies/boxoffice endpoint
-
-        Returns:
-            List of BoxOfficeMovie objects
-        """
-        movies = []
-        rank = 1
-
-        for entry in data[:10]:  # Top 10 only
-            movie_data = entry.get("movie", {})
-            ids = movie_data.get("ids", {})
-            revenue = entry.get("revenue")
-
-            tmdb_id = ids.get("tmdb")
-            if tmdb_id is None:
-                logger.warning(
-                    f"Skipping '{movie_data.get('title', 'Unknown')}' - no TMDB ID available"
-                )
-                continue
-
-            genres = movie_data.get("genres")
-
-            movie = BoxOfficeMovie(
-                rank=rank,
-                title=movie_data.get("title", "Unknown"),
-                year=movie_data.get("year"),
-                revenue=revenue,
-                tmdb_id=tmdb_id,
-                imdb_id=ids.get("imdb"),
-                trakt_id=ids.get("trakt"),
-                trakt_slug=ids.get("slug"),
-                overview=movie_data.get("overview"),
-                runtime=movie_data.get("runtime"),
-                certification=movie_data.get("certification"),
-                genres=genres if isinstance(genres, list) else None,
-                released=movie_data.get("released"),
-                rating=movie_data.get("rating"),
-            )
-            movies.append(movie)
-            rank += 1
-
-            logger.debug(f"Parsed movie: #{movie.rank} {movie.title} (TMDB: {movie.tmdb_id})")
-
-        if not movies:
-            raise BoxOfficeError("No movies found in Trakt box office data")
-
-        logger.info(f"Successfully parsed {len(movies)} movies from Trakt box office")
-        return movies
+        """Parse a Trakt box office response (see ``parse_trakt_box_office``)."""
+        return parse_trakt_box_office(data)
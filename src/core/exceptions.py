@@ -31,6 +31,12 @@ class RadarrConnectionError(RadarrError):
     pass
 
 
+class RadarrTimeoutError(RadarrConnectionError):
+    """Raised when a Radarr request times out."""
+
+    pass
+
+
 class RadarrAuthenticationError(RadarrError):
     """Raised when Radarr authentication fails."""
 
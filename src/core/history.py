@@ -0,0 +1,332 @@
+"""Indexed store of scheduler run results."""
+
+import json
+import re
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, cast
+
+from ..utils.config import settings
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Per-run files written by earlier versions: 2025W10_20250310_120000.json
+# and 2025W10_latest.json
+_LEGACY_RUN_FILE = re.compile(r"^(\d{4}W\d{2})_(\d{8}_\d{6})$")
+_LEGACY_LATEST_FILE = re.compile(r"^(\d{4}W\d{2})_latest$")
+
+
+@dataclass(frozen=True)
+class HistoryRun:
+    """One stored scheduler run."""
+
+    id: int
+    week: str
+    run_at: datetime
+    data: Dict[str, Any]
+
+
+def _week_of(moment: datetime) -> str:
+    """ISO week label ("2025W10") used to group runs."""
+    year, week, _ = moment.isocalendar()
+    return f"{year}W{week:02d}"
+
+
+def _read_legacy_files(
+    directory: Path,
+) -> Tuple[List[Tuple[float, str, str]], List[Path]]:
+    """
+    Read per-run JSON files written by earlier versions.
+
+    A week's latest file duplicates its newest run file, so it is only
+    imported once the run files of that week have aged out.
+
+    Args:
+        directory: History directory
+
+    Returns:
+        (run time, week, JSON text) per run, and the files that were read
+    """
+    runs: List[Tuple[float, str, str]] = []
+    files: List[Path] = []
+    run_weeks = set()
+    latest_files = []
+    for file in sorted(directory.glob("*.json")):
+        latest_match = _LEGACY_LATEST_FILE.match(file.stem)
+        run_match = _LEGACY_RUN_FILE.match(file.stem)
+        if latest_match:
+            latest_files.append((file, latest_match.group(1)))
+        elif run_match:
+            try:
+                run_at = datetime.strptime(run_match.group(2), "%Y%m%d_%H%M%S")
+                runs.append((run_at.timestamp(), run_match.group(1), file.read_text()))
+            except (OSError, ValueError) as e:
+                logger.warning(f"Skipping unreadable history file {file.name}: {e}")
+                continue
+            run_weeks.add(run_match.group(1))
+            files.append(file)
+
+    for file, week in latest_files:
+        if week not in run_weeks:
+            try:
+                runs.append((file.stat().st_mtime, week, file.read_text()))
+            except OSError as e:
+                logger.warning(f"Skipping unreadable history file {file.name}: {e}")
+                continue
+        files.append(file)
+    return runs, files
+
+
+class HistoryStore:
+    """
+    SQLite-backed history of scheduler runs.
+
+    Runs are appended to a table keyed by an increasing ID with an index on
+    run time, and a second table points at the latest run of each ISO week.
+    Recent runs, the latest run and per-week results are therefore index
+    lookups however many runs are kept. Runs older than the retention
+    period are compacted away on append, except the latest run of each
+    week. Per-run JSON files from earlier versions are imported (and
+    removed) when the store is first opened. Storage errors are logged;
+    reads then return nothing and writes return None.
+    """
+
+    def __init__(
+        self,
+        path: Callable[[], Path],
+        retention_days: Callable[[], int],
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Initialize the store; the database is opened on first use.
+
+        Args:
+            path: Returns the SQLite file location; legacy JSON files are
+                read from the same directory
+            retention_days: Returns how long runs are kept
+            clock: Wall-clock time source (overridable for tests)
+        """
+        self._path = path
+        self._retention_days = retention_days
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_path: Optional[Path] = None
+        self._counters = {"appended": 0, "compacted": 0, "imported": 0, "errors": 0}
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open (or reopen, if the data directory changed) the database."""
+        path = Path(self._path())
+        if self._conn is None or self._conn_path != path:
+            if self._conn is not None:
+                self._conn.close()
+            path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(path, check_same_thread=False)
+            # Must precede table creation to take effect on a new database
+            conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS runs ("
+                "id INTEGER PRIMARY KEY AUTOINCREMENT, week TEXT NOT NULL, "
+                "run_at REAL NOT NULL, data TEXT NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS runs_run_at ON runs (run_at)")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS latest ("
+                "week TEXT PRIMARY KEY, run_id INTEGER NOT NULL)"
+            )
+            conn.commit()
+            self._conn, self._conn_path = conn, path
+            self._import_legacy(conn, path.parent)
+        return self._conn
+
+    def append(self, results: Dict[str, Any]) -> Optional[int]:
+        """
+        Store the results of a run and compact expired runs.
+
+        Args:
+            results: Run results (JSON-serializable; other values are
+                stored as strings)
+
+        Returns:
+            ID of the stored run, or None if it could not be stored
+        """
+        now = self._clock()
+        week = _week_of(datetime.fromtimestamp(now))
+        try:
+            data = json.dumps(results, default=str)
+            with self._lock:
+                conn = self._connect()
+                run_id = self._insert(conn, week, now, data)
+                self._counters["appended"] += 1
+                self._compact(conn, now)
+                conn.commit()
+                return run_id
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            self._record_error("write", e)
+            return None
+
+    def update(self, run_id: int, results: Dict[str, Any]) -> None:
+        """
+        Replace the stored results of a run (e.g. to add final timings).
+
+        Args:
+            run_id: ID returned by ``append``
+            results: Complete run results
+        """
+        try:
+            data = json.dumps(results, default=str)
+            with self._lock:
+                conn = self._connect()
+                conn.execute("UPDATE runs SET data = ? WHERE id = ?", (data, run_id))
+                conn.commit()
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            self._record_error("write", e)
+
+    def recent(self, limit: int = 20) -> List[HistoryRun]:
+        """
+        Most recent runs, newest first.
+
+        Args:
+            limit: Maximum number of runs
+
+        Returns:
+            Stored runs
+        """
+        return self._query(
+            "SELECT id, week, run_at, data FROM runs ORDER BY id DESC LIMIT ?",
+            (limit,),
+        )
+
+    def last(self) -> Optional[HistoryRun]:
+        """The most recent run, if any."""
+        runs = self.recent(1)
+        return runs[0] if runs else None
+
+    def latest_per_week(self, limit: int = 10) -> List[HistoryRun]:
+        """
+        Latest run of each week, newest week first.
+
+        Args:
+            limit: Maximum number of weeks
+
+        Returns:
+            Stored runs
+        """
+        return self._query(
+            "SELECT r.id, r.week, r.run_at, r.data FROM latest AS l "
+            "JOIN runs AS r ON r.id = l.run_id ORDER BY l.week DESC LIMIT ?",
+            (limit,),
+        )
+
+    def _query(self, sql: str, params: Tuple[Any, ...]) -> List[HistoryRun]:
+        """Run a select returning runs."""
+        try:
+            with self._lock:
+                rows = self._connect().execute(sql, params).fetchall()
+            runs = []
+            for run_id, week, run_at, data in rows:
+                results = json.loads(data)
+                if isinstance(results, dict):
+                    runs.append(
+                        HistoryRun(
+                            run_id, week, datetime.fromtimestamp(run_at), results
+                        )
+                    )
+            return runs
+        except (sqlite3.Error, ValueError) as e:
+            self._record_error("read", e)
+            return []
+
+    @staticmethod
+    def _insert(conn: sqlite3.Connection, week: str, run_at: float, data: str) -> int:
+        """Add a run and make it the latest of its week. Lock held."""
+        cursor = conn.execute(
+            "INSERT INTO runs (week, run_at, data) VALUES (?, ?, ?)",
+            (week, run_at, data),
+        )
+        conn.execute(
+            "INSERT OR REPLACE INTO latest (week, run_id) VALUES (?, ?)",
+            (week, cursor.lastrowid),
+        )
+        # Always set after a successful INSERT
+        return cast(int, cursor.lastrowid)
+
+    def _compact(self, conn: sqlite3.Connection, now: float) -> None:
+        """Delete runs past retention, keeping each week's latest. Lock held."""
+        cutoff = now - self._retention_days() * 86400
+        deleted = conn.execute(
+            "DELETE FROM runs WHERE run_at < ? "
+            "AND id NOT IN (SELECT run_id FROM latest)",
+            (cutoff,),
+        ).rowcount
+        if deleted > 0:
+            self._counters["compacted"] += deleted
+            conn.execute("PRAGMA incremental_vacuum").fetchall()
+            logger.debug(f"Compacted {deleted} history runs older than {cutoff}")
+
+    def _import_legacy(self, conn: sqlite3.Connection, directory: Path) -> None:
+        """Move per-run JSON files from earlier versions into the store. Lock held."""
+        runs, files = _read_legacy_files(directory)
+        if not files:
+            return
+        try:
+            for run_at, week, data in sorted(runs):
+                self._insert(conn, week, run_at, data)
+            conn.commit()
+        except sqlite3.Error as e:
+            conn.rollback()
+            self._counters["errors"] += 1
+            logger.warning(f"History import failed: {e}")
+            return
+        self._counters["imported"] += len(runs)
+        for file in files:
+            file.unlink(missing_ok=True)
+        logger.info(f"Imported {len(runs)} history runs from {len(files)} files")
+
+    def _record_error(self, action: str, error: Exception) -> None:
+        """Count and log a storage failure."""
+        with self._lock:
+            self._counters["errors"] += 1
+        logger.warning(f"History {action} failed: {error}")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+            self._conn, self._conn_path = None, None
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters, stored run count and retention."""
+        try:
+            with self._lock:
+                size = (
+                    self._connect().execute("SELECT COUNT(*) FROM runs").fetchone()[0]
+                )
+        except sqlite3.Error:
+            size = None
+        with self._lock:
+            counters = dict(self._counters)
+        return {
+            **counters,
+            "runs": size,
+            "retention_days": self._retention_days(),
+        }
+
+
+_history_store = HistoryStore(
+    path=lambda: settings.get_history_path() / "runs.sqlite3",
+    retention_days=lambda: settings.boxarr_data_history_retention_days,
+)
+
+
+def get_history_store() -> HistoryStore:
+    """Get the history store for the configured data directory."""
+    return _history_store
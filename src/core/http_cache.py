@@ -0,0 +1,308 @@
+"""Persistent conditional-request cache for Trakt API responses."""
+
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Mapping, Optional
+from urllib.parse import urlencode
+
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Trakt is queried for a handful of endpoints; this is plenty
+MAX_ENTRIES = 256
+
+
+@dataclass
+class CachedResponse:
+    """A stored response body with its validators."""
+
+    data: Any
+    etag: Optional[str]
+    last_modified: Optional[str]
+    expires_at: float
+
+    def is_fresh(self, now: float) -> bool:
+        """Whether the entry may be served without asking the server."""
+        return now < self.expires_at
+
+    def validators(self) -> Dict[str, str]:
+        """Headers for a conditional request revalidating this entry."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def freshness_lifetime(headers: Mapping[str, Any], max_age: float) -> Optional[float]:
+    """
+    Seconds a response may be served locally.
+
+    ``no-store`` responses are not cached and ``no-cache`` ones are
+    revalidated on every use. Otherwise the server's ``max-age`` wins,
+    shorter or longer; the configured lifetime only applies when the
+    server sends none.
+
+    Args:
+        headers: Response headers
+        max_age: Default freshness lifetime in seconds
+
+    Returns:
+        Lifetime in seconds, or None if the response must not be stored
+    """
+    directives = {}
+    for part in str(headers.get("Cache-Control") or "").split(","):
+        name, _, value = part.strip().partition("=")
+        directives[name.lower()] = value.strip('"')
+    if "no-store" in directives:
+        return None
+    if "no-cache" in directives:
+        return 0.0
+    if "max-age" not in directives:
+        return max_age
+    try:
+        return max(0.0, float(directives["max-age"]))
+    except ValueError:
+        return max_age
+
+
+class HTTPResponseCache:
+    """
+    SQLite-backed HTTP cache with an in-memory front for fresh entries.
+
+    Fresh entries are answered from memory without touching the network
+    or disk. Stale ones keep their ETag/Last-Modified so the client can
+    revalidate with a conditional request and reuse the body on a 304.
+    Storage errors are logged and treated as misses; the cache never makes
+    a request fail.
+    """
+
+    def __init__(
+        self,
+        path: Callable[[], Path],
+        max_age: Callable[[], float],
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Initialize the cache; the database is opened on first use.
+
+        Args:
+            path: Returns the SQLite file location
+            max_age: Returns the default freshness lifetime in seconds,
+                used when the server sends no max-age (0 disables caching)
+            clock: Wall-clock time source (overridable for tests)
+        """
+        self._path = path
+        self._max_age = max_age
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._memory: Dict[str, CachedResponse] = {}
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_path: Optional[Path] = None
+        self._counters = {
+            "hits": 0,
+            "misses": 0,
+            "revalidated": 0,
+            "stores": 0,
+            "errors": 0,
+        }
+
+    @staticmethod
+    def key_for(url: str, params: Optional[Mapping[str, Any]] = None) -> str:
+        """Cache key for a GET request: the URL with sorted query parameters."""
+        if not params:
+            return url
+        return f"{url}?{urlencode(sorted(params.items()))}"
+
+    @property
+    def enabled(self) -> bool:
+        """Whether caching is switched on (max-age above zero)."""
+        return self._max_age() > 0
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open (or reopen, if the data directory changed) the database."""
+        path = Path(self._path())
+        if self._conn is None or self._conn_path != path:
+            if self._conn is not None:
+                self._conn.close()
+            path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, body TEXT NOT NULL, etag TEXT, "
+                "last_modified TEXT, expires_at REAL NOT NULL, "
+                "stored_at REAL NOT NULL)"
+            )
+            self._conn, self._conn_path = conn, path
+            self._memory.clear()
+        return self._conn
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """
+        Return the stored response for ``key``, fresh or stale.
+
+        Args:
+            key: See ``key_for``
+
+        Returns:
+            Cached response, or None if nothing is stored
+        """
+        if not self.enabled:
+            return None
+        try:
+            with self._lock:
+                entry = self._memory.get(key)
+                if entry is None:
+                    row = (
+                        self._connect()
+                        .execute(
+                            "SELECT body, etag, last_modified, expires_at "
+                            "FROM responses WHERE key = ?",
+                            (key,),
+                        )
+                        .fetchone()
+                    )
+                    if row is not None:
+                        entry = CachedResponse(json.loads(row[0]), *row[1:])
+                        self._memory[key] = entry
+                fresh = entry is not None and entry.is_fresh(self._clock())
+                self._counters["hits" if fresh else "misses"] += 1
+                return entry
+        except (sqlite3.Error, ValueError) as e:
+            self._record_error("read", e)
+            return None
+
+    def in_memory(self, key: str) -> bool:
+        """
+        Whether ``get(key)`` can be answered without touching the disk.
+
+        Lets asyncio callers serve memory hits inline and move only real
+        SQLite reads to a worker thread.
+        """
+        with self._lock:
+            return key in self._memory
+
+    def is_fresh(self, entry: CachedResponse) -> bool:
+        """Whether ``entry`` can be served without a request."""
+        return entry.is_fresh(self._clock())
+
+    def put(
+        self, key: str, data: Any, headers: Mapping[str, Any]
+    ) -> Optional[CachedResponse]:
+        """
+        Store a 200 response.
+
+        Args:
+            key: See ``key_for``
+            data: Decoded JSON body
+            headers: Response headers (validators and Cache-Control)
+
+        Returns:
+            The stored entry, or None if the response may not be cached
+        """
+        lifetime = freshness_lifetime(headers, self._max_age())
+        if not self.enabled or lifetime is None:
+            return None
+        entry = CachedResponse(
+            data=data,
+            etag=headers.get("ETag"),
+            last_modified=headers.get("Last-Modified"),
+            expires_at=self._clock() + lifetime,
+        )
+        self._write(key, entry)
+        return entry
+
+    def revalidated(
+        self, key: str, entry: CachedResponse, headers: Mapping[str, Any]
+    ) -> CachedResponse:
+        """
+        Renew an entry after the server answered 304 Not Modified.
+
+        Args:
+            key: See ``key_for``
+            entry: The entry that was revalidated
+            headers: 304 response headers
+
+        Returns:
+            The renewed entry
+        """
+        lifetime = freshness_lifetime(headers, self._max_age()) or 0.0
+        renewed = CachedResponse(
+            data=entry.data,
+            etag=headers.get("ETag") or entry.etag,
+            last_modified=headers.get("Last-Modified") or entry.last_modified,
+            expires_at=self._clock() + lifetime,
+        )
+        with self._lock:
+            self._counters["revalidated"] += 1
+        self._write(key, renewed)
+        return renewed
+
+    def _write(self, key: str, entry: CachedResponse) -> None:
+        """Persist an entry and keep it in memory."""
+        try:
+            body = json.dumps(entry.data)
+            with self._lock:
+                conn = self._connect()
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        key,
+                        body,
+                        entry.etag,
+                        entry.last_modified,
+                        entry.expires_at,
+                        self._clock(),
+                    ),
+                )
+                conn.execute(
+                    "DELETE FROM responses WHERE key NOT IN (SELECT key FROM "
+                    "responses ORDER BY stored_at DESC LIMIT ?)",
+                    (MAX_ENTRIES,),
+                )
+                conn.commit()
+                self._memory[key] = entry
+                self._counters["stores"] += 1
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            self._record_error("write", e)
+
+    def _record_error(self, action: str, error: Exception) -> None:
+        """Count and log a storage failure."""
+        with self._lock:
+            self._counters["errors"] += 1
+        logger.warning(f"Trakt response cache {action} failed: {error}")
+
+    def clear(self) -> None:
+        """Remove every cached response."""
+        try:
+            with self._lock:
+                self._memory.clear()
+                conn = self._connect()
+                conn.execute("DELETE FROM responses")
+                conn.commit()
+        except sqlite3.Error as e:
+            self._record_error("clear", e)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+            self._conn, self._conn_path = None, None
+            self._memory.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and settings."""
+        with self._lock:
+            return {
+                **self._counters,
+                "in_memory": len(self._memory),
+                "max_age_seconds": self._max_age(),
+            }
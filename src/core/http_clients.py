@@ -0,0 +1,250 @@
+"""Process-wide pooled HTTP clients for outbound API calls."""
+
+import asyncio
+import importlib.util
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+
+from ..utils.config import settings
+from ..utils.logger import get_logger
+from .boxoffice import trakt_headers
+
+logger = get_logger(__name__)
+
+
+def _http2_available() -> bool:
+    """Check whether the optional ``h2`` package needed for HTTP/2 is installed."""
+    return importlib.util.find_spec("h2") is not None
+
+
+class HTTPClientRegistry:
+    """
+    Registry of long-lived, connection-pooled ``httpx`` clients.
+
+    Clients are keyed by base URL and API key so that every RadarrService
+    pointed at the same instance shares one keep-alive pool instead of
+    paying a fresh TCP/TLS handshake per request handler.
+    """
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._lock = threading.Lock()
+        self._clients: Dict[Tuple[str, str], httpx.Client] = {}
+        # Async clients are bound to the event loop that created them
+        self._async_clients: Dict[Tuple[str, str, int], httpx.AsyncClient] = {}
+        self._closed = False
+
+    @staticmethod
+    def _limits() -> httpx.Limits:
+        """Build pool limits from settings."""
+        return httpx.Limits(
+            max_connections=settings.radarr_http_max_connections,
+            max_keepalive_connections=settings.radarr_http_max_keepalive_connections,
+            keepalive_expiry=settings.radarr_http_keepalive_expiry_seconds,
+        )
+
+    @staticmethod
+    def _use_http2() -> bool:
+        """Resolve the HTTP/2 setting, falling back when ``h2`` is missing."""
+        if not settings.radarr_http_http2:
+            return False
+        if not _http2_available():
+            logger.warning(
+                "HTTP/2 requested for Radarr but the 'h2' package is not installed; "
+                "falling back to HTTP/1.1 (pip install 'httpx[http2]')"
+            )
+            return False
+        return True
+
+    def _build_client(self, base_url: str, key: str) -> httpx.Client:
+        """Create a blocking client for a Radarr instance with pool settings."""
+        return httpx.Client(
+            base_url=base_url,
+            headers={"X-Api-Key": key},
+            timeout=settings.radarr_http_timeout_seconds,
+            limits=self._limits(),
+            http2=self._use_http2(),
+            follow_redirects=True,
+        )
+
+    def radarr_client(
+        self, url: Optional[str] = None, api_key: Optional[str] = None
+    ) -> httpx.Client:
+        """
+        Get the shared client for a Radarr instance.
+
+        Args:
+            url: Radarr URL (defaults to config)
+            api_key: Radarr API key (defaults to config)
+
+        Returns:
+            Pooled httpx.Client bound to the Radarr base URL
+        """
+        base_url = (url or str(settings.radarr_url)).rstrip("/")
+        key = api_key or settings.radarr_api_key
+        cache_key = (base_url, key)
+
+        with self._lock:
+            client = self._clients.get(cache_key)
+            if client is None or client.is_closed:
+                client = self._build_client(base_url, key)
+                self._clients[cache_key] = client
+                self._closed = False
+                logger.debug(f"Created pooled Radarr client for {base_url}")
+            return client
+
+    def unpooled_radarr_client(self, url: str, api_key: str) -> httpx.Client:
+        """
+        Create a client that is not kept in the registry.
+
+        Used for one-off calls against credentials that may never be used
+        again (such as the setup page's connection test), so the caller owns
+        the client and closes it instead of leaving a pool open until shutdown.
+
+        Args:
+            url: Radarr URL
+            api_key: Radarr API key
+
+        Returns:
+            New httpx.Client bound to the Radarr base URL
+        """
+        return self._build_client(url.rstrip("/"), api_key)
+
+    def async_radarr_client(
+        self, url: Optional[str] = None, api_key: Optional[str] = None
+    ) -> httpx.AsyncClient:
+        """
+        Get the shared asyncio client for a Radarr instance.
+
+        Must be called from a running event loop; each loop gets its own
+        pool because asyncio connections cannot be shared across loops.
+
+        Args:
+            url: Radarr URL (defaults to config)
+            api_key: Radarr API key (defaults to config)
+
+        Returns:
+            Pooled httpx.AsyncClient bound to the Radarr base URL
+        """
+        base_url = (url or str(settings.radarr_url)).rstrip("/")
+        key = api_key or settings.radarr_api_key
+        cache_key = (base_url, key, id(asyncio.get_running_loop()))
+
+        with self._lock:
+            client = self._async_clients.get(cache_key)
+            if client is None or client.is_closed:
+                client = httpx.AsyncClient(
+                    base_url=base_url,
+                    headers={"X-Api-Key": key},
+                    timeout=settings.radarr_http_timeout_seconds,
+                    limits=self._limits(),
+                    http2=self._use_http2(),
+                    follow_redirects=True,
+                )
+                self._async_clients[cache_key] = client
+                self._closed = False
+                logger.debug(f"Created pooled async Radarr client for {base_url}")
+            return client
+
+    def async_trakt_client(self, client_id: str) -> httpx.AsyncClient:
+        """
+        Get the shared asyncio client for the Trakt API.
+
+        Like ``async_radarr_client``, each event loop gets its own pool.
+
+        Args:
+            client_id: Trakt API client ID sent with every request
+
+        Returns:
+            Pooled httpx.AsyncClient carrying the Trakt headers
+        """
+        cache_key = ("trakt", client_id, id(asyncio.get_running_loop()))
+
+        with self._lock:
+            client = self._async_clients.get(cache_key)
+            if client is None or client.is_closed:
+                client = httpx.AsyncClient(
+                    headers=trakt_headers(client_id), timeout=30.0
+                )
+                self._async_clients[cache_key] = client
+                self._closed = False
+                logger.debug("Created pooled async Trakt client")
+            return client
+
+    def _take_clients(self) -> Tuple[List[httpx.Client], List[httpx.AsyncClient]]:
+        """Detach every pooled client from the registry and mark it closed."""
+        with self._lock:
+            clients = list(self._clients.values())
+            async_clients = list(self._async_clients.values())
+            self._clients.clear()
+            self._async_clients.clear()
+            self._closed = True
+        return clients, async_clients
+
+    @staticmethod
+    def _close_sync(clients: List[httpx.Client]) -> None:
+        """Close blocking clients, logging rather than raising."""
+        for client in clients:
+            try:
+                client.close()
+            except Exception as e:
+                logger.debug(f"Error closing pooled client: {e}")
+
+    def close(self) -> None:
+        """
+        Close every pooled client.
+
+        Async clients are dropped without awaiting their shutdown; use
+        ``aclose()`` from an event loop to close them cleanly.
+        """
+        clients, _ = self._take_clients()
+        self._close_sync(clients)
+
+    async def aclose(self) -> None:
+        """Close every pooled client, awaiting async clients on this loop."""
+        clients, async_clients = self._take_clients()
+        self._close_sync(clients)
+        for client in async_clients:
+            try:
+                await client.aclose()
+            except Exception as e:
+                # Clients from another (finished) loop cannot be awaited here
+                logger.debug(f"Error closing pooled async client: {e}")
+
+    @property
+    def closed(self) -> bool:
+        """Whether ``close()`` has been called with no clients created since."""
+        return self._closed
+
+
+_registry: Optional[HTTPClientRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_client_registry() -> HTTPClientRegistry:
+    """Get the process-wide client registry, creating it on first use."""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = HTTPClientRegistry()
+        return _registry
+
+
+def close_client_registry() -> None:
+    """Close and discard the process-wide client registry."""
+    global _registry
+    with _registry_lock:
+        registry, _registry = _registry, None
+    if registry is not None:
+        registry.close()
+
+
+async def aclose_client_registry() -> None:
+    """Close and discard the process-wide client registry from an event loop."""
+    global _registry
+    with _registry_lock:
+        registry, _registry = _registry, None
+    if registry is not None:
+        await registry.aclose()
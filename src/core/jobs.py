@@ -0,0 +1,302 @@
+"""In-process priority queue for long-running update jobs."""
+
+import asyncio
+import itertools
+import threading
+import uuid
+from datetime import datetime
+from enum import Enum, IntEnum
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Finished jobs kept for status queries
+MAX_FINISHED_JOBS = 100
+
+
+class JobPriority(IntEnum):
+    """Job priority; lower values run first."""
+
+    MANUAL = 0
+    SCHEDULED = 10
+    BACKGROUND = 20
+
+
+class JobStatus(str, Enum):
+    """Lifecycle state of a job."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class Job:
+    """
+    A queued unit of work and its progress.
+
+    Progress may be reported from worker threads; every change bumps
+    ``version`` so watchers can tell when to send an update.
+    """
+
+    def __init__(
+        self,
+        kind: str,
+        func: Callable[["Job"], Awaitable[Any]],
+        key: Optional[str] = None,
+        priority: JobPriority = JobPriority.MANUAL,
+    ):
+        """
+        Create a queued job.
+
+        Args:
+            kind: Job type (e.g. "box_office_update")
+            func: Coroutine function run with the job as its argument
+            key: Identity for coalescing duplicate submissions
+            priority: Scheduling priority
+        """
+        self.id = uuid.uuid4().hex
+        self.kind = kind
+        self.key = key
+        self.priority = priority
+        self.status = JobStatus.QUEUED
+        self.message = "Queued"
+        self.progress: Optional[int] = None
+        self.total: Optional[int] = None
+        self.result: Any = None
+        self.error: Optional[str] = None
+        self.submissions = 1
+        self.created_at = datetime.now()
+        self.started_at: Optional[datetime] = None
+        self.finished_at: Optional[datetime] = None
+        self.version = 0
+        self._func = func
+        self._lock = threading.Lock()
+        self._done: Optional[asyncio.Event] = None
+
+    @property
+    def finished(self) -> bool:
+        """Whether the job has succeeded or failed."""
+        return self.status in (JobStatus.SUCCEEDED, JobStatus.FAILED)
+
+    def report(
+        self,
+        message: str,
+        progress: Optional[int] = None,
+        total: Optional[int] = None,
+    ) -> None:
+        """
+        Update the progress shown to clients (thread-safe).
+
+        Args:
+            message: Human-readable current step
+            progress: Steps completed, if known
+            total: Total steps, if known
+        """
+        with self._lock:
+            self.message = message
+            if progress is not None:
+                self.progress = progress
+            if total is not None:
+                self.total = total
+            self.version += 1
+
+    def _set_status(self, status: JobStatus, message: str) -> None:
+        """Move the job to a new state."""
+        with self._lock:
+            self.status = status
+            self.message = message
+            if status is JobStatus.RUNNING:
+                self.started_at = datetime.now()
+            elif self.finished:
+                self.finished_at = datetime.now()
+            self.version += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-friendly form for the API."""
+        with self._lock:
+            return {
+                "id": self.id,
+                "kind": self.kind,
+                "key": self.key,
+                "priority": self.priority.name.lower(),
+                "status": self.status.value,
+                "message": self.message,
+                "progress": self.progress,
+                "total": self.total,
+                "result": self.result,
+                "error": self.error,
+                "submissions": self.submissions,
+                "created_at": self.created_at.isoformat(),
+                "started_at": self.started_at.isoformat() if self.started_at else None,
+                "finished_at": (
+                    self.finished_at.isoformat() if self.finished_at else None
+                ),
+            }
+
+
+class JobQueue:
+    """
+    Priority queue of jobs run by a fixed number of asyncio workers.
+
+    Submitting a job whose key matches one that is queued or running
+    returns the existing job instead of queueing a duplicate (raising its
+    priority if needed). Workers start on first use in the running event
+    loop; if the loop changes (e.g. between test clients), queued jobs are
+    carried over and jobs that were running are marked failed.
+    """
+
+    def __init__(self, workers: int = 1):
+        """
+        Initialize an empty queue.
+
+        Args:
+            workers: Jobs run at the same time
+        """
+        self._concurrency = workers
+        self._jobs: Dict[str, Job] = {}
+        self._active: Dict[str, Job] = {}
+        self._sequence = itertools.count()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.PriorityQueue] = None
+        self._workers: List[asyncio.Task] = []
+
+    def submit(
+        self,
+        kind: str,
+        func: Callable[[Job], Awaitable[Any]],
+        key: Optional[str] = None,
+        priority: JobPriority = JobPriority.MANUAL,
+    ) -> Tuple[Job, bool]:
+        """
+        Queue a job, or join a queued/running job with the same key.
+
+        Must be called from the event loop the workers run in.
+
+        Args:
+            kind: Job type
+            func: Coroutine function run with the job as its argument
+            key: Identity for coalescing (defaults to ``kind``)
+            priority: Scheduling priority
+
+        Returns:
+            The job and whether it was an existing one
+        """
+        self._ensure_workers()
+        key = key or kind
+        existing = self._active.get(key)
+        if existing is not None and not existing.finished:
+            existing.submissions += 1
+            if existing.status is JobStatus.QUEUED and priority < existing.priority:
+                existing.priority = priority
+                self._push(existing)
+            logger.info(f"Coalesced {kind} request into job {existing.id}")
+            return existing, True
+
+        job = Job(kind, func, key=key, priority=priority)
+        job._done = asyncio.Event()
+        self._jobs[job.id] = job
+        self._active[key] = job
+        self._push(job)
+        self._prune()
+        logger.info(f"Queued {kind} job {job.id} ({priority.name.lower()})")
+        return job, False
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """Look up a job by ID."""
+        return self._jobs.get(job_id)
+
+    def list(self) -> List[Job]:
+        """Known jobs, newest first."""
+        return sorted(self._jobs.values(), key=lambda j: j.created_at, reverse=True)
+
+    async def wait(self, job: Job) -> Job:
+        """Wait until ``job`` has finished."""
+        if not job.finished and job._done is not None:
+            await job._done.wait()
+        return job
+
+    async def shutdown(self) -> None:
+        """Stop the workers; queued jobs are left unstarted."""
+        if self._loop is not asyncio.get_running_loop():
+            self._workers = []  # Their loop is gone already
+            return
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    def _push(self, job: Job) -> None:
+        """Add a heap entry for ``job`` (stale entries are skipped later)."""
+        assert self._queue is not None
+        self._queue.put_nowait((job.priority, next(self._sequence), job))
+
+    def _ensure_workers(self) -> None:
+        """Bind to the running loop and keep the worker tasks alive."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._queue = asyncio.PriorityQueue()
+            self._workers = []
+            for job in self._jobs.values():
+                if job.status is JobStatus.RUNNING:
+                    self._finish(job, error="Interrupted")
+                elif job.status is JobStatus.QUEUED:
+                    job._done = asyncio.Event()
+                    self._push(job)
+        self._workers = [w for w in self._workers if not w.done()]
+        while len(self._workers) < self._concurrency:
+            self._workers.append(loop.create_task(self._work()))
+
+    async def _work(self) -> None:
+        """Worker loop: run the highest-priority queued job."""
+        assert self._queue is not None
+        queue = self._queue
+        while True:
+            _, _, job = await queue.get()
+            if job.status is not JobStatus.QUEUED:
+                continue  # Superseded entry of a re-prioritized job
+            job._set_status(JobStatus.RUNNING, "Running")
+            try:
+                result = await job._func(job)
+            except asyncio.CancelledError:
+                self._finish(job, error="Cancelled")
+                raise
+            except Exception as e:
+                logger.error(f"Job {job.id} ({job.kind}) failed: {e}")
+                self._finish(job, error=str(e))
+            else:
+                self._finish(job, result=result)
+
+    def _finish(
+        self, job: Job, result: Any = None, error: Optional[str] = None
+    ) -> None:
+        """Record the outcome and release waiters."""
+        job.result, job.error = result, error
+        if error is None:
+            job._set_status(JobStatus.SUCCEEDED, "Completed")
+        else:
+            job._set_status(JobStatus.FAILED, error)
+        if self._active.get(job.key or job.kind) is job:
+            del self._active[job.key or job.kind]
+        if job._done is not None:
+            job._done.set()
+
+    def _prune(self) -> None:
+        """Forget the oldest finished jobs beyond ``MAX_FINISHED_JOBS``."""
+        finished = [job for job in self.list() if job.finished]
+        for job in finished[MAX_FINISHED_JOBS:]:
+            del self._jobs[job.id]
+
+
+_job_queue: Optional[JobQueue] = None
+
+
+def get_job_queue() -> JobQueue:
+    """Get the process-wide job queue, creating it on first use."""
+    global _job_queue
+    if _job_queue is None:
+        _job_queue = JobQueue()
+    return _job_queue
@@ -1,18 +1,97 @@
 """JSON data generator for weekly box office pages."""
 
 import json
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
 
 from ..utils.config import settings
 from ..utils.logger import get_logger
-from .boxoffice import MatchResult
+from .boxoffice import BoxOfficeMovie, MatchResult, match_box_office_to_radarr
+from .library import LibraryIndex
+from .metrics import carry_run_stats
 from .models import MovieStatus
-from .radarr import RadarrService
+from .radarr import RadarrMovie, RadarrService
 
 logger = get_logger(__name__)
 
+# Radarr-derived fields of a week entry for a movie not in the library
+UNMATCHED_RADARR_FIELDS: Dict[str, Any] = {
+    "radarr_id": None,
+    "radarr_title": None,
+    "status": "Not in Radarr",
+    "status_color": "#718096",
+    "status_icon": "\u2795",
+    "quality_profile_id": None,
+    "quality_profile_name": None,
+    "has_file": False,
+    "can_upgrade_quality": False,
+}
+
+# Week files written together by bulk regeneration
+REGENERATE_BATCH_SIZE = 25
+
+# Stored week files: 2025W10.json
+_WEEK_FILE = re.compile(r"^(\d{4})W(\d{2})$")
+
+
+class _StoredWeek(NamedTuple):
+    """A stored week re-matched for regeneration."""
+
+    path: Path
+    year: int
+    week: int
+    text: str
+    match_results: List[MatchResult]
+
+
+def reconstruct_box_office_movies(metadata: Dict[str, Any]) -> List[BoxOfficeMovie]:
+    """
+    Rebuild the box office movies of a stored week.
+
+    Trakt only serves the current week, so past weeks are re-matched from
+    the box office data kept in their JSON files.
+
+    Args:
+        metadata: Contents of a week file
+
+    Returns:
+        Box office movies in stored order
+    """
+    movies = []
+    for m in metadata.get("movies", []):
+        genres_raw = m.get("genres")
+        if isinstance(genres_raw, str) and genres_raw:
+            genres_list = [g.strip() for g in genres_raw.split(",")]
+        elif isinstance(genres_raw, list):
+            genres_list = genres_raw
+        else:
+            genres_list = None
+
+        movies.append(
+            BoxOfficeMovie(
+                rank=m.get("rank", 0),
+                title=m.get("title", "Unknown"),
+                year=m.get("year"),
+                revenue=m.get("revenue"),
+                tmdb_id=m.get("tmdb_id"),
+                imdb_id=m.get("imdb_id"),
+                overview=m.get("overview"),
+                runtime=m.get("runtime"),
+                certification=m.get("certification"),
+                genres=genres_list,
+                released=m.get("released"),
+                rating=m.get("rating"),
+                poster=m.get("poster"),
+            )
+        )
+    return movies
+
 
 class WeeklyDataGenerator:
     """Generates JSON data files for weekly box office data."""
@@ -34,6 +113,7 @@ class WeeklyDataGenerator:
         year: int,
         week: int,
         radarr_movies: Optional[List] = None,
+        enrich_posters: bool = True,
     ) -> Path:
         """
         Generate JSON data file for a week's box office data.
@@ -43,10 +123,48 @@ class WeeklyDataGenerator:
             year: Year
             week: Week number
             radarr_movies: Optional list of Radarr movies (for compatibility)
+            enrich_posters: Look up missing posters first (disable when the
+                caller already ran ``enrich_posters`` on a batch of weeks)
 
         Returns:
             Path to generated JSON file
         """
+        if enrich_posters:
+            self.enrich_posters([match_results])
+
+        # Get quality profiles if available
+        quality_profiles, ultra_hd_id = self._load_profile_context()
+
+        metadata = self._build_week(
+            match_results, year, week, quality_profiles, ultra_hd_id
+        )
+        metadata_path = self.output_dir / f"{year}W{week:02d}.json"
+        self._write_weeks([(metadata_path, json.dumps(metadata, indent=2))])
+
+        logger.info(f"Generated weekly data: {metadata_path}")
+        return metadata_path
+
+    def _build_week(
+        self,
+        match_results: List[MatchResult],
+        year: int,
+        week: int,
+        quality_profiles: Dict[int, str],
+        ultra_hd_id: Optional[int],
+    ) -> Dict[str, Any]:
+        """
+        Build the contents of a week file.
+
+        Args:
+            match_results: Movie matching results
+            year: Year
+            week: Week number
+            quality_profiles: Profile ID -> name
+            ultra_hd_id: Ultra-HD profile ID, if any
+
+        Returns:
+            Week metadata with full movie data
+        """
         # Calculate friday and sunday from year and week
         from datetime import date, timedelta
 
@@ -56,40 +174,6 @@ class WeeklyDataGenerator:
         friday = datetime.combine(monday + timedelta(days=4), datetime.min.time())
         sunday = datetime.combine(monday + timedelta(days=6), datetime.min.time())
 
-        # Get quality profiles if available
-        quality_profiles = {}
-        ultra_hd_id = None
-
-        if self.radarr_service:
-            try:
-                profiles = self.radarr_service.get_quality_profiles()
-                quality_profiles = {p.id: p.name for p in profiles}
-
-                # Find Ultra-HD profile
-                for p in profiles:
-                    if (
-                        "ultra" in p.name.lower()
-                        or "uhd" in p.name.lower()
-                        or "2160" in p.name
-                    ):
-                        ultra_hd_id = p.id
-                        break
-
-                if not ultra_hd_id and settings.radarr_quality_profile_upgrade:
-                    upgrade_profile = next(
-                        (
-                            p
-                            for p in profiles
-                            if p.name == settings.radarr_quality_profile_upgrade
-                        ),
-                        None,
-                    )
-                    if upgrade_profile:
-                        ultra_hd_id = upgrade_profile.id
-
-            except Exception as e:
-                logger.warning(f"Could not fetch quality profiles: {e}")
-
         # Prepare movie data
         movies_data = []
         for result in match_results:
@@ -122,79 +206,19 @@ class WeeklyDataGenerator:
                 "released": bom.released,
                 "poster": bom.poster,
                 # Radarr fields (defaults for unmatched)
-                "radarr_id": None,
-                "radarr_title": None,
-                "status": "Not in Radarr",
-                "status_color": "#718096",
-                "status_icon": "\u2795",
-                "quality_profile_id": None,
-                "quality_profile_name": None,
-                "has_file": False,
-                "can_upgrade_quality": False,
+                **UNMATCHED_RADARR_FIELDS,
             }
 
             if result.is_matched and result.radarr_movie:
                 movie = result.radarr_movie
                 movie_data.update(
-                    {
-                        "radarr_id": movie.id,
-                        "radarr_title": movie.title,
-                        "quality_profile_id": movie.qualityProfileId,
-                        "quality_profile_name": quality_profiles.get(
-                            movie.qualityProfileId, ""
-                        ),
-                        "has_file": movie.hasFile,
-                        "poster": movie.poster_url or bom.poster,
-                        "can_upgrade_quality": bool(
-                            movie.qualityProfileId
-                            and ultra_hd_id
-                            and movie.qualityProfileId != ultra_hd_id
-                            and settings.boxarr_features_quality_upgrade
-                        ),
-                    }
+                    self._radarr_fields(movie, quality_profiles, ultra_hd_id)
                 )
-
-                # Initial status (will be updated dynamically when page loads)
-                if movie.hasFile:
-                    movie_data["status"] = "Downloaded"
-                    movie_data["status_color"] = "#48bb78"
-                    movie_data["status_icon"] = "\u2705"
-                elif movie.status == MovieStatus.RELEASED and movie.isAvailable:
-                    movie_data["status"] = "Missing"
-                    movie_data["status_color"] = "#f56565"
-                    movie_data["status_icon"] = "\u274c"
-                elif movie.status == MovieStatus.IN_CINEMAS:
-                    movie_data["status"] = "In Cinemas"
-                    movie_data["status_color"] = "#f6ad55"
-                    movie_data["status_icon"] = "\U0001f3ac"
-                else:
-                    movie_data["status"] = "Pending"
-                    movie_data["status_color"] = "#ed8936"
-                    movie_data["status_icon"] = "\u23f3"
-            else:
-                # For unmatched movies, fetch poster from TMDB via Radarr
-                if self.radarr_service and bom.tmdb_id and not movie_data.get("poster"):
-                    try:
-                        search_results = self.radarr_service.search_movie(
-                            f"tmdb:{bom.tmdb_id}"
-                        )
-                        if search_results and len(search_results) > 0:
-                            tmdb_movie = search_results[0]
-                            poster = tmdb_movie.get("remotePoster")
-                            if poster:
-                                movie_data["poster"] = poster
-                            logger.debug(
-                                f"Enriched poster for '{bom.title}' via TMDB lookup"
-                            )
-                    except Exception as e:
-                        logger.warning(
-                            f"Could not fetch poster for '{bom.title}': {e}"
-                        )
+                movie_data["poster"] = movie.poster_url or bom.poster
 
             movies_data.append(movie_data)
 
-        # Save metadata with full movie data
-        metadata = {
+        return {
             "generated_at": datetime.now().isoformat(),
             "year": year,
             "week": week,
@@ -207,10 +231,431 @@ class WeeklyDataGenerator:
             "movies": movies_data,  # Store full movie data for display
         }
 
-        # Save JSON file
-        metadata_path = self.output_dir / f"{year}W{week:02d}.json"
-        with open(metadata_path, "w") as f:
-            json.dump(metadata, f, indent=2)
+    def generate_weeks(
+        self, weeks: List[Tuple[List[MatchResult], int, int]]
+    ) -> List[Path]:
+        """
+        Generate several weeks, looking up each missing poster only once.
 
-        logger.info(f"Generated weekly data: {metadata_path}")
-        return metadata_path
+        Args:
+            weeks: (match results, year, week) per week
+
+        Returns:
+            Paths of the generated JSON files, in input order
+        """
+        self.enrich_posters([match_results for match_results, _, _ in weeks])
+        return [
+            self.generate_weekly_data(match_results, year, week, enrich_posters=False)
+            for match_results, year, week in weeks
+        ]
+
+    def regenerate_weeks(
+        self,
+        year: Optional[int] = None,
+        progress: Optional[Callable[[str, int, int], None]] = None,
+        workers: Optional[int] = None,
+        batch_size: int = REGENERATE_BATCH_SIZE,
+    ) -> Dict[str, Any]:
+        """
+        Re-match every stored week against one library and profile snapshot.
+
+        The library index and quality profiles are read once for the whole
+        run rather than once per week. Week files are loaded and matched
+        in parallel, missing posters are looked up once across all weeks,
+        and the results are written in batches: each batch is staged to
+        temporary files and then renamed into place. Weeks whose content
+        did not change (apart from ``generated_at``) are not rewritten.
+
+        Args:
+            year: Only regenerate weeks of this year
+            progress: Called with (message, weeks done, total weeks)
+            workers: Threads for loading, matching and rendering (defaults
+                to ``boxarr.scheduler.disk_workers``)
+            batch_size: Weeks written per batch
+
+        Returns:
+            Summary with counts of weeks written, unchanged and failed
+        """
+        started = time.perf_counter()
+        paths = self.stored_week_files(year)
+        total = len(paths)
+
+        def report(message: str, done: int) -> None:
+            if progress is not None:
+                progress(message, done, total)
+
+        library = (
+            self.radarr_service.get_library_index()
+            if self.radarr_service
+            else LibraryIndex()
+        )
+        quality_profiles, ultra_hd_id = self._load_profile_context()
+
+        written, unchanged, failed = 0, 0, []
+        with ThreadPoolExecutor(
+            max_workers=workers or settings.boxarr_scheduler_disk_workers,
+            thread_name_prefix="regenerate",
+        ) as pool:
+            report(f"Matching {total} weeks against Radarr", 0)
+            weeks = []
+            for path, stored in zip(
+                paths, pool.map(partial(self._load_stored_week, library), paths)
+            ):
+                if stored is None:
+                    failed.append(path.stem)
+                else:
+                    weeks.append(stored)
+
+            self.enrich_posters([stored.match_results for stored in weeks])
+
+            render = partial(self._render_week, quality_profiles, ultra_hd_id)
+            for start in range(0, len(weeks), batch_size):
+                batch = weeks[start : start + batch_size]
+                changed = [item for item in pool.map(render, batch) if item]
+                self._write_weeks(changed)
+                written += len(changed)
+                unchanged += len(batch) - len(changed)
+                report(
+                    f"Regenerated {start + len(batch)} of {len(weeks)} weeks",
+                    start + len(batch) + len(failed),
+                )
+
+        duration_ms = round((time.perf_counter() - started) * 1000, 1)
+        logger.info(
+            f"Regenerated {total} weeks in {duration_ms / 1000:.2f}s: "
+            f"{written} written, {unchanged} unchanged, {len(failed)} failed"
+        )
+        return {
+            "weeks": total,
+            "written": written,
+            "unchanged": unchanged,
+            "failed": failed,
+            "duration_ms": duration_ms,
+        }
+
+    def stored_week_files(self, year: Optional[int] = None) -> List[Path]:
+        """
+        List the stored week files, oldest week first.
+
+        Args:
+            year: Only list weeks of this year
+
+        Returns:
+            Paths of week files
+        """
+        return [
+            path
+            for path in sorted(self.output_dir.glob("*.json"))
+            if (match := _WEEK_FILE.match(path.stem))
+            and (year is None or int(match.group(1)) == year)
+        ]
+
+    @staticmethod
+    def _load_stored_week(library: LibraryIndex, path: Path) -> Optional[_StoredWeek]:
+        """Read a week file and re-match its movies against ``library``."""
+        try:
+            text = path.read_text()
+            metadata = json.loads(text)
+            year, week = int(metadata["year"]), int(metadata["week"])
+        except (OSError, KeyError, TypeError, ValueError) as e:
+            logger.warning(f"Skipping unreadable week file {path.name}: {e}")
+            return None
+        match_results = match_box_office_to_radarr(
+            reconstruct_box_office_movies(metadata), library
+        )
+        return _StoredWeek(path, year, week, text, match_results)
+
+    def _render_week(
+        self,
+        quality_profiles: Dict[int, str],
+        ultra_hd_id: Optional[int],
+        stored: _StoredWeek,
+    ) -> Optional[Tuple[Path, str]]:
+        """Serialize a regenerated week, or None if its content is unchanged."""
+        metadata = self._build_week(
+            stored.match_results,
+            stored.year,
+            stored.week,
+            quality_profiles,
+            ultra_hd_id,
+        )
+        text = json.dumps(metadata, indent=2)
+        try:
+            previous_generated_at = json.loads(stored.text).get("generated_at")
+        except ValueError:
+            previous_generated_at = None
+        if previous_generated_at:
+            # Compare with the stored file as if generated at the same time
+            same = json.dumps(
+                {**metadata, "generated_at": previous_generated_at}, indent=2
+            )
+            if same == stored.text:
+                return None
+        return stored.path, text
+
+    @staticmethod
+    def _write_weeks(items: List[Tuple[Path, str]]) -> None:
+        """
+        Write week files atomically, as one batch.
+
+        Every file is staged first and only then renamed into place, so
+        readers never see a half-written week and a failure while staging
+        leaves the whole batch unchanged.
+
+        Args:
+            items: (path, JSON text) per week
+        """
+        staged = []
+        try:
+            for path, text in items:
+                tmp_path = path.with_suffix(".json.tmp")
+                with open(tmp_path, "w") as f:
+                    f.write(text)
+                staged.append((tmp_path, path))
+        except OSError:
+            for tmp_path, _ in staged:
+                tmp_path.unlink(missing_ok=True)
+            raise
+        for tmp_path, path in staged:
+            os.replace(tmp_path, path)
+
+    def enrich_posters(
+        self, batches: Iterable[List[MatchResult]]
+    ) -> Dict[int, Optional[str]]:
+        """
+        Fill in posters for unmatched movies across a batch of weeks.
+
+        Movies not in Radarr have no poster until looked up on TMDB
+        through Radarr. The TMDB IDs needing one are collected from every
+        week first, so a film that charted for many weeks is looked up
+        once; lookups run concurrently (up to
+        ``radarr.bulk_add_concurrency``) and posters are written back to
+        the box office movies.
+
+        Args:
+            batches: Match results of each week
+
+        Returns:
+            TMDB ID -> poster URL (None if the lookup found none)
+        """
+        pending: Dict[int, List[BoxOfficeMovie]] = {}
+        for match_results in batches:
+            for result in match_results:
+                bom = result.box_office_movie
+                if not result.is_matched and bom.tmdb_id and not bom.poster:
+                    pending.setdefault(bom.tmdb_id, []).append(bom)
+        if not pending or not self.radarr_service:
+            return {}
+
+        workers = min(len(pending), settings.radarr_bulk_add_concurrency)
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="poster-lookup"
+        ) as pool:
+            lookup = carry_run_stats(partial(self._lookup_poster, self.radarr_service))
+            posters = dict(zip(pending, pool.map(lookup, pending)))
+
+        for tmdb_id, movies in pending.items():
+            for bom in movies:
+                bom.poster = posters[tmdb_id]
+        logger.info(
+            f"Looked up posters for {len(pending)} distinct movies "
+            f"({sum(len(movies) for movies in pending.values())} week entries)"
+        )
+        return posters
+
+    @staticmethod
+    def _lookup_poster(radarr_service: RadarrService, tmdb_id: int) -> Optional[str]:
+        """
+        Find a movie's poster on TMDB via Radarr.
+
+        Args:
+            radarr_service: Radarr service to search with
+            tmdb_id: TMDB ID
+
+        Returns:
+            Poster URL, or None if not found or the lookup failed
+        """
+        try:
+            search_results = radarr_service.search_movie(f"tmdb:{tmdb_id}")
+        except Exception as e:
+            logger.warning(f"Could not fetch poster for TMDB {tmdb_id}: {e}")
+            return None
+        if not search_results:
+            return None
+        logger.debug(f"Enriched poster for TMDB {tmdb_id} via TMDB lookup")
+        return search_results[0].get("remotePoster")
+
+    def _load_profile_context(self) -> Tuple[Dict[int, str], Optional[int]]:
+        """
+        Load quality profile names and the Ultra-HD profile ID.
+
+        Returns:
+            Tuple of (profile ID -> name, Ultra-HD profile ID or None)
+        """
+        quality_profiles: Dict[int, str] = {}
+        ultra_hd_id = None
+
+        if self.radarr_service:
+            try:
+                profiles = self.radarr_service.get_quality_profiles()
+                quality_profiles = {p.id: p.name for p in profiles}
+
+                # Find Ultra-HD profile
+                for p in profiles:
+                    if (
+                        "ultra" in p.name.lower()
+                        or "uhd" in p.name.lower()
+                        or "2160" in p.name
+                    ):
+                        ultra_hd_id = p.id
+                        break
+
+                if not ultra_hd_id and settings.radarr_quality_profile_upgrade:
+                    upgrade_profile = next(
+                        (
+                            p
+                            for p in profiles
+                            if p.name == settings.radarr_quality_profile_upgrade
+                        ),
+                        None,
+                    )
+                    if upgrade_profile:
+                        ultra_hd_id = upgrade_profile.id
+
+            except Exception as e:
+                logger.warning(f"Could not fetch quality profiles: {e}")
+
+        return quality_profiles, ultra_hd_id
+
+    @staticmethod
+    def _radarr_fields(
+        movie: Any, quality_profiles: Dict[int, str], ultra_hd_id: Optional[int]
+    ) -> Dict[str, Any]:
+        """
+        Build the Radarr-derived fields of a week entry for a library movie.
+
+        Args:
+            movie: Radarr movie
+            quality_profiles: Profile ID -> name
+            ultra_hd_id: Ultra-HD profile ID, if any
+
+        Returns:
+            Fields to merge into the week entry (poster excluded)
+        """
+        fields: Dict[str, Any] = {
+            "radarr_id": movie.id,
+            "radarr_title": movie.title,
+            "quality_profile_id": movie.qualityProfileId,
+            "quality_profile_name": quality_profiles.get(movie.qualityProfileId, ""),
+            "has_file": movie.hasFile,
+            "can_upgrade_quality": bool(
+                movie.qualityProfileId
+                and ultra_hd_id
+                and movie.qualityProfileId != ultra_hd_id
+                and settings.boxarr_features_quality_upgrade
+            ),
+        }
+
+        # Initial status (will be updated dynamically when page loads)
+        if movie.hasFile:
+            fields["status"] = "Downloaded"
+            fields["status_color"] = "#48bb78"
+            fields["status_icon"] = "\u2705"
+        elif movie.status == MovieStatus.RELEASED and movie.isAvailable:
+            fields["status"] = "Missing"
+            fields["status_color"] = "#f56565"
+            fields["status_icon"] = "\u274c"
+        elif movie.status == MovieStatus.IN_CINEMAS:
+            fields["status"] = "In Cinemas"
+            fields["status_color"] = "#f6ad55"
+            fields["status_icon"] = "\U0001f3ac"
+        else:
+            fields["status"] = "Pending"
+            fields["status_color"] = "#ed8936"
+            fields["status_icon"] = "\u23f3"
+        return fields
+
+    def apply_movie_update(
+        self, tmdb_id: Optional[int], movie: Optional[RadarrMovie]
+    ) -> List[Path]:
+        """
+        Patch a movie's Radarr status in every stored week, in place.
+
+        Only the Radarr-derived fields change; box office data and the
+        rest of each week are kept as generated.
+
+        Args:
+            tmdb_id: TMDB ID identifying the movie in week files
+            movie: Current Radarr record, or None if it left the library
+
+        Returns:
+            Paths of week files that were rewritten
+        """
+        if not tmdb_id:
+            return []
+
+        quality_profiles: Dict[int, str] = {}
+        ultra_hd_id = None
+        if movie is not None:
+            quality_profiles, ultra_hd_id = self._load_profile_context()
+
+        updated = [
+            json_file
+            for json_file in sorted(self.output_dir.glob("*.json"))
+            if self._patch_week_file(
+                json_file, tmdb_id, movie, quality_profiles, ultra_hd_id
+            )
+        ]
+
+        if updated:
+            logger.info(
+                f"Updated Radarr status for TMDB {tmdb_id} in {len(updated)} week(s)"
+            )
+        return updated
+
+    def _patch_week_file(
+        self,
+        json_file: Path,
+        tmdb_id: int,
+        movie: Optional[RadarrMovie],
+        quality_profiles: Dict[int, str],
+        ultra_hd_id: Optional[int],
+    ) -> bool:
+        """
+        Patch one week file's entries for a movie.
+
+        Returns:
+            True if the file contained the movie and was rewritten
+        """
+        try:
+            with open(json_file) as f:
+                metadata = json.load(f)
+        except Exception as e:
+            logger.warning(f"Skipping unreadable week file {json_file}: {e}")
+            return False
+
+        entries = [
+            m for m in metadata.get("movies", []) if m.get("tmdb_id") == tmdb_id
+        ]
+        if not entries:
+            return False
+
+        for entry in entries:
+            if movie is None:
+                entry.update(UNMATCHED_RADARR_FIELDS)
+            else:
+                entry.update(self._radarr_fields(movie, quality_profiles, ultra_hd_id))
+                entry["poster"] = movie.poster_url or entry.get("poster")
+
+        metadata["matched_movies"] = sum(
+            1 for m in metadata.get("movies", []) if m.get("radarr_id")
+        )
+        if quality_profiles:
+            metadata["quality_profiles"] = quality_profiles
+
+        # Write atomically so readers never see a half-written week
+        tmp_path = json_file.with_suffix(".json.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(metadata, f, indent=2)
+        tmp_path.replace(json_file)
+        return True
@@ -0,0 +1,114 @@
+"""Incremental parsing of large JSON array responses."""
+
+import codecs
+import json
+import re
+from typing import Any, List, Optional, Tuple
+
+_WHITESPACE = re.compile(r"[ \t\r\n]*")
+
+# Punctuation allowed in each parser state, and the state it leads to
+_EXPECTED = {"start": "[", "first": "]", "sep": ",]", "value": "", "done": ""}
+_NEXT_STATE = {"[": "first", "]": "done", ",": "value"}
+
+
+class JSONArrayParser:
+    """
+    Parse a top-level JSON array one element at a time.
+
+    Feed raw response chunks as they arrive; every element completed by a
+    chunk is returned straight away, so only the unparsed tail of the
+    payload is held in memory rather than the whole body.
+
+    Example:
+        parser = JSONArrayParser()
+        for chunk in response.iter_bytes():
+            for item in parser.feed(chunk):
+                handle(item)
+        parser.close()
+    """
+
+    def __init__(self) -> None:
+        """Create a parser expecting the opening bracket."""
+        self._decoder = json.JSONDecoder()
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        # start -> first (value or "]") -> sep ("," or "]") / value -> done
+        self._state = "start"
+        self.count = 0
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """
+        Consume a chunk of the response body.
+
+        Args:
+            chunk: Next bytes of the payload
+
+        Returns:
+            Array elements completed by this chunk
+
+        Raises:
+            ValueError: If the payload is not a JSON array
+        """
+        self._buffer += self._text.decode(chunk)
+        return self._drain(final=False)
+
+    def close(self) -> List[Any]:
+        """
+        Signal the end of the body.
+
+        Returns:
+            Any elements still buffered
+
+        Raises:
+            ValueError: If the payload was truncated or malformed
+        """
+        self._buffer += self._text.decode(b"", final=True)
+        items = self._drain(final=True)
+        if self._state != "done":
+            raise ValueError("Truncated JSON array")
+        return items
+
+    def _drain(self, final: bool) -> List[Any]:
+        """Parse as many elements as the buffer holds."""
+        items: List[Any] = []
+        buffer = self._buffer
+        pos = 0
+        while True:
+            pos = _WHITESPACE.match(buffer, pos).end()  # type: ignore[union-attr]
+            if pos == len(buffer):
+                break
+            if self._state == "value" or (
+                self._state == "first" and buffer[pos] != "]"
+            ):
+                decoded = self._decode(buffer, pos, final)
+                if decoded is None:
+                    break  # Element still incomplete; wait for more bytes
+                item, pos = decoded
+                items.append(item)
+                self.count += 1
+                self._state = "sep"
+            else:
+                self._punctuation(buffer[pos])
+                pos += 1
+
+        self._buffer = buffer[pos:]
+        return items
+
+    def _decode(self, buffer: str, pos: int, final: bool) -> Optional[Tuple[Any, int]]:
+        """Decode the element at ``pos``, or None if more bytes are needed."""
+        try:
+            item, end = self._decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError as e:
+            if final:
+                raise ValueError(f"Invalid JSON array element: {e}") from e
+            return None
+        if end == len(buffer) and not final:
+            return None  # A bare number could continue in the next chunk
+        return item, end
+
+    def _punctuation(self, char: str) -> None:
+        """Advance past a bracket or comma, rejecting anything else."""
+        if char not in _EXPECTED[self._state]:
+            raise ValueError(f"Unexpected {char!r} in JSON array")
+        self._state = _NEXT_STATE[char]
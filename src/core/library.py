@@ -0,0 +1,650 @@
+"""In-memory index and shared cache for the Radarr library."""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import Future
+from datetime import datetime, timezone
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
+
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def normalize_title(title: Optional[str]) -> str:
+    """
+    Normalize a movie title for index lookups.
+
+    Lowercases and collapses whitespace so that "The  Batman " and
+    "the batman" resolve to the same key.
+
+    Args:
+        title: Raw movie title
+
+    Returns:
+        Normalized title (empty string for missing titles)
+    """
+    if not title:
+        return ""
+    return " ".join(title.lower().split())
+
+
+class LibraryIndex:
+    """
+    Immutable lookup tables over a Radarr library snapshot.
+
+    Built once per cache refresh and swapped in as a whole, so readers
+    never observe a half-built index.
+    """
+
+    __slots__ = ("movies", "_by_id", "_by_tmdb", "_by_imdb", "_by_title", "_titles")
+
+    def __init__(self, movies: Iterable[Any] = ()):
+        """
+        Build the index.
+
+        Args:
+            movies: Radarr movie records (anything exposing id, tmdbId,
+                imdbId and title attributes)
+        """
+        self.movies: List[Any] = []
+        self._by_id: Dict[int, Any] = {}
+        self._by_tmdb: Dict[int, Any] = {}
+        self._by_imdb: Dict[str, Any] = {}
+        self._by_title: Dict[str, Any] = {}
+        # Normalized titles in library order, for the substring fallback
+        self._titles: List[tuple] = []
+
+        for movie in movies:
+            self.add(movie)
+
+    def add(self, movie: Any) -> None:
+        """
+        Append a movie while the index is being built.
+
+        Lets a streaming fetch index records as they are parsed. Must not
+        be called once the index has been published to readers.
+
+        Args:
+            movie: Radarr movie record
+        """
+        self.movies.append(movie)
+        self._by_id[movie.id] = movie
+        if movie.tmdbId:
+            # First occurrence wins, matching the old linear scan
+            self._by_tmdb.setdefault(movie.tmdbId, movie)
+        if movie.imdbId:
+            self._by_imdb.setdefault(movie.imdbId.lower(), movie)
+        key = normalize_title(movie.title)
+        if key:
+            self._by_title.setdefault(key, movie)
+            self._titles.append((key, movie))
+
+    def __len__(self) -> int:
+        """Number of indexed movies."""
+        return len(self.movies)
+
+    def __bool__(self) -> bool:
+        """An index is truthy when it holds at least one movie."""
+        return bool(self.movies)
+
+    def get_by_id(self, movie_id: Optional[int]) -> Optional[Any]:
+        """Look up a movie by Radarr ID."""
+        if movie_id is None:
+            return None
+        return self._by_id.get(movie_id)
+
+    def get_by_tmdb_id(self, tmdb_id: Optional[int]) -> Optional[Any]:
+        """Look up a movie by TMDB ID."""
+        if not tmdb_id:
+            return None
+        return self._by_tmdb.get(tmdb_id)
+
+    def get_by_imdb_id(self, imdb_id: Optional[str]) -> Optional[Any]:
+        """Look up a movie by IMDb ID (case-insensitive)."""
+        if not imdb_id:
+            return None
+        return self._by_imdb.get(imdb_id.lower())
+
+    def find_by_title(self, title: str) -> Optional[Any]:
+        """
+        Find a movie by title.
+
+        Exact (normalized) matches are a single dict lookup; only when that
+        misses do we fall back to a substring scan.
+
+        Args:
+            title: Movie title to search
+
+        Returns:
+            First matching movie or None
+        """
+        key = normalize_title(title)
+        if not key:
+            return None
+
+        exact = self._by_title.get(key)
+        if exact is not None:
+            return exact
+
+        for candidate, movie in self._titles:
+            if key in candidate:
+                return movie
+        return None
+
+    def find_movie_by_tmdb_id(self, tmdb_id: int) -> Optional[Any]:
+        """Alias so an index can stand in for a service in matching helpers."""
+        return self.get_by_tmdb_id(tmdb_id)
+
+
+# What a library fetch returns: a movie list, or an index built while streaming
+LibrarySnapshot = Union[List[Any], LibraryIndex]
+
+
+class LibraryCache:
+    """
+    Shared Radarr library snapshot with stale-while-revalidate.
+
+    Within the soft TTL the cached index is returned as-is. Between the
+    soft and hard TTL the stale index is returned immediately while one
+    background refresh runs. Past the hard TTL (or with no snapshot)
+    callers wait for a fetch; concurrent waiters share a single in-flight
+    request instead of each downloading the library.
+
+    The flight is a ``concurrent.futures.Future`` so blocking callers in
+    worker threads and asyncio callers can wait on the same fetch.
+    """
+
+    def __init__(
+        self,
+        soft_ttl: Callable[[], float],
+        hard_ttl: Callable[[], float],
+        clock: Callable[[], float] = time.monotonic,
+        on_refresh: Optional[Callable[[LibraryIndex], None]] = None,
+    ):
+        """
+        Initialize an empty cache.
+
+        Args:
+            soft_ttl: Returns the age (seconds) after which a refresh starts
+            hard_ttl: Returns the age after which stale data is not served
+            clock: Monotonic time source (overridable for tests)
+            on_refresh: Called with each newly published index (must not
+                block; used to persist the snapshot)
+        """
+        self._soft_ttl = soft_ttl
+        self._hard_ttl = hard_ttl
+        self._clock = clock
+        self._on_refresh = on_refresh
+        # Set while serving a snapshot restored from disk that no fetch
+        # has confirmed yet; it is served regardless of the hard TTL
+        self._seeded = False
+        self._lock = threading.Lock()
+        self._index = LibraryIndex()
+        self._fetched_at: Optional[float] = None
+        # Bumped on invalidate so in-flight fetches from before it are not published
+        self._generation = 0
+        self._flight: Optional[Tuple[int, Future]] = None
+        # Patches applied while a fetch is in flight, replayed onto its result
+        self._flight_patches: Dict[int, Optional[Any]] = {}
+        self._tasks: Set[Any] = set()
+        self._counters = {
+            "hits": 0,
+            "stale_hits": 0,
+            "misses": 0,
+            "coalesced": 0,
+            "refreshes": 0,
+            "refresh_errors": 0,
+            "patches": 0,
+        }
+
+    @property
+    def index(self) -> LibraryIndex:
+        """Current snapshot, regardless of age."""
+        return self._index
+
+    def _lookup(self, force: bool) -> Tuple[str, Any]:
+        """
+        Decide how to serve a request. Must be called with the lock held.
+
+        Returns:
+            ("hit", index), ("stale", index) when a background refresh should
+            also start, ("wait", future) to join an in-flight fetch, or
+            ("lead", future) when the caller must perform the fetch
+        """
+        age = None
+        if self._fetched_at is not None:
+            age = self._clock() - self._fetched_at
+
+        if not force and age is not None:
+            if age < self._soft_ttl():
+                self._counters["hits"] += 1
+                return "hit", self._index
+            if age < self._hard_ttl() or self._seeded:
+                self._counters["stale_hits"] += 1
+                if self._current_flight() is None:
+                    return "stale", self._start_flight()
+                return "hit", self._index
+
+        self._counters["misses"] += 1
+        flight = self._current_flight()
+        if flight is not None:
+            self._counters["coalesced"] += 1
+            return "wait", flight
+        return "lead", self._start_flight()
+
+    def _current_flight(self) -> Optional[Future]:
+        """In-flight fetch started since the last invalidation, if any."""
+        if self._flight is not None and self._flight[0] == self._generation:
+            return self._flight[1]
+        return None
+
+    def _start_flight(self) -> Future:
+        """Register a new in-flight fetch. Must be called with the lock held."""
+        future: Future = Future()
+        self._flight = (self._generation, future)
+        self._flight_patches = {}
+        return future
+
+    def _complete(
+        self,
+        future: Future,
+        generation: int,
+        movies: Optional[LibrarySnapshot] = None,
+        error: Optional[BaseException] = None,
+    ) -> Optional[LibraryIndex]:
+        """Publish a fetch result (or error) and release waiters."""
+        with self._lock:
+            if self._flight is not None and self._flight[1] is future:
+                self._flight = None
+            if error is not None:
+                self._counters["refresh_errors"] += 1
+                index = None
+            else:
+                # Build outside readers' view, then swap in as a whole
+                if isinstance(movies, LibraryIndex):
+                    index = movies  # Already indexed while streaming
+                else:
+                    index = LibraryIndex(movies or [])
+                self._counters["refreshes"] += 1
+                published = generation == self._generation
+                if published:
+                    if self._flight_patches:
+                        # The fetch may predate changes patched in meanwhile
+                        index = LibraryIndex(
+                            apply_library_delta(index.movies, self._flight_patches)
+                        )
+                        self._flight_patches = {}
+                    self._index = index
+                    self._fetched_at = self._clock()
+                    self._seeded = False
+
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(index)
+            if published and index is not None and self._on_refresh is not None:
+                self._on_refresh(index)
+        return index
+
+    def get(
+        self, fetch: Callable[[], LibrarySnapshot], force: bool = False
+    ) -> LibraryIndex:
+        """
+        Get the library index, fetching with a blocking callable if needed.
+
+        Args:
+            fetch: Returns the movie list or a prebuilt LibraryIndex
+            force: Bypass the TTLs (still shares an in-flight fetch)
+
+        Returns:
+            LibraryIndex snapshot
+        """
+        with self._lock:
+            action, value = self._lookup(force)
+            generation = self._generation
+
+        if action == "hit":
+            return cast(LibraryIndex, value)
+        if action == "stale":
+            threading.Thread(
+                target=self._run_sync, args=(fetch, value, generation), daemon=True
+            ).start()
+            return self._index
+        if action == "wait":
+            return cast(LibraryIndex, value.result())
+        return cast(
+            LibraryIndex, self._run_sync(fetch, value, generation, raise_errors=True)
+        )
+
+    async def aget(
+        self, fetch: Callable[[], Awaitable[LibrarySnapshot]], force: bool = False
+    ) -> LibraryIndex:
+        """
+        Get the library index, fetching with a coroutine function if needed.
+
+        Args:
+            fetch: Coroutine function returning the movie list or a
+                prebuilt LibraryIndex
+            force: Bypass the TTLs (still shares an in-flight fetch)
+
+        Returns:
+            LibraryIndex snapshot
+        """
+        with self._lock:
+            action, value = self._lookup(force)
+            generation = self._generation
+
+        if action == "hit":
+            return cast(LibraryIndex, value)
+        if action == "stale":
+            task = asyncio.get_running_loop().create_task(
+                self._run_async(fetch, value, generation)
+            )
+            # Keep a reference so the refresh is not garbage collected mid-flight
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+            return self._index
+        if action == "wait":
+            return cast(LibraryIndex, await asyncio.wrap_future(value))
+        return cast(
+            LibraryIndex,
+            await self._run_async(fetch, value, generation, raise_errors=True),
+        )
+
+    def _run_sync(
+        self,
+        fetch: Callable[[], LibrarySnapshot],
+        future: Future,
+        generation: int,
+        raise_errors: bool = False,
+    ) -> Optional[LibraryIndex]:
+        """Run a blocking fetch as the flight leader."""
+        try:
+            movies = fetch()
+        except Exception as e:
+            self._complete(future, generation, error=e)
+            if raise_errors:
+                raise
+            logger.warning(f"Background library refresh failed: {e}")
+            return None
+        return self._complete(future, generation, movies)
+
+    async def _run_async(
+        self,
+        fetch: Callable[[], Awaitable[LibrarySnapshot]],
+        future: Future,
+        generation: int,
+        raise_errors: bool = False,
+    ) -> Optional[LibraryIndex]:
+        """Run an async fetch as the flight leader."""
+        try:
+            movies = await fetch()
+        except Exception as e:
+            self._complete(future, generation, error=e)
+            if raise_errors:
+                raise
+            logger.warning(f"Background library refresh failed: {e}")
+            return None
+        return self._complete(future, generation, movies)
+
+    def patch(self, updates: Dict[int, Optional[Any]]) -> bool:
+        """
+        Apply per-movie changes to the current snapshot without refetching.
+
+        The snapshot keeps its age, so TTL-driven refreshes still happen.
+        A fetch in flight may have read the library before these changes,
+        so they are also replayed onto its result when it is published.
+
+        Args:
+            updates: Radarr ID -> current movie, or None when it was deleted
+
+        Returns:
+            True if a snapshot existed and was patched
+        """
+        with self._lock:
+            if self._current_flight() is not None:
+                self._flight_patches.update(updates)
+            if self._fetched_at is None:
+                return False
+            self._index = LibraryIndex(apply_library_delta(self._index.movies, updates))
+            self._counters["patches"] += 1
+            return True
+
+    def seed(self, movies: LibrarySnapshot) -> bool:
+        """
+        Install a snapshot restored from disk, if nothing is cached yet.
+
+        The seeded index is treated as stale: the first read returns it
+        and starts a background refresh. It keeps being served, whatever
+        its age, until a fetch succeeds, so a briefly unreachable Radarr
+        does not leave callers without a library.
+
+        Args:
+            movies: Restored movie list or index
+
+        Returns:
+            True if the snapshot was installed
+        """
+        index = movies if isinstance(movies, LibraryIndex) else LibraryIndex(movies)
+        with self._lock:
+            if self._fetched_at is not None:
+                return False
+            self._index = index
+            self._fetched_at = self._clock() - self._soft_ttl()
+            self._seeded = True
+            return True
+
+    def peek(self) -> Optional[LibraryIndex]:
+        """
+        Current snapshot if it can be served without waiting for a fetch.
+
+        Unlike ``get`` this neither counts as a hit nor starts a refresh.
+
+        Returns:
+            The index, or None when empty or past the hard TTL
+        """
+        with self._lock:
+            if self._fetched_at is None:
+                return None
+            if self._seeded or self._clock() - self._fetched_at < self._hard_ttl():
+                return self._index
+            return None
+
+    def invalidate(self) -> None:
+        """Drop the snapshot; fetches already in flight will not be published."""
+        with self._lock:
+            self._generation += 1
+            self._flight_patches = {}
+            self._index = LibraryIndex()
+            self._fetched_at = None
+            self._seeded = False
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Cache counters and current snapshot state.
+
+        Returns:
+            Dictionary of counters plus size, age and in-flight status
+        """
+        with self._lock:
+            age = None
+            if self._fetched_at is not None:
+                age = round(self._clock() - self._fetched_at, 3)
+            return {
+                **self._counters,
+                "size": len(self._index),
+                "age_seconds": age,
+                "in_flight": self._current_flight() is not None,
+                "seeded": self._seeded,
+                "soft_ttl_seconds": self._soft_ttl(),
+                "hard_ttl_seconds": self._hard_ttl(),
+            }
+
+
+def apply_library_delta(
+    movies: Iterable[Any], updates: Dict[int, Optional[Any]]
+) -> List[Any]:
+    """
+    Apply per-movie changes to a library snapshot.
+
+    Args:
+        movies: Current snapshot, in library order
+        updates: Radarr ID -> refreshed movie, or None when it was deleted
+
+    Returns:
+        New movie list; changed movies keep their position and unknown
+        IDs are appended
+    """
+    result = []
+    seen = set()
+    for movie in movies:
+        if movie.id in updates:
+            seen.add(movie.id)
+            replacement = updates[movie.id]
+            if replacement is not None:
+                result.append(replacement)
+        else:
+            result.append(movie)
+    for movie_id, movie in updates.items():
+        if movie_id not in seen and movie is not None:
+            result.append(movie)
+    return result
+
+
+class LibrarySyncState:
+    """
+    Bookkeeping for incremental library syncs.
+
+    Decides whether the next refresh can be a delta (history since the
+    last sync plus per-movie refreshes) or must be a full download, and
+    keeps counters for the stats endpoint.
+    """
+
+    # Re-read this much history before the last sync to absorb clock skew
+    OVERLAP_SECONDS = 60.0
+
+    def __init__(self, clock: Callable[[], float] = time.time):
+        """
+        Initialize with no sync recorded.
+
+        Args:
+            clock: Wall-clock time source (history queries need real dates)
+        """
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._last_sync: Optional[float] = None
+        self._last_full_sync: Optional[float] = None
+        self._counters = {
+            "full_syncs": 0,
+            "incremental_syncs": 0,
+            "movies_refreshed": 0,
+            "movies_removed": 0,
+            "incremental_failures": 0,
+        }
+
+    def plan(
+        self, have_snapshot: bool, mode: str, full_resync_seconds: float
+    ) -> Tuple[str, Optional[str]]:
+        """
+        Choose how to refresh the library.
+
+        Args:
+            have_snapshot: Whether a non-empty snapshot exists to patch
+            mode: Configured sync mode ("full" or "incremental")
+            full_resync_seconds: Maximum time between full downloads
+
+        Returns:
+            ("full", None) or ("incremental", ISO-8601 UTC timestamp to
+            request history since)
+        """
+        with self._lock:
+            if (
+                mode != "incremental"
+                or not have_snapshot
+                or self._last_sync is None
+                or self._last_full_sync is None
+                or self._clock() - self._last_full_sync >= full_resync_seconds
+            ):
+                return "full", None
+            since = datetime.fromtimestamp(
+                self._last_sync - self.OVERLAP_SECONDS, tz=timezone.utc
+            )
+            return "incremental", since.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    def started(self) -> float:
+        """Timestamp to record for a sync that is about to start."""
+        return self._clock()
+
+    def record(
+        self, mode: str, started_at: float, refreshed: int = 0, removed: int = 0
+    ) -> None:
+        """
+        Record a completed sync.
+
+        Args:
+            mode: "full" or "incremental"
+            started_at: Value returned by ``started()`` before the sync
+            refreshed: Movies re-fetched individually (incremental only)
+            removed: Movies dropped because Radarr no longer has them
+        """
+        with self._lock:
+            self._last_sync = started_at
+            if mode == "full":
+                self._last_full_sync = started_at
+                self._counters["full_syncs"] += 1
+            else:
+                self._counters["incremental_syncs"] += 1
+                self._counters["movies_refreshed"] += refreshed
+                self._counters["movies_removed"] += removed
+
+    def record_failure(self) -> None:
+        """Count an incremental sync that fell back to a full download."""
+        with self._lock:
+            self._counters["incremental_failures"] += 1
+
+    def resume(
+        self, last_sync: Optional[float], last_full_sync: Optional[float]
+    ) -> None:
+        """
+        Restore sync timestamps saved with a library snapshot.
+
+        Lets an incremental refresh after a restart read only the history
+        since the snapshot was taken.
+
+        Args:
+            last_sync: Start time of the snapshot's last sync
+            last_full_sync: Start time of its last full download
+        """
+        with self._lock:
+            if self._last_sync is None:
+                self._last_sync = last_sync
+                self._last_full_sync = last_full_sync
+
+    def reset(self) -> None:
+        """Forget previous syncs so the next refresh is a full download."""
+        with self._lock:
+            self._last_sync = None
+            self._last_full_sync = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Sync counters and timestamps."""
+        with self._lock:
+            return {
+                **self._counters,
+                "last_sync": self._last_sync,
+                "last_full_sync": self._last_full_sync,
+            }
@@ -0,0 +1,269 @@
+"""Persistent cache for Radarr movie lookups (TMDB searches)."""
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from ..utils.logger import get_logger
+from .library import normalize_title
+
+logger = get_logger(__name__)
+
+# Empty results are re-checked sooner: the movie may just not be on TMDB yet
+NEGATIVE_TTL_SECONDS = 3600
+
+# Fields Radarr fills in only for movies already in the library. They
+# describe library state rather than TMDB metadata, so they go stale as
+# soon as the movie is deleted or edited and are never cached.
+LIBRARY_STATE_FIELDS = frozenset(
+    {
+        "id",
+        "path",
+        "folderName",
+        "rootFolderPath",
+        "qualityProfileId",
+        "monitored",
+        "hasFile",
+        "movieFile",
+        "movieFileId",
+        "sizeOnDisk",
+        "added",
+        "tags",
+        "statistics",
+    }
+)
+
+
+def strip_library_state(movie: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Copy a lookup result without its library-state fields.
+
+    Args:
+        movie: Movie from ``/api/v3/movie/lookup``
+
+    Returns:
+        The movie's TMDB metadata only
+    """
+    return {k: v for k, v in movie.items() if k not in LIBRARY_STATE_FIELDS}
+
+
+class LookupCache:
+    """
+    SQLite-backed TTL + LRU cache for ``/api/v3/movie/lookup`` results.
+
+    Entries are keyed by TMDB ID for ``tmdb:<id>`` terms and by normalized
+    text otherwise. Each movie returned by a title search is also stored
+    under its TMDB ID, so adding a movie right after searching for it
+    needs no second lookup. Library-state fields (see
+    ``LIBRARY_STATE_FIELDS``) are dropped before storing, so a cached
+    result never claims a movie is in the library. Storage errors are
+    logged and treated as misses; the cache never makes a lookup fail.
+    """
+
+    def __init__(
+        self,
+        path: Callable[[], Path],
+        ttl: Callable[[], float],
+        max_entries: Callable[[], int],
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Initialize the cache; the database is opened on first use.
+
+        Args:
+            path: Returns the SQLite file location
+            ttl: Returns the entry lifetime in seconds (0 disables caching)
+            max_entries: Returns the LRU capacity
+            clock: Wall-clock time source (overridable for tests)
+        """
+        self._path = path
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_path: Optional[Path] = None
+        self._counters = {
+            "hits": 0,
+            "misses": 0,
+            "expired": 0,
+            "stores": 0,
+            "evictions": 0,
+            "errors": 0,
+        }
+
+    @staticmethod
+    def key_for(term: str) -> str:
+        """
+        Cache key for a lookup term.
+
+        Args:
+            term: Radarr lookup term ("tmdb:603" or free text)
+
+        Returns:
+            "tmdb:<id>" or "term:<normalized text>"
+        """
+        text = term.strip()
+        if text.lower().startswith("tmdb:") and text[5:].strip().isdigit():
+            return f"tmdb:{int(text[5:])}"
+        return f"term:{normalize_title(text)}"
+
+    @property
+    def enabled(self) -> bool:
+        """Whether caching is switched on (TTL above zero)."""
+        return self._ttl() > 0
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open (or reopen, if the data directory changed) the database."""
+        path = Path(self._path())
+        if self._conn is None or self._conn_path != path:
+            if self._conn is not None:
+                self._conn.close()
+            path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS lookups ("
+                "key TEXT PRIMARY KEY, results TEXT NOT NULL, "
+                "stored_at REAL NOT NULL, used_at REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS lookups_used_at ON lookups (used_at)"
+            )
+            self._conn, self._conn_path = conn, path
+        return self._conn
+
+    def get(self, term: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Return cached results for ``term``.
+
+        Args:
+            term: Radarr lookup term
+
+        Returns:
+            Cached result list, or None on a miss or expired entry
+        """
+        if not self.enabled:
+            return None
+        key = self.key_for(term)
+        now = self._clock()
+        try:
+            with self._lock:
+                conn = self._connect()
+                row = conn.execute(
+                    "SELECT results, stored_at FROM lookups WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    self._counters["misses"] += 1
+                    return None
+                results = json.loads(row[0])
+                ttl = self._ttl() if results else min(self._ttl(), NEGATIVE_TTL_SECONDS)
+                if now - row[1] >= ttl:
+                    conn.execute("DELETE FROM lookups WHERE key = ?", (key,))
+                    conn.commit()
+                    self._counters["expired"] += 1
+                    self._counters["misses"] += 1
+                    return None
+                conn.execute("UPDATE lookups SET used_at = ? WHERE key = ?", (now, key))
+                conn.commit()
+                self._counters["hits"] += 1
+                return results if isinstance(results, list) else None
+        except (sqlite3.Error, ValueError) as e:
+            self._record_error("read", e)
+            return None
+
+    def put(self, term: str, results: List[Dict[str, Any]]) -> None:
+        """
+        Store lookup results, evicting least recently used entries.
+
+        Args:
+            term: Radarr lookup term
+            results: Results returned by Radarr (library state is not stored)
+        """
+        if not self.enabled:
+            return
+        now = self._clock()
+        key = self.key_for(term)
+        movies = [
+            strip_library_state(movie) if isinstance(movie, dict) else movie
+            for movie in results
+        ]
+        rows = [(key, json.dumps(movies), now, now)]
+        if key.startswith("term:"):
+            rows.extend(
+                (f"tmdb:{movie['tmdbId']}", json.dumps([movie]), now, now)
+                for movie in movies
+                if isinstance(movie, dict) and isinstance(movie.get("tmdbId"), int)
+            )
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.executemany(
+                    "INSERT OR REPLACE INTO lookups VALUES (?, ?, ?, ?)", rows
+                )
+                self._counters["stores"] += len(rows)
+                self._evict(conn)
+                conn.commit()
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            self._record_error("write", e)
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Drop least recently used entries above capacity. Lock held."""
+        excess = conn.execute("SELECT COUNT(*) FROM lookups").fetchone()[0] - max(
+            1, self._max_entries()
+        )
+        if excess > 0:
+            conn.execute(
+                "DELETE FROM lookups WHERE key IN "
+                "(SELECT key FROM lookups ORDER BY used_at LIMIT ?)",
+                (excess,),
+            )
+            self._counters["evictions"] += excess
+
+    def _record_error(self, action: str, error: Exception) -> None:
+        """Count and log a storage failure."""
+        with self._lock:
+            self._counters["errors"] += 1
+        logger.warning(f"Lookup cache {action} failed: {error}")
+
+    def clear(self) -> None:
+        """Remove every cached lookup."""
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute("DELETE FROM lookups")
+                conn.commit()
+        except sqlite3.Error as e:
+            self._record_error("clear", e)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+            self._conn, self._conn_path = None, None
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters, size and settings."""
+        size = None
+        if self.enabled:
+            try:
+                with self._lock:
+                    size = (
+                        self._connect()
+                        .execute("SELECT COUNT(*) FROM lookups")
+                        .fetchone()[0]
+                    )
+            except sqlite3.Error:
+                size = None
+        with self._lock:
+            return {
+                **self._counters,
+                "size": size,
+                "ttl_seconds": self._ttl(),
+                "max_entries": self._max_entries(),
+            }
@@ -0,0 +1,157 @@
+"""Shared cache for small, rarely changing Radarr resources."""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
+
+# Resources held by the cache
+METADATA_KINDS = ("tags", "profiles", "root_folders", "system_status")
+
+T = TypeVar("T")
+
+
+class MetadataCache:
+    """
+    TTL cache for Radarr tags, quality profiles, root folders and status.
+
+    Entries are keyed by Radarr instance so a connection test against
+    another server never sees the configured server's data. Every store
+    or invalidation bumps a single ``version`` stamp, which lets callers
+    tell whether anything changed since they last looked.
+
+    Invalidated and expired entries stop being served as fresh but are
+    kept as "last known" values, used when Radarr is unreachable and
+    persisted with the library snapshot.
+    """
+
+    def __init__(
+        self,
+        ttl: Callable[[], float],
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize an empty cache.
+
+        Args:
+            ttl: Returns the freshness lifetime in seconds
+            clock: Monotonic time source (overridable for tests)
+        """
+        self._ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        # (source, kind) -> (value, stored_at or None once invalidated)
+        self._entries: Dict[Tuple[str, str], Tuple[Any, Optional[float]]] = {}
+        self._version = 0
+        self._counters = {"hits": 0, "misses": 0, "stores": 0, "invalidations": 0}
+
+    @property
+    def version(self) -> int:
+        """Stamp bumped on every change."""
+        return self._version
+
+    def get(self, source: str, kind: str) -> Optional[Any]:
+        """
+        Return a fresh cached value.
+
+        Args:
+            source: Radarr base URL
+            kind: One of ``METADATA_KINDS``
+
+        Returns:
+            Cached value, or None if missing, invalidated or expired
+        """
+        with self._lock:
+            entry = self._entries.get((source, kind))
+            if (
+                entry is not None
+                and entry[1] is not None
+                and self._clock() - entry[1] < self._ttl()
+            ):
+                self._counters["hits"] += 1
+                return entry[0]
+            self._counters["misses"] += 1
+            return None
+
+    def last_known(self, source: str, kind: str) -> Optional[Any]:
+        """Return the most recent value regardless of age, if any."""
+        with self._lock:
+            entry = self._entries.get((source, kind))
+            return entry[0] if entry is not None else None
+
+    def put(self, source: str, kind: str, value: T) -> T:
+        """
+        Store a freshly fetched value.
+
+        Args:
+            source: Radarr base URL
+            kind: One of ``METADATA_KINDS``
+            value: Raw Radarr response
+
+        Returns:
+            ``value``, for chaining
+        """
+        with self._lock:
+            self._entries[(source, kind)] = (value, self._clock())
+            self._version += 1
+            self._counters["stores"] += 1
+        return value
+
+    def seed(self, source: str, values: Dict[str, Any]) -> None:
+        """
+        Install last known values (e.g. from a snapshot) without marking
+        them fresh; existing entries win.
+
+        Args:
+            source: Radarr base URL
+            values: kind -> raw value
+        """
+        with self._lock:
+            for kind, value in values.items():
+                if kind in METADATA_KINDS:
+                    self._entries.setdefault((source, kind), (value, None))
+
+    def invalidate(self, kind: Optional[str] = None) -> None:
+        """
+        Mark entries stale so the next read refetches them.
+
+        Args:
+            kind: Only invalidate this resource (default: everything)
+        """
+        with self._lock:
+            for key, (value, _stored_at) in list(self._entries.items()):
+                if kind is None or key[1] == kind:
+                    self._entries[key] = (value, None)
+            self._version += 1
+            self._counters["invalidations"] += 1
+
+    def clear(self) -> None:
+        """Forget everything, including last known values."""
+        with self._lock:
+            self._entries.clear()
+            self._version += 1
+
+    def export(self, source: str) -> Dict[str, Any]:
+        """Last known values for one Radarr instance, for persistence."""
+        with self._lock:
+            return {
+                kind: value
+                for (entry_source, kind), (value, _) in self._entries.items()
+                if entry_source == source
+            }
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters, version stamp and per-resource freshness."""
+        with self._lock:
+            now = self._clock()
+            # None marks a stale (invalidated or restored) entry
+            ages = {
+                kind: None if stored_at is None else round(now - stored_at, 3)
+                for (_source, kind), (_value, stored_at) in self._entries.items()
+            }
+            return {
+                **self._counters,
+                "version": self._version,
+                "entries": len(self._entries),
+                "age_seconds": ages,
+                "ttl_seconds": self._ttl(),
+            }
@@ -0,0 +1,197 @@
+"""Request accounting and per-stage timing for the update pipeline."""
+
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any, Callable, Dict, Iterator, List, Optional, TypeVar
+
+import httpx
+
+# Upstream services whose requests are counted
+SERVICES = ("radarr", "trakt")
+
+
+class RequestStats:
+    """
+    Process-wide count of outbound requests and bytes per upstream service.
+
+    Counters only ever grow; callers measure a span of work by diffing two
+    snapshots. Bytes are as received on the wire (before decompression).
+    """
+
+    def __init__(self):
+        """Initialize zeroed counters."""
+        self._lock = threading.Lock()
+        self._counts = {service: {"requests": 0, "bytes": 0} for service in SERVICES}
+
+    def record(self, service: str, nbytes: int) -> None:
+        """
+        Count one completed request.
+
+        Args:
+            service: One of ``SERVICES``
+            nbytes: Response bytes received
+        """
+        with self._lock:
+            counts = self._counts.setdefault(service, {"requests": 0, "bytes": 0})
+            counts["requests"] += 1
+            counts["bytes"] += nbytes
+
+    def snapshot(self) -> Dict[str, Dict[str, int]]:
+        """Copy of the current counters."""
+        with self._lock:
+            return {service: dict(counts) for service, counts in self._counts.items()}
+
+
+_request_stats = RequestStats()
+
+# Counters of the pipeline stage running in this context, if any, so a run
+# only counts its own requests and not the web UI's traffic meanwhile
+_run_stats: ContextVar[Optional[RequestStats]] = ContextVar("run_stats", default=None)
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+def record_request(service: str, response: httpx.Response) -> None:
+    """
+    Count a response from an upstream service.
+
+    Args:
+        service: One of ``SERVICES``
+        response: Response whose body has been read (or streamed)
+    """
+    nbytes: Any = response.num_bytes_downloaded
+    if not isinstance(nbytes, int):
+        # Stand-in responses (e.g. mocks) have no byte count
+        nbytes = 0
+    elif not nbytes:
+        # Bodies that never went through the network stream (e.g. responses
+        # from a mock transport) only know their decoded length
+        try:
+            nbytes = len(response.content)
+        except httpx.ResponseNotRead:
+            pass
+    _request_stats.record(service, nbytes)
+    run_stats = _run_stats.get()
+    if run_stats is not None:
+        run_stats.record(service, nbytes)
+
+
+def carry_run_stats(func: _F) -> _F:
+    """
+    Make ``func`` count its requests towards the current pipeline stage.
+
+    Context variables do not follow work handed to a thread pool, so wrap
+    functions submitted from inside a stage before passing them on.
+
+    Args:
+        func: Function to run in another thread
+
+    Returns:
+        ``func`` itself when no stage is running, else a wrapper
+    """
+    run_stats = _run_stats.get()
+    if run_stats is None:
+        return func
+
+    @wraps(func)
+    def run(*args: Any, **kwargs: Any) -> Any:
+        token = _run_stats.set(run_stats)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _run_stats.reset(token)
+
+    return run  # type: ignore[return-value]
+
+
+def get_request_stats() -> Dict[str, Dict[str, int]]:
+    """Get the process-wide request and byte counters."""
+    return _request_stats.snapshot()
+
+
+def _diff(
+    after: Dict[str, Dict[str, int]], before: Dict[str, Dict[str, int]]
+) -> Dict[str, Dict[str, int]]:
+    """Per-service counter increase between two snapshots."""
+    return {
+        service: {
+            key: value - before.get(service, {}).get(key, 0)
+            for key, value in counts.items()
+        }
+        for service, counts in after.items()
+    }
+
+
+class PipelineMetrics:
+    """
+    Timings and request counts for each stage of one pipeline run.
+
+    Requests are counted in the run's own counters while a stage is
+    active, through a context variable, so other requests the process
+    makes at the same time (e.g. the web UI) are not attributed to it.
+    Blocking work handed to a thread pool must be wrapped with
+    ``carry_run_stats`` to be counted.
+    """
+
+    def __init__(
+        self,
+        clock: Callable[[], float] = time.perf_counter,
+        stats: Optional[RequestStats] = None,
+        on_stage: Optional[Callable[[str], None]] = None,
+    ):
+        """
+        Start timing a run.
+
+        Args:
+            clock: Monotonic time source (overridable for tests)
+            stats: Counters for this run's requests (defaults to new ones)
+            on_stage: Called with each stage name as it starts (e.g. to
+                report job progress)
+        """
+        self._clock = clock
+        self._stats = stats if stats is not None else RequestStats()
+        self._on_stage = on_stage
+        self._started = clock()
+        self._first = self._stats.snapshot()
+        self.stages: List[Dict[str, Any]] = []
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """
+        Time a stage and attribute the requests it made.
+
+        The stage is recorded (marked failed) even if it raises.
+
+        Args:
+            name: Stage name
+        """
+        if self._on_stage is not None:
+            self._on_stage(name)
+        before = self._stats.snapshot()
+        started = self._clock()
+        token = _run_stats.set(self._stats)
+        failed = True
+        try:
+            yield
+            failed = False
+        finally:
+            _run_stats.reset(token)
+            entry: Dict[str, Any] = {
+                "name": name,
+                "duration_ms": round((self._clock() - started) * 1000, 1),
+                **_diff(self._stats.snapshot(), before),
+            }
+            if failed:
+                entry["failed"] = True
+            self.stages.append(entry)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Stages plus whole-run totals, for history and the API."""
+        return {
+            "total_ms": round((self._clock() - self._started) * 1000, 1),
+            "stages": [dict(stage) for stage in self.stages],
+            **_diff(self._stats.snapshot(), self._first),
+        }
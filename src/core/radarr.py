@@ -1,8 +1,11 @@
 """Radarr API client for movie management."""
 
-from dataclasses import dataclass, field
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, fields
 from enum import Enum
-from typing import Any, Dict, List, Optional, cast
+from typing import Any, Dict, List, Optional, Set, Tuple, TypeVar, Union, cast
 
 import httpx
 
@@ -13,11 +16,27 @@ from .exceptions import (
     RadarrConnectionError,
     RadarrError,
     RadarrNotFoundError,
+    RadarrTimeoutError,
 )
+from .http_clients import HTTPClientRegistry, get_client_registry
+from .json_stream import JSONArrayParser
+from .library import (
+    LibraryCache,
+    LibraryIndex,
+    LibrarySnapshot,
+    LibrarySyncState,
+    apply_library_delta,
+)
+from .lookup_cache import LookupCache, strip_library_state
+from .metadata_cache import MetadataCache
+from .metrics import carry_run_stats, record_request
 from .models import MovieStatus
+from .snapshot import SnapshotStore
 
 logger = get_logger(__name__)
 
+T = TypeVar("T")
+
 
 @dataclass
 class QualityProfile:
@@ -36,9 +55,16 @@ class QualityProfile:
     language: Optional[Dict] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RadarrMovie:
-    """Represents a movie in Radarr."""
+    """
+    Represents a movie in Radarr.
+
+    Only the fields Boxarr reads are kept; nested objects such as
+    ``movieFile`` and ``images`` are reduced to the values derived from
+    them. The full Radarr payload is fetched on demand when a movie is
+    updated (see ``RadarrService.get_movie_raw``).
+    """
 
     id: int
     title: str
@@ -52,47 +78,892 @@ class RadarrMovie:
     isAvailable: bool = False
     qualityProfileId: Optional[int] = None
     rootFolderPath: Optional[str] = None
-    movieFile: Optional[Dict] = None
-    images: List[Dict] = field(default_factory=list)
-    genres: List[str] = field(default_factory=list)
+    genres: Tuple[str, ...] = ()
     runtime: Optional[int] = None
-    _raw_data: Optional[Dict] = field(default=None, repr=False)
+    poster_url: Optional[str] = None
+    file_quality: Optional[str] = None
+    file_size: Optional[int] = None
 
     @property
-    def poster_url(self) -> Optional[str]:
-        """Get poster URL if available."""
-        for image in self.images:
-            if image.get("coverType") == "poster":
-                url = image.get("remoteUrl")
-                return url if isinstance(url, str) else None
+    def file_size_gb(self) -> Optional[float]:
+        """Get file size in GB if movie has file."""
+        if self.file_size:
+            return round(self.file_size / (1024**3), 2)
         return None
 
+
+def _intern(value: Any) -> Optional[str]:
+    """Intern strings repeated across a library (genres, root folders)."""
+    return sys.intern(value) if isinstance(value, str) else None
+
+
+def _poster_url(images: Any) -> Optional[str]:
+    """Return the remote poster URL from a Radarr ``images`` list."""
+    for image in images or ():
+        if isinstance(image, dict) and image.get("coverType") == "poster":
+            url = image.get("remoteUrl")
+            return url if isinstance(url, str) else None
+    return None
+
+
+def _file_details(movie_file: Any) -> Tuple[Optional[str], Optional[int]]:
+    """Return (quality name, size in bytes) from a Radarr ``movieFile``."""
+    if not isinstance(movie_file, dict):
+        return None, None
+    quality_obj = (movie_file.get("quality") or {}).get("quality", {})
+    name = quality_obj.get("name") if isinstance(quality_obj, dict) else None
+    size = movie_file.get("size", 0)
+    return (
+        _intern(name),
+        int(size) if isinstance(size, (int, float)) and size > 0 else None,
+    )
+
+
+class MovieAddStatus(str, Enum):
+    """Outcome of one movie in a bulk add."""
+
+    ADDED = "added"
+    EXISTS = "exists"
+    NOT_FOUND = "not_found"
+    SKIPPED = "skipped"
+    FAILED = "failed"
+
+
+@dataclass
+class MovieAddRequest:
+    """A movie to add with ``add_movies_bulk``; unset fields use defaults."""
+
+    tmdb_id: int
+    root_folder: Optional[str] = None
+    quality_profile_id: Optional[int] = None
+    title: Optional[str] = None
+
+
+@dataclass
+class MovieAddResult:
+    """Per-movie report returned by ``add_movies_bulk``."""
+
+    tmdb_id: int
+    title: str
+    status: MovieAddStatus
+    movie: Optional[RadarrMovie] = None
+    error: Optional[str] = None
+
     @property
-    def file_quality(self) -> Optional[str]:
-        """Get file quality if movie has file."""
-        if self.movieFile:
-            quality = self.movieFile.get("quality", {})
-            quality_obj = quality.get("quality", {})
-            if isinstance(quality_obj, dict):
-                name = quality_obj.get("name")
-                return name if isinstance(name, str) else None
+    def added(self) -> bool:
+        """Whether the movie was added by this request."""
+        return self.status is MovieAddStatus.ADDED
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-friendly form for API responses."""
+        return {
+            "tmdb_id": self.tmdb_id,
+            "title": self.title,
+            "status": self.status.value,
+            "radarr_id": self.movie.id if self.movie else None,
+            "error": self.error,
+        }
+
+
+# Lookup outcome per requested movie: first result, None, or the error
+_AddLookup = Union[Dict[str, Any], None, Exception]
+
+
+# Radarr accepts only these minimumAvailability values on v3+
+_ALLOWED_MINIMUM_AVAILABILITY = {"announced", "inCinemas", "released"}
+
+
+def _cache_ttl() -> int:
+    """Soft TTL shared by the library and metadata caches."""
+    try:
+        return int(getattr(settings, "radarr_cache_ttl_seconds", 120))
+    except Exception:
+        return 120
+
+
+def _cache_hard_ttl() -> int:
+    """Longest a stale library snapshot may be served while it refreshes."""
+    try:
+        hard = int(getattr(settings, "radarr_cache_hard_ttl_seconds", 900))
+    except Exception:
+        hard = 900
+    return max(hard, _cache_ttl())
+
+
+# Library snapshot shared across service instances (blocking and async)
+def _persist_library(index: LibraryIndex) -> None:
+    """Schedule a snapshot write after each library refresh."""
+    if getattr(settings, "radarr_snapshot_enabled", True):
+        _snapshot_store.save_later(_build_snapshot)
+
+
+_library_cache = LibraryCache(
+    soft_ttl=_cache_ttl, hard_ttl=_cache_hard_ttl, on_refresh=_persist_library
+)
+_library_sync = LibrarySyncState()
+_snapshot_store = SnapshotStore(lambda: settings.boxarr_data_directory)
+
+# TMDB lookups via Radarr are slow (1-3 s), so results persist across runs
+_lookup_cache = LookupCache(
+    path=lambda: settings.boxarr_data_directory / "radarr_lookups.sqlite3",
+    ttl=lambda: float(getattr(settings, "radarr_lookup_cache_ttl_seconds", 86400)),
+    max_entries=lambda: int(getattr(settings, "radarr_lookup_cache_max_entries", 5000)),
+)
+
+# Tags, quality profiles, root folders and system status; the last known
+# values are persisted with the library snapshot
+_metadata_cache = MetadataCache(ttl=_cache_ttl)
+
+# How find_movies_by_tmdb_ids resolved each call (see _tmdb_lookup_plan)
+_tmdb_lookup_counts = {"index": 0, "probe": 0, "snapshot": 0, "probe_requests": 0}
+_MOVIE_FIELDS = tuple(f.name for f in fields(RadarrMovie))
+
+# History events that change a movie's file or status
+_LIBRARY_HISTORY_EVENTS = {
+    "grabbed",
+    "downloadFolderImported",
+    "downloadFailed",
+    "movieFileDeleted",
+    "movieFolderImported",
+    "movieFileRenamed",
+    "downloadIgnored",
+}
+
+
+def get_library_cache_stats() -> Dict[str, Any]:
+    """Hit/miss/refresh counters and snapshot state of the library cache."""
+    return {
+        **_library_cache.stats(),
+        "sync": _library_sync.stats(),
+        "snapshot": _snapshot_store.stats(),
+        "tmdb_lookups": dict(_tmdb_lookup_counts),
+    }
+
+
+def get_metadata_cache_stats() -> Dict[str, Any]:
+    """Hit/miss counters and version stamp of the Radarr metadata cache."""
+    return _metadata_cache.stats()
+
+
+def invalidate_radarr_metadata(kind: Optional[str] = None) -> None:
+    """
+    Force tags, profiles, root folders and status to be refetched.
+
+    Called after changes Boxarr makes itself, such as saving a new
+    Radarr configuration.
+
+    Args:
+        kind: Only invalidate this resource (see ``METADATA_KINDS``)
+    """
+    _metadata_cache.invalidate(kind)
+
+
+def _source_key(url: Any) -> str:
+    """Normalize a Radarr URL for keying caches and snapshots."""
+    return str(url).rstrip("/")
+
+
+def get_lookup_cache_stats() -> Dict[str, Any]:
+    """Hit/miss/eviction counters of the persistent movie lookup cache."""
+    return _lookup_cache.stats()
+
+
+def _build_snapshot() -> Dict[str, Any]:
+    """Serialize the cached library and metadata for the snapshot file."""
+    sync = _library_sync.stats()
+    return {
+        "source": _source_key(settings.radarr_url),
+        "fields": list(_MOVIE_FIELDS),
+        # Rows rather than dicts keep the file compact
+        "movies": [
+            [getattr(movie, name) for name in _MOVIE_FIELDS]
+            for movie in _library_cache.index.movies
+        ],
+        "metadata": _metadata_cache.export(_source_key(settings.radarr_url)),
+        "last_sync": sync["last_sync"],
+        "last_full_sync": sync["last_full_sync"],
+    }
+
+
+def _movie_from_row(row: List[Any]) -> RadarrMovie:
+    """Rebuild a RadarrMovie from a snapshot row."""
+    values = dict(zip(_MOVIE_FIELDS, row))
+    values["status"] = MovieStatus(values["status"]) if values["status"] else None
+    values["genres"] = tuple(values["genres"] or ())
+    return RadarrMovie(**values)
+
+
+def restore_library_snapshot() -> bool:
+    """
+    Seed the library cache from the on-disk snapshot.
+
+    Called at startup so the UI and matching have a library immediately.
+    The restored data is revalidated in the background on first use and
+    is served even if Radarr cannot be reached until then.
+
+    Returns:
+        True if a snapshot was restored
+    """
+    if not getattr(settings, "radarr_snapshot_enabled", True):
+        return False
+    if not settings.radarr_api_key or _library_cache.index:
+        return False
+
+    source = _source_key(settings.radarr_url)
+    data = _snapshot_store.load(source)
+    if data is None:
+        return False
+    if data.get("fields") != list(_MOVIE_FIELDS):
+        logger.info("Ignoring library snapshot with a different movie layout")
+        return False
+
+    try:
+        index = LibraryIndex(_movie_from_row(row) for row in data.get("movies", []))
+    except Exception as e:
+        logger.warning(f"Ignoring corrupt library snapshot: {e}")
+        return False
+    if not _library_cache.seed(index):
+        return False
+
+    _metadata_cache.seed(source, data.get("metadata") or {})
+    _library_sync.resume(data.get("last_sync"), data.get("last_full_sync"))
+
+    age = time.time() - float(data.get("saved_at") or 0)
+    logger.info(f"Restored {len(index)} Radarr movies from snapshot ({age:.0f}s old)")
+    return True
+
+
+def _plan_library_sync() -> Tuple[str, Optional[str]]:
+    """Decide between a full download and a history-driven delta."""
+    return _library_sync.plan(
+        have_snapshot=bool(_library_cache.index),
+        mode=str(getattr(settings, "radarr_library_sync_mode", "full")),
+        full_resync_seconds=float(
+            getattr(settings, "radarr_library_full_resync_seconds", 3600)
+        ),
+    )
+
+
+def _changed_movie_ids(history: Any) -> Set[int]:
+    """Extract IDs of movies touched by relevant history records."""
+    records = history.get("records", []) if isinstance(history, dict) else history
+    changed: Set[int] = set()
+    for record in records or []:
+        if not isinstance(record, dict):
+            continue
+        if record.get("eventType") not in _LIBRARY_HISTORY_EVENTS:
+            continue
+        movie_id = _coerce_id(record.get("movieId"))
+        if movie_id:
+            changed.add(movie_id)
+    return changed
+
+
+def _delta_too_large(changed: Set[int], since: str) -> bool:
+    """
+    Whether refreshing ``changed`` one by one costs more than a full download.
+
+    Uses the same cut-off as TMDB ID probes (``radarr.probe_threshold``).
+    """
+    if len(changed) <= settings.radarr_probe_threshold:
+        return False
+    logger.info(f"{len(changed)} movies changed since {since}; doing a full sync")
+    return True
+
+
+def _coerce_id(value: Any) -> Optional[int]:
+    """Coerce an ID that some Radarr versions return as a string."""
+    if isinstance(value, int):
+        return value
+    if isinstance(value, (str, bytes)):
+        try:
+            return int(str(value))
+        except Exception:
+            return None
+    return None
+
+
+class RadarrServiceBase:
+    """
+    Transport-independent parts of the Radarr client.
+
+    Holds configuration, response checking, parsing and payload building so
+    the blocking and asyncio services only differ in how they do I/O.
+    """
+
+    def __init__(self, url: Optional[str] = None, api_key: Optional[str] = None):
+        """
+        Resolve Radarr connection settings.
+
+        Args:
+            url: Radarr URL (defaults to config)
+            api_key: Radarr API key (defaults to config)
+        """
+        self.url = (url or str(settings.radarr_url)).rstrip("/")
+        self.api_key = api_key or settings.radarr_api_key
+
+        if not self.api_key:
+            raise RadarrAuthenticationError("Radarr API key not provided")
+
+        self._quality_profiles: Optional[List[QualityProfile]] = None
+
+    def _check_response(self, response: httpx.Response, endpoint: str) -> None:
+        """Raise the matching Radarr error for an unsuccessful response."""
+        if response.status_code == 401:
+            raise RadarrAuthenticationError("Invalid API key")
+        elif response.status_code == 404:
+            raise RadarrNotFoundError(f"Resource not found: {endpoint}")
+
+        response.raise_for_status()
+
+    @staticmethod
+    def _error_body(resp: httpx.Response) -> Optional[str]:
+        """Extract a short error description from a failed Radarr response."""
+        # Prefer JSON message when present
+        try:
+            j = resp.json()
+            # Radarr usually returns {"message": "..."} or {"errors": [...]}
+            if isinstance(j, dict):
+                if "message" in j:
+                    return str(j.get("message"))
+                if "errors" in j and isinstance(j.get("errors"), list):
+                    return "; ".join(str(x) for x in j.get("errors")[:3])
+            return None
+        except Exception:
+            # Fall back to raw text (trim to avoid log spam)
+            return resp.text[:300]
+
+    def _translate_error(self, e: Exception) -> RadarrError:
+        """
+        Log a transport error and convert it to a RadarrError.
+
+        Args:
+            e: Exception raised while talking to Radarr
+
+        Returns:
+            RadarrError to raise in its place
+        """
+        if isinstance(e, httpx.ConnectError):
+            logger.error(f"Failed to connect to Radarr: {e}")
+            return RadarrConnectionError(f"Cannot connect to Radarr at {self.url}")
+        if isinstance(e, httpx.TimeoutException):
+            logger.error(f"Radarr request timed out: {e!r}")
+            return RadarrTimeoutError(f"Radarr at {self.url} did not respond in time")
+        if isinstance(e, httpx.HTTPError):
+            # Include response details when available to aid debugging
+            try:
+                resp = e.response  # type: ignore[attr-defined]
+                body = self._error_body(resp) if resp is not None else None
+                logger.error(
+                    "Radarr API error: %s (status %s) %s",
+                    e,
+                    getattr(resp, "status_code", "unknown"),
+                    f"- {body}" if body else "",
+                )
+            except Exception:
+                logger.error(f"Radarr API error: {e}")
+            return RadarrError(f"Radarr API error: {e}")
+        logger.error(f"Unexpected Radarr API error: {e}")
+        return RadarrError(f"Radarr API error: {e}")
+
+    def _parse_movie(
+        self, data: Dict[str, Any], with_overview: bool = True
+    ) -> RadarrMovie:
+        """
+        Parse movie data into RadarrMovie object.
+
+        The raw dict is not retained, so it can be freed once parsed.
+
+        Args:
+            data: Raw movie data from API
+            with_overview: Keep the overview text; library listings skip it
+
+        Returns:
+            RadarrMovie object
+        """
+        file_quality, file_size = _file_details(data.get("movieFile"))
+        return RadarrMovie(
+            id=data["id"],
+            title=data["title"],
+            tmdbId=data.get("tmdbId", 0),
+            imdbId=data.get("imdbId"),
+            year=data.get("year"),
+            status=MovieStatus(data["status"]) if "status" in data else None,
+            overview=data.get("overview") if with_overview else None,
+            hasFile=data.get("hasFile", False),
+            monitored=data.get("monitored", True),
+            isAvailable=data.get("isAvailable", False),
+            qualityProfileId=data.get("qualityProfileId"),
+            rootFolderPath=_intern(data.get("rootFolderPath")),
+            genres=tuple(g for g in map(_intern, data.get("genres") or ()) if g),
+            runtime=data.get("runtime"),
+            poster_url=_poster_url(data.get("images")),
+            file_quality=file_quality,
+            file_size=file_size,
+        )
+
+    def _cached_metadata(self, kind: str) -> Optional[Any]:
+        """Fresh cached metadata for this Radarr instance, if any."""
+        return _metadata_cache.get(self.url, kind)
+
+    def _store_metadata(self, kind: str, value: T) -> T:
+        """Cache freshly fetched metadata for this Radarr instance."""
+        return _metadata_cache.put(self.url, kind, value)
+
+    def _fallback_metadata(self, kind: str, error: RadarrError) -> Any:
+        """
+        Fall back to the last known metadata while Radarr is unavailable.
+
+        Args:
+            kind: Resource that failed to load
+            error: Error raised by the request
+
+        Returns:
+            Last known raw response
+
+        Raises:
+            RadarrError: ``error`` itself for auth/not-found errors or when
+                nothing is known
+        """
+        value = _metadata_cache.last_known(self.url, kind)
+        if value is None or isinstance(
+            error, (RadarrAuthenticationError, RadarrNotFoundError)
+        ):
+            raise error
+        logger.warning(f"Radarr unavailable, using saved {kind}: {error}")
+        return value
+
+    def _record_created_tag(self, tag: Any) -> None:
+        """Add a newly created tag to the cached list, or invalidate it."""
+        tags = self._cached_metadata("tags")
+        if isinstance(tag, dict) and tags is not None:
+            self._store_metadata("tags", [*tags, tag])
+        else:
+            _metadata_cache.invalidate("tags")
+
+    def _index_movies(self, index: LibraryIndex, items: List[Any]) -> None:
+        """Parse streamed library entries straight into ``index``."""
+        for item in items:
+            index.add(self._parse_movie(item, with_overview=False))
+
+    def _parse_quality_profiles(self, data: Any) -> List[QualityProfile]:
+        """Parse the /qualityProfile response into QualityProfile objects."""
+        profiles: List[QualityProfile] = []
+        for profile in data:
+            # Only extract the fields we need, ignore extra fields from newer Radarr versions
+            filtered_profile = {
+                "id": profile.get("id"),
+                "name": profile.get("name"),
+                "upgradeAllowed": profile.get("upgradeAllowed", False),
+                "cutoff": profile.get("cutoff", 0),
+                "items": profile.get("items", []),
+                "minFormatScore": profile.get("minFormatScore", 0),
+                "cutoffFormatScore": profile.get("cutoffFormatScore", 0),
+                "minUpgradeFormatScore": profile.get("minUpgradeFormatScore", 0),
+                "formatItems": profile.get("formatItems", []),
+                "language": profile.get("language"),
+            }
+            profiles.append(QualityProfile(**filtered_profile))
+        return profiles
+
+    @staticmethod
+    def _find_profile_by_name(
+        profiles: List[QualityProfile], name: str
+    ) -> Optional[QualityProfile]:
+        """Case-insensitive quality profile lookup."""
+        for profile in profiles:
+            if profile.name.lower() == name.lower():
+                return profile
         return None
 
-    @property
-    def file_size_gb(self) -> Optional[float]:
-        """Get file size in GB if movie has file."""
-        if self.movieFile:
-            size_bytes = self.movieFile.get("size", 0)
-            if isinstance(size_bytes, (int, float)) and size_bytes > 0:
-                return round(size_bytes / (1024**3), 2)
+    @staticmethod
+    def _default_profile_id(profiles: List[QualityProfile]) -> int:
+        """Resolve the configured default quality profile ID."""
+        default_profile = next(
+            (p for p in profiles if p.name == settings.radarr_quality_profile_default),
+            profiles[0] if profiles else None,
+        )
+        return default_profile.id if default_profile else 1
+
+    @staticmethod
+    def _find_tag(tags: List[Dict[str, Any]], label: str) -> Optional[Dict[str, Any]]:
+        """Find a tag by its label (case-insensitive)."""
+        for tag in tags:
+            if isinstance(tag, dict) and tag.get("label", "").lower() == label.lower():
+                return tag
         return None
 
+    @staticmethod
+    def _add_request_options() -> Dict[str, Any]:
+        """Request options for the lookups and adds of a bulk add."""
+        return {"timeout": settings.radarr_add_timeout_seconds}
+
+    def _timed_out_adds(
+        self, pending: List[Tuple[int, Dict[str, Any]]], error: RadarrTimeoutError
+    ) -> List[Tuple[int, MovieAddResult]]:
+        """
+        Report every movie of a timed-out import as failed.
+
+        Radarr may still be importing them, so they are not retried one by
+        one (that would race the import into duplicate errors).
+        """
+        logger.warning(f"Bulk import of {len(pending)} movies timed out: {error}")
+        return [
+            (position, self._single_add_result(payload, error))
+            for position, payload in pending
+        ]
+
+    @staticmethod
+    def _remember_added(movies: List[RadarrMovie]) -> None:
+        """
+        Insert movies Radarr just created into the cached library.
+
+        Add responses are complete movie records, so the new movies become
+        visible without downloading the library again. Without a cached
+        snapshot there is nothing to update; the next read fetches it.
+        """
+        if movies and _library_cache.patch({movie.id: movie for movie in movies}):
+            logger.debug(f"Inserted {len(movies)} added movies into the cached library")
+
+    @staticmethod
+    def _auto_tag_label() -> Optional[str]:
+        """Label to tag added movies with, or None when auto-tagging is off."""
+        if settings.boxarr_features_auto_tag_enabled:
+            label = settings.boxarr_features_auto_tag_text
+            if isinstance(label, str) and label.strip():
+                return label.strip()
+        return None
+
+    def _build_add_payload(
+        self,
+        movie_info: Dict[str, Any],
+        quality_profile_id: int,
+        root_folder: str,
+        monitored: bool,
+        search_for_movie: bool,
+        tag_id: Optional[int],
+    ) -> Dict[str, Any]:
+        """
+        Build the POST /movie payload from a lookup result.
+
+        Args:
+            movie_info: Movie from /movie/lookup
+            quality_profile_id: Quality profile ID
+            root_folder: Root folder path
+            monitored: Whether to monitor movie
+            search_for_movie: Whether to search for movie immediately
+            tag_id: Auto-tag ID to apply, if any
+
+        Returns:
+            Movie payload for Radarr
+        """
+        # Prepare movie data
+        add_options: Dict[str, Any] = {
+            "searchForMovie": search_for_movie,
+            "monitor": settings.radarr_monitor_option.value,
+        }
+
+        # A lookup of a library movie carries its Radarr ID, path, etc.;
+        # those must not be posted back as a new movie
+        movie_data: Dict[str, Any] = {
+            **strip_library_state(movie_info),
+            "qualityProfileId": quality_profile_id,
+            "rootFolderPath": root_folder,
+            "monitored": monitored,
+            "addOptions": add_options,
+        }
+
+        # Radarr expects minimumAvailability at the top level of the movie payload.
+        # Only include it when the UI toggle is enabled and the value is supported
+        # by the Radarr API (older values like preDb are not accepted by v3+).
+        try:
+            if getattr(settings, "radarr_minimum_availability_enabled", False):
+                avail = getattr(settings, "radarr_minimum_availability", None)
+                # Accept only supported values for v3+ API
+                value = getattr(avail, "value", None) or str(avail or "").strip()
+                if value in _ALLOWED_MINIMUM_AVAILABILITY:
+                    movie_data["minimumAvailability"] = value
+                else:
+                    # Fallback to a safe default when encountering unsupported value
+                    logger.warning(
+                        "Unsupported minimumAvailability '%s'; defaulting to 'announced'",
+                        value,
+                    )
+                    movie_data["minimumAvailability"] = "announced"
+        except Exception:
+            # Never let availability decoration break add flow
+            pass
+
+        # Apply auto-tagging if enabled
+        try:
+            if settings.boxarr_features_auto_tag_enabled:
+                if tag_id is not None:
+                    movie_data["tags"] = [tag_id]
+            else:
+                # Explicitly set empty tags to avoid any defaults
+                movie_data["tags"] = []
+        except Exception as e:
+            logger.warning(f"Auto-tagging skipped due to error: {e}")
+
+        return movie_data
+
+    @staticmethod
+    def _found_tmdb_ids(
+        requests: List[MovieAddRequest], lookups: List[_AddLookup]
+    ) -> List[int]:
+        """TMDB IDs of the requests whose lookup found a movie."""
+        return [
+            request.tmdb_id
+            for request, info in zip(requests, lookups)
+            if isinstance(info, dict)
+        ]
+
+    @staticmethod
+    def _present_tmdb_ids(found: Dict[int, Optional[RadarrMovie]]) -> Set[int]:
+        """TMDB IDs that ``find_movies_by_tmdb_ids`` located in the library."""
+        return {tmdb_id for tmdb_id, movie in found.items() if movie is not None}
+
+    def _prepare_bulk_add(
+        self,
+        requests: List[MovieAddRequest],
+        lookups: List[_AddLookup],
+        in_library: Set[int],
+        default_profile_id: int,
+        monitored: bool,
+        search_for_movie: bool,
+        tag_id: Optional[int],
+    ) -> Tuple[List[Optional[MovieAddResult]], List[Tuple[int, Dict[str, Any]]]]:
+        """
+        Turn lookup results into add payloads.
+
+        Args:
+            requests: Movies to add
+            lookups: Lookup outcome for each request, in the same order
+            in_library: TMDB IDs already in the Radarr library
+            default_profile_id: Profile for requests without one
+            monitored: Whether to monitor added movies
+            search_for_movie: Whether Radarr should search after adding
+            tag_id: Auto-tag to apply, if any
+
+        Returns:
+            Results already known (None where a payload is pending) and
+            (request position, payload) pairs still to submit
+        """
+        results: List[Optional[MovieAddResult]] = [None] * len(requests)
+        pending: List[Tuple[int, Dict[str, Any]]] = []
+        queued: Set[int] = set()
+        for position, (request, info) in enumerate(zip(requests, lookups)):
+            title = request.title or f"TMDB {request.tmdb_id}"
+            if isinstance(info, Exception):
+                results[position] = MovieAddResult(
+                    request.tmdb_id, title, MovieAddStatus.FAILED, error=str(info)
+                )
+            elif not isinstance(info, dict):
+                results[position] = MovieAddResult(
+                    request.tmdb_id,
+                    title,
+                    MovieAddStatus.NOT_FOUND,
+                    error=f"Movie with TMDB ID {request.tmdb_id} not found",
+                )
+            elif request.tmdb_id in in_library or request.tmdb_id in queued:
+                results[position] = MovieAddResult(
+                    request.tmdb_id, info.get("title") or title, MovieAddStatus.EXISTS
+                )
+            else:
+                queued.add(request.tmdb_id)
+                payload = self._build_add_payload(
+                    info,
+                    (
+                        default_profile_id
+                        if request.quality_profile_id is None
+                        else request.quality_profile_id
+                    ),
+                    request.root_folder or str(settings.radarr_root_folder),
+                    monitored,
+                    search_for_movie,
+                    tag_id,
+                )
+                pending.append((position, payload))
+        return results, pending
+
+    def _import_results(
+        self, pending: List[Tuple[int, Dict[str, Any]]], data: Any
+    ) -> List[Tuple[int, MovieAddResult]]:
+        """
+        Match a ``/movie/import`` response back to the submitted payloads.
+
+        Radarr skips movies it refuses (e.g. already added) instead of
+        failing the batch, so those are reported as skipped.
+        """
+        imported: Dict[int, RadarrMovie] = {}
+        for item in data if isinstance(data, list) else []:
+            if isinstance(item, dict):
+                parsed = self._parse_movie(item)
+                imported[parsed.tmdbId] = parsed
+        results = []
+        for position, payload in pending:
+            tmdb_id = payload.get("tmdbId")
+            movie = imported.get(tmdb_id) if isinstance(tmdb_id, int) else None
+            title = str(payload.get("title") or f"TMDB {tmdb_id}")
+            results.append(
+                (
+                    position,
+                    (
+                        MovieAddResult(
+                            cast(int, tmdb_id), movie.title, MovieAddStatus.ADDED, movie
+                        )
+                        if movie
+                        else MovieAddResult(
+                            cast(int, tmdb_id),
+                            title,
+                            MovieAddStatus.SKIPPED,
+                            error="Not imported by Radarr",
+                        )
+                    ),
+                )
+            )
+        return results
+
+    def _single_add_result(
+        self, payload: Dict[str, Any], outcome: Union[Dict[str, Any], Exception]
+    ) -> MovieAddResult:
+        """Report for one movie added with a plain POST /movie."""
+        tmdb_id = cast(int, payload.get("tmdbId"))
+        if isinstance(outcome, Exception):
+            return MovieAddResult(
+                tmdb_id,
+                str(payload.get("title") or f"TMDB {tmdb_id}"),
+                MovieAddStatus.FAILED,
+                error=str(outcome),
+            )
+        movie = self._parse_movie(outcome)
+        return MovieAddResult(tmdb_id, movie.title, MovieAddStatus.ADDED, movie)
+
+    @staticmethod
+    def _finish_bulk_add(
+        results: List[Optional[MovieAddResult]],
+    ) -> List[MovieAddResult]:
+        """Log a summary of a bulk add and return the completed report."""
+        report = [result for result in results if result is not None]
+        counts: Dict[str, int] = {}
+        for result in report:
+            counts[result.status.value] = counts.get(result.status.value, 0) + 1
+        summary = ", ".join(f"{count} {status}" for status, count in counts.items())
+        logger.info(f"Bulk add of {len(report)} movies: {summary or 'nothing to do'}")
+        return report
+
+    @staticmethod
+    def _tmdb_lookup_plan(
+        count: int, fresh: bool
+    ) -> Tuple[str, Optional[LibraryIndex]]:
+        """
+        Decide how to resolve ``count`` TMDB IDs against the library.
+
+        Args:
+            count: Number of distinct TMDB IDs
+            fresh: Whether the cached library must not be used
+
+        Returns:
+            ("index", cached index) when a usable snapshot exists,
+            ("probe", None) to query each ID with ``/movie?tmdbId=``, or
+            ("snapshot", None) to load the whole library
+        """
+        index = None if fresh else _library_cache.peek()
+        if index is not None:
+            plan = "index"
+        elif count <= settings.radarr_probe_threshold:
+            plan = "probe"
+        else:
+            plan = "snapshot"
+        _tmdb_lookup_counts[plan] += 1
+        if plan == "probe":
+            _tmdb_lookup_counts["probe_requests"] += count
+        return plan, index
+
+    def _probe_result(self, tmdb_id: int, data: Any) -> Optional[RadarrMovie]:
+        """
+        Pick the movie out of a ``/movie?tmdbId=`` response.
+
+        Radarr versions that ignore the filter return the whole library,
+        so the match is checked rather than assumed.
+        """
+        return next(
+            (
+                self._parse_movie(item)
+                for item in (data if isinstance(data, list) else [])
+                if isinstance(item, dict) and item.get("tmdbId") == tmdb_id
+            ),
+            None,
+        )
+
+    @staticmethod
+    def _remember_probed(
+        found: Dict[int, Optional[RadarrMovie]],
+    ) -> Dict[int, Optional[RadarrMovie]]:
+        """Patch probed movies that are new or changed into the cached library."""
+        index = _library_cache.index
+        changed: Dict[int, Optional[RadarrMovie]] = {
+            movie.id: movie
+            for movie in found.values()
+            if movie is not None and index.get_by_id(movie.id) != movie
+        }
+        if changed:
+            _library_cache.patch(changed)
+        return found
+
+    def _apply_editor_response(
+        self, movie_ids: List[int], response: httpx.Response
+    ) -> List[RadarrMovie]:
+        """
+        Parse a movie editor response and refresh the cached library.
+
+        Radarr versions that answer without a body leave nothing to patch
+        in, so the cache is invalidated instead.
+
+        Args:
+            movie_ids: Movies sent to the editor
+            response: Editor response
+
+        Returns:
+            Updated movies reported by Radarr (possibly empty)
+        """
+        try:
+            data = response.json() if response.content else []
+        except ValueError:
+            data = []
+        updated = [
+            self._parse_movie(item)
+            for item in (data if isinstance(data, list) else [])
+            if isinstance(item, dict)
+        ]
+        if not updated or not _library_cache.patch({m.id: m for m in updated}):
+            _library_cache.invalidate()
+        logger.info(f"Updated {len(movie_ids)} movies with the Radarr movie editor")
+        return updated
+
+    @staticmethod
+    def _build_update_payload(
+        movie: RadarrMovie, current: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Build the PUT /movie payload for an updated movie.
 
-_movies_cache: Dict[str, Any] = {"ts": 0.0, "data": []}
-_profiles_cache: Dict[str, Any] = {"ts": 0.0, "data": []}
+        Args:
+            movie: Movie carrying the changed fields
+            current: Full raw movie payload freshly fetched from Radarr
+
+        Returns:
+            Movie payload for Radarr
+        """
+        movie_dict = dict(current)
+        movie_dict["qualityProfileId"] = movie.qualityProfileId
+        movie_dict["monitored"] = movie.monitored
+        if movie.rootFolderPath:
+            movie_dict["rootFolderPath"] = movie.rootFolderPath
+        return movie_dict
 
 
-class RadarrService:
+class RadarrService(RadarrServiceBase):
     """Service for interacting with Radarr API."""
 
     def __init__(
@@ -100,6 +971,7 @@ class RadarrService:
         url: Optional[str] = None,
         api_key: Optional[str] = None,
         http_client: Optional[httpx.Client] = None,
+        registry: Optional[HTTPClientRegistry] = None,
     ):
         """
         Initialize Radarr service.
@@ -107,22 +979,16 @@ class RadarrService:
         Args:
             url: Radarr URL (defaults to config)
             api_key: Radarr API key (defaults to config)
-            http_client: Optional HTTP client for testing
+            http_client: Optional HTTP client for testing; closed with the service
+            registry: Client registry to draw the pooled client from
+                (defaults to the process-wide registry)
         """
-        self.url = (url or str(settings.radarr_url)).rstrip("/")
-        self.api_key = api_key or settings.radarr_api_key
-
-        if not self.api_key:
-            raise RadarrAuthenticationError("Radarr API key not provided")
-
-        self.client = http_client or httpx.Client(
-            base_url=self.url,
-            headers={"X-Api-Key": self.api_key},
-            timeout=30.0,
-            follow_redirects=True,
-        )
+        super().__init__(url, api_key)
 
-        self._quality_profiles: Optional[List[QualityProfile]] = None
+        # Pooled clients are owned by the registry and outlive this service
+        self._owns_client = http_client is not None
+        pool = registry or get_client_registry()
+        self.client = http_client or pool.radarr_client(self.url, self.api_key)
 
     def __enter__(self):
         """Context manager entry."""
@@ -133,8 +999,8 @@ class RadarrService:
         self.close()
 
     def close(self) -> None:
-        """Close HTTP client."""
-        if self.client:
+        """Close HTTP client unless it is shared through the client registry."""
+        if self.client and self._owns_client:
             self.client.close()
 
     def _make_request(self, method: str, endpoint: str, **kwargs) -> httpx.Response:
@@ -154,53 +1020,14 @@ class RadarrService:
         """
         try:
             response = self.client.request(method, endpoint, **kwargs)
-
-            if response.status_code == 401:
-                raise RadarrAuthenticationError("Invalid API key")
-            elif response.status_code == 404:
-                raise RadarrNotFoundError(f"Resource not found: {endpoint}")
-
-            response.raise_for_status()
+            record_request("radarr", response)
+            self._check_response(response, endpoint)
             return response
-
-        except httpx.ConnectError as e:
-            logger.error(f"Failed to connect to Radarr: {e}")
-            raise RadarrConnectionError(
-                f"Cannot connect to Radarr at {self.url}"
-            ) from e
-        except httpx.HTTPError as e:
-            # Include response details when available to aid debugging
-            try:
-                resp = e.response  # type: ignore[attr-defined]
-                body = None
-                if resp is not None:
-                    # Prefer JSON message when present
-                    try:
-                        j = resp.json()
-                        # Radarr usually returns {"message": "..."} or {"errors": [...]}
-                        if isinstance(j, dict):
-                            if "message" in j:
-                                body = str(j.get("message"))
-                            elif "errors" in j and isinstance(j.get("errors"), list):
-                                body = "; ".join(str(x) for x in j.get("errors")[:3])
-                    except Exception:
-                        # Fall back to raw text (trim to avoid log spam)
-                        body = resp.text[:300]
-                logger.error(
-                    "Radarr API error: %s (status %s) %s",
-                    e,
-                    getattr(resp, "status_code", "unknown"),
-                    f"- {body}" if body else "",
-                )
-            except Exception:
-                logger.error(f"Radarr API error: {e}")
-            raise RadarrError(f"Radarr API error: {e}") from e
         except RadarrError:
             # Re-raise intentionally thrown Radarr* errors
             raise
         except Exception as e:
-            logger.error(f"Unexpected Radarr API error: {e}")
-            raise RadarrError(f"Radarr API error: {e}") from e
+            raise self._translate_error(e) from e
 
     def test_connection(self) -> bool:
         """
@@ -224,81 +1051,139 @@ class RadarrService:
         Returns:
             List of RadarrMovie objects
         """
-        # Simple in-memory TTL cache (shared across service instances)
+        return cast(List[RadarrMovie], self.get_library_index(ignore_cache).movies)
+
+    def get_library_index(self, ignore_cache: bool = False) -> LibraryIndex:
+        """
+        Get the indexed Radarr library.
+
+        The index is shared across service instances. Once the soft TTL
+        passes, the previous snapshot keeps being served while one
+        background refresh runs; concurrent misses share a single fetch.
+
+        Args:
+            ignore_cache: Force a fresh fetch from Radarr
+
+        Returns:
+            LibraryIndex over the current library
+        """
+        # Shared cache: stale-while-revalidate with a single fetch in flight
+        return _library_cache.get(self._fetch_library, force=ignore_cache)
+
+    def _fetch_library(self) -> LibrarySnapshot:
+        """Refresh the library, incrementally when configured and possible."""
+        mode, since = _plan_library_sync()
+        started_at = _library_sync.started()
+        if mode == "incremental" and since:
+            try:
+                delta = self._fetch_library_delta(since, started_at)
+                if delta is not None:
+                    return delta
+            except RadarrError as e:
+                _library_sync.record_failure()
+                logger.warning(f"Incremental library sync failed, doing full: {e}")
+
+        index = self._stream_library()
+        _library_sync.record("full", started_at)
+        logger.info(f"Fetched {len(index)} movies from Radarr")
+        return index
+
+    def _stream_library(self) -> LibraryIndex:
+        """
+        Download the full library, indexing movies as the body arrives.
+
+        Only one raw movie dict is alive at a time, instead of the whole
+        decoded response next to the parsed records.
+
+        Returns:
+            Index of every movie in Radarr
+        """
+        endpoint = "/api/v3/movie"
+        index = LibraryIndex()
+        parser = JSONArrayParser()
         try:
-            ttl = getattr(settings, "radarr_cache_ttl_seconds", 120)
-        except Exception:
-            ttl = 120
+            with self.client.stream("GET", endpoint) as response:
+                if response.is_error:
+                    response.read()
+                self._check_response(response, endpoint)
+                for chunk in response.iter_bytes():
+                    self._index_movies(index, parser.feed(chunk))
+            record_request("radarr", response)
+            self._index_movies(index, parser.close())
+        except RadarrError:
+            raise
+        except Exception as e:
+            raise self._translate_error(e) from e
+        return index
 
-        now = __import__("time").time()
-        if (
-            not ignore_cache
-            and _movies_cache["data"]
-            and (now - _movies_cache["ts"]) < ttl
-        ):
-            return cast(List[RadarrMovie], _movies_cache["data"])
+    def _fetch_library_delta(
+        self, since: str, started_at: float
+    ) -> Optional[List[RadarrMovie]]:
+        """
+        Patch the cached library with movies changed since the last sync.
 
-        response = self._make_request("GET", "/api/v3/movie")
-        movies: List[RadarrMovie] = []
+        Args:
+            since: ISO-8601 UTC timestamp to read history from
+            started_at: Sync start time to record on success
 
-        for movie_data in response.json():
-            movie = self._parse_movie(movie_data)
-            movies.append(movie)
+        Returns:
+            Updated movie list, or None when so many movies changed that a
+            full download is cheaper
+        """
+        response = self._make_request(
+            "GET", "/api/v3/history/since", params={"date": since}
+        )
+        changed = _changed_movie_ids(response.json())
+        if _delta_too_large(changed, since):
+            return None
+        updates: Dict[int, Optional[RadarrMovie]] = {}
+        for movie_id in sorted(changed):
+            try:
+                updates[movie_id] = self.get_movie(movie_id)
+            except RadarrNotFoundError:
+                updates[movie_id] = None
 
-        _movies_cache["data"] = movies
-        _movies_cache["ts"] = now
-        logger.info(f"Fetched {len(movies)} movies from Radarr")
-        return movies
+        movies = apply_library_delta(_library_cache.index.movies, updates)
+        removed = sum(1 for movie in updates.values() if movie is None)
+        _library_sync.record("incremental", started_at, len(updates) - removed, removed)
+        logger.debug(f"Incremental library sync: {len(updates)} changed since {since}")
+        return cast(List[RadarrMovie], movies)
 
     # Tag management helpers
     def get_tags(self) -> List[Dict[str, Any]]:
-        """Fetch all tags from Radarr."""
-        response = self._make_request("GET", "/api/v3/tag")
+        """Fetch all tags from Radarr (cached)."""
+        cached = self._cached_metadata("tags")
+        if cached is not None:
+            return cast(List[Dict[str, Any]], cached)
+        try:
+            response = self._make_request("GET", "/api/v3/tag")
+        except RadarrError as e:
+            return cast(List[Dict[str, Any]], self._fallback_metadata("tags", e))
         data = response.json()
-        return data if isinstance(data, list) else []
+        return self._store_metadata("tags", data if isinstance(data, list) else [])
 
     def get_tag_by_label(self, label: str) -> Optional[Dict[str, Any]]:
         """Find a tag by its label (case-insensitive)."""
         try:
-            tags = self.get_tags()
-            for tag in tags:
-                if (
-                    isinstance(tag, dict)
-                    and tag.get("label", "").lower() == label.lower()
-                ):
-                    return tag
+            return self._find_tag(self.get_tags(), label)
         except Exception:
-            pass
-        return None
+            return None
 
     def create_tag(self, label: str) -> Optional[int]:
         """Create a new tag and return its ID."""
         response = self._make_request("POST", "/api/v3/tag", json={"label": label})
         tag = response.json()
+        self._record_created_tag(tag)
         if isinstance(tag, dict):
-            tag_id = tag.get("id")
-            if isinstance(tag_id, int):
-                return tag_id
             # Some Radarr versions may return string IDs; attempt to cast
-            if isinstance(tag_id, (str, bytes)):
-                try:
-                    return int(str(tag_id))
-                except Exception:
-                    return None
+            return _coerce_id(tag.get("id"))
         return None
 
     def ensure_tag(self, label: str) -> Optional[int]:
         """Ensure a tag with given label exists in Radarr and return its ID."""
         existing = self.get_tag_by_label(label)
         if existing and isinstance(existing, dict):
-            ex_id = existing.get("id")
-            if isinstance(ex_id, int):
-                return ex_id
-            if isinstance(ex_id, (str, bytes)):
-                try:
-                    return int(str(ex_id))
-                except Exception:
-                    return None
+            return _coerce_id(existing.get("id"))
         try:
             return self.create_tag(label)
         except Exception as e:
@@ -315,24 +1200,44 @@ class RadarrService:
         Returns:
             RadarrMovie object
         """
+        return self._parse_movie(self.get_movie_raw(movie_id))
+
+    def get_movie_raw(self, movie_id: int) -> Dict[str, Any]:
+        """
+        Get the complete Radarr payload for one movie.
+
+        Args:
+            movie_id: Radarr movie ID
+
+        Returns:
+            Raw movie dict, as required by PUT /movie
+        """
         response = self._make_request("GET", f"/api/v3/movie/{movie_id}")
-        return self._parse_movie(response.json())
+        return cast(Dict[str, Any], response.json())
 
-    def search_movie(self, term: str) -> List[Dict[str, Any]]:
+    def search_movie(self, term: str, **kwargs) -> List[Dict[str, Any]]:
         """
         Search for movies using Radarr's search.
 
         Args:
             term: Search term
+            **kwargs: Additional request arguments (e.g. ``timeout``)
 
         Returns:
-            List of search results
+            List of search results (served from the lookup cache when fresh)
         """
+        cached = _lookup_cache.get(term)
+        if cached is not None:
+            return cached
+
         response = self._make_request(
-            "GET", "/api/v3/movie/lookup", params={"term": term}
+            "GET", "/api/v3/movie/lookup", params={"term": term}, **kwargs
         )
         result = response.json()
-        return result if isinstance(result, list) else []
+        if not isinstance(result, list):
+            return []
+        _lookup_cache.put(term, result)
+        return result
 
     def add_movie(
         self,
@@ -360,20 +1265,9 @@ class RadarrService:
         if not search_results:
             raise RadarrNotFoundError(f"Movie with TMDB ID {tmdb_id} not found")
 
-        movie_info = search_results[0]
-
         # Use defaults from config if not specified
         if quality_profile_id is None:
-            profiles = self.get_quality_profiles()
-            default_profile = next(
-                (
-                    p
-                    for p in profiles
-                    if p.name == settings.radarr_quality_profile_default
-                ),
-                profiles[0] if profiles else None,
-            )
-            quality_profile_id = default_profile.id if default_profile else 1
+            quality_profile_id = self._default_profile_id(self.get_quality_profiles())
 
         if root_folder is None:
             root_folder = str(settings.radarr_root_folder)
@@ -381,67 +1275,153 @@ class RadarrService:
         if search_for_movie is None:
             search_for_movie = settings.radarr_search_for_movie
 
-        # Prepare movie data
-        add_options: Dict[str, Any] = {
-            "searchForMovie": search_for_movie,
-            "monitor": settings.radarr_monitor_option.value,
-        }
+        movie_data = self._build_add_payload(
+            search_results[0],
+            quality_profile_id,
+            root_folder,
+            monitored,
+            search_for_movie,
+            self._auto_tag_id(),
+        )
 
-        movie_data: Dict[str, Any] = {
-            **movie_info,
-            "qualityProfileId": quality_profile_id,
-            "rootFolderPath": root_folder,
-            "monitored": monitored,
-            "addOptions": add_options,
-        }
+        response = self._make_request("POST", "/api/v3/movie", json=movie_data)
+        added_movie = self._parse_movie(response.json())
 
-        # Radarr expects minimumAvailability at the top level of the movie payload.
-        # Only include it when the UI toggle is enabled and the value is supported
-        # by the Radarr API (older values like preDb are not accepted by v3+).
+        logger.info(f"Added movie to Radarr: {added_movie.title}")
+        # Make the new movie visible without refetching the library
+        self._remember_added([added_movie])
+        return added_movie
+
+    def add_movies_bulk(
+        self,
+        requests: List[MovieAddRequest],
+        monitored: bool = True,
+        search_for_movie: Optional[bool] = None,
+    ) -> List[MovieAddResult]:
+        """
+        Add several movies to Radarr at once.
+
+        Lookups run concurrently and the movies are submitted in a single
+        ``/api/v3/movie/import`` request. If Radarr rejects the batch (e.g.
+        an older version without the endpoint), the movies are added one
+        by one with bounded concurrency instead. A failure affects only
+        the movie concerned.
+
+        Args:
+            requests: Movies to add
+            monitored: Whether to monitor added movies
+            search_for_movie: Whether to search for movies immediately
+
+        Returns:
+            One result per request, in request order
+        """
+        if not requests:
+            return []
+        if search_for_movie is None:
+            search_for_movie = settings.radarr_search_for_movie
+
+        workers = min(settings.radarr_bulk_add_concurrency, len(requests))
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="radarr-bulk"
+        ) as pool:
+            lookups = list(pool.map(carry_run_stats(self._lookup_for_add), requests))
+
+        # Profiles and the tag are only needed if something can be added
+        found = any(isinstance(info, dict) for info in lookups)
+        in_library = self._library_tmdb_ids(self._found_tmdb_ids(requests, lookups))
+        default_profile_id = 1
+        if found and any(r.quality_profile_id is None for r in requests):
+            default_profile_id = self._default_profile_id(self.get_quality_profiles())
+
+        results, pending = self._prepare_bulk_add(
+            requests,
+            lookups,
+            in_library,
+            default_profile_id,
+            monitored,
+            search_for_movie,
+            self._auto_tag_id() if found else None,
+        )
+        if pending:
+            try:
+                response = self._make_request(
+                    "POST",
+                    "/api/v3/movie/import",
+                    json=[p for _, p in pending],
+                    **self._add_request_options(),
+                )
+                added = self._import_results(pending, response.json())
+            except RadarrAuthenticationError:
+                raise
+            except RadarrTimeoutError as e:
+                # The import may still complete, so the cached library
+                # cannot be patched reliably
+                self.bust_cache()
+                added = self._timed_out_adds(pending, e)
+            except RadarrError as e:
+                logger.info(f"Bulk import unavailable, adding one by one: {e}")
+                added = self._add_individually(pending, workers)
+            for position, result in added:
+                results[position] = result
+            self._remember_added([result.movie for _, result in added if result.movie])
+        return self._finish_bulk_add(results)
+
+    def _library_tmdb_ids(self, tmdb_ids: List[int]) -> Set[int]:
+        """
+        Which of ``tmdb_ids`` are already in the library.
+
+        Answered by the library index or filtered probes rather than the
+        lookup results, whose Radarr IDs may be stale. If the check fails,
+        nothing is treated as present; Radarr still refuses duplicates.
+        """
+        if not tmdb_ids:
+            return set()
         try:
-            if getattr(settings, "radarr_minimum_availability_enabled", False):
-                avail = getattr(settings, "radarr_minimum_availability", None)
-                # Accept only supported values for v3+ API
-                allowed = {"announced", "inCinemas", "released"}
-                value = getattr(avail, "value", None) or str(avail or "").strip()
-                if value in allowed:
-                    movie_data["minimumAvailability"] = value
-                else:
-                    # Fallback to a safe default when encountering unsupported value
-                    logger.warning(
-                        "Unsupported minimumAvailability '%s'; defaulting to 'announced'",
-                        value,
-                    )
-                    movie_data["minimumAvailability"] = "announced"
-        except Exception:
-            # Never let availability decoration break add flow
-            pass
+            return self._present_tmdb_ids(self.find_movies_by_tmdb_ids(tmdb_ids))
+        except RadarrError as e:
+            logger.warning(f"Could not check library before adding: {e}")
+            return set()
 
-        # Apply auto-tagging if enabled
+    def _lookup_for_add(self, request: MovieAddRequest) -> _AddLookup:
+        """Look up one movie for a bulk add, capturing errors."""
         try:
-            if settings.boxarr_features_auto_tag_enabled:
-                label = settings.boxarr_features_auto_tag_text
-                if isinstance(label, str) and label.strip():
-                    tag_id = self.ensure_tag(label.strip())
-                    if tag_id is not None:
-                        movie_data["tags"] = [tag_id]
-            else:
-                # Explicitly set empty tags to avoid any defaults
-                movie_data["tags"] = []
-        except Exception as e:
-            logger.warning(f"Auto-tagging skipped due to error: {e}")
+            found = self.search_movie(
+                f"tmdb:{request.tmdb_id}", **self._add_request_options()
+            )
+        except RadarrError as e:
+            return e
+        return found[0] if found else None
 
-        response = self._make_request("POST", "/api/v3/movie", json=movie_data)
-        added_movie = self._parse_movie(response.json())
+    def _add_individually(
+        self, pending: List[Tuple[int, Dict[str, Any]]], workers: int
+    ) -> List[Tuple[int, MovieAddResult]]:
+        """POST each payload separately, ``workers`` at a time."""
 
-        logger.info(f"Added movie to Radarr: {added_movie.title}")
-        # Invalidate library cache so new movie is visible immediately
+        def add(payload: Dict[str, Any]) -> MovieAddResult:
+            try:
+                response = self._make_request(
+                    "POST", "/api/v3/movie", json=payload, **self._add_request_options()
+                )
+            except RadarrError as e:
+                return self._single_add_result(payload, e)
+            return self._single_add_result(payload, response.json())
+
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="radarr-bulk"
+        ) as pool:
+            added = list(
+                pool.map(carry_run_stats(add), [payload for _, payload in pending])
+            )
+        return [(position, result) for (position, _), result in zip(pending, added)]
+
+    def _auto_tag_id(self) -> Optional[int]:
+        """ID of the auto-tag for added movies, creating it if needed."""
         try:
-            _movies_cache["ts"] = 0.0
-            _movies_cache["data"] = []
-        except Exception:
-            pass
-        return added_movie
+            label = self._auto_tag_label()
+            return self.ensure_tag(label) if label else None
+        except Exception as e:
+            logger.warning(f"Auto-tagging skipped due to error: {e}")
+            return None
 
     def update_movie(self, movie: RadarrMovie) -> RadarrMovie:
         """
@@ -453,29 +1433,8 @@ class RadarrService:
         Returns:
             Updated movie
         """
-        # Use the raw data if available, otherwise construct minimal object
-        if hasattr(movie, "_raw_data") and movie._raw_data:
-            movie_dict = movie._raw_data.copy()
-            # Update the changed fields
-            movie_dict["qualityProfileId"] = movie.qualityProfileId
-            movie_dict["monitored"] = movie.monitored
-            movie_dict["rootFolderPath"] = movie.rootFolderPath
-        else:
-            # Fallback: Get the full movie data first
-            current_movie = self.get_movie(movie.id)
-            if hasattr(current_movie, "_raw_data") and current_movie._raw_data:
-                movie_dict = current_movie._raw_data.copy()
-                movie_dict["qualityProfileId"] = movie.qualityProfileId
-            else:
-                # Last resort: construct minimal object
-                movie_dict = {
-                    "id": movie.id,
-                    "title": movie.title,
-                    "tmdbId": movie.tmdbId,
-                    "qualityProfileId": movie.qualityProfileId,
-                    "monitored": movie.monitored,
-                    "rootFolderPath": movie.rootFolderPath,
-                }
+        # Records don't keep the raw payload; fetch it just for this update
+        movie_dict = self._build_update_payload(movie, self.get_movie_raw(movie.id))
 
         response = self._make_request(
             "PUT", f"/api/v3/movie/{movie.id}", json=movie_dict
@@ -498,9 +1457,15 @@ class RadarrService:
         Returns:
             Updated movie
         """
-        movie = self.get_movie(movie_id)
-        movie.qualityProfileId = quality_profile_id
-        return self.update_movie(movie)
+        movie_dict = self.get_movie_raw(movie_id)
+        movie_dict["qualityProfileId"] = quality_profile_id
+        response = self._make_request(
+            "PUT", f"/api/v3/movie/{movie_id}", json=movie_dict
+        )
+
+        updated_movie = self._parse_movie(response.json())
+        logger.info(f"Updated movie in Radarr: {updated_movie.title}")
+        return updated_movie
 
     def delete_movie(self, movie_id: int, delete_files: bool = False) -> None:
         """
@@ -521,40 +1486,17 @@ class RadarrService:
         Returns:
             List of QualityProfile objects
         """
-        # Prefer global cache with TTL to reduce repeated fetches
-        try:
-            ttl = getattr(settings, "radarr_cache_ttl_seconds", 120)
-        except Exception:
-            ttl = 120
-
-        now = __import__("time").time()
-        if (
-            not ignore_cache
-            and _profiles_cache["data"]
-            and (now - _profiles_cache["ts"]) < ttl
-        ):
-            return cast(List[QualityProfile], _profiles_cache["data"])
+        # Prefer the shared metadata cache to reduce repeated fetches
+        cached = None if ignore_cache else self._cached_metadata("profiles")
+        if cached is not None:
+            return self._parse_quality_profiles(cached)
 
-        response = self._make_request("GET", "/api/v3/qualityProfile")
-        profiles: List[QualityProfile] = []
-        for profile in response.json():
-            # Only extract the fields we need, ignore extra fields from newer Radarr versions
-            filtered_profile = {
-                "id": profile.get("id"),
-                "name": profile.get("name"),
-                "upgradeAllowed": profile.get("upgradeAllowed", False),
-                "cutoff": profile.get("cutoff", 0),
-                "items": profile.get("items", []),
-                "minFormatScore": profile.get("minFormatScore", 0),
-                "cutoffFormatScore": profile.get("cutoffFormatScore", 0),
-                "minUpgradeFormatScore": profile.get("minUpgradeFormatScore", 0),
-                "formatItems": profile.get("formatItems", []),
-                "language": profile.get("language"),
-            }
-            profiles.append(QualityProfile(**filtered_profile))
+        try:
+            data = self._make_request("GET", "/api/v3/qualityProfile").json()
+        except RadarrError as e:
+            return self._parse_quality_profiles(self._fallback_metadata("profiles", e))
+        profiles = self._parse_quality_profiles(self._store_metadata("profiles", data))
 
-        _profiles_cache["data"] = profiles
-        _profiles_cache["ts"] = now
         self._quality_profiles = profiles
         return profiles
 
@@ -568,22 +1510,18 @@ class RadarrService:
         Returns:
             QualityProfile or None if not found
         """
-        profiles = self.get_quality_profiles()
-        for profile in profiles:
-            if profile.name.lower() == name.lower():
-                return profile
-        return None
+        return self._find_profile_by_name(self.get_quality_profiles(), name)
 
     def bust_cache(self) -> None:
         """Invalidate the in-memory movie cache so the next call fetches fresh data."""
-        _movies_cache["ts"] = 0.0
-        _movies_cache["data"] = []
+        _library_cache.invalidate()
+        _library_sync.reset()
 
     def find_movie_by_tmdb_id(self, tmdb_id: int) -> Optional[RadarrMovie]:
         """
         Look up a movie in the Radarr library by TMDB ID.
 
-        Uses the cached movie list for efficiency.
+        Uses the cached library index for efficiency.
 
         Args:
             tmdb_id: TMDB ID to search for
@@ -591,65 +1529,90 @@ class RadarrService:
         Returns:
             RadarrMovie if found, None otherwise
         """
-        movies = self.get_all_movies()
-        for movie in movies:
-            if movie.tmdbId == tmdb_id:
-                return movie
-        return None
+        return cast(
+            Optional[RadarrMovie], self.get_library_index().get_by_tmdb_id(tmdb_id)
+        )
 
-    def search_movie_by_title(self, title: str) -> Optional[RadarrMovie]:
+    def find_movies_by_tmdb_ids(
+        self, tmdb_ids: List[int], fresh: bool = False
+    ) -> Dict[int, Optional[RadarrMovie]]:
         """
-        Search for movie in library by title.
+        Look up several movies in the Radarr library by TMDB ID.
+
+        A usable cached library answers directly. Otherwise, up to
+        ``radarr.probe_threshold`` IDs are checked with server-side
+        filtered queries (``/api/v3/movie?tmdbId=``) instead of
+        downloading the whole library.
 
         Args:
-            title: Movie title to search
+            tmdb_ids: TMDB IDs to look up
+            fresh: Ignore the cached library (e.g. duplicate checks)
 
         Returns:
-            First matching movie or None
+            TMDB ID -> movie, or None when not in the library
         """
-        movies = self.get_all_movies()
-        title_lower = title.lower()
+        ids = list(dict.fromkeys(tmdb_ids))
+        if not ids:
+            return {}
+        plan, index = self._tmdb_lookup_plan(len(ids), fresh)
+        if plan == "probe":
+            workers = min(settings.radarr_bulk_add_concurrency, len(ids))
+            with ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="radarr-probe"
+            ) as pool:
+                probe = carry_run_stats(self._probe_tmdb_id)
+                found = dict(zip(ids, pool.map(probe, ids)))
+            return self._remember_probed(found)
+        if index is None:
+            index = self.get_library_index(ignore_cache=fresh)
+        return {tmdb_id: index.get_by_tmdb_id(tmdb_id) for tmdb_id in ids}
+
+    def _probe_tmdb_id(self, tmdb_id: int) -> Optional[RadarrMovie]:
+        """Fetch one movie with a filtered library query."""
+        response = self._make_request(
+            "GET", "/api/v3/movie", params={"tmdbId": tmdb_id}
+        )
+        return self._probe_result(tmdb_id, response.json())
 
-        # Exact match
-        for movie in movies:
-            if movie.title.lower() == title_lower:
-                return movie
+    def find_movie_by_imdb_id(self, imdb_id: str) -> Optional[RadarrMovie]:
+        """
+        Look up a movie in the Radarr library by IMDb ID.
 
-        # Partial match
-        for movie in movies:
-            if title_lower in movie.title.lower():
-                return movie
+        Args:
+            imdb_id: IMDb ID (e.g. "tt1877830")
 
-        return None
+        Returns:
+            RadarrMovie if found, None otherwise
+        """
+        return cast(
+            Optional[RadarrMovie], self.get_library_index().get_by_imdb_id(imdb_id)
+        )
 
-    def _parse_movie(self, data: Dict[str, Any]) -> RadarrMovie:
+    def find_movie_by_id(self, movie_id: int) -> Optional[RadarrMovie]:
         """
-        Parse movie data into RadarrMovie object.
+        Look up a movie in the cached Radarr library by Radarr ID.
 
         Args:
-            data: Raw movie data from API
+            movie_id: Radarr movie ID
 
         Returns:
-            RadarrMovie object
+            RadarrMovie if found, None otherwise
         """
-        return RadarrMovie(
-            id=data["id"],
-            title=data["title"],
-            tmdbId=data.get("tmdbId", 0),
-            imdbId=data.get("imdbId"),
-            year=data.get("year"),
-            status=MovieStatus(data["status"]) if "status" in data else None,
-            overview=data.get("overview"),
-            hasFile=data.get("hasFile", False),
-            monitored=data.get("monitored", True),
-            isAvailable=data.get("isAvailable", False),
-            qualityProfileId=data.get("qualityProfileId"),
-            rootFolderPath=data.get("rootFolderPath"),
-            movieFile=data.get("movieFile"),
-            images=data.get("images", []),
-            genres=data.get("genres", []),
-            runtime=data.get("runtime"),
-            _raw_data=data,  # Store the complete raw data
+        return cast(Optional[RadarrMovie], self.get_library_index().get_by_id(movie_id))
+
+    def search_movie_by_title(self, title: str) -> Optional[RadarrMovie]:
+        """
+        Search for movie in library by title.
+
+        Args:
+            title: Movie title to search
+
+        Returns:
+            First matching movie or None
+        """
+        # Exact match is an index lookup; partial match scans only on a miss
+        return cast(
+            Optional[RadarrMovie], self.get_library_index().find_by_title(title)
         )
 
     def get_system_status(self) -> Dict[str, Any]:
@@ -659,9 +1622,17 @@ class RadarrService:
         Returns:
             System status information
         """
-        response = self._make_request("GET", "/api/v3/system/status")
+        cached = self._cached_metadata("system_status")
+        if cached is not None:
+            return cast(Dict[str, Any], cached)
+        try:
+            response = self._make_request("GET", "/api/v3/system/status")
+        except RadarrError as e:
+            return cast(Dict[str, Any], self._fallback_metadata("system_status", e))
         result = response.json()
-        return result if isinstance(result, dict) else {}
+        return self._store_metadata(
+            "system_status", result if isinstance(result, dict) else {}
+        )
 
     def get_root_folders(self) -> List[Dict[str, Any]]:
         """
@@ -674,9 +1645,19 @@ class RadarrService:
         Raises:
             RadarrError: If request fails
         """
-        response = self._make_request("GET", "/api/v3/rootFolder")
+        cached = self._cached_metadata("root_folders")
+        if cached is not None:
+            return cast(List[Dict[str, Any]], cached)
+        try:
+            response = self._make_request("GET", "/api/v3/rootFolder")
+        except RadarrError as e:
+            return cast(
+                List[Dict[str, Any]], self._fallback_metadata("root_folders", e)
+            )
         result = response.json()
-        return result if isinstance(result, list) else []
+        return self._store_metadata(
+            "root_folders", result if isinstance(result, list) else []
+        )
 
     def get_root_folder_paths(self) -> List[str]:
         """
@@ -728,6 +1709,31 @@ class RadarrService:
         # Use existing upgrade_movie_quality method
         return self.upgrade_movie_quality(movie_id, profile_id)
 
+    def update_movies_quality_profile(
+        self, movie_ids: List[int], profile_id: int
+    ) -> List[RadarrMovie]:
+        """
+        Switch several movies to a quality profile in one request.
+
+        Args:
+            movie_ids: Movie IDs in Radarr
+            profile_id: New quality profile ID
+
+        Returns:
+            Updated movies as reported by Radarr
+
+        Raises:
+            RadarrError: If the update fails
+        """
+        if not movie_ids:
+            return []
+        response = self._make_request(
+            "PUT",
+            "/api/v3/movie/editor",
+            json={"movieIds": list(movie_ids), "qualityProfileId": profile_id},
+        )
+        return self._apply_editor_response(list(movie_ids), response)
+
     def trigger_movie_search(self, movie_id: int) -> bool:
         """
         Trigger a search for a specific movie in Radarr.
@@ -737,13 +1743,22 @@ class RadarrService:
 
         Returns:
             True if command was successfully sent
+        """
+        return self.trigger_movies_search([movie_id])
 
-        Raises:
-            RadarrError: If command fails
+    def trigger_movies_search(self, movie_ids: List[int]) -> bool:
+        """
+        Trigger one search command covering several movies.
+
+        Args:
+            movie_ids: Movie IDs in Radarr
+
+        Returns:
+            True if command was successfully sent
         """
         try:
-            # Send command to Radarr to search for the movie
-            command_data = {"name": "MoviesSearch", "movieIds": [movie_id]}
+            # Send command to Radarr to search for the movies
+            command_data = {"name": "MoviesSearch", "movieIds": list(movie_ids)}
 
             response = self._make_request("POST", "/api/v3/command", json=command_data)
 
@@ -751,5 +1766,5 @@ class RadarrService:
             result = response.json()
             return result.get("status") in ["queued", "started", "completed"]
         except Exception as e:
-            logger.error(f"Failed to trigger search for movie {movie_id}: {e}")
+            logger.error(f"Failed to trigger search for movies {movie_ids}: {e}")
             return False
@@ -11,15 +11,17 @@ logger = get_logger(__name__)
 class RootFolderManager:
     """Manages root folder selection based on configuration and movie metadata."""
 
-    def __init__(self, radarr_service=None):
+    def __init__(self, radarr_service=None, root_folders: Optional[List[str]] = None):
         """
         Initialize root folder manager.
 
         Args:
             radarr_service: Optional RadarrService instance for fetching available folders
+            root_folders: Root folder paths already fetched by the caller (e.g.
+                from AsyncRadarrService), used instead of a blocking fetch
         """
         self.radarr_service = radarr_service
-        self._available_folders_cache = None
+        self._available_folders_cache = root_folders
 
     def get_available_root_folders(self) -> List[str]:
         """
@@ -101,24 +103,36 @@ class RootFolderManager:
         Returns:
             Dictionary with folder paths as keys and stats as values
         """
-        stats = {}
-
         if self.radarr_service:
             try:
-                folders = self.radarr_service.get_root_folders()
-                for folder in folders:
-                    path = folder.get("path", "")
-                    if path:
-                        stats[path] = {
-                            "id": folder.get("id"),
-                            "accessible": folder.get("accessible", False),
-                            "freeSpace": folder.get("freeSpace", 0),
-                            "totalSpace": folder.get("totalSpace", 0),
-                            "unmappedFolders": folder.get("unmappedFolders", []),
-                        }
+                return self.build_folder_stats(self.radarr_service.get_root_folders())
             except Exception as e:
                 logger.error(f"Failed to get root folder stats: {e}")
 
+        return {}
+
+    @staticmethod
+    def build_folder_stats(folders: List[Dict]) -> Dict[str, Dict]:
+        """
+        Summarize a /rootFolder response into per-path statistics.
+
+        Args:
+            folders: Root folder records as returned by Radarr
+
+        Returns:
+            Dictionary with folder paths as keys and stats as values
+        """
+        stats = {}
+        for folder in folders:
+            path = folder.get("path", "")
+            if path:
+                stats[path] = {
+                    "id": folder.get("id"),
+                    "accessible": folder.get("accessible", False),
+                    "freeSpace": folder.get("freeSpace", 0),
+                    "totalSpace": folder.get("totalSpace", 0),
+                    "unmappedFolders": folder.get("unmappedFolders", []),
+                }
         return stats
 
     def suggest_folder_for_genres(self, genres: List[str]) -> Optional[str]:
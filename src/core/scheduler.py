@@ -1,11 +1,10 @@
 """Scheduler service for automated box office updates."""
 
 import asyncio
-import json
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple, cast
 
 import pytz
 from apscheduler.events import EVENT_JOB_ERROR, EVENT_JOB_EXECUTED
@@ -14,15 +13,39 @@ from apscheduler.triggers.cron import CronTrigger
 
 from ..utils.config import settings
 from ..utils.logger import get_logger
-from .boxoffice import BoxOfficeService, MatchResult, match_box_office_to_radarr
+from .async_boxoffice import AsyncBoxOfficeService
+from .async_radarr import AsyncRadarrService
+from .auto_add_policy import get_auto_add_policy
+from .boxoffice import (
+    BoxOfficeService,
+    MatchResult,
+    match_box_office_to_radarr,
+    rematch_unmatched,
+    unmatched_tmdb_ids,
+)
 from .exceptions import SchedulerError
+from .history import get_history_store
+from .jobs import Job, JobPriority, get_job_queue
 from .json_generator import WeeklyDataGenerator
+from .metrics import PipelineMetrics, carry_run_stats
 from .models import MovieStatus
-from .radarr import RadarrService
+from .radarr import MovieAddRequest, RadarrService
 from .root_folder_manager import RootFolderManager
+from .single_flight import SingleFlight
 
 logger = get_logger(__name__)
 
+# One box office update at a time, across the cron job, manual triggers
+# and other Boxarr processes sharing the data directory
+_update_flight = SingleFlight(
+    lambda: Path(settings.boxarr_data_directory) / "update_box_office.lock"
+)
+
+
+def get_update_lock_stats() -> Dict[str, Any]:
+    """Counters of the box office update single-flight lock."""
+    return _update_flight.stats()
+
 
 class BoxarrScheduler:
     """Scheduler for automated box office tracking."""
@@ -53,7 +76,13 @@ class BoxarrScheduler:
         self.boxoffice_service = boxoffice_service
         self.radarr_service = radarr_service
 
-        self._executor = ThreadPoolExecutor(max_workers=2)
+        # Disk-bound work only (data generation, history); Radarr and Trakt
+        # requests are async, limited by radarr.bulk_add_concurrency and
+        # trakt.max_concurrency, so a slow add never holds these threads
+        self._executor = ThreadPoolExecutor(
+            max_workers=settings.boxarr_scheduler_disk_workers,
+            thread_name_prefix="scheduler-disk",
+        )
         self._running = False
 
         # Add event listeners
@@ -76,7 +105,7 @@ class BoxarrScheduler:
 
                 # Schedule the main job
                 job = self.scheduler.add_job(
-                    self.update_box_office,
+                    self._run_queued_update,
                     CronTrigger.from_crontab(settings.boxarr_scheduler_cron),
                     id="box_office_update",
                     name="Box Office Update",
@@ -123,18 +152,76 @@ class BoxarrScheduler:
         self._running = False
         logger.info("Scheduler stopped")
 
-    async def update_box_office(self) -> Dict[str, Any]:  # noqa: C901
+    def queue_update(
+        self, priority: JobPriority = JobPriority.MANUAL
+    ) -> Tuple[Job, bool]:
+        """
+        Queue a box office update on the job queue.
+
+        While an update is queued or running, further requests join that
+        job instead of starting another run.
+
+        Args:
+            priority: MANUAL for user-triggered runs, SCHEDULED for cron runs
+
+        Returns:
+            The job and whether it was already queued or running
+        """
+        return get_job_queue().submit(
+            "box_office_update", self._update_job, priority=priority
+        )
+
+    async def _run_queued_update(
+        self, priority: JobPriority = JobPriority.SCHEDULED
+    ) -> None:
+        """Queue an update and wait for it (APScheduler entry point)."""
+        job, _ = self.queue_update(priority)
+        await get_job_queue().wait(job)
+        if job.error:
+            raise SchedulerError(f"Update failed: {job.error}")
+
+    async def _update_job(self, job: Job) -> Dict[str, Any]:
+        """Run an update for the job queue and summarize the outcome."""
+        results = await self.update_box_office(
+            progress=lambda stage: job.report(f"Running {stage.replace('_', ' ')}")
+        )
+        added_movies = results.get("added_movies", [])
+        return {
+            "success": True,
+            "message": "Box office update completed",
+            "movies_found": results.get("total_count"),
+            "movies_added": (
+                len(added_movies) if isinstance(added_movies, list) else 0
+            ),
+        }
+
+    async def update_box_office(
+        self, progress: Optional[Callable[[str], None]] = None
+    ) -> Dict[str, Any]:
         """
         Main job to update box office data.
 
         Fetches the current week's box office from Trakt and matches
-        against Radarr library by TMDB ID.
+        against Radarr library by TMDB ID. Only one update runs at a time,
+        across processes; a call made while one is running waits for it
+        and returns its results.
+
+        Args:
+            progress: Called with each pipeline stage name as it starts
+                (not called when joining a run already in progress)
 
         Returns:
             Update results dictionary
         """
+        result = await _update_flight.run(lambda: self._run_update(progress))
+        return cast(Dict[str, Any], result)
+
+    async def _run_update(  # noqa: C901
+        self, progress: Optional[Callable[[str], None]] = None
+    ) -> Dict[str, Any]:
+        """Run the update pipeline (see ``update_box_office``)."""
         logger.info("Starting scheduled box office update")
-        start_time = datetime.now()
+        metrics = PipelineMetrics(on_stage=progress)
 
         try:
             # Initialize services if needed
@@ -151,25 +238,26 @@ class BoxarrScheduler:
             most_recent_friday = today - timedelta(days=days_since_friday)
             actual_year, actual_week, _ = most_recent_friday.isocalendar()
 
-            # Fetch current box office from Trakt API
-            box_office_movies = await self._run_in_executor(
-                self.boxoffice_service.fetch_box_office
-            )
+            # Fetch current box office from Trakt API (rate limit waits and
+            # retries are awaited, not slept in a worker thread)
+            with metrics.stage("trakt_fetch"):
+                async with self._async_boxoffice_service() as trakt:
+                    box_office_movies = await trakt.fetch_box_office()
 
-            # Match movies against Radarr by TMDB ID
-            match_results = await self._run_in_executor(
-                match_box_office_to_radarr,
-                box_office_movies,
-                self.radarr_service,
-            )
+            # Match movies against Radarr by TMDB ID (index lookups, no I/O)
+            radarr = self._async_radarr_service()
+            with metrics.stage("match"):
+                library = await radarr.get_library_index()
+                match_results = match_box_office_to_radarr(box_office_movies, library)
 
             # Auto-add missing movies to Radarr with default profile (if enabled)
             added_movies = []
             if settings.boxarr_features_auto_add:
                 logger.info("Auto-add is enabled, adding missing movies to Radarr")
-                added_movies = await self._auto_add_missing_movies(
-                    match_results, actual_year
-                )
+                with metrics.stage("auto_add"):
+                    added_movies = await self._auto_add_missing_movies(
+                        match_results, actual_year, radarr
+                    )
             else:
                 unmatched_count = len([r for r in match_results if not r.is_matched])
                 if unmatched_count > 0:
@@ -178,40 +266,56 @@ class BoxarrScheduler:
                         f"manual addition required"
                     )
 
-            # If movies were added, bust cache and re-match
+            # If movies were added, re-check just the unmatched ones; the adds
+            # were inserted into the cached library, so this is in memory
             if added_movies:
                 logger.info(
                     f"Added {len(added_movies)} movies to Radarr, re-matching..."
                 )
-                self.radarr_service.bust_cache()
-                match_results = await self._run_in_executor(
-                    match_box_office_to_radarr,
-                    box_office_movies,
-                    self.radarr_service,
-                )
+                with metrics.stage("rematch"):
+                    found = await radarr.find_movies_by_tmdb_ids(
+                        unmatched_tmdb_ids(match_results)
+                    )
+                    match_results = rematch_unmatched(match_results, found)
 
             # Generate JSON data file
             page_generator = WeeklyDataGenerator(self.radarr_service)
-            data_path = await self._run_in_executor(
-                page_generator.generate_weekly_data,
-                match_results,
-                actual_year,
-                actual_week,
-            )
+            with metrics.stage("generate"):
+                data_path = await self._run_in_executor(
+                    page_generator.generate_weekly_data,
+                    match_results,
+                    actual_year,
+                    actual_week,
+                )
 
             # Process results for history
             results = self._process_match_results(match_results)
             results["data_path"] = str(data_path)
             results["added_movies"] = added_movies
 
-            # Save to history
-            await self._save_to_history(results)
+            # Save to history, then store the finished timings with it
+            with metrics.stage("history_save"):
+                run_id = await self._save_to_history(results)
+            results["metrics"] = metrics.to_dict()
+            if run_id is not None:
+                await self._run_in_executor(
+                    get_history_store().update, run_id, results
+                )
 
-            duration = (datetime.now() - start_time).total_seconds()
             logger.info(
-                f"Box office update completed in {duration:.2f} seconds. "
+                f"Box office update completed in "
+                f"{results['metrics']['total_ms'] / 1000:.2f} seconds. "
                 f"Matched {results['matched_count']}/{results['total_count']} movies"
             )
+            logger.info(
+                "Stage timings: "
+                + ", ".join(
+                    f"{stage['name']} {stage['duration_ms']:.0f}ms "
+                    f"({stage['radarr']['requests']} Radarr/"
+                    f"{stage['trakt']['requests']} Trakt requests)"
+                    for stage in metrics.stages
+                )
+            )
 
             return results
 
@@ -219,10 +323,29 @@ class BoxarrScheduler:
             logger.error(f"Box office update failed: {e}")
             raise SchedulerError(f"Update failed: {e}") from e
 
+    def _async_boxoffice_service(self) -> AsyncBoxOfficeService:
+        """Build an asyncio Trakt client matching ``self.boxoffice_service``."""
+        return AsyncBoxOfficeService(
+            client_id=getattr(self.boxoffice_service, "client_id", None),
+            api_url=getattr(self.boxoffice_service, "api_url", None),
+        )
+
+    def _async_radarr_service(self) -> AsyncRadarrService:
+        """
+        Build an asyncio Radarr client for the current run.
+
+        Created per run so the pooled client is bound to the running loop;
+        it targets the same instance as ``self.radarr_service``.
+        """
+        return AsyncRadarrService(
+            url=getattr(self.radarr_service, "url", None),
+            api_key=getattr(self.radarr_service, "api_key", None),
+        )
+
     async def _run_in_executor(self, func: Callable, *args) -> Any:
         """Run blocking function in executor."""
         loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(self._executor, func, *args)
+        return await loop.run_in_executor(self._executor, carry_run_stats(func), *args)
 
     def _process_match_results(
         self, match_results: List[MatchResult]
@@ -294,104 +417,70 @@ class BoxarrScheduler:
         else:
             return "Pending"
 
-    async def _save_to_history(self, results: Dict[str, Any]) -> None:
+    async def _save_to_history(self, results: Dict[str, Any]) -> Optional[int]:
         """
         Save results to history.
 
         Args:
             results: Results dictionary
-        """
-        try:
-            history_dir = settings.get_history_path()
-            # Ensure history directory exists before writing
-            history_dir.mkdir(parents=True, exist_ok=True)
-
-            # Generate filename
-            now = datetime.now()
-            year, week, _ = now.isocalendar()
-            filename = f"{year}W{week:02d}_{now.strftime('%Y%m%d_%H%M%S')}.json"
-
-            # Save to file
-            history_file = history_dir / filename
-            with open(history_file, "w") as f:
-                json.dump(results, f, indent=2, default=str)
-
-            # Also save as latest
-            latest_file = history_dir / f"{year}W{week:02d}_latest.json"
-            with open(latest_file, "w") as f:
-                json.dump(results, f, indent=2, default=str)
-
-            logger.debug(f"Saved history to {history_file}")
 
-            # Clean up old history
-            await self._cleanup_old_history(history_dir)
-
-        except Exception as e:
-            logger.error(f"Failed to save history: {e}")
-
-    async def _cleanup_old_history(self, history_dir: Path) -> None:
-        """
-        Clean up old history files.
-
-        Args:
-            history_dir: History directory path
+        Returns:
+            ID of the stored run (None if saving failed)
         """
-        try:
-            retention_days = settings.boxarr_data_history_retention_days
-            cutoff_date = datetime.now().timestamp() - (retention_days * 86400)
-
-            for file in history_dir.glob("*.json"):
-                if file.stat().st_mtime < cutoff_date and "latest" not in file.name:
-                    file.unlink()
-                    logger.debug(f"Deleted old history file: {file.name}")
-
-        except Exception as e:
-            logger.error(f"Failed to cleanup history: {e}")
+        run_id = cast(
+            Optional[int],
+            await self._run_in_executor(get_history_store().append, results),
+        )
+        if run_id is not None:
+            logger.debug(f"Saved history run {run_id}")
+        return run_id
 
     async def _auto_add_missing_movies(
-        self, match_results: List[MatchResult], top_year: int
+        self,
+        match_results: List[MatchResult],
+        top_year: int,
+        radarr: Optional[AsyncRadarrService] = None,
     ) -> List[str]:
         """
         Automatically add unmatched movies to Radarr with default profile.
 
         Uses Trakt data directly for filtering (genres, certification, year)
-        instead of searching TMDB separately.
+        instead of searching TMDB separately; the filters come from the
+        compiled auto-add policy.
 
         Args:
             match_results: Match results
             top_year: Current year for re-release filtering
+            radarr: Async Radarr client (created for this run if omitted)
 
         Returns:
             List of added movie titles
         """
         if not self.radarr_service:
             return []
+        radarr = radarr or self._async_radarr_service()
 
         added_movies = []
-        unmatched = [r for r in match_results if not r.is_matched]
-
-        if not unmatched:
+        decisions = get_auto_add_policy().evaluate(match_results, top_year)
+        if not decisions:
+            logger.info("No movies to auto-add - all top movies are already in Radarr")
             return []
 
-        # Apply limit if configured
-        limit = settings.boxarr_features_auto_add_limit
-        if limit < len(unmatched):
-            logger.info(
-                f"Limiting auto-add to top {limit} movies "
-                f"(out of {len(unmatched)} unmatched)"
-            )
-            unmatched = sorted(unmatched, key=lambda r: r.box_office_movie.rank)[
-                :limit
-            ]
-
-        if not unmatched:
-            logger.info("No movies to auto-add - all top movies are already in Radarr")
+        for decision in decisions:
+            if not decision.accepted:
+                bom = decision.result.box_office_movie
+                logger.info(
+                    f"Skipping '{bom.title}' (rank #{bom.rank}) - {decision.reason}"
+                )
+        candidates = [d.result.box_office_movie for d in decisions if d.accepted]
+        if not candidates:
+            logger.info("No unmatched movies passed the auto-add filters")
             return []
 
-        logger.info(f"Auto-adding up to {len(unmatched)} unmatched movies to Radarr")
+        logger.info(f"Auto-adding up to {len(candidates)} unmatched movies to Radarr")
 
         # Get default quality profile
-        profiles = self.radarr_service.get_quality_profiles()
+        profiles = await radarr.get_quality_profiles()
         default_profile = next(
             (p for p in profiles if p.name == settings.radarr_quality_profile_default),
             profiles[0] if profiles else None,
@@ -401,106 +490,47 @@ class BoxarrScheduler:
             logger.error("No quality profiles found in Radarr")
             return []
 
-        for result in unmatched:
-            bom = result.box_office_movie
-
-            if not bom.tmdb_id:
-                logger.warning(
-                    f"Skipping '{bom.title}' - no TMDB ID available for add"
-                )
-                continue
-
-            try:
-                # Ignore re-releases (older than top_year - 1)
-                if settings.boxarr_features_auto_add_ignore_rereleases:
-                    movie_year = bom.year
-                    if movie_year and movie_year < (top_year - 1):
-                        logger.info(
-                            f"Skipping '{bom.title}' (rank #{bom.rank}) - "
-                            f"release year {movie_year} older than "
-                            f"cutoff {top_year - 1}"
-                        )
-                        continue
-
-                # Apply genre filter using Trakt data
-                if settings.boxarr_features_auto_add_genre_filter_enabled:
-                    movie_genres = bom.genres or []
-
-                    if (
-                        settings.boxarr_features_auto_add_genre_filter_mode
-                        == "whitelist"
-                    ):
-                        whitelist = (
-                            settings.boxarr_features_auto_add_genre_whitelist
-                        )
-                        if whitelist and not any(
-                            genre in whitelist for genre in movie_genres
-                        ):
-                            logger.info(
-                                f"Skipping '{bom.title}' (rank #{bom.rank}) - "
-                                f"genres {movie_genres} not in "
-                                f"whitelist {whitelist}"
-                            )
-                            continue
-                    else:  # blacklist mode
-                        blacklist = (
-                            settings.boxarr_features_auto_add_genre_blacklist
-                        )
-                        if blacklist and any(
-                            genre in blacklist for genre in movie_genres
-                        ):
-                            logger.info(
-                                f"Skipping '{bom.title}' (rank #{bom.rank}) - "
-                                f"contains blacklisted genre(s) "
-                                f"from {blacklist}"
-                            )
-                            continue
-
-                # Apply rating filter using Trakt certification
-                if settings.boxarr_features_auto_add_rating_filter_enabled:
-                    movie_rating = bom.certification
-                    rating_whitelist = (
-                        settings.boxarr_features_auto_add_rating_whitelist
-                    )
+        # Fetch root folders once for the whole batch
+        try:
+            root_folders = await radarr.get_root_folder_paths()
+        except Exception as e:
+            logger.error(f"Failed to fetch root folders from Radarr: {e}")
+            root_folders = []
+        root_folder_manager = RootFolderManager(root_folders=root_folders or None)
+
+        # Determine root folders based on Trakt genres (accepted movies
+        # always have a TMDB ID)
+        to_add = [
+            MovieAddRequest(
+                tmdb_id=cast(int, bom.tmdb_id),
+                root_folder=root_folder_manager.determine_root_folder(
+                    genres=bom.genres or [], movie_title=bom.title
+                ),
+                quality_profile_id=default_profile.id,
+                title=bom.title,
+            )
+            for bom in candidates
+        ]
 
-                    if (
-                        rating_whitelist
-                        and movie_rating
-                        and movie_rating not in rating_whitelist
-                    ):
-                        logger.info(
-                            f"Skipping '{bom.title}' (rank #{bom.rank}) - "
-                            f"rating '{movie_rating}' not in "
-                            f"allowed ratings {rating_whitelist}"
-                        )
-                        continue
-
-                # Determine root folder based on Trakt genres
-                root_folder_manager = RootFolderManager(self.radarr_service)
-                movie_genres = bom.genres or []
-                root_folder = root_folder_manager.determine_root_folder(
-                    genres=movie_genres,
-                    movie_title=bom.title,
-                )
+        # Add everything that passed the filters in one batch
+        try:
+            results = await radarr.add_movies_bulk(to_add, search_for_movie=True)
+        except Exception as e:
+            logger.warning(f"Failed to auto-add {len(to_add)} movies: {e}")
+            return []
 
-                # Add the movie using TMDB ID from Trakt
-                added_movie = await self._run_in_executor(
-                    self.radarr_service.add_movie,
-                    bom.tmdb_id,
-                    default_profile.id,
-                    root_folder,
-                    True,  # monitored
-                    True,  # search for movie
-                )
+        for add_result in results:
+            if add_result.added:
                 logger.info(
-                    f"Auto-added movie to Radarr: {added_movie.title} "
-                    f"with profile '{default_profile.name}' "
-                    f"in folder '{root_folder}'"
+                    f"Auto-added movie to Radarr: {add_result.title} "
+                    f"with profile '{default_profile.name}'"
+                )
+                added_movies.append(add_result.title)
+            else:
+                logger.warning(
+                    f"Did not auto-add {add_result.title}: "
+                    f"{add_result.error or add_result.status.value}"
                 )
-                added_movies.append(added_movie.title)
-
-            except Exception as e:
-                logger.warning(f"Failed to auto-add {bom.title}: {e}")
 
         return added_movies
 
@@ -533,7 +563,7 @@ class BoxarrScheduler:
 
             # Add new job with updated cron
             job = self.scheduler.add_job(
-                self.update_box_office,
+                self._run_queued_update,
                 CronTrigger.from_crontab(cron_expr),
                 id="box_office_update",
                 name="Box Office Update",
@@ -574,7 +604,10 @@ class BoxarrScheduler:
         """Trigger immediate update."""
         if self._running:
             self.scheduler.add_job(
-                self.update_box_office, id="manual_update", replace_existing=True
+                self._run_queued_update,
+                id="manual_update",
+                replace_existing=True,
+                kwargs={"priority": JobPriority.MANUAL},
             )
             logger.info("Manual update triggered")
         else:
@@ -590,16 +623,7 @@ class BoxarrScheduler:
         Returns:
             List of historical results
         """
-        history_dir = settings.get_history_path()
-        history_files = sorted(history_dir.glob("*_latest.json"), reverse=True)[:limit]
-
-        results = []
-        for file in history_files:
-            try:
-                with open(file) as f:
-                    data = json.load(f)
-                    results.append(data)
-            except Exception as e:
-                logger.error(f"Failed to read history file {file}: {e}")
-
-        return results
+        runs = await self._run_in_executor(
+            get_history_store().latest_per_week, limit
+        )
+        return [run.data for run in runs]
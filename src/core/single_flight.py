@@ -0,0 +1,158 @@
+"""Single-flight execution of the update pipeline across tasks and processes."""
+
+import asyncio
+import json
+import os
+import time
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from ..utils.logger import get_logger
+from .exceptions import SchedulerError
+
+fcntl: Optional[ModuleType]
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+logger = get_logger(__name__)
+
+
+class SingleFlight:
+    """
+    Run at most one instance of a coroutine at a time.
+
+    Within a process, callers arriving while a run is in flight await that
+    run and get its result (or exception). Across processes, an exclusive
+    ``flock`` on a lock file serializes runs; a process that had to wait
+    for another one reuses the result that process wrote next to the lock
+    file instead of starting a second run. Without ``fcntl`` only the
+    in-process guarantee holds.
+    """
+
+    def __init__(self, lock_path: Callable[[], Path], poll_interval: float = 0.5):
+        """
+        Initialize the guard.
+
+        Args:
+            lock_path: Returns the lock file location; the result of each
+                run is stored alongside it
+            poll_interval: Seconds between attempts while another process
+                holds the lock
+        """
+        self._lock_path = lock_path
+        self._poll_interval = poll_interval
+        self._flight: Optional[asyncio.Future] = None
+        self._counters = {"runs": 0, "joined": 0, "reused": 0}
+
+    async def run(self, func: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run ``func`` unless a run is already in flight, then share its outcome.
+
+        Args:
+            func: Coroutine function producing a JSON-serializable result
+
+        Returns:
+            Result of this run or of the in-flight one
+        """
+        loop = asyncio.get_running_loop()
+        flight = self._flight
+        if flight is not None and not flight.done() and flight.get_loop() is loop:
+            self._counters["joined"] += 1
+            logger.info("Update already running; waiting for its result")
+            return await asyncio.shield(flight)
+
+        flight = loop.create_future()
+        self._flight = flight
+        try:
+            result = await self._run_exclusive(func)
+        except BaseException as e:
+            flight.set_exception(e)
+            flight.exception()  # Joiners re-raise it; don't log it as unretrieved
+            raise
+        else:
+            flight.set_result(result)
+            return result
+        finally:
+            if self._flight is flight:
+                self._flight = None
+
+    async def _run_exclusive(self, func: Callable[[], Awaitable[Any]]) -> Any:
+        """Hold the lock file for one run, or reuse the run that held it."""
+        lock_path = Path(self._lock_path())
+        lock_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(lock_path, "a+") as handle:
+            waited_since = None
+            while not self._try_lock(handle):
+                if waited_since is None:
+                    waited_since = time.time()
+                    logger.info(
+                        "Update running in another process; waiting for its result"
+                    )
+                await asyncio.sleep(self._poll_interval)
+            try:
+                if waited_since is not None:
+                    stored = self._read_result(lock_path, waited_since)
+                    if stored is not None:
+                        self._counters["reused"] += 1
+                        if stored.get("error"):
+                            raise SchedulerError(stored["error"])
+                        return stored.get("result")
+                self._counters["runs"] += 1
+                try:
+                    result = await func()
+                except Exception as e:
+                    self._write_result(lock_path, {"error": str(e)})
+                    raise
+                self._write_result(lock_path, {"result": result})
+                return result
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(handle, fcntl.LOCK_UN)
+
+    @staticmethod
+    def _try_lock(handle: Any) -> bool:
+        """Take the exclusive lock without blocking."""
+        if fcntl is None:
+            return True
+        try:
+            fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return False
+        return True
+
+    @staticmethod
+    def _result_path(lock_path: Path) -> Path:
+        """File holding the outcome of the last run."""
+        return lock_path.with_suffix(".result.json")
+
+    def _write_result(self, lock_path: Path, outcome: Dict[str, Any]) -> None:
+        """Store a run's outcome for processes waiting on the lock."""
+        path = self._result_path(lock_path)
+        tmp = path.with_suffix(".tmp")
+        try:
+            with open(tmp, "w") as f:
+                json.dump({**outcome, "finished_at": time.time()}, f, default=str)
+            os.replace(tmp, path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Could not store update result: {e}")
+
+    def _read_result(self, lock_path: Path, since: float) -> Optional[Dict[str, Any]]:
+        """Outcome of a run that finished after ``since``, if there is one."""
+        try:
+            with open(self._result_path(lock_path)) as f:
+                stored = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(stored, dict) or stored.get("finished_at", 0) < since:
+            return None  # The other process died without finishing
+        return stored
+
+    def stats(self) -> Dict[str, Any]:
+        """Run counters and whether a run is in flight in this process."""
+        return {
+            **self._counters,
+            "in_flight": self._flight is not None and not self._flight.done(),
+        }
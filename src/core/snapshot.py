@@ -0,0 +1,154 @@
+"""On-disk snapshot of the Radarr library for fast, offline-tolerant startup."""
+
+import gzip
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Bump whenever the layout of the snapshot file changes
+SNAPSHOT_VERSION = 1
+
+
+class SnapshotStore:
+    """
+    Reads and writes the library snapshot file.
+
+    The file is gzipped JSON stamped with ``SNAPSHOT_VERSION``. Files with
+    another version, or written for a different Radarr instance, are
+    ignored rather than migrated; the next refresh simply rewrites them.
+    Writes happen on a single background thread and are coalesced, so
+    callers never block on disk I/O.
+    """
+
+    FILENAME = "radarr_snapshot.json.gz"
+
+    def __init__(self, directory: Callable[[], Path]):
+        """
+        Initialize the store.
+
+        Args:
+            directory: Returns the directory holding the snapshot file
+        """
+        self._directory = directory
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending = False
+        self._counters: Dict[str, Any] = {
+            "loads": 0,
+            "saves": 0,
+            "save_errors": 0,
+            "last_saved": None,
+            "last_loaded": None,
+        }
+
+    @property
+    def path(self) -> Path:
+        """Location of the snapshot file."""
+        return Path(self._directory()) / self.FILENAME
+
+    def load(self, source: str) -> Optional[Dict[str, Any]]:
+        """
+        Read the snapshot written for ``source``.
+
+        Args:
+            source: Radarr URL the snapshot must belong to
+
+        Returns:
+            Snapshot dict, or None if missing, stale-format or unreadable
+        """
+        path = self.path
+        if not path.exists():
+            return None
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                data = json.load(f)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable library snapshot {path}: {e}")
+            return None
+
+        if not isinstance(data, dict) or data.get("version") != SNAPSHOT_VERSION:
+            logger.info("Ignoring library snapshot from another Boxarr version")
+            return None
+        if data.get("source") != source:
+            logger.info("Ignoring library snapshot from a different Radarr")
+            return None
+
+        with self._lock:
+            self._counters["loads"] += 1
+            self._counters["last_loaded"] = data.get("saved_at")
+        return data
+
+    def write(self, data: Dict[str, Any]) -> None:
+        """
+        Write a snapshot synchronously (atomically replacing the old one).
+
+        Args:
+            data: Snapshot contents; version and timestamp are added here
+        """
+        path = self.path
+        payload = {**data, "version": SNAPSHOT_VERSION, "saved_at": time.time()}
+        tmp = path.with_suffix(".tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Level 1 keeps a 25k-movie write well under a second
+            with gzip.open(tmp, "wt", encoding="utf-8", compresslevel=1) as f:
+                json.dump(payload, f, separators=(",", ":"))
+            os.replace(tmp, path)
+        except Exception as e:
+            with self._lock:
+                self._counters["save_errors"] += 1
+            logger.warning(f"Failed to write library snapshot {path}: {e}")
+            return
+        with self._lock:
+            self._counters["saves"] += 1
+            self._counters["last_saved"] = payload["saved_at"]
+
+    def save_later(self, build: Callable[[], Dict[str, Any]]) -> None:
+        """
+        Write a snapshot in the background.
+
+        ``build`` runs on the writer thread, so a burst of refreshes
+        produces one write of the newest state instead of many.
+
+        Args:
+            build: Returns the snapshot contents at write time
+        """
+        with self._lock:
+            if self._pending:
+                return
+            self._pending = True
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="radarr-snapshot"
+                )
+            executor = self._executor
+
+        def run() -> None:
+            with self._lock:
+                self._pending = False
+            try:
+                self.write(build())
+            except Exception as e:
+                logger.warning(f"Failed to build library snapshot: {e}")
+
+        executor.submit(run)
+
+    def flush(self) -> None:
+        """Wait for background writes to finish (used on shutdown and in tests)."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def stats(self) -> Dict[str, Any]:
+        """Load/save counters and the file location."""
+        with self._lock:
+            return {"path": str(self.path), **self._counters}
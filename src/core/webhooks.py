@@ -0,0 +1,108 @@
+"""Radarr Connect webhook handling for push-based library updates."""
+
+from dataclasses import replace
+from typing import Any, Dict, Optional, cast
+
+from ..utils.logger import get_logger
+from .async_radarr import AsyncRadarrService
+from .exceptions import RadarrError, RadarrNotFoundError
+from .radarr import RadarrMovie, _coerce_id, _library_cache
+
+logger = get_logger(__name__)
+
+# Radarr Connect events that change what Boxarr shows for a movie
+SUPPORTED_EVENTS = {"Download", "MovieAdded", "MovieDelete", "MovieFileDelete"}
+
+
+def _record_from_payload(event: str, movie_data: Dict[str, Any]) -> RadarrMovie:
+    """
+    Derive a library record from the webhook alone.
+
+    Used when Radarr cannot be queried for the full movie. Webhook movie
+    objects omit status and quality profile, so an existing cached record
+    is preferred and only its file state is changed.
+
+    Args:
+        event: Webhook event type
+        movie_data: The payload's ``movie`` object
+
+    Returns:
+        Best-effort RadarrMovie
+    """
+    has_file = event == "Download"
+    movie_id = _coerce_id(movie_data.get("id")) or 0
+    cached = cast(Optional[RadarrMovie], _library_cache.index.get_by_id(movie_id))
+    if cached is not None:
+        if event == "MovieAdded":
+            return cached
+        return replace(cached, hasFile=has_file)
+
+    return RadarrMovie(
+        id=movie_id,
+        title=str(movie_data.get("title") or ""),
+        tmdbId=_coerce_id(movie_data.get("tmdbId")) or 0,
+        imdbId=movie_data.get("imdbId"),
+        year=movie_data.get("year"),
+        hasFile=has_file,
+    )
+
+
+async def handle_radarr_webhook(
+    payload: Dict[str, Any], radarr: Optional[AsyncRadarrService] = None
+) -> Dict[str, Any]:
+    """
+    Apply a Radarr Connect webhook to the cached library.
+
+    Download, MovieAdded and MovieFileDelete re-fetch the movie from
+    Radarr (falling back to the payload if that fails); MovieDelete drops
+    it. Other events, including Radarr's "Test", are acknowledged and
+    ignored.
+
+    Args:
+        payload: Webhook JSON body
+        radarr: Async Radarr client used to fetch the full movie
+
+    Returns:
+        Summary with event, movie IDs, whether the library changed and the
+        resulting movie record (None when it left the library)
+
+    Raises:
+        ValueError: If a supported event carries no movie ID
+    """
+    event = str(payload.get("eventType") or "")
+    if event not in SUPPORTED_EVENTS:
+        logger.debug(f"Ignoring Radarr webhook event '{event}'")
+        return {"event": event, "handled": False}
+
+    movie_data = payload.get("movie") or {}
+    movie_id = _coerce_id(movie_data.get("id"))
+    if not movie_id:
+        raise ValueError(f"Radarr webhook '{event}' has no movie id")
+    tmdb_id = _coerce_id(movie_data.get("tmdbId"))
+
+    record: Optional[RadarrMovie] = None
+    if event != "MovieDelete":
+        try:
+            if radarr is None:
+                raise RadarrError("Radarr not configured")
+            record = await radarr.get_movie(movie_id)
+        except RadarrNotFoundError:
+            # Deleted again before we got to it
+            record = None
+        except RadarrError as e:
+            logger.warning(f"Using webhook payload for movie {movie_id}: {e}")
+            record = _record_from_payload(event, movie_data)
+
+    library_updated = _library_cache.patch({movie_id: record})
+    logger.info(
+        f"Radarr webhook {event}: movie {movie_id} "
+        f"({'updated' if library_updated else 'no cached library'})"
+    )
+    return {
+        "event": event,
+        "handled": True,
+        "movie_id": movie_id,
+        "tmdb_id": tmdb_id or (record.tmdbId if record else None),
+        "library_updated": library_updated,
+        "movie": record,
+    }
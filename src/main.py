@@ -15,6 +15,8 @@ setup_logging()
 
 from src.api.app import create_app_with_scheduler  # noqa: E402
 from src.core.boxoffice import BoxOfficeService  # noqa: E402
+from src.core.http_clients import aclose_client_registry  # noqa: E402
+from src.core.json_generator import WeeklyDataGenerator  # noqa: E402
 from src.core.radarr import RadarrService  # noqa: E402
 from src.core.scheduler import BoxarrScheduler  # noqa: E402
 from src.utils.config import settings  # noqa: E402
@@ -68,6 +70,7 @@ class BoxarrApplication:
         logger.info("Shutting down Boxarr")
 
         # Scheduler cleanup is handled by FastAPI shutdown event
+        await aclose_client_registry()
         self._shutdown_event.set()
         logger.info("Boxarr shutdown complete")
 
@@ -150,15 +153,49 @@ class BoxarrApplication:
             logger.error(f"Update failed: {e}")
             sys.exit(1)
 
-    async def main(self, mode="api"):
+    async def run_regenerate(self, year=None):
+        """
+        Regenerate stored weeks against the current Radarr library (no API).
+
+        Args:
+            year: Only regenerate weeks of this year
+        """
+        logger.info("Regenerating stored weeks")
+
+        def progress(message, done, total):
+            logger.info(f"{message} ({done}/{total})")
+
+        with RadarrService() as radarr:
+            generator = WeeklyDataGenerator(radarr)
+            try:
+                summary = await asyncio.to_thread(
+                    generator.regenerate_weeks, year=year, progress=progress
+                )
+            except Exception as e:
+                logger.error(f"Regeneration failed: {e}")
+                sys.exit(1)
+
+        print("\n" + "=" * 50)
+        print("WEEK REGENERATION RESULTS")
+        print("=" * 50)
+        print(f"Weeks: {summary['weeks']}")
+        print(f"Changed: {summary['written']}")
+        print(f"Unchanged: {summary['unchanged']}")
+        if summary["failed"]:
+            print(f"Failed: {', '.join(summary['failed'])}")
+        print(f"Duration: {summary['duration_ms'] / 1000:.2f} seconds")
+        print("=" * 50 + "\n")
+
+    async def main(self, mode="api", year=None):
         """
         Main application entry point.
 
         Args:
-            mode: Run mode ("api" or "cli")
+            mode: Run mode ("api", "cli" or "regenerate")
+            year: Year to regenerate (regenerate mode only)
         """
-        # CLI mode requires configuration
-        if mode == "cli" and not settings.is_configured:
+        # CLI modes require configuration
+        if mode != "api" and not settings.is_configured:
             logger.error(
                 "CLI mode requires configuration. Please run in API mode first to configure."
             )
@@ -176,6 +213,8 @@ class BoxarrApplication:
 
             if mode == "api":
                 await self.run_api()
+            elif mode == "regenerate":
+                await self.run_regenerate(year)
             else:
                 await self.run_cli()
 
@@ -195,10 +234,14 @@ def cli():
     )
     parser.add_argument(
         "--mode",
-        choices=["api", "cli", "update"],
+        choices=["api", "cli", "update", "regenerate"],
         default="api",
-        help="Run mode (default: api)",
+        help=(
+            "Run mode (default: api); 'regenerate' re-matches all stored "
+            "weeks against the current Radarr library"
+        ),
     )
+    parser.add_argument("--year", type=int, help="Only regenerate weeks of this year")
     parser.add_argument("--config", type=Path, help="Path to configuration file")
     parser.add_argument(
         "--log-level",
@@ -224,7 +267,7 @@ def cli():
     app = BoxarrApplication()
 
     try:
-        asyncio.run(app.main(mode))
+        asyncio.run(app.main(mode, year=args.year))
     except KeyboardInterrupt:
         logger.info("Interrupted by user")
     except Exception as e:
@@ -9,6 +9,10 @@ import yaml
 from pydantic import BaseModel, Field, HttpUrl, validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
 
 class ThemeEnum(str, Enum):
     """Available UI themes."""
@@ -102,6 +106,30 @@ class Settings(BaseSettings):
         description="Configuration for root folder mappings",
     )
 
+    # Radarr HTTP client pool
+    radarr_http_timeout_seconds: float = Field(
+        default=30.0, gt=0, le=300, description="Timeout for Radarr API requests"
+    )
+    radarr_http_max_connections: int = Field(
+        default=20, ge=1, le=200, description="Maximum open connections to Radarr"
+    )
+    radarr_http_max_keepalive_connections: int = Field(
+        default=10,
+        ge=0,
+        le=200,
+        description="Idle connections kept alive in the Radarr pool",
+    )
+    radarr_http_keepalive_expiry_seconds: float = Field(
+        default=30.0,
+        ge=0,
+        le=3600,
+        description="Seconds an idle Radarr connection is kept before closing",
+    )
+    radarr_http_http2: bool = Field(
+        default=False,
+        description="Use HTTP/2 for Radarr requests (requires the 'h2' package)",
+    )
+
     # Boxarr Server Configuration
     boxarr_host: str = Field(default="0.0.0.0", description="Host to bind server to")
     boxarr_port: int = Field(
@@ -126,6 +154,15 @@ class Settings(BaseSettings):
     boxarr_scheduler_timezone: str = Field(
         default="America/New_York", description="Timezone for scheduler"
     )
+    boxarr_scheduler_disk_workers: int = Field(
+        default=2,
+        ge=1,
+        le=16,
+        description=(
+            "Worker threads the scheduler uses for data generation and history "
+            "writes; Radarr and Trakt requests have their own limits"
+        ),
+    )
 
     # UI Configuration
     boxarr_ui_theme: ThemeEnum = Field(default=ThemeEnum.LIGHT, description="UI theme")
@@ -219,6 +256,89 @@ class Settings(BaseSettings):
         le=3600,
         description="In-memory TTL for Radarr library/profile cache",
     )
+    radarr_cache_hard_ttl_seconds: int = Field(
+        default=900,
+        ge=10,
+        le=86400,
+        description=(
+            "Maximum age of a stale Radarr library snapshot served while a "
+            "background refresh runs"
+        ),
+    )
+    radarr_library_sync_mode: str = Field(
+        default="full",
+        description=(
+            "Library refresh mode: 'full' re-downloads every movie, "
+            "'incremental' applies changes from Radarr history. Radarr records "
+            "no history when a movie is added, deleted or edited in its own UI, "
+            "so in incremental mode those changes appear only after the next "
+            "full resync (the webhook reports adds and deletes sooner)"
+        ),
+    )
+    radarr_library_full_resync_seconds: int = Field(
+        default=3600,
+        ge=300,
+        le=604800,
+        description="Seconds between full library downloads in incremental mode",
+    )
+    radarr_lookup_cache_ttl_seconds: int = Field(
+        default=86400,
+        ge=0,
+        le=2592000,
+        description=(
+            "How long TMDB lookups made through Radarr are cached on disk "
+            "(0 disables the cache)"
+        ),
+    )
+    radarr_lookup_cache_max_entries: int = Field(
+        default=5000,
+        ge=100,
+        le=1000000,
+        description="Lookup cache capacity; least recently used entries are evicted",
+    )
+    radarr_bulk_add_concurrency: int = Field(
+        default=4,
+        ge=1,
+        le=32,
+        description=(
+            "Parallel Radarr requests used for lookups and fallback single "
+            "adds when adding movies in bulk, and for poster lookups when "
+            "generating weeks"
+        ),
+    )
+    radarr_add_timeout_seconds: float = Field(
+        default=30.0,
+        ge=1.0,
+        le=600.0,
+        description=(
+            "Timeout for each lookup, import and add request made while adding "
+            "movies in bulk"
+        ),
+    )
+    radarr_probe_threshold: int = Field(
+        default=25,
+        ge=0,
+        le=1000,
+        description=(
+            "Up to this many movies are checked with filtered "
+            "/api/v3/movie?tmdbId= queries instead of downloading the whole "
+            "library (0 always downloads it)"
+        ),
+    )
+    radarr_snapshot_enabled: bool = Field(
+        default=True,
+        description=(
+            "Persist the Radarr library, profiles, tags and root folders to "
+            "the data directory and serve them at startup until revalidated"
+        ),
+    )
+    radarr_webhook_secret: str = Field(
+        default="",
+        description=(
+            "Shared secret Radarr must send (token query parameter or "
+            "X-Boxarr-Token header) to the webhook endpoint; empty disables the check"
+        ),
+    )
     boxarr_data_directory: Path = Field(
         default=Path("/config"), description="Data storage directory"
     )
@@ -228,6 +348,37 @@ class Settings(BaseSettings):
     trakt_api_url: str = Field(
         default="https://api.trakt.tv", description="Trakt API base URL"
     )
+    trakt_rate_limit_requests: int = Field(
+        default=1000,
+        ge=1,
+        le=100000,
+        description=(
+            "Requests allowed per rate-limit period until Trakt reports its "
+            "own limit in the X-Ratelimit header"
+        ),
+    )
+    trakt_rate_limit_period_seconds: int = Field(
+        default=300,
+        ge=1,
+        le=86400,
+        description="Length of the Trakt rate-limit period in seconds",
+    )
+    trakt_max_concurrency: int = Field(
+        default=4,
+        ge=1,
+        le=32,
+        description="Trakt requests a client keeps in flight at once",
+    )
+    trakt_cache_max_age_seconds: int = Field(
+        default=3600,
+        ge=0,
+        le=604800,
+        description=(
+            "How long Trakt responses are served from the on-disk cache before "
+            "being revalidated with ETag/Last-Modified, unless the server sends "
+            "its own Cache-Control max-age (0 disables the cache)"
+        ),
+    )
 
     # Logging Configuration
     log_level: str = Field(
@@ -268,6 +419,14 @@ class Settings(BaseSettings):
             raise ValueError("Auto tag must be at most 20 characters")
         return s
 
+    @validator("radarr_library_sync_mode", pre=True)
+    def validate_library_sync_mode(cls, v: Any) -> str:
+        """Accept only the supported library sync modes."""
+        mode = str(v or "full").strip().lower()
+        if mode not in ("full", "incremental"):
+            raise ValueError("Library sync mode must be 'full' or 'incremental'")
+        return mode
+
     @validator("trakt_client_id")
     def validate_trakt_client_id(cls, v: str) -> str:
         """Check for Trakt client ID from environment if not set."""
@@ -390,6 +549,38 @@ class Settings(BaseSettings):
                     if hasattr(self, section):
                         setattr(self, section, values)
 
+            self._enforce_field_bounds()
+
+    def _enforce_field_bounds(self) -> None:
+        """
+        Bring numeric settings loaded from YAML back within their bounds.
+
+        ``load_from_yaml`` assigns with ``setattr``, which skips pydantic
+        validation, so values such as a concurrency of 0 would otherwise
+        reach the semaphores and thread pools they size. Values outside a
+        ``ge``/``le`` bound are clamped to it; values failing a ``gt``/``lt``
+        bound fall back to the default.
+        """
+        for name, field in type(self).model_fields.items():
+            value = getattr(self, name)
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                continue
+            fixed = value
+            for bound in field.metadata:
+                ge, le = getattr(bound, "ge", None), getattr(bound, "le", None)
+                gt, lt = getattr(bound, "gt", None), getattr(bound, "lt", None)
+                if ge is not None and fixed < ge:
+                    fixed = ge
+                elif le is not None and fixed > le:
+                    fixed = le
+                elif (gt is not None and fixed <= gt) or (
+                    lt is not None and fixed >= lt
+                ):
+                    fixed = field.default
+            if fixed != value:
+                logger.warning(f"Setting {name}={value} is out of range; using {fixed}")
+                setattr(self, name, fixed)
+
     def get_root_folder_for_genres(
         self, genres: List[str], default: Optional[str] = None
     ) -> str:
@@ -149,6 +149,62 @@ function updateGenreMode() {
     }
 }
 
+function formatBytes(bytes) {
+    if (bytes < 1024) return `${bytes} B`;
+    if (bytes < 1024 * 1024) return `${(bytes / 1024).toFixed(1)} KB`;
+    return `${(bytes / (1024 * 1024)).toFixed(1)} MB`;
+}
+
+function formatRunStages(metrics) {
+    if (!metrics || !metrics.stages) return 'Not recorded';
+    const stages = metrics.stages.map(stage => {
+        const requests = [];
+        if (stage.radarr && stage.radarr.requests) {
+            requests.push(`Radarr ${stage.radarr.requests} req, ${formatBytes(stage.radarr.bytes)}`);
+        }
+        if (stage.trakt && stage.trakt.requests) {
+            requests.push(`Trakt ${stage.trakt.requests} req, ${formatBytes(stage.trakt.bytes)}`);
+        }
+        const detail = requests.length ? ` <small>(${requests.join('; ')})</small>` : '';
+        const failed = stage.failed ? ' ✗' : '';
+        return `${stage.name.replace('_', ' ')}: ${Math.round(stage.duration_ms)} ms${failed}${detail}`;
+    });
+    return `${stages.join('<br>')}<br><small>Total ${Math.round(metrics.total_ms)} ms</small>`;
+}
+
+// Updates run as background jobs: poll a queued job until it finishes and
+// resolve with its result. Responses without a job_id pass through.
+function waitForJob(data, onProgress) {
+    if (!data || !data.job_id) return Promise.resolve(data);
+    let lastMessage = null;
+    return new Promise((resolve, reject) => {
+        const poll = () => {
+            fetch(apiUrl(`/scheduler/jobs/${data.job_id}`))
+                .then(response => {
+                    if (!response.ok) {
+                        throw new Error(`HTTP error! status: ${response.status}`);
+                    }
+                    return response.json();
+                })
+                .then(job => {
+                    if (onProgress && job.message !== lastMessage) {
+                        lastMessage = job.message;
+                        onProgress(job.message);
+                    }
+                    if (job.status === 'succeeded') {
+                        resolve(job.result || { success: true, message: job.message });
+                    } else if (job.status === 'failed') {
+                        resolve({ success: false, message: job.error || 'Job failed' });
+                    } else {
+                        setTimeout(poll, 1000);
+                    }
+                })
+                .catch(reject);
+        };
+        poll();
+    });
+}
+
 function refreshSchedulerStatus() {
     fetch(apiUrl('/scheduler/status'))
         .then(response => response.json())
@@ -205,6 +261,12 @@ function refreshSchedulerStatus() {
                     lastRun.innerHTML = 'No previous runs';
                 }
             }
+
+            // Update last run stage timings
+            const lastRunStages = document.getElementById('debugLastRunStages');
+            if (lastRunStages) {
+                lastRunStages.innerHTML = formatRunStages(data.last_run && data.last_run.metrics);
+            }
             
             // Update active jobs
             const activeJobs = document.getElementById('debugActiveJobs');
@@ -236,6 +298,10 @@ function triggerScheduler() {
     
     fetch(apiUrl('/scheduler/trigger'), { method: 'POST' })
         .then(response => response.json())
+        .then(data => {
+            btn.textContent = 'Running...';
+            return waitForJob(data);
+        })
         .then(data => {
             if (data.success) {
                 alert(`Update completed! Found ${data.movies_found} movies, added ${data.movies_added || 0} new movies.`);
@@ -428,6 +494,7 @@ function reloadScheduler() {
                 addLogEntry('Received response from server');
                 return response.json();
             })
+            .then(data => waitForJob(data, addLogEntry))
             .then(data => {
                 if (data.success) {
                     addLogEntry(`Found ${data.movies_found || 0} movies`, 'success');
@@ -551,6 +618,7 @@ function reloadScheduler() {
             addLogEntry('Received response from server');
             return response.json();
         })
+        .then(data => waitForJob(data, addLogEntry))
         .then(data => {
             if (data.success) {
                 addLogEntry(`Found ${data.movies_found || 0} movies`, 'success');
@@ -650,6 +718,7 @@ function reloadScheduler() {
             addLogEntry('Received response from server');
             return response.json();
         })
+        .then(data => waitForJob(data, addLogEntry))
         .then(data => {
             if (data.success) {
                 addLogEntry(`Found ${data.movies_found || 0} movies`, 'success');
@@ -3,8 +3,50 @@
 import sys
 from pathlib import Path
 
+import pytest
+
 # Add src directory to Python path
 project_root = Path(__file__).parent.parent
 src_path = project_root / "src"
 sys.path.insert(0, str(project_root))
 sys.path.insert(0, str(src_path))
+
+
+@pytest.fixture(autouse=True)
+def _no_persistent_radarr_caches(monkeypatch):
+    """Keep tests from writing Radarr caches into the real data directory."""
+    from src.utils.config import settings
+
+    monkeypatch.setattr(settings, "radarr_snapshot_enabled", False)
+    monkeypatch.setattr(settings, "radarr_lookup_cache_ttl_seconds", 0)
+
+
+class FakeClock:
+    """Time source for components that take a ``clock``; advance via ``now``."""
+
+    def __init__(self, now: float = 1_700_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def fake_clock():
+    """A manually advanced clock for TTL, rate-limit and timing tests."""
+    return FakeClock()
+
+
+@pytest.fixture(autouse=True)
+def _reset_radarr_caches():
+    """Start and finish every test with empty process-wide Radarr caches."""
+    from src.core import radarr
+
+    def reset():
+        radarr._library_cache.invalidate()
+        radarr._library_sync.reset()
+        radarr._metadata_cache.clear()
+
+    reset()
+    yield
+    reset()
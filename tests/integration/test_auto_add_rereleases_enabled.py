@@ -6,14 +6,43 @@ movies whose original release year is >= (Y - 1).
 Example: for Y=2021, only movies from 2020 and 2021 should be added.
 """
 
+import json
+import time
 from pathlib import Path
 
+import httpx
 import yaml
 from fastapi.testclient import TestClient
 
 from src.api.app import create_app
-from src.core.boxoffice import BoxOfficeMovie
-from src.utils.config import Settings
+from src.api.dependencies import get_radarr_service
+from src.core import jobs
+from src.core import radarr as core_radarr
+from src.core.jobs import JobQueue
+from src.utils.config import Settings, settings
+
+WEEK_MOVIES = [
+    {
+        "rank": 1,
+        "title": "New Hit",
+        "tmdb_id": 111,
+        "year": 2021,  # same year as the stored week
+        "genres": "Action",
+        "certification": "PG-13",
+    },
+    {
+        "rank": 2,
+        "title": "Old Classic",
+        "tmdb_id": 222,
+        "year": 1995,  # much older original release year
+        "genres": "Drama",
+        "certification": "PG",
+    },
+]
+LOOKUPS = {
+    111: {"tmdbId": 111, "title": "New Hit", "year": 2021},
+    222: {"tmdbId": 222, "title": "Old Classic", "year": 1995},
+}
 
 
 def _seed_config(dir_path: Path) -> Path:
@@ -45,87 +74,91 @@ def _seed_config(dir_path: Path) -> Path:
     return p
 
 
-class _FakeRadarrService:
-    added_calls = []
-
-    def __init__(self, *_, **__):
-        pass
-
-    def get_all_movies(self):
-        return []
-
-    def get_root_folder_paths(self):
-        return ["/movies"]
-
-    def search_movie_tmdb(self, title: str):
-        if title == "New Hit":
-            return [
-                {
-                    "tmdbId": 111,
-                    "title": title,
-                    "genres": ["Action"],
-                    "year": 2021,
-                    "certification": "PG-13",
-                }
-            ]
-        elif title == "Old Classic":
-            return [
-                {
-                    "tmdbId": 222,
-                    "title": title,
-                    "genres": ["Drama"],
-                    "year": 1995,
-                    "certification": "PG",
-                }
-            ]
-        return []
-
-    def add_movie(
-        self,
-        tmdb_id: int,
-        quality_profile_id=None,
-        root_folder: str | None = None,
-        monitored: bool = True,
-        search_for_movie: bool = True,
-    ):
-        _FakeRadarrService.added_calls.append(
-            {"tmdb_id": tmdb_id, "root_folder": root_folder}
+def _seed_week(year: int, week: int, movies: list) -> None:
+    """Store a week file the way a previous update would have."""
+    pages = Path(settings.boxarr_data_directory) / "weekly_pages"
+    pages.mkdir(parents=True, exist_ok=True)
+    with open(pages / f"{year}W{week:02d}.json", "w") as f:
+        json.dump({"year": year, "week": week, "movies": movies}, f)
+
+
+class _FakeRadarr:
+    """Minimal Radarr API: empty library, TMDB lookups and bulk import."""
+
+    def __init__(self, lookups: dict, root_folders: list):
+        self.lookups = lookups
+        self.root_folders = root_folders
+        self.imported = []
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if path == "/api/v3/movie" and request.method == "GET":
+            return httpx.Response(200, json=[])  # nothing in the library
+        if path == "/api/v3/movie/lookup":
+            found = self.lookups.get(int(request.url.params["term"][5:]))
+            return httpx.Response(200, json=[found] if found else [])
+        if path == "/api/v3/rootFolder":
+            return httpx.Response(200, json=[{"path": p} for p in self.root_folders])
+        if path == "/api/v3/qualityProfile":
+            return httpx.Response(200, json=[{"id": 1, "name": "HD-1080p"}])
+        if path == "/api/v3/tag":
+            if request.method == "POST":
+                return httpx.Response(201, json={"id": 1, "label": "boxarr"})
+            return httpx.Response(200, json=[])
+        if path == "/api/v3/movie/import":
+            body = json.loads(request.content)
+            self.imported.extend(body)
+            return httpx.Response(
+                200, json=[{**m, "id": i} for i, m in enumerate(body, start=1)]
+            )
+        return httpx.Response(404)
+
+    def service(self) -> core_radarr.RadarrService:
+        client = httpx.Client(
+            base_url="http://localhost:7878",
+            transport=httpx.MockTransport(self.handler),
+        )
+        return core_radarr.RadarrService(
+            url="http://localhost:7878", api_key="test-key", http_client=client
         )
-        return {"id": tmdb_id, "tmdbId": tmdb_id}
 
 
-class _FakeBoxOfficeService:
-    def fetch_weekend_box_office(self, year: int, week: int):
-        return [
-            BoxOfficeMovie(rank=1, title="New Hit"),
-            BoxOfficeMovie(rank=2, title="Old Classic"),
-        ]
+def _wait_for_job(client: TestClient, job_id: str) -> dict:
+    for _ in range(200):
+        job = client.get(f"/api/scheduler/jobs/{job_id}").json()
+        if job["status"] in ("succeeded", "failed"):
+            return job
+        time.sleep(0.05)
+    raise AssertionError(f"Job {job_id} did not finish")
 
 
 def test_ignore_rereleases_enabled_skips_old_years(tmp_path, monkeypatch):
     config_path = _seed_config(tmp_path)
     monkeypatch.setenv("BOXARR_DATA_DIRECTORY", str(tmp_path))
     Settings.reload_from_file(config_path)
+    monkeypatch.setattr(jobs, "_job_queue", JobQueue())
 
-    import src.core.boxoffice as core_boxoffice
-    import src.core.radarr as core_radarr
-
-    monkeypatch.setattr(core_radarr, "RadarrService", _FakeRadarrService)
-    monkeypatch.setattr(core_boxoffice, "BoxOfficeService", _FakeBoxOfficeService)
+    _seed_week(2021, 10, WEEK_MOVIES)
+    radarr = _FakeRadarr(lookups=LOOKUPS, root_folders=["/movies"])
 
     app = create_app()
-    client = TestClient(app)
+    app.dependency_overrides[get_radarr_service] = radarr.service
 
-    _FakeRadarrService.added_calls.clear()
+    with TestClient(app) as client:
+        resp = client.post(
+            "/api/scheduler/update-week", json={"year": 2021, "week": 10}
+        )
+        assert resp.status_code == 200
+        job = _wait_for_job(client, resp.json()["job_id"])
 
-    resp = client.post("/api/scheduler/update-week", json={"year": 2021, "week": 10})
-    assert resp.status_code == 200
-    data = resp.json()
+    data = job["result"]
     assert data["success"] is True
     assert data["movies_found"] == 2
     assert data["movies_added"] == 1  # Only the 2021 movie is added
+    decisions = {d["tmdb_id"]: d["code"] for d in data["auto_add_decisions"]}
+    assert decisions == {111: "accepted", 222: "rerelease"}
 
-    tmdb_ids = {c["tmdb_id"] for c in _FakeRadarrService.added_calls}
+    tmdb_ids = {m["tmdbId"] for m in radarr.imported}
     assert tmdb_ids == {111}
 
     # Reset settings cache for isolation
@@ -2,16 +2,23 @@
 
 This verifies that POST /api/scheduler/update-week applies the same
 genre-based root folder mapping as the main scheduler/manual add paths.
+The update runs on the job queue, so the test polls the job for its result.
 """
 
+import json
+import time
 from pathlib import Path
 
+import httpx
 import yaml
 from fastapi.testclient import TestClient
 
 from src.api.app import create_app
-from src.core.boxoffice import BoxOfficeMovie
-from src.utils.config import Settings
+from src.api.dependencies import get_radarr_service
+from src.core import jobs
+from src.core import radarr as core_radarr
+from src.core.jobs import JobQueue
+from src.utils.config import Settings, settings
 
 
 def _seed_config(dir_path: Path) -> Path:
@@ -53,48 +60,62 @@ def _seed_config(dir_path: Path) -> Path:
     return p
 
 
-class _FakeRadarrService:
-    """Captures add_movie calls and simulates minimal Radarr behavior."""
-
-    added_calls = []  # class-level capture for simplicity
-
-    def __init__(self, *_, **__):
-        pass
-
-    def get_all_movies(self):  # no movies in library -> all unmatched
-        return []
-
-    def get_root_folder_paths(self):
-        # Advertise both default and mapped folder so mapping validates
-        return ["/movies", "/movies/horror"]
-
-    def search_movie_tmdb(self, title: str):
-        # Return a Horror movie to trigger mapping
-        return [{"tmdbId": 999999, "title": title, "genres": ["Horror"]}]
-
-    def add_movie(
-        self,
-        tmdb_id: int,
-        quality_profile_id=None,
-        root_folder: str | None = None,
-        monitored: bool = True,
-        search_for_movie: bool = True,
-    ):
-        _FakeRadarrService.added_calls.append(
-            {
-                "tmdb_id": tmdb_id,
-                "root_folder": root_folder,
-                "monitored": monitored,
-                "search": search_for_movie,
-            }
+def _seed_week(year: int, week: int, movies: list) -> None:
+    """Store a week file the way a previous update would have."""
+    pages = Path(settings.boxarr_data_directory) / "weekly_pages"
+    pages.mkdir(parents=True, exist_ok=True)
+    with open(pages / f"{year}W{week:02d}.json", "w") as f:
+        json.dump({"year": year, "week": week, "movies": movies}, f)
+
+
+class _FakeRadarr:
+    """Minimal Radarr API: empty library, TMDB lookups and bulk import."""
+
+    def __init__(self, lookups: dict, root_folders: list):
+        self.lookups = lookups
+        self.root_folders = root_folders
+        self.imported = []
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if path == "/api/v3/movie" and request.method == "GET":
+            return httpx.Response(200, json=[])  # nothing in the library
+        if path == "/api/v3/movie/lookup":
+            found = self.lookups.get(int(request.url.params["term"][5:]))
+            return httpx.Response(200, json=[found] if found else [])
+        if path == "/api/v3/rootFolder":
+            return httpx.Response(200, json=[{"path": p} for p in self.root_folders])
+        if path == "/api/v3/qualityProfile":
+            return httpx.Response(200, json=[{"id": 1, "name": "HD-1080p"}])
+        if path == "/api/v3/tag":
+            if request.method == "POST":
+                return httpx.Response(201, json={"id": 1, "label": "boxarr"})
+            return httpx.Response(200, json=[])
+        if path == "/api/v3/movie/import":
+            body = json.loads(request.content)
+            self.imported.extend(body)
+            return httpx.Response(
+                200, json=[{**m, "id": i} for i, m in enumerate(body, start=1)]
+            )
+        return httpx.Response(404)
+
+    def service(self) -> core_radarr.RadarrService:
+        client = httpx.Client(
+            base_url="http://localhost:7878",
+            transport=httpx.MockTransport(self.handler),
+        )
+        return core_radarr.RadarrService(
+            url="http://localhost:7878", api_key="test-key", http_client=client
         )
-        return {"id": 1, "tmdbId": tmdb_id}
 
 
-class _FakeBoxOfficeService:
-    def fetch_weekend_box_office(self, year: int, week: int):
-        # Single item to keep logic simple
-        return [BoxOfficeMovie(rank=1, title="Scary Movie")]  # Horror via TMDB stub
+def _wait_for_job(client: TestClient, job_id: str) -> dict:
+    for _ in range(200):
+        job = client.get(f"/api/scheduler/jobs/{job_id}").json()
+        if job["status"] in ("succeeded", "failed"):
+            return job
+        time.sleep(0.05)
+    raise AssertionError(f"Job {job_id} did not finish")
 
 
 def test_update_week_respects_genre_mapping(tmp_path, monkeypatch):
@@ -102,28 +123,40 @@ def test_update_week_respects_genre_mapping(tmp_path, monkeypatch):
     config_path = _seed_config(tmp_path)
     monkeypatch.setenv("BOXARR_DATA_DIRECTORY", str(tmp_path))
     Settings.reload_from_file(config_path)
-
-    # Patch route dependencies to fakes
-    # Patch core services that the route imports dynamically inside the function
-    import src.core.boxoffice as core_boxoffice
-    import src.core.radarr as core_radarr
-
-    monkeypatch.setattr(core_radarr, "RadarrService", _FakeRadarrService)
-    monkeypatch.setattr(core_boxoffice, "BoxOfficeService", _FakeBoxOfficeService)
+    monkeypatch.setattr(jobs, "_job_queue", JobQueue())
+
+    _seed_week(
+        2024,
+        10,
+        [{"rank": 1, "title": "Scary Movie", "tmdb_id": 999999, "genres": "Horror"}],
+    )
+    # Advertise both default and mapped folder so mapping validates
+    radarr = _FakeRadarr(
+        lookups={999999: {"tmdbId": 999999, "title": "Scary Movie"}},
+        root_folders=["/movies", "/movies/horror"],
+    )
 
     app = create_app()
-    client = TestClient(app)
+    app.dependency_overrides[get_radarr_service] = radarr.service
 
-    _FakeRadarrService.added_calls.clear()
+    with TestClient(app) as client:
+        resp = client.post(
+            "/api/scheduler/update-week", json={"year": 2024, "week": 10}
+        )
+        assert resp.status_code == 200
+        queued = resp.json()
+        assert queued["success"] is True and queued["job_id"]
+        job = _wait_for_job(client, queued["job_id"])
 
-    # Use any valid-ish year/week; BoxOfficeService is faked anyway
-    resp = client.post("/api/scheduler/update-week", json={"year": 2024, "week": 10})
-    assert resp.status_code == 200
-    data = resp.json()
+    assert job["status"] == "succeeded"
+    data = job["result"]
     assert data["success"] is True
     assert data["movies_found"] == 1
     assert data["movies_added"] == 1
 
     # Assert mapping chose the Horror folder
-    assert _FakeRadarrService.added_calls, "No add_movie calls captured"
-    assert _FakeRadarrService.added_calls[0]["root_folder"] == "/movies/horror"
+    assert radarr.imported, "No movies submitted to Radarr"
+    assert radarr.imported[0]["rootFolderPath"] == "/movies/horror"
+
+    # Reset settings cache for isolation
+    Settings.reload_from_file(tmp_path / "local.yaml")
@@ -0,0 +1,128 @@
+"""Tests for the async Trakt client and the shared rate limiter."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from src.core import async_boxoffice
+from src.core.async_boxoffice import AsyncBoxOfficeService
+from src.core.boxoffice import TraktRateLimiter
+from src.core.exceptions import BoxOfficeError
+
+BOX_OFFICE = [
+    {"revenue": 100, "movie": {"title": "Dune", "year": 2024, "ids": {"tmdb": 1}}},
+]
+
+
+@pytest.fixture(autouse=True)
+def _no_response_cache(monkeypatch):
+    monkeypatch.setattr(async_boxoffice.settings, "trakt_cache_max_age_seconds", 0)
+
+
+@pytest.fixture
+def limiter(monkeypatch, fake_clock):
+    settings = async_boxoffice.settings
+    monkeypatch.setattr(settings, "trakt_rate_limit_requests", 2)
+    monkeypatch.setattr(settings, "trakt_rate_limit_period_seconds", 10)
+    return TraktRateLimiter(clock=fake_clock)
+
+
+def test_bucket_follows_trakt_headers(limiter):
+    assert limiter.reserve() == 0
+    assert limiter.reserve() == 0
+    # Empty bucket: wait for one token at 2 per 10s
+    assert limiter.reserve() == pytest.approx(5)
+
+    limiter._clock.now += 20
+    ratelimit = {"limit": 1000, "period": 300, "remaining": 0, "until": "2000-01-01"}
+    limiter.update({"X-Ratelimit": json.dumps(ratelimit)})
+    assert limiter.reserve() == pytest.approx(0.3)
+
+    limiter.update({"Retry-After": "30"})
+    assert limiter.backoff() == 30
+    assert limiter.reserve() == 30
+    stats = limiter.stats()
+    assert stats["limit"] == 1000 and stats["retry_after"] == 1
+    assert stats["throttled"] == 3
+
+
+@pytest.fixture
+def sleeps(monkeypatch, limiter):
+    waits = []
+
+    async def fake_sleep(seconds):
+        waits.append(seconds)
+        limiter._clock.now += seconds
+
+    monkeypatch.setattr(async_boxoffice.asyncio, "sleep", fake_sleep)
+    return waits
+
+
+def _service(handler, limiter):
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return AsyncBoxOfficeService(
+        client_id="id",
+        api_url="https://trakt",
+        http_client=client,
+        rate_limiter=limiter,
+    )
+
+
+@pytest.mark.asyncio
+async def test_retry_after_is_awaited(limiter, sleeps):
+    responses = [
+        httpx.Response(429, headers={"Retry-After": "7"}),
+        httpx.Response(200, json=BOX_OFFICE),
+    ]
+
+    async with _service(lambda request: responses.pop(0), limiter) as service:
+        movies = await service.fetch_box_office()
+
+    assert [m.title for m in movies] == ["Dune"]
+    assert sleeps == [pytest.approx(7)]
+
+
+@pytest.mark.asyncio
+async def test_client_errors_are_not_retried(limiter, sleeps):
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.path)
+        return httpx.Response(401)
+
+    async with _service(handler, limiter) as service:
+        with pytest.raises(BoxOfficeError, match="/movies/boxoffice"):
+            await service.fetch_box_office()
+    assert calls == ["/movies/boxoffice"] and sleeps == []
+
+
+@pytest.mark.asyncio
+async def test_endpoints_are_fetched_concurrently(monkeypatch):
+    monkeypatch.setattr(async_boxoffice.settings, "trakt_rate_limit_requests", 100)
+    in_flight = []
+    peak = []
+
+    async def handler(request):
+        in_flight.append(request)
+        peak.append(len(in_flight))
+        await asyncio.sleep(0.01)
+        in_flight.remove(request)
+        if request.url.path == "/movies/missing":
+            return httpx.Response(404)
+        return httpx.Response(200, json={"path": request.url.path})
+
+    service = _service(handler, TraktRateLimiter())
+    async with service:
+        results = await service.get_many(
+            {
+                "trending": ("/movies/trending", None),
+                "popular": ("/movies/popular", {"limit": 5}),
+                "missing": ("/movies/missing", None),
+            }
+        )
+
+    assert max(peak) == 3
+    assert results["popular"] == {"path": "/movies/popular"}
+    assert isinstance(results["missing"], BoxOfficeError)
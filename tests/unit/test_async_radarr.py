@@ -0,0 +1,186 @@
+"""Tests for the asyncio Radarr client."""
+
+import json
+
+import httpx
+import pytest
+
+from src.core import radarr as radarr_module
+from src.core.async_radarr import AsyncRadarrService
+from src.core.exceptions import RadarrAuthenticationError, RadarrConnectionError
+from src.core.http_clients import HTTPClientRegistry
+
+LIBRARY = [
+    {"id": 1, "title": "Dune", "tmdbId": 438631, "status": "released"},
+    {"id": 2, "title": "Barbie", "tmdbId": 346698, "status": "released"},
+]
+PROFILES = [{"id": 4, "name": "HD-1080p"}, {"id": 5, "name": "Ultra-HD"}]
+
+
+def _service(handler) -> AsyncRadarrService:
+    client = httpx.AsyncClient(
+        base_url="http://radarr:7878", transport=httpx.MockTransport(handler)
+    )
+    return AsyncRadarrService(
+        url="http://radarr:7878", api_key="key", http_client=client
+    )
+
+
+@pytest.mark.asyncio
+async def test_library_index_is_cached_and_shared():
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.path)
+        return httpx.Response(200, json=LIBRARY)
+
+    async with _service(handler) as service:
+        index = await service.get_library_index()
+        assert index.get_by_tmdb_id(346698).title == "Barbie"
+        assert (await service.find_movie_by_tmdb_id(438631)).id == 1
+
+    # The blocking service sees the same cached library
+    sync_service = radarr_module.RadarrService(url="http://radarr:7878", api_key="key")
+    assert sync_service.find_movie_by_id(2).title == "Barbie"
+    assert calls == ["/api/v3/movie"]
+
+
+@pytest.mark.asyncio
+async def test_library_lookups_match_blocking_service():
+    library = [dict(LIBRARY[0], imdbId="tt1160419"), LIBRARY[1]]
+
+    def handler(request):
+        return httpx.Response(200, json=library)
+
+    async with _service(handler) as service:
+        assert (await service.find_movie_by_imdb_id("tt1160419")).title == "Dune"
+        assert (await service.find_movie_by_id(2)).title == "Barbie"
+        assert (await service.search_movie_by_title("barbie")).id == 2
+        assert await service.find_movie_by_id(99) is None
+
+
+@pytest.mark.asyncio
+async def test_update_movie_quality_profile():
+    sent = []
+
+    def handler(request):
+        if request.method == "PUT":
+            sent.append(json.loads(request.content))
+            return httpx.Response(200, content=request.content)
+        return httpx.Response(200, json=LIBRARY[0])
+
+    async with _service(handler) as service:
+        movie = await service.update_movie_quality_profile(1, 5)
+
+    assert sent[0]["qualityProfileId"] == 5
+    assert movie.qualityProfileId == 5
+
+
+@pytest.mark.asyncio
+async def test_add_movie_builds_payload_and_updates_cache(monkeypatch):
+    monkeypatch.setattr(
+        radarr_module.settings, "radarr_quality_profile_default", "HD-1080p"
+    )
+    monkeypatch.setattr(
+        radarr_module.settings, "boxarr_features_auto_tag_enabled", False
+    )
+    posted = {}
+
+    def handler(request):
+        path = request.url.path
+        if path == "/api/v3/movie/lookup":
+            return httpx.Response(200, json=[{"title": "Dune", "tmdbId": 438631}])
+        if path == "/api/v3/qualityProfile":
+            return httpx.Response(200, json=PROFILES)
+        if path == "/api/v3/movie" and request.method == "GET":
+            return httpx.Response(200, json=LIBRARY)
+        if path == "/api/v3/movie" and request.method == "POST":
+            posted.update(json.loads(request.content))
+            return httpx.Response(201, json={**LIBRARY[0], "id": 9})
+        return httpx.Response(404)
+
+    async with _service(handler) as service:
+        assert len(await service.get_library_index()) == 2
+        added = await service.add_movie(438631, root_folder="/movies")
+
+    assert added.id == 9
+    assert posted["qualityProfileId"] == 4
+    assert posted["rootFolderPath"] == "/movies"
+    assert posted["tags"] == []
+    # The created movie is inserted into the cached library, not refetched
+    assert radarr_module.get_library_cache_stats()["size"] == 3
+    assert radarr_module._library_cache.index.get_by_id(9) is not None
+
+
+@pytest.mark.asyncio
+async def test_errors_are_translated():
+    def unauthorized(request):
+        return httpx.Response(401)
+
+    def unreachable(request):
+        raise httpx.ConnectError("refused", request=request)
+
+    async with _service(unauthorized) as service:
+        with pytest.raises(RadarrAuthenticationError):
+            await service.get_movie(1)
+
+    async with _service(unreachable) as service:
+        with pytest.raises(RadarrConnectionError):
+            await service.get_system_status()
+        assert await service.test_connection() is False
+
+
+class _ChunkedBody(httpx.AsyncByteStream):
+    def __init__(self, body: bytes, size: int):
+        self.chunks = [body[i : i + size] for i in range(0, len(body), size)]
+
+    async def __aiter__(self):
+        for chunk in self.chunks:
+            yield chunk
+
+
+@pytest.mark.asyncio
+async def test_library_is_streamed_in_chunks():
+    body = json.dumps(LIBRARY).encode()
+
+    def handler(request):
+        return httpx.Response(200, stream=_ChunkedBody(body, 16))
+
+    async with _service(handler) as service:
+        index = await service.get_library_index()
+    assert [movie.title for movie in index.movies] == ["Dune", "Barbie"]
+
+    async with _service(lambda request: httpx.Response(401)) as service:
+        with pytest.raises(RadarrAuthenticationError):
+            await service.get_library_index(ignore_cache=True)
+
+
+@pytest.mark.asyncio
+async def test_registry_binds_async_clients_to_loop():
+    registry = HTTPClientRegistry()
+    a = AsyncRadarrService(url="http://radarr:7878", api_key="key", registry=registry)
+    b = AsyncRadarrService(url="http://radarr:7878", api_key="key", registry=registry)
+    assert a.client is b.client
+
+    # Pooled clients belong to the registry, not the service
+    await a.close()
+    assert not a.client.is_closed
+
+    await registry.aclose()
+    assert a.client.is_closed
+
+
+def test_health_check_uses_async_service():
+    from fastapi.testclient import TestClient
+
+    from src.api.app import create_app
+    from src.api.dependencies import get_async_radarr_service
+
+    def handler(request):
+        return httpx.Response(200, json={"version": "5.0"})
+
+    app = create_app()
+    app.dependency_overrides[get_async_radarr_service] = lambda: _service(handler)
+    resp = TestClient(app).get("/api/health")
+
+    assert resp.json()["radarr_connected"] is True
@@ -0,0 +1,101 @@
+"""Tests for the compiled auto-add policy."""
+
+from types import SimpleNamespace
+
+from src.core import auto_add_policy
+from src.core.auto_add_policy import AutoAddPolicy, get_auto_add_policy
+from src.core.boxoffice import BoxOfficeMovie, MatchResult
+
+
+def _config(**overrides):
+    options = {
+        "limit": 10,
+        "genre_filter_enabled": False,
+        "genre_filter_mode": "blacklist",
+        "genre_whitelist": [],
+        "genre_blacklist": [],
+        "rating_filter_enabled": False,
+        "rating_whitelist": [],
+        "ignore_rereleases": False,
+    }
+    options.update(overrides)
+    return SimpleNamespace(
+        **{f"boxarr_features_auto_add_{k}": v for k, v in options.items()}
+    )
+
+
+def _chart(*movies):
+    return [
+        MatchResult(BoxOfficeMovie(rank=rank, tmdb_id=rank, **movie))
+        for rank, movie in enumerate(movies, start=1)
+    ]
+
+
+def test_compiles_normalized_sets_and_skips_empty_filters():
+    policy = AutoAddPolicy.from_settings(
+        _config(
+            genre_filter_enabled=True,
+            genre_filter_mode="whitelist",
+            genre_whitelist=["Science Fiction ", "Action"],
+            rating_filter_enabled=True,
+        )
+    )
+    assert policy.genre_mode == "whitelist"
+    assert policy.genres == frozenset({"science fiction", "action"})
+    # An empty rating whitelist allows every rating
+    assert policy.ratings == frozenset()
+
+    off = AutoAddPolicy.from_settings(_config(genre_filter_enabled=True))
+    assert off.genre_mode is None
+
+
+def test_evaluate_explains_every_unmatched_movie():
+    policy = AutoAddPolicy.from_settings(
+        _config(
+            limit=5,
+            genre_filter_enabled=True,
+            genre_blacklist=["Horror"],
+            rating_filter_enabled=True,
+            rating_whitelist=["PG", "PG-13"],
+            ignore_rereleases=True,
+        )
+    )
+    chart = _chart(
+        {"title": "Hit", "year": 2024, "genres": ["action"], "certification": "pg-13"},
+        {"title": "Classic", "year": 1995},
+        {"title": "Scary", "year": 2024, "genres": ["horror", "thriller"]},
+        {"title": "Mature", "year": 2024, "certification": "R"},
+        {"title": "Owned", "year": 2024},
+        {"title": "Unrated", "year": 2024},
+        {"title": "Sixth", "year": 2024},
+    )
+    chart[4].radarr_movie = object()
+    chart.append(MatchResult(BoxOfficeMovie(rank=8, title="No ID")))
+    chart.reverse()
+
+    decisions = policy.evaluate(chart, 2024)
+
+    assert [(d.result.box_office_movie.title, d.code) for d in decisions] == [
+        ("Hit", "accepted"),
+        ("Classic", "rerelease"),
+        ("Scary", "genre_excluded"),
+        ("Mature", "rating_not_allowed"),
+        ("Unrated", "accepted"),
+        ("Sixth", "over_limit"),
+        ("No ID", "over_limit"),
+    ]
+    assert "['horror']" in decisions[2].reason
+    assert decisions[0].to_dict()["accepted"] is True
+
+
+def test_policy_is_recompiled_after_reset(monkeypatch):
+    settings = auto_add_policy.get_settings()
+    monkeypatch.setattr(settings, "boxarr_features_auto_add_limit", 3)
+    auto_add_policy.reset_auto_add_policy()
+    first = get_auto_add_policy()
+    assert first.limit == 3 and get_auto_add_policy() is first
+
+    monkeypatch.setattr(settings, "boxarr_features_auto_add_limit", 4)
+    auto_add_policy.reset_auto_add_policy()
+    assert get_auto_add_policy().limit == 4
+    auto_add_policy.reset_auto_add_policy()
@@ -0,0 +1,209 @@
+"""Tests for adding movies to Radarr in bulk."""
+
+import json
+
+import httpx
+import pytest
+
+from src.core import radarr as radarr_module
+from src.core.async_radarr import AsyncRadarrService
+from src.core.radarr import MovieAddRequest, MovieAddStatus, RadarrService
+
+# TMDB ID -> lookup result; 603 is already in the library (has a Radarr ID)
+LOOKUPS = {
+    438631: {"title": "Dune", "tmdbId": 438631},
+    346698: {"title": "Barbie", "tmdbId": 346698},
+    603: {"title": "The Matrix", "tmdbId": 603, "id": 12},
+}
+LIBRARY = {603: {"id": 12, "title": "The Matrix", "tmdbId": 603}}
+REQUESTS = [
+    MovieAddRequest(tmdb_id=438631, root_folder="/movies/scifi"),
+    MovieAddRequest(tmdb_id=1, title="Unknown"),
+    MovieAddRequest(tmdb_id=603),
+    MovieAddRequest(tmdb_id=346698, quality_profile_id=5),
+]
+
+
+@pytest.fixture(autouse=True)
+def _settings(monkeypatch):
+    settings = radarr_module.settings
+    monkeypatch.setattr(settings, "radarr_quality_profile_default", "HD-1080p")
+    monkeypatch.setattr(settings, "radarr_root_folder", "/movies")
+    monkeypatch.setattr(settings, "boxarr_features_auto_tag_enabled", False)
+
+
+def _handler(calls, import_status=200, failing=()):
+    def handler(request):
+        path = request.url.path
+        calls.append((request.method, path))
+        if path == "/api/v3/movie/lookup":
+            tmdb_id = int(request.url.params["term"][5:])
+            found = LOOKUPS.get(tmdb_id)
+            return httpx.Response(200, json=[found] if found else [])
+        if path == "/api/v3/qualityProfile":
+            return httpx.Response(200, json=[{"id": 4, "name": "HD-1080p"}])
+        if path == "/api/v3/movie" and request.method == "GET":
+            found = LIBRARY.get(int(request.url.params["tmdbId"]))
+            return httpx.Response(200, json=[found] if found else [])
+        body = json.loads(request.content or b"null")
+        if path == "/api/v3/movie/import":
+            if import_status != 200:
+                return httpx.Response(import_status)
+            # Radarr silently drops movies it refuses to import
+            imported = [m for m in body if m["tmdbId"] not in failing]
+            return httpx.Response(
+                200, json=[{**m, "id": m["tmdbId"] % 100} for m in imported]
+            )
+        if path == "/api/v3/movie" and request.method == "POST":
+            if body["tmdbId"] in failing:
+                return httpx.Response(400, json={"message": "invalid path"})
+            return httpx.Response(201, json={**body, "id": body["tmdbId"] % 100})
+        return httpx.Response(404)
+
+    return handler
+
+
+def _sync_service(handler):
+    client = httpx.Client(
+        base_url="http://radarr:7878", transport=httpx.MockTransport(handler)
+    )
+    return RadarrService(url="http://radarr:7878", api_key="key", http_client=client)
+
+
+def test_bulk_add_submits_one_import_request():
+    calls = []
+    service = _sync_service(_handler(calls, failing={346698}))
+    results = service.add_movies_bulk(REQUESTS)
+
+    assert [r.status for r in results] == [
+        MovieAddStatus.ADDED,
+        MovieAddStatus.NOT_FOUND,
+        MovieAddStatus.EXISTS,
+        MovieAddStatus.SKIPPED,
+    ]
+    assert results[0].movie.rootFolderPath == "/movies/scifi"
+    assert results[1].title == "Unknown"
+    assert calls.count(("POST", "/api/v3/movie/import")) == 1
+    assert ("POST", "/api/v3/movie") not in calls
+    assert results[0].to_dict()["status"] == "added"
+
+
+def test_bulk_add_falls_back_to_single_adds():
+    calls = []
+    submitted = []
+
+    def handler(request):
+        if request.url.path == "/api/v3/movie" and request.method == "POST":
+            submitted.append(json.loads(request.content))
+        return _handler(calls, import_status=404, failing={438631})(request)
+
+    results = _sync_service(handler).add_movies_bulk(REQUESTS)
+
+    assert results[0].status is MovieAddStatus.FAILED
+    assert "400" in results[0].error
+    assert results[3].added and results[3].movie.id == 98
+    profiles = {m["tmdbId"]: m["qualityProfileId"] for m in submitted}
+    assert profiles == {438631: 4, 346698: 5}
+
+
+@pytest.mark.asyncio
+async def test_async_bulk_add_matches_blocking_service():
+    calls = []
+    client = httpx.AsyncClient(
+        base_url="http://radarr:7878",
+        transport=httpx.MockTransport(_handler(calls, import_status=405)),
+    )
+    async with AsyncRadarrService(
+        url="http://radarr:7878", api_key="key", http_client=client
+    ) as service:
+        results = await service.add_movies_bulk(REQUESTS)
+
+    assert [r.status for r in results] == [
+        MovieAddStatus.ADDED,
+        MovieAddStatus.NOT_FOUND,
+        MovieAddStatus.EXISTS,
+        MovieAddStatus.ADDED,
+    ]
+    assert calls.count(("POST", "/api/v3/movie")) == 2
+    assert calls.count(("GET", "/api/v3/movie/lookup")) == 4
+
+
+def test_cached_lookup_does_not_block_re_adding_a_deleted_movie(monkeypatch, tmp_path):
+    settings = radarr_module.settings
+    monkeypatch.setattr(settings, "boxarr_data_directory", tmp_path)
+    monkeypatch.setattr(settings, "radarr_lookup_cache_ttl_seconds", 3600)
+    library = dict(LIBRARY)
+    calls = []
+    submitted = []
+    base = _handler(calls)
+
+    def handler(request):
+        path = request.url.path
+        if path == "/api/v3/movie" and request.method == "GET":
+            found = library.get(int(request.url.params["tmdbId"]))
+            return httpx.Response(200, json=[found] if found else [])
+        if path == "/api/v3/movie/import":
+            submitted.extend(json.loads(request.content))
+        return base(request)
+
+    service = _sync_service(handler)
+    try:
+        # Looked up while in the library, then deleted from Radarr
+        assert service.search_movie("tmdb:603")[0]["id"] == 12
+        library.clear()
+        results = service.add_movies_bulk([MovieAddRequest(tmdb_id=603)])
+    finally:
+        radarr_module._lookup_cache.close()
+
+    assert results[0].status is MovieAddStatus.ADDED
+    assert calls.count(("GET", "/api/v3/movie/lookup")) == 1
+    assert "id" not in submitted[0] and "path" not in submitted[0]
+
+
+def test_timed_out_import_is_not_retried_one_by_one():
+    calls = []
+    timeouts = []
+
+    def handler(request):
+        timeouts.append(request.extensions["timeout"]["read"])
+        if request.url.path == "/api/v3/movie/import":
+            raise httpx.ReadTimeout("slow import", request=request)
+        return _handler(calls)(request)
+
+    radarr_module.settings.radarr_add_timeout_seconds = 7.5
+    try:
+        results = _sync_service(handler).add_movies_bulk(REQUESTS[:1])
+    finally:
+        radarr_module.settings.radarr_add_timeout_seconds = 30.0
+
+    assert results[0].status is MovieAddStatus.FAILED
+    assert "did not respond in time" in results[0].error
+    assert ("POST", "/api/v3/movie") not in calls
+    # The lookup and the import both used the add timeout
+    assert timeouts[0] == timeouts[-1] == 7.5
+
+
+def test_added_movies_are_inserted_into_the_cached_library():
+    calls = []
+    base = _handler(calls)
+
+    def handler(request):
+        if request.url.path == "/api/v3/movie" and request.method == "GET":
+            calls.append(("GET", "/api/v3/movie"))
+            return httpx.Response(
+                200, json=[{"id": 12, "title": "The Matrix", "tmdbId": 603}]
+            )
+        return base(request)
+
+    service = _sync_service(handler)
+    service.get_library_index()
+    refreshes = radarr_module.get_library_cache_stats()["refreshes"]
+    service.add_movies_bulk(REQUESTS[:1])
+    service.add_movie(346698)
+    calls.clear()
+
+    found = service.find_movies_by_tmdb_ids([438631, 346698, 603])
+
+    assert calls == []
+    assert found[438631].id == 31 and found[346698].title == "Barbie"
+    assert radarr_module.get_library_cache_stats()["refreshes"] == refreshes
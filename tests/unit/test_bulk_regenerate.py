@@ -0,0 +1,107 @@
+"""Tests for bulk regeneration of stored weeks."""
+
+import json
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api.routes import scheduler as scheduler_routes
+from src.core import jobs, json_generator
+from src.core.boxoffice import BoxOfficeMovie, MatchResult
+from src.core.jobs import JobQueue
+from src.core.json_generator import WeeklyDataGenerator
+from src.core.library import LibraryIndex
+from src.core.radarr import QualityProfile, RadarrMovie
+
+
+class _SnapshotRadarr:
+    """Radarr stand-in that counts library and profile reads."""
+
+    def __init__(self, movies):
+        self.library = LibraryIndex(movies)
+        self.calls = {"library": 0, "profiles": 0, "lookups": 0}
+
+    def get_library_index(self):
+        self.calls["library"] += 1
+        return self.library
+
+    def get_quality_profiles(self):
+        self.calls["profiles"] += 1
+        return [QualityProfile(id=1, name="HD-1080p")]
+
+    def search_movie(self, term):
+        self.calls["lookups"] += 1
+        return []
+
+
+def _store_weeks(count):
+    """Write ``count`` weeks in which no movie is in Radarr yet."""
+    generator = WeeklyDataGenerator()
+    for week in range(1, count + 1):
+        results = [
+            MatchResult(
+                BoxOfficeMovie(
+                    rank=rank, title=f"Movie {tmdb_id}", tmdb_id=tmdb_id, poster="p"
+                )
+            )
+            for rank, tmdb_id in enumerate((week, week + 1), start=1)
+        ]
+        generator.generate_weekly_data(results, 2024, week, enrich_posters=False)
+    return generator.output_dir
+
+
+def test_all_weeks_rematch_against_one_snapshot(tmp_path, monkeypatch):
+    monkeypatch.setattr(json_generator.settings, "boxarr_data_directory", tmp_path)
+    output_dir = _store_weeks(30)
+    (output_dir / "2024W05.json").write_text("{not json")
+    radarr = _SnapshotRadarr([])
+    generator = WeeklyDataGenerator(radarr)
+    reported = []
+
+    summary = generator.regenerate_weeks(
+        progress=lambda message, done, total: reported.append((done, total)),
+        workers=4,
+        batch_size=8,
+    )
+
+    assert radarr.calls == {"library": 1, "profiles": 1, "lookups": 0}
+    assert summary["weeks"] == 30 and summary["failed"] == ["2024W05"]
+    # Every readable week gains the profile names
+    assert summary["written"] == 29
+    assert reported[-1] == (30, 30)
+    assert not list(output_dir.glob("*.tmp"))
+
+    radarr.library = LibraryIndex(
+        [RadarrMovie(id=7, title="Movie 3", tmdbId=3, qualityProfileId=1)]
+    )
+    again = generator.regenerate_weeks(year=2024)
+
+    # Only the weeks charting Movie 3 are rewritten
+    assert again["written"] == 2 and again["unchanged"] == 27
+    week_3 = json.loads((output_dir / "2024W03.json").read_text())
+    assert week_3["movies"][0]["radarr_id"] == 7
+    assert week_3["movies"][0]["quality_profile_name"] == "HD-1080p"
+    assert week_3["matched_movies"] == 1
+    assert generator.regenerate_weeks(year=2023)["weeks"] == 0
+
+
+def test_regenerate_endpoint_streams_job_progress(tmp_path, monkeypatch):
+    monkeypatch.setattr(json_generator.settings, "boxarr_data_directory", tmp_path)
+    monkeypatch.setattr(jobs, "_job_queue", JobQueue())
+    _store_weeks(3)
+    app = FastAPI()
+    app.include_router(scheduler_routes.router)
+    app.dependency_overrides[scheduler_routes.get_radarr_service] = lambda: None
+
+    with TestClient(app) as client:
+        assert (
+            client.post("/api/scheduler/regenerate-weeks", json={"year": 1990})
+        ).status_code == 400
+        queued = client.post("/api/scheduler/regenerate-weeks").json()
+        stream = client.get(f"/api/scheduler/jobs/{queued['job_id']}/events")
+
+    final = json.loads(stream.text.strip().splitlines()[-1][6:])
+    assert final["key"] == "regenerate_weeks:all"
+    assert final["priority"] == "background"
+    assert final["result"]["success"] is True
+    assert final["result"]["weeks"] == 3 and final["progress"] == 3
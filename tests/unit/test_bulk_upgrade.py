@@ -0,0 +1,131 @@
+"""Tests for bulk quality upgrades through the Radarr movie editor."""
+
+import json
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from src.core import radarr as radarr_module
+from src.core.async_radarr import AsyncRadarrService
+
+PROFILES = [{"id": 4, "name": "HD-1080p"}, {"id": 5, "name": "Ultra-HD"}]
+LIBRARY = [
+    {"id": 1, "title": "Dune", "tmdbId": 438631, "qualityProfileId": 4},
+    {"id": 2, "title": "Barbie", "tmdbId": 346698, "qualityProfileId": 5},
+    {"id": 3, "title": "Oppenheimer", "tmdbId": 872585, "qualityProfileId": 4},
+]
+
+
+def _handler(calls):
+    def handler(request):
+        path = request.url.path
+        body = json.loads(request.content) if request.content else None
+        calls.append((request.method, path, body))
+        if path == "/api/v3/qualityProfile":
+            return httpx.Response(200, json=PROFILES)
+        if path == "/api/v3/movie":
+            return httpx.Response(200, json=LIBRARY)
+        if path == "/api/v3/movie/editor":
+            updated = [
+                {**movie, "qualityProfileId": body["qualityProfileId"]}
+                for movie in LIBRARY
+                if movie["id"] in body["movieIds"]
+            ]
+            return httpx.Response(202, json=updated)
+        if path == "/api/v3/command":
+            return httpx.Response(201, json={"id": 77, "status": "queued"})
+        return httpx.Response(404)
+
+    return handler
+
+
+def test_editor_update_patches_cached_library():
+    calls = []
+    client = httpx.Client(
+        base_url="http://radarr:7878", transport=httpx.MockTransport(_handler(calls))
+    )
+    service = radarr_module.RadarrService(
+        url="http://radarr:7878", api_key="key", http_client=client
+    )
+    service.get_library_index()
+
+    updated = service.update_movies_quality_profile([1, 3], 5)
+    assert [m.qualityProfileId for m in updated] == [5, 5]
+    assert service.find_movie_by_id(3).qualityProfileId == 5
+    assert service.trigger_movies_search([1, 3]) is True
+
+    writes = [c for c in calls if c[0] != "GET"]
+    assert writes == [
+        ("PUT", "/api/v3/movie/editor", {"movieIds": [1, 3], "qualityProfileId": 5}),
+        ("POST", "/api/v3/command", {"name": "MoviesSearch", "movieIds": [1, 3]}),
+    ]
+    # The library was not downloaded again
+    assert calls.count(("GET", "/api/v3/movie", None)) == 1
+
+
+def test_upgrade_week_streams_progress(monkeypatch, tmp_path):
+    settings = radarr_module.settings
+    monkeypatch.setattr(settings, "boxarr_data_directory", tmp_path)
+    monkeypatch.setattr(settings, "boxarr_features_quality_upgrade", True)
+    monkeypatch.setattr(settings, "radarr_quality_profile_upgrade", "Ultra-HD")
+    weekly_pages = tmp_path / "weekly_pages"
+    weekly_pages.mkdir()
+    week = {"movies": [{"radarr_id": 1}, {"radarr_id": 2}, {"radarr_id": None}]}
+    (weekly_pages / "2024W10.json").write_text(json.dumps(week))
+
+    from src.api.app import create_app
+    from src.api.dependencies import get_async_radarr_service
+
+    calls = []
+
+    async def radarr_override():
+        client = httpx.AsyncClient(
+            base_url="http://radarr:7878",
+            transport=httpx.MockTransport(_handler(calls)),
+        )
+        async with AsyncRadarrService(
+            url="http://radarr:7878", api_key="key", http_client=client
+        ) as service:
+            yield service
+
+    app = create_app()
+    app.dependency_overrides[get_async_radarr_service] = radarr_override
+    with TestClient(app) as client:
+        response = client.post(
+            "/api/movies/upgrade-bulk",
+            json={"year": 2024, "week": 10, "movie_ids": [3, 99]},
+        )
+
+    events = [
+        json.loads(line[6:])
+        for line in response.text.splitlines()
+        if line.startswith("data: ")
+    ]
+    assert [e["stage"] for e in events] == [
+        "resolving",
+        "updating",
+        "searching",
+        "complete",
+    ]
+    # Barbie is already on Ultra-HD and 99 is not in Radarr
+    assert events[-1]["movie_ids"] == [3, 1]
+    assert events[-1]["skipped"] == 2
+    assert [c[1] for c in calls if c[0] != "GET"] == [
+        "/api/v3/movie/editor",
+        "/api/v3/command",
+    ]
+
+
+def test_upgrade_unknown_week_is_not_found(monkeypatch, tmp_path):
+    monkeypatch.setattr(radarr_module.settings, "boxarr_data_directory", tmp_path)
+
+    from src.api.app import create_app
+
+    with TestClient(create_app()) as client:
+        response = client.post(
+            "/api/movies/upgrade-bulk", json={"year": 2024, "week": 11}
+        )
+
+    assert response.status_code == 404
+    assert response.json()["detail"] == "No stored data for week 2024W11"
@@ -0,0 +1,31 @@
+"""Tests for loading settings from YAML."""
+
+import yaml
+
+from src.utils.config import Settings
+
+
+def test_out_of_range_yaml_values_are_clamped(tmp_path):
+    path = tmp_path / "local.yaml"
+    path.write_text(
+        yaml.safe_dump(
+            {
+                "radarr": {
+                    "bulk_add_concurrency": 0,
+                    "http_timeout_seconds": 0,
+                    "lookup_cache_max_entries": 10_000_000,
+                },
+                "trakt": {"max_concurrency": -3},
+                "boxarr": {"scheduler": {"disk_workers": 0}},
+            }
+        )
+    )
+    loaded = Settings()
+    loaded.load_from_yaml(path)
+
+    assert loaded.radarr_bulk_add_concurrency == 1
+    assert loaded.trakt_max_concurrency == 1
+    assert loaded.boxarr_scheduler_disk_workers == 1
+    assert loaded.radarr_lookup_cache_max_entries == 1_000_000
+    # gt=0 has no nearest valid value, so the default is used
+    assert loaded.radarr_http_timeout_seconds == 30.0
@@ -0,0 +1,74 @@
+"""Tests for saving configuration from the settings UI."""
+
+import yaml
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api.routes import config as config_routes
+from src.utils import config as config_module
+from src.utils.config import settings
+
+FORM = {
+    "radarr_url": "http://localhost:7878",
+    "radarr_api_key": "new-key",
+    "radarr_root_folder": "/movies",
+    "radarr_quality_profile_default": "HD-1080p",
+    "radarr_quality_profile_upgrade": "",
+    "boxarr_scheduler_enabled": False,
+    "boxarr_scheduler_cron": "0 23 * * 1",
+    "boxarr_features_auto_add": False,
+    "boxarr_features_quality_upgrade": False,
+    "boxarr_ui_theme": "dark",
+}
+
+
+class _FakeRadarrService:
+    busted = 0
+
+    def __init__(self, *_, **__):
+        pass
+
+    def test_connection(self) -> bool:
+        return True
+
+    def bust_cache(self) -> None:
+        _FakeRadarrService.busted += 1
+
+
+def test_ui_save_keeps_yaml_only_settings(monkeypatch, tmp_path):
+    monkeypatch.setenv("BOXARR_DATA_DIRECTORY", str(tmp_path))
+    monkeypatch.setattr(config_module, "_settings", None)
+    monkeypatch.setattr(config_routes, "RadarrService", _FakeRadarrService)
+    (tmp_path / "local.yaml").write_text(
+        yaml.safe_dump(
+            {
+                "radarr": {
+                    "url": "http://localhost:7878",
+                    "api_key": "old-key",
+                    "quality_profile_upgrade": "Ultra-HD",
+                    "webhook_secret": "s3cret",
+                    "bulk_add_concurrency": 8,
+                },
+                "trakt": {"client_id": "abc", "max_concurrency": 2},
+                "boxarr": {"ui": {"theme": "light", "cards_per_row": {"desktop": 4}}},
+            }
+        )
+    )
+    app = FastAPI()
+    app.include_router(config_routes.router)
+
+    with TestClient(app) as client:
+        body = client.post("/api/config/save", json=FORM).json()
+    assert body["success"] is True
+
+    saved = yaml.safe_load((tmp_path / "local.yaml").read_text())
+    assert saved["radarr"]["api_key"] == "new-key"
+    assert saved["radarr"]["webhook_secret"] == "s3cret"
+    assert saved["radarr"]["bulk_add_concurrency"] == 8
+    # A field cleared in the form is still removed
+    assert "quality_profile_upgrade" not in saved["radarr"]
+    assert saved["trakt"]["max_concurrency"] == 2
+    assert saved["boxarr"]["ui"] == {"theme": "dark", "cards_per_row": {"desktop": 4}}
+    assert settings.radarr_webhook_secret == "s3cret"
+    # A new API key means the cached library may belong to another instance
+    assert _FakeRadarrService.busted == 1
@@ -0,0 +1,120 @@
+"""Tests for the indexed scheduler history store."""
+
+import json
+import os
+from datetime import datetime
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api.routes import scheduler as scheduler_routes
+from src.core import history
+from src.core.history import HistoryStore
+
+DAY = 86400
+# Monday of ISO week 2025W10
+START = datetime(2025, 3, 3, 12, 0).timestamp()
+
+
+@pytest.fixture
+def fake_clock(fake_clock):
+    fake_clock.now = START
+    return fake_clock
+
+
+def _store(tmp_path, clock, retention_days=30):
+    return HistoryStore(
+        path=lambda: tmp_path / "runs.sqlite3",
+        retention_days=lambda: retention_days,
+        clock=clock,
+    )
+
+
+def test_runs_are_indexed_by_recency_and_week(tmp_path, fake_clock):
+    store = _store(tmp_path, fake_clock)
+
+    first = store.append({"total_count": 10})
+    fake_clock.now += DAY
+    second = store.append({"total_count": 11})
+    fake_clock.now += 7 * DAY
+    third = store.append({"total_count": 12, "when": datetime(2025, 3, 11)})
+    store.update(third, {"total_count": 12, "metrics": {"total_ms": 5.0}})
+
+    assert [run.id for run in store.recent(2)] == [third, second]
+    assert store.last().data == {"total_count": 12, "metrics": {"total_ms": 5.0}}
+    weeks = store.latest_per_week()
+    assert [(run.week, run.id) for run in weeks] == [
+        ("2025W11", third),
+        ("2025W10", second),
+    ]
+    assert first not in [run.id for run in weeks]
+    assert store.stats()["runs"] == 3
+
+
+def test_compaction_drops_expired_runs_but_keeps_each_weeks_latest(
+    tmp_path, fake_clock
+):
+    store = _store(tmp_path, fake_clock, retention_days=7)
+
+    store.append({"run": 1})
+    fake_clock.now += DAY
+    kept = store.append({"run": 2})
+    fake_clock.now += 30 * DAY
+    store.append({"run": 3})
+
+    runs = store.recent(10)
+    assert [run.data["run"] for run in runs] == [3, 2]
+    assert runs[1].id == kept
+    assert store.stats()["compacted"] == 1
+
+
+def test_legacy_json_files_are_imported_once(tmp_path, fake_clock):
+    (tmp_path / "2025W09_20250226_080000.json").write_text(
+        json.dumps({"total_count": 8})
+    )
+    (tmp_path / "2025W10_20250305_080000.json").write_text(
+        json.dumps({"total_count": 9})
+    )
+    (tmp_path / "2025W10_20250306_080000.json").write_text(
+        json.dumps({"total_count": 10})
+    )
+    (tmp_path / "2025W10_latest.json").write_text(json.dumps({"total_count": 10}))
+    # Only the latest file of an old week is left after the old cleanup
+    old_latest = tmp_path / "2024W40_latest.json"
+    old_latest.write_text(json.dumps({"total_count": 7}))
+    os.utime(old_latest, (START - 150 * DAY, START - 150 * DAY))
+
+    store = _store(tmp_path, fake_clock)
+
+    assert [run.data["total_count"] for run in store.recent(10)] == [10, 9, 8, 7]
+    assert [run.week for run in store.latest_per_week()] == [
+        "2025W10",
+        "2025W09",
+        "2024W40",
+    ]
+    assert list(tmp_path.glob("*.json")) == []
+    assert store.stats()["imported"] == 4
+
+
+def test_history_endpoint_reads_the_store(tmp_path, monkeypatch, fake_clock):
+    store = _store(tmp_path, fake_clock)
+    store.append({"total_count": 10, "added_movies": [{"title": "Wonka"}]})
+    monkeypatch.setattr(history, "_history_store", store)
+    app = FastAPI()
+    app.include_router(scheduler_routes.router)
+
+    with TestClient(app) as client:
+        runs = client.get("/api/scheduler/history").json()["runs"]
+
+    assert runs == [
+        {
+            "timestamp": "2025-03-03T12:00:00",
+            "week": "2025W10",
+            "success": False,
+            "movies_found": 10,
+            "movies_added": 1,
+            "error": None,
+            "metrics": None,
+        }
+    ]
@@ -0,0 +1,144 @@
+"""Tests for the conditional-request Trakt response cache."""
+
+import threading
+
+import httpx
+import pytest
+
+from src.core.async_boxoffice import AsyncBoxOfficeService
+from src.core.boxoffice import TraktRateLimiter
+from src.core.http_cache import HTTPResponseCache, freshness_lifetime
+from src.core.http_clients import HTTPClientRegistry
+
+CHART = [{"revenue": 1, "movie": {"title": "Dune", "ids": {"tmdb": 438631}}}]
+
+
+def test_freshness_lifetime_honors_cache_control():
+    assert freshness_lifetime({}, 60) == 60
+    assert freshness_lifetime({"Cache-Control": "private, max-age=0"}, 60) == 0
+    assert freshness_lifetime({"Cache-Control": "max-age=600"}, 60) == 600
+    # A shorter server max-age is honoured, not overridden by the default
+    assert freshness_lifetime({"Cache-Control": "max-age=30"}, 60) == 30
+    assert freshness_lifetime({"Cache-Control": "max-age=soon"}, 60) == 60
+    assert freshness_lifetime({"Cache-Control": "no-cache"}, 60) == 0
+    assert freshness_lifetime({"Cache-Control": "no-store, max-age=600"}, 60) is None
+
+
+@pytest.fixture
+def trakt(tmp_path, fake_clock):
+    requests = []
+    responses = []
+
+    def handler(request):
+        requests.append(request)
+        return responses.pop(0)
+
+    def make_service():
+        cache = HTTPResponseCache(
+            path=lambda: tmp_path / "trakt.sqlite3",
+            max_age=lambda: 60,
+            clock=fake_clock,
+        )
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return AsyncBoxOfficeService(
+            client_id="id",
+            api_url="https://trakt",
+            http_client=client,
+            rate_limiter=TraktRateLimiter(),
+            cache=cache,
+        )
+
+    return make_service, fake_clock, requests, responses
+
+
+@pytest.mark.asyncio
+async def test_fresh_hits_skip_the_network_and_stale_ones_revalidate(trakt):
+    make_service, clock, requests, responses = trakt
+    responses.append(httpx.Response(200, json=CHART, headers={"ETag": '"w1"'}))
+
+    async with make_service() as service:
+        first = await service.fetch_box_office()
+        second = await service.fetch_box_office()
+    assert first == second and len(requests) == 1
+
+    # After a restart the entry comes from disk; once stale it is revalidated
+    clock.now += 61
+    responses.append(httpx.Response(304, headers={"ETag": '"w1"'}))
+    async with make_service() as service:
+        movies = await service.fetch_box_office()
+        await service.fetch_box_office()
+        stats = service.cache.stats()
+
+    assert movies[0].title == "Dune"
+    assert len(requests) == 2
+    assert requests[1].headers["If-None-Match"] == '"w1"'
+    assert stats["revalidated"] == 1 and stats["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_stale_entry_is_served_when_trakt_is_down(trakt, monkeypatch):
+    make_service, clock, requests, responses = trakt
+    responses.append(
+        httpx.Response(200, json=CHART, headers={"Last-Modified": "Fri, 01 Mar 2024"})
+    )
+    async with make_service() as service:
+        await service.fetch_box_office()
+
+    clock.now += 61
+    responses.extend([httpx.Response(503)] * 3)
+    async with make_service() as service:
+        service.INITIAL_BACKOFF = 0
+        movies = await service.fetch_box_office()
+
+    assert movies[0].tmdb_id == 438631
+    assert requests[-1].headers["If-Modified-Since"] == "Fri, 01 Mar 2024"
+    assert len(requests) == 4
+
+
+@pytest.mark.asyncio
+async def test_disk_reads_and_writes_run_off_the_event_loop(trakt):
+    make_service, clock, requests, responses = trakt
+    responses.append(httpx.Response(200, json=CHART))
+    loop_thread = threading.get_ident()
+    disk_threads = []
+
+    async with make_service() as service:
+        connect = service.cache._connect
+
+        def tracked_connect():
+            disk_threads.append(threading.get_ident())
+            return connect()
+
+        service.cache._connect = tracked_connect
+        await service.fetch_box_office()
+        disk_calls = len(disk_threads)
+        # A fresh in-memory hit needs no disk access at all
+        await service.fetch_box_office()
+
+    assert disk_calls == len(disk_threads) == 2
+    assert loop_thread not in disk_threads
+
+
+@pytest.mark.asyncio
+async def test_cache_hits_never_build_a_client(tmp_path, fake_clock):
+    cache = HTTPResponseCache(
+        path=lambda: tmp_path / "trakt.sqlite3", max_age=lambda: 60, clock=fake_clock
+    )
+    key = cache.key_for("https://trakt/movies/boxoffice", {"extended": "full"})
+    cache.put(key, CHART, {})
+    registry = HTTPClientRegistry()
+
+    async with AsyncBoxOfficeService(
+        client_id="id", api_url="https://trakt", cache=cache, registry=registry
+    ) as service:
+        movies = await service.fetch_box_office()
+    assert movies[0].title == "Dune"
+    assert not registry._async_clients
+
+    # Misses share one pooled client per loop, which outlives the service
+    first = AsyncBoxOfficeService(client_id="id", registry=registry)
+    second = AsyncBoxOfficeService(client_id="id", registry=registry)
+    assert first.client is second.client
+    await first.close()
+    assert not second.client.is_closed
+    await registry.aclose()
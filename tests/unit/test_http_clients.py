@@ -0,0 +1,86 @@
+"""Tests for the pooled HTTP client registry."""
+
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+from src.core.http_clients import HTTPClientRegistry
+from src.core.radarr import RadarrService
+
+
+def test_registry_reuses_client_per_instance():
+    registry = HTTPClientRegistry()
+    a = registry.radarr_client("http://radarr:7878/", "key")
+    b = registry.radarr_client("http://radarr:7878", "key")
+    other = registry.radarr_client("http://radarr:7878", "other-key")
+
+    assert a is b
+    assert a is not other
+    assert a.headers["X-Api-Key"] == "key"
+
+    registry.close()
+    assert a.is_closed and other.is_closed
+    assert registry.closed
+
+
+def test_service_does_not_close_pooled_client():
+    registry = HTTPClientRegistry()
+    with RadarrService(
+        url="http://radarr:7878", api_key="key", registry=registry
+    ) as service:
+        client = service.client
+    assert not client.is_closed
+    assert (
+        RadarrService(url="http://radarr:7878", api_key="key", registry=registry).client
+        is client
+    )
+    registry.close()
+
+
+def test_http2_falls_back_without_h2():
+    registry = HTTPClientRegistry()
+    with (
+        patch("src.core.http_clients.settings") as mock_settings,
+        patch("src.core.http_clients._http2_available", return_value=False),
+    ):
+        mock_settings.radarr_http_http2 = True
+        assert registry._use_http2() is False
+
+
+def test_app_lifecycle_manages_registry():
+    from src.api.app import create_app
+
+    app = create_app()
+    with TestClient(app):
+        registry = app.state.http_clients
+        client = registry.radarr_client("http://radarr:7878", "key")
+        assert not client.is_closed
+    assert client.is_closed
+    assert app.state.http_clients is None
+
+
+def test_config_test_route_does_not_pool_tried_credentials():
+    from src.api.app import create_app
+
+    registry = HTTPClientRegistry()
+    opened = []
+
+    def unpooled(url, api_key):
+        client = HTTPClientRegistry.unpooled_radarr_client(registry, url, api_key)
+        opened.append(client)
+        return client
+
+    with (
+        patch("src.api.routes.config.get_client_registry", return_value=registry),
+        patch.object(registry, "unpooled_radarr_client", side_effect=unpooled),
+        patch.object(RadarrService, "test_connection", return_value=False),
+    ):
+        client = TestClient(create_app())
+        resp = client.post(
+            "/api/config/test",
+            json={"url": "http://typo:7878", "api_key": "wrong"},
+        )
+
+    assert resp.json()["success"] is False
+    assert len(opened) == 1 and opened[0].is_closed
+    assert registry._clients == {}
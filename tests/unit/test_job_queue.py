@@ -0,0 +1,162 @@
+"""Tests for the update job queue and its API."""
+
+import asyncio
+import json
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api.routes import scheduler as scheduler_routes
+from src.core import jobs
+from src.core.jobs import JobPriority, JobQueue, JobStatus
+
+
+@pytest.mark.asyncio
+async def test_jobs_run_by_priority_and_duplicates_coalesce():
+    queue = JobQueue()
+    order = []
+    release = asyncio.Event()
+
+    def work(name):
+        async def run(job):
+            if name == "blocker":
+                await release.wait()
+            job.report(f"ran {name}", progress=1, total=1)
+            order.append(name)
+            return name
+
+        return run
+
+    blocker, _ = queue.submit("blocker", work("blocker"))
+    await asyncio.sleep(0)
+    scheduled, _ = queue.submit("update", work("scheduled"), "a", JobPriority.SCHEDULED)
+    other, _ = queue.submit("update", work("other"), "b", JobPriority.SCHEDULED)
+    # A manual request for a queued key joins it and moves it ahead
+    joined, coalesced = queue.submit("update", work("ignored"), "b")
+    assert coalesced and joined is other and other.submissions == 2
+    assert other.priority is JobPriority.MANUAL
+
+    release.set()
+    await queue.wait(scheduled)
+
+    assert order == ["blocker", "other", "scheduled"]
+    assert scheduled.status is JobStatus.SUCCEEDED and scheduled.result == "scheduled"
+    assert scheduled.to_dict()["message"] == "Completed"
+    # Finished keys can be queued again
+    again, coalesced = queue.submit("update", work("again"), "a")
+    assert not coalesced and again is not scheduled
+    await queue.wait(again)
+    await queue.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_failed_job_records_the_error():
+    queue = JobQueue()
+
+    async def fail(job):
+        raise RuntimeError("radarr down")
+
+    job, _ = queue.submit("update", fail)
+    await queue.wait(job)
+
+    assert job.status is JobStatus.FAILED and job.error == "radarr down"
+    await queue.shutdown()
+
+
+class _FakeScheduler:
+    def queue_update(self, priority):
+        async def run(job):
+            job.report("Running match")
+            await asyncio.sleep(0.05)
+            return {"success": True, "movies_found": 10, "movies_added": 2}
+
+        return jobs.get_job_queue().submit("box_office_update", run, priority=priority)
+
+
+def test_trigger_returns_a_job_to_poll_and_stream(monkeypatch):
+    monkeypatch.setattr(jobs, "_job_queue", JobQueue())
+    monkeypatch.setattr(scheduler_routes, "_scheduler", _FakeScheduler())
+    app = FastAPI()
+    app.include_router(scheduler_routes.router)
+
+    with TestClient(app) as client:
+        first = client.post("/api/scheduler/trigger").json()
+        second = client.post("/api/scheduler/trigger").json()
+        assert first["success"] and first["job_id"] == second["job_id"]
+        assert second["coalesced"] is True
+
+        stream = client.get(f"/api/scheduler/jobs/{first['job_id']}/events")
+        events = [
+            json.loads(line[6:])
+            for line in stream.text.splitlines()
+            if line.startswith("data: ")
+        ]
+        assert events[-1]["status"] == "succeeded"
+        assert events[-1]["result"]["movies_added"] == 2
+
+        job = client.get(f"/api/scheduler/jobs/{first['job_id']}").json()
+        assert job["priority"] == "manual" and job["submissions"] == 2
+        assert client.get("/api/scheduler/jobs").json()["jobs"][0]["id"] == job["id"]
+        assert client.get("/api/scheduler/jobs/missing").status_code == 404
+
+
+def test_update_week_runs_as_a_job(monkeypatch, tmp_path):
+    monkeypatch.setattr(jobs, "_job_queue", JobQueue())
+    monkeypatch.setattr(scheduler_routes.settings, "boxarr_data_directory", tmp_path)
+    app = FastAPI()
+    app.include_router(scheduler_routes.router)
+    app.dependency_overrides[scheduler_routes.get_radarr_service] = lambda: None
+
+    with TestClient(app) as client:
+        assert (
+            client.post(
+                "/api/scheduler/update-week", json={"year": 2024, "week": 60}
+            ).status_code
+            == 400
+        )
+        queued = client.post(
+            "/api/scheduler/update-week", json={"year": 2024, "week": 10}
+        ).json()
+        stream = client.get(f"/api/scheduler/jobs/{queued['job_id']}/events")
+
+    final = json.loads(stream.text.strip().splitlines()[-1][6:])
+    assert final["key"] == "update_week:2024W10"
+    assert final["result"]["success"] is False
+    assert "No stored data" in final["result"]["message"]
+
+
+def test_queued_update_week_returns_the_update_payload(monkeypatch, tmp_path):
+    monkeypatch.setattr(jobs, "_job_queue", JobQueue())
+    monkeypatch.setattr(scheduler_routes.settings, "boxarr_data_directory", tmp_path)
+    pages = tmp_path / "weekly_pages"
+    pages.mkdir()
+    (pages / "2024W10.json").write_text(
+        json.dumps(
+            {
+                "year": 2024,
+                "week": 10,
+                "movies": [{"rank": 1, "title": "Dune", "tmdb_id": 438631}],
+            }
+        )
+    )
+    app = FastAPI()
+    app.include_router(scheduler_routes.router)
+    app.dependency_overrides[scheduler_routes.get_radarr_service] = lambda: None
+
+    with TestClient(app) as client:
+        queued = client.post(
+            "/api/scheduler/update-week", json={"year": 2024, "week": 10}
+        ).json()
+        client.get(f"/api/scheduler/jobs/{queued['job_id']}/events")
+        job = client.get(f"/api/scheduler/jobs/{queued['job_id']}").json()
+
+    assert job["status"] == "succeeded"
+    assert job["result"] == {
+        "success": True,
+        "message": "Updated week 2024W10",
+        "movies_found": 1,
+        "movies_added": 0,
+        "add_results": [],
+        "auto_add_decisions": [],
+    }
@@ -0,0 +1,54 @@
+"""Tests for the incremental JSON array parser."""
+
+import json
+
+import pytest
+
+from src.core.json_stream import JSONArrayParser
+
+
+def _parse_in_chunks(body: bytes, size: int):
+    parser = JSONArrayParser()
+    batches = [parser.feed(body[i : i + size]) for i in range(0, len(body), size)]
+    batches.append(parser.close())
+    return batches
+
+
+@pytest.mark.parametrize("size", [1, 3, 7, 64, 100000])
+def test_elements_match_json_loads_for_any_chunking(size):
+    payload = [
+        {"id": 1, "title": "Amélie", "genres": ["Comedy", "Romance"]},
+        {"id": 2, "title": 'Se7en [1995], "director\'s cut"', "nested": {"a": [1]}},
+        12345,
+        None,
+    ]
+    body = json.dumps(payload, ensure_ascii=False, indent=1).encode()
+
+    batches = _parse_in_chunks(body, size)
+
+    assert [item for batch in batches for item in batch] == payload
+
+
+def test_elements_are_yielded_before_the_body_ends():
+    parser = JSONArrayParser()
+
+    assert parser.feed(b'[{"id": 1}, {"id": ') == [{"id": 1}]
+    assert parser.feed(b"2}]") == [{"id": 2}]
+    assert parser.close() == []
+    assert parser.count == 2
+
+
+def test_empty_array():
+    parser = JSONArrayParser()
+    assert parser.feed(b" [ ] ") == []
+    assert parser.close() == []
+
+
+@pytest.mark.parametrize(
+    "body", [b'{"id": 1}', b'[{"id": 1}', b'[{"id": 1} {"id": 2}]', b"[1] 2"]
+)
+def test_malformed_bodies_raise(body):
+    parser = JSONArrayParser()
+    with pytest.raises(ValueError):
+        parser.feed(body)
+        parser.close()
@@ -0,0 +1,201 @@
+"""Tests for the indexed Radarr library lookups."""
+
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.core import radarr as radarr_module
+from src.core.library import LibraryCache, LibraryIndex, normalize_title
+from src.core.radarr import RadarrMovie, RadarrService
+
+
+def _movie(movie_id, title, tmdb_id, imdb_id=None):
+    return RadarrMovie(id=movie_id, title=title, tmdbId=tmdb_id, imdbId=imdb_id)
+
+
+def test_normalize_title():
+    assert normalize_title("  The   Batman ") == "the batman"
+    assert normalize_title(None) == ""
+
+
+def test_index_lookups():
+    batman = _movie(1, "The Batman", 414906, "tt1877830")
+    dune = _movie(2, "Dune", 438631)
+    index = LibraryIndex([batman, dune])
+
+    assert len(index) == 2
+    assert index.get_by_id(2) is dune
+    assert index.get_by_tmdb_id(414906) is batman
+    assert index.get_by_imdb_id("TT1877830") is batman
+    assert index.get_by_tmdb_id(0) is None
+    assert index.get_by_id(None) is None
+
+
+def test_title_prefers_exact_over_partial():
+    partial = _movie(1, "Dune: Part Two", 693134)
+    exact = _movie(2, "Dune", 438631)
+    index = LibraryIndex([partial, exact])
+
+    assert index.find_by_title("dune") is exact
+    assert index.find_by_title("part two") is partial
+    assert index.find_by_title("Oppenheimer") is None
+
+
+def test_service_uses_index_and_rebuilds_on_refresh():
+    service = RadarrService(url="http://localhost:7878", api_key="test_key")
+
+    payload = [{"id": 7, "title": "Barbie", "tmdbId": 346698, "imdbId": "tt1517268"}]
+    with patch("httpx.Client.send") as mock_request:
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.is_error = False
+        mock_response.iter_bytes.return_value = [json.dumps(payload).encode()]
+        mock_request.return_value = mock_response
+
+        assert service.find_movie_by_tmdb_id(346698).id == 7
+        assert service.find_movie_by_imdb_id("tt1517268").id == 7
+        assert service.find_movie_by_id(7).title == "Barbie"
+        assert service.search_movie_by_title("barbie").id == 7
+        # All lookups above are served from a single library fetch
+        assert mock_request.call_count == 1
+
+    service.bust_cache()
+    assert not radarr_module._library_cache.index
+
+
+def _cache(clock, soft=10, hard=60):
+    return LibraryCache(soft_ttl=lambda: soft, hard_ttl=lambda: hard, clock=clock)
+
+
+def test_cache_serves_stale_while_revalidating(fake_clock):
+    cache = _cache(fake_clock)
+    cache.get(lambda: [_movie(1, "Dune", 438631)])
+
+    fake_clock.now += 30  # past soft TTL, within hard TTL
+    refreshed = threading.Event()
+
+    def slow_fetch():
+        refreshed.wait(5)
+        return [_movie(1, "Dune", 438631), _movie(2, "Barbie", 346698)]
+
+    # Stale snapshot comes back immediately while the refresh runs
+    assert len(cache.get(slow_fetch)) == 1
+    assert cache.stats()["in_flight"]
+    refreshed.set()
+    for _ in range(100):
+        if not cache.stats()["in_flight"]:
+            break
+        time.sleep(0.01)
+    assert len(cache.get(slow_fetch)) == 2
+
+    stats = cache.stats()
+    assert stats["stale_hits"] == 1
+    assert stats["hits"] == 1
+    assert stats["refreshes"] == 2
+
+
+def _wait_for_refresh(cache):
+    for _ in range(100):
+        if not cache.stats()["in_flight"]:
+            return
+        time.sleep(0.01)
+
+
+def test_seeded_snapshot_is_served_until_a_refresh_succeeds(fake_clock):
+    cache = _cache(fake_clock)
+    assert cache.seed([_movie(1, "Dune", 438631)])
+    fake_clock.now += 3600  # far past the hard TTL
+
+    def unreachable():
+        raise RuntimeError("Radarr down")
+
+    for _ in range(2):
+        assert len(cache.get(unreachable)) == 1
+        _wait_for_refresh(cache)
+    assert cache.stats()["refresh_errors"] == 2
+
+    cache.get(lambda: [_movie(1, "Dune", 438631), _movie(2, "Barbie", 346698)])
+    _wait_for_refresh(cache)
+    assert len(cache.index) == 2
+    assert cache.stats()["seeded"] is False
+    # Only an empty cache can be seeded
+    assert not cache.seed([_movie(3, "Oppenheimer", 872585)])
+
+
+def test_cache_coalesces_concurrent_misses(fake_clock):
+    cache = _cache(fake_clock)
+    calls = []
+    release = threading.Event()
+
+    def fetch():
+        calls.append(1)
+        release.wait(5)
+        return [_movie(1, "Dune", 438631)]
+
+    with ThreadPoolExecutor(max_workers=5) as pool:
+        futures = [pool.submit(cache.get, fetch) for _ in range(5)]
+        time.sleep(0.05)
+        release.set()
+        results = [f.result() for f in futures]
+
+    assert len(calls) == 1
+    assert all(r is results[0] for r in results)
+    assert cache.stats()["coalesced"] == 4
+
+
+def test_cache_past_hard_ttl_refetches_and_surfaces_errors(fake_clock):
+    cache = _cache(fake_clock)
+    cache.get(lambda: [_movie(1, "Dune", 438631)])
+    fake_clock.now += 120
+
+    def failing():
+        raise RuntimeError("radarr down")
+
+    with pytest.raises(RuntimeError):
+        cache.get(failing)
+    assert cache.stats()["refresh_errors"] == 1
+
+
+def test_invalidate_discards_in_flight_result(fake_clock):
+    cache = _cache(fake_clock)
+    release = threading.Event()
+
+    def old_fetch():
+        release.wait(5)
+        return [_movie(1, "Old", 1)]
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        pending = pool.submit(cache.get, old_fetch)
+        time.sleep(0.05)
+        cache.invalidate()
+        release.set()
+        pending.result()
+
+    # The pre-invalidation fetch is not published
+    assert len(cache.index) == 0
+    assert cache.get(lambda: [_movie(2, "New", 2)]).get_by_id(2).title == "New"
+
+
+def test_patch_during_fetch_is_replayed_onto_its_result(fake_clock):
+    cache = _cache(fake_clock)
+    cache.get(lambda: [_movie(1, "Dune", 438631)])
+    fake_clock.now += 120
+    release = threading.Event()
+
+    def fetch():
+        release.wait(5)
+        return [_movie(1, "Dune", 438631)]
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        pending = pool.submit(cache.get, fetch)
+        time.sleep(0.05)
+        # A movie added while the library download is under way
+        assert cache.patch({2: _movie(2, "Wonka", 787699)})
+        release.set()
+        pending.result()
+
+    assert cache.index.get_by_tmdb_id(787699).title == "Wonka"
@@ -0,0 +1,127 @@
+"""Tests for the persisted Radarr library snapshot."""
+
+import gzip
+import json
+
+import httpx
+import pytest
+
+from src.core import radarr as radarr_module
+from src.core.models import MovieStatus
+from src.core.radarr import RadarrService
+from src.core.snapshot import SNAPSHOT_VERSION
+
+LIBRARY = [
+    {
+        "id": 1,
+        "title": "Dune",
+        "tmdbId": 438631,
+        "status": "released",
+        "hasFile": True,
+        "genres": ["Science Fiction"],
+        "movieFile": {"size": 2**30, "quality": {"quality": {"name": "WEBDL-1080p"}}},
+    },
+    {"id": 2, "title": "Barbie", "tmdbId": 346698, "status": "inCinemas"},
+]
+PROFILES = [{"id": 4, "name": "HD-1080p"}]
+FOLDERS = [{"id": 1, "path": "/movies"}]
+
+
+def _handler(request):
+    routes = {
+        "/api/v3/movie": LIBRARY,
+        "/api/v3/qualityProfile": PROFILES,
+        "/api/v3/rootFolder": FOLDERS,
+        "/api/v3/tag": [{"id": 3, "label": "boxarr"}],
+    }
+    return httpx.Response(200, json=routes[request.url.path])
+
+
+def _unreachable(request):
+    raise httpx.ConnectError("refused", request=request)
+
+
+def _service(handler):
+    client = httpx.Client(
+        base_url="http://radarr:7878", transport=httpx.MockTransport(handler)
+    )
+    return RadarrService(url="http://radarr:7878", api_key="key", http_client=client)
+
+
+def _reset():
+    radarr_module._library_cache.invalidate()
+    radarr_module._library_sync.reset()
+    radarr_module._metadata_cache.clear()
+
+
+@pytest.fixture
+def snapshot_settings(monkeypatch, tmp_path):
+    settings = radarr_module.settings
+    monkeypatch.setattr(settings, "radarr_snapshot_enabled", True)
+    monkeypatch.setattr(settings, "boxarr_data_directory", tmp_path)
+    monkeypatch.setattr(settings, "radarr_url", "http://radarr:7878")
+    monkeypatch.setattr(settings, "radarr_api_key", "key")
+    _reset()
+    yield tmp_path
+    radarr_module._snapshot_store.flush()
+    _reset()
+
+
+def _save_snapshot():
+    service = _service(_handler)
+    service.get_library_index()
+    service.get_quality_profiles()
+    service.get_root_folders()
+    service.get_tags()
+    # Metadata is written along with the next library refresh
+    service.get_library_index(ignore_cache=True)
+    radarr_module._snapshot_store.flush()
+
+
+def test_snapshot_round_trip(snapshot_settings):
+    _save_snapshot()
+    path = snapshot_settings / "radarr_snapshot.json.gz"
+    with gzip.open(path, "rt") as f:
+        assert json.load(f)["version"] == SNAPSHOT_VERSION
+
+    _reset()
+    assert radarr_module.restore_library_snapshot() is True
+
+    index = radarr_module._library_cache.index
+    dune = index.get_by_tmdb_id(438631)
+    assert dune.status is MovieStatus.RELEASED
+    assert dune.genres == ("Science Fiction",)
+    assert dune.file_quality == "WEBDL-1080p" and dune.file_size_gb == 1.0
+    assert index.find_by_title("barbie").id == 2
+    assert radarr_module.get_library_cache_stats()["seeded"] is True
+
+
+def test_restored_snapshot_works_while_radarr_is_down(snapshot_settings):
+    _save_snapshot()
+    _reset()
+    radarr_module.restore_library_snapshot()
+
+    offline = _service(_unreachable)
+    assert offline.find_movie_by_tmdb_id(346698).title == "Barbie"
+    assert [p.name for p in offline.get_quality_profiles()] == ["HD-1080p"]
+    assert offline.get_root_folder_paths() == ["/movies"]
+    assert offline.get_tag_by_label("boxarr")["id"] == 3
+
+
+def test_snapshot_for_other_radarr_or_version_is_ignored(snapshot_settings):
+    _save_snapshot()
+    path = snapshot_settings / "radarr_snapshot.json.gz"
+
+    _reset()
+    radarr_module.settings.radarr_url = "http://other:7878"
+    assert radarr_module.restore_library_snapshot() is False
+
+    radarr_module.settings.radarr_url = "http://radarr:7878"
+    with gzip.open(path, "rt") as f:
+        data = json.load(f)
+    with gzip.open(path, "wt") as f:
+        json.dump({**data, "version": SNAPSHOT_VERSION + 1}, f)
+    assert radarr_module.restore_library_snapshot() is False
+
+    path.write_bytes(b"not gzip")
+    assert radarr_module.restore_library_snapshot() is False
@@ -0,0 +1,186 @@
+"""Tests for incremental Radarr library sync."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from src.core import radarr as radarr_module
+from src.core.async_radarr import AsyncRadarrService
+from src.core.library import LibrarySyncState, apply_library_delta
+from src.core.radarr import RadarrMovie, RadarrService
+
+
+def _movie(movie_id, title, has_file=False):
+    return RadarrMovie(id=movie_id, title=title, tmdbId=movie_id * 10, hasFile=has_file)
+
+
+def test_apply_delta_replaces_removes_and_appends():
+    movies = [_movie(1, "A"), _movie(2, "B"), _movie(3, "C")]
+    updated = apply_library_delta(
+        movies, {2: _movie(2, "B", has_file=True), 3: None, 4: _movie(4, "D")}
+    )
+
+    assert [m.id for m in updated] == [1, 2, 4]
+    assert updated[1].hasFile
+
+
+def test_plan_requires_snapshot_and_respects_full_resync():
+    clock = [10_000.0]
+    state = LibrarySyncState(clock=lambda: clock[0])
+
+    assert state.plan(True, "incremental", 3600) == ("full", None)
+    state.record("full", state.started())
+
+    clock[0] += 120
+    mode, since = state.plan(True, "incremental", 3600)
+    assert mode == "incremental"
+    assert since == "1970-01-01T02:45:40Z"  # last sync minus overlap
+    assert state.plan(False, "incremental", 3600)[0] == "full"
+    assert state.plan(True, "full", 3600)[0] == "full"
+
+    clock[0] += 3600
+    assert state.plan(True, "incremental", 3600)[0] == "full"
+
+
+def test_service_applies_history_delta(monkeypatch):
+    monkeypatch.setattr(
+        radarr_module.settings, "radarr_library_sync_mode", "incremental"
+    )
+    library = [
+        {"id": 1, "title": "Dune", "tmdbId": 438631, "hasFile": False},
+        {"id": 2, "title": "Barbie", "tmdbId": 346698, "hasFile": False},
+    ]
+    requests = []
+
+    def handler(request):
+        requests.append(request.url.path)
+        if request.url.path == "/api/v3/movie":
+            return httpx.Response(200, json=library)
+        if request.url.path == "/api/v3/history/since":
+            return httpx.Response(
+                200,
+                json=[
+                    {"movieId": 1, "eventType": "downloadFolderImported"},
+                    {"movieId": 2, "eventType": "movieFileDeleted"},
+                    {"movieId": 1, "eventType": "grabbed"},
+                ],
+            )
+        if request.url.path == "/api/v3/movie/1":
+            return httpx.Response(200, json={**library[0], "hasFile": True})
+        return httpx.Response(404)
+
+    client = httpx.Client(
+        base_url="http://radarr:7878", transport=httpx.MockTransport(handler)
+    )
+    service = RadarrService(url="http://radarr:7878", api_key="key", http_client=client)
+
+    assert len(service.get_library_index()) == 2
+    index = service.get_library_index(ignore_cache=True)
+
+    assert index.get_by_id(1).hasFile is True
+    assert index.get_by_id(2) is None
+    assert requests.count("/api/v3/movie") == 1
+    stats = radarr_module.get_library_cache_stats()["sync"]
+    assert stats["incremental_syncs"] == 1
+    assert stats["movies_refreshed"] == 1
+    assert stats["movies_removed"] == 1
+
+
+def test_history_failure_falls_back_to_full(monkeypatch):
+    monkeypatch.setattr(
+        radarr_module.settings, "radarr_library_sync_mode", "incremental"
+    )
+    full_fetches = []
+
+    def handler(request):
+        if request.url.path == "/api/v3/movie":
+            full_fetches.append(1)
+            return httpx.Response(200, json=[{"id": 1, "title": "Dune", "tmdbId": 1}])
+        return httpx.Response(500)
+
+    client = httpx.Client(
+        base_url="http://radarr:7878", transport=httpx.MockTransport(handler)
+    )
+    service = RadarrService(url="http://radarr:7878", api_key="key", http_client=client)
+    service.get_library_index()
+    service.get_library_index(ignore_cache=True)
+
+    assert len(full_fetches) == 2
+    assert radarr_module.get_library_cache_stats()["sync"]["incremental_failures"] == 1
+
+
+def test_large_history_delta_does_a_full_download(monkeypatch):
+    monkeypatch.setattr(
+        radarr_module.settings, "radarr_library_sync_mode", "incremental"
+    )
+    monkeypatch.setattr(radarr_module.settings, "radarr_probe_threshold", 1)
+    requests = []
+
+    def handler(request):
+        requests.append(request.url.path)
+        if request.url.path == "/api/v3/movie":
+            return httpx.Response(200, json=[{"id": 1, "title": "Dune", "tmdbId": 1}])
+        if request.url.path == "/api/v3/history/since":
+            return httpx.Response(
+                200,
+                json=[
+                    {"movieId": 1, "eventType": "grabbed"},
+                    {"movieId": 2, "eventType": "grabbed"},
+                ],
+            )
+        return httpx.Response(404)
+
+    client = httpx.Client(
+        base_url="http://radarr:7878", transport=httpx.MockTransport(handler)
+    )
+    service = RadarrService(url="http://radarr:7878", api_key="key", http_client=client)
+    before = radarr_module.get_library_cache_stats()["sync"]
+    service.get_library_index()
+    service.get_library_index(ignore_cache=True)
+
+    # No per-movie refreshes: the changed set exceeded the probe threshold
+    assert requests == ["/api/v3/movie", "/api/v3/history/since", "/api/v3/movie"]
+    stats = radarr_module.get_library_cache_stats()["sync"]
+    assert stats["full_syncs"] - before["full_syncs"] == 2
+    assert stats["incremental_failures"] == before["incremental_failures"]
+
+
+@pytest.mark.asyncio
+async def test_async_delta_refreshes_are_bounded(monkeypatch):
+    monkeypatch.setattr(
+        radarr_module.settings, "radarr_library_sync_mode", "incremental"
+    )
+    monkeypatch.setattr(radarr_module.settings, "radarr_bulk_add_concurrency", 2)
+    library = [{"id": i, "title": f"Movie {i}", "tmdbId": i} for i in range(1, 9)]
+    in_flight = [0, 0]  # current, peak
+
+    async def handler(request):
+        path = request.url.path
+        if path == "/api/v3/movie":
+            return httpx.Response(200, json=library)
+        if path == "/api/v3/history/since":
+            return httpx.Response(
+                200,
+                json=[{"movieId": m["id"], "eventType": "grabbed"} for m in library],
+            )
+        in_flight[0] += 1
+        in_flight[1] = max(in_flight)
+        await asyncio.sleep(0.01)
+        in_flight[0] -= 1
+        return httpx.Response(200, json=library[int(path.rsplit("/", 1)[1]) - 1])
+
+    client = httpx.AsyncClient(
+        base_url="http://radarr:7878", transport=httpx.MockTransport(handler)
+    )
+    async with AsyncRadarrService(
+        url="http://radarr:7878", api_key="key", http_client=client
+    ) as service:
+        before = radarr_module.get_library_cache_stats()["sync"]["movies_refreshed"]
+        await service.get_library_index()
+        index = await service.get_library_index(ignore_cache=True)
+
+    assert len(index) == 8
+    assert in_flight[1] == 2
+    after = radarr_module.get_library_cache_stats()["sync"]["movies_refreshed"]
+    assert after - before == 8
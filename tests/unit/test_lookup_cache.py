@@ -0,0 +1,120 @@
+"""Tests for the persistent Radarr lookup cache."""
+
+import httpx
+
+from src.core import radarr as radarr_module
+from src.core.lookup_cache import NEGATIVE_TTL_SECONDS, LookupCache
+from src.core.radarr import RadarrService
+
+DUNE = {"title": "Dune: Part Two", "tmdbId": 693134, "year": 2024}
+
+
+def _cache(tmp_path, clock, ttl=3600, max_entries=100):
+    return LookupCache(
+        path=lambda: tmp_path / "lookups.sqlite3",
+        ttl=lambda: ttl,
+        max_entries=lambda: max_entries,
+        clock=clock,
+    )
+
+
+def test_keys_normalize_terms():
+    assert LookupCache.key_for("tmdb:693134") == "tmdb:693134"
+    assert LookupCache.key_for(" TMDB: 693134 ") == "tmdb:693134"
+    assert LookupCache.key_for("Dune:  Part Two ") == LookupCache.key_for(
+        "dune: part two"
+    )
+
+
+def test_hits_persist_and_expire(tmp_path, fake_clock):
+    cache = _cache(tmp_path, fake_clock)
+    assert cache.get("Dune Part Two") is None
+
+    cache.put("Dune Part Two", [DUNE])
+    assert cache.get("dune part two") == [DUNE]
+    # Each title result is reachable by TMDB ID as well
+    assert cache.get("tmdb:693134") == [DUNE]
+    cache.close()
+
+    reopened = _cache(tmp_path, fake_clock)
+    assert reopened.get("Dune Part Two") == [DUNE]
+    fake_clock.now += 3600
+    assert reopened.get("Dune Part Two") is None
+    assert reopened.stats()["expired"] == 1
+
+
+def test_library_state_is_not_cached(tmp_path, fake_clock):
+    cache = _cache(tmp_path, fake_clock)
+    in_library = {**DUNE, "id": 7, "path": "/movies/Dune", "monitored": True}
+    cache.put("Dune Part Two", [in_library])
+
+    assert cache.get("Dune Part Two") == [DUNE]
+    assert cache.get("tmdb:693134") == [DUNE]
+
+
+def test_empty_results_expire_sooner(tmp_path, fake_clock):
+    cache = _cache(tmp_path, fake_clock, ttl=NEGATIVE_TTL_SECONDS * 10)
+    cache.put("Unreleased Indie", [])
+    assert cache.get("Unreleased Indie") == []
+
+    fake_clock.now += NEGATIVE_TTL_SECONDS
+    assert cache.get("Unreleased Indie") is None
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path, fake_clock):
+    cache = _cache(tmp_path, fake_clock, max_entries=2)
+    for term in ("tmdb:1", "tmdb:2"):
+        cache.put(term, [{"tmdbId": int(term[5:])}])
+        fake_clock.now += 1
+    cache.get("tmdb:1")  # refresh its recency
+    fake_clock.now += 1
+    cache.put("tmdb:3", [{"tmdbId": 3}])
+
+    assert cache.get("tmdb:2") is None
+    assert cache.get("tmdb:1") is not None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_zero_ttl_disables_and_storage_errors_are_misses(tmp_path, fake_clock):
+    disabled = _cache(tmp_path, fake_clock, ttl=0)
+    disabled.put("Dune", [DUNE])
+    assert disabled.get("Dune") is None
+    assert not (tmp_path / "lookups.sqlite3").exists()
+
+    (tmp_path / "lookups.sqlite3").write_bytes(b"not a database" * 100)
+    broken = _cache(tmp_path, fake_clock)
+    assert broken.get("Dune") is None
+    broken.put("Dune", [DUNE])
+    assert broken.stats()["errors"] >= 1
+
+
+def test_service_reuses_lookups_across_callers(monkeypatch, tmp_path):
+    settings = radarr_module.settings
+    monkeypatch.setattr(settings, "boxarr_data_directory", tmp_path)
+    monkeypatch.setattr(settings, "radarr_lookup_cache_ttl_seconds", 3600)
+    monkeypatch.setattr(settings, "boxarr_features_auto_tag_enabled", False)
+    lookups = []
+
+    def handler(request):
+        path = request.url.path
+        if path == "/api/v3/movie/lookup":
+            lookups.append(request.url.params["term"])
+            return httpx.Response(200, json=[DUNE])
+        if path == "/api/v3/qualityProfile":
+            return httpx.Response(200, json=[{"id": 1, "name": "Any"}])
+        if path == "/api/v3/movie":
+            return httpx.Response(201, json={**DUNE, "id": 9})
+        return httpx.Response(200, json=[])
+
+    client = httpx.Client(
+        base_url="http://radarr:7878", transport=httpx.MockTransport(handler)
+    )
+    service = RadarrService(url="http://radarr:7878", api_key="key", http_client=client)
+    try:
+        assert service.search_movie("Dune Part Two") == [DUNE]
+        assert service.search_movie_tmdb("dune part two") == [DUNE]
+        service.add_movie(693134, quality_profile_id=1, root_folder="/movies")
+    finally:
+        radarr_module._lookup_cache.close()
+
+    assert lookups == ["Dune Part Two"]
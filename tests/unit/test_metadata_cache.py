@@ -0,0 +1,113 @@
+"""Tests for the shared Radarr metadata cache."""
+
+import httpx
+import pytest
+
+from src.core import radarr as radarr_module
+from src.core.exceptions import RadarrAuthenticationError, RadarrConnectionError
+from src.core.metadata_cache import MetadataCache
+from src.core.radarr import RadarrService
+
+SOURCE = "http://radarr:7878"
+
+
+def test_entries_expire_and_bump_version(fake_clock):
+    cache = MetadataCache(ttl=lambda: 60, clock=fake_clock)
+    assert cache.get(SOURCE, "tags") is None
+
+    cache.put(SOURCE, "tags", [{"id": 1, "label": "boxarr"}])
+    version = cache.version
+    assert cache.get(SOURCE, "tags") == [{"id": 1, "label": "boxarr"}]
+    # Other Radarr instances never see this instance's data
+    assert cache.get("http://other:7878", "tags") is None
+
+    fake_clock.now += 60
+    assert cache.get(SOURCE, "tags") is None
+    assert cache.last_known(SOURCE, "tags") == [{"id": 1, "label": "boxarr"}]
+
+    cache.invalidate("profiles")
+    assert cache.version > version
+    stats = cache.stats()
+    assert stats["hits"] == 1 and stats["misses"] == 3
+    assert stats["invalidations"] == 1
+
+
+def test_invalidate_and_seed_keep_last_known_values(fake_clock):
+    cache = MetadataCache(ttl=lambda: 60, clock=fake_clock)
+    cache.put(SOURCE, "profiles", [{"id": 4, "name": "HD"}])
+    cache.invalidate()
+    assert cache.get(SOURCE, "profiles") is None
+    assert cache.export(SOURCE) == {"profiles": [{"id": 4, "name": "HD"}]}
+
+    cache.seed(SOURCE, {"profiles": [], "root_folders": ["/movies"], "bogus": 1})
+    assert cache.last_known(SOURCE, "profiles") == [{"id": 4, "name": "HD"}]
+    assert cache.get(SOURCE, "root_folders") is None
+    assert set(cache.export(SOURCE)) == {"profiles", "root_folders"}
+
+
+@pytest.fixture
+def counted_service(monkeypatch):
+    monkeypatch.setattr(radarr_module.settings, "radarr_cache_ttl_seconds", 300)
+    monkeypatch.setattr(
+        radarr_module.settings, "boxarr_features_auto_tag_enabled", True
+    )
+    monkeypatch.setattr(
+        radarr_module.settings, "boxarr_features_auto_tag_text", "boxarr"
+    )
+    calls = []
+
+    def handler(request):
+        calls.append((request.method, request.url.path))
+        path = request.url.path
+        if path == "/api/v3/tag" and request.method == "POST":
+            return httpx.Response(201, json={"id": 7, "label": "boxarr"})
+        if path == "/api/v3/tag":
+            return httpx.Response(200, json=[])
+        if path == "/api/v3/qualityProfile":
+            return httpx.Response(200, json=[{"id": 1, "name": "Any"}])
+        if path == "/api/v3/rootFolder":
+            return httpx.Response(200, json=[{"path": "/movies"}])
+        if path == "/api/v3/movie/lookup":
+            tmdb_id = int(request.url.params["term"][5:])
+            return httpx.Response(200, json=[{"tmdbId": tmdb_id, "title": "M"}])
+        if path == "/api/v3/movie":
+            return httpx.Response(201, json={"id": 1, "tmdbId": 1, "title": "M"})
+        return httpx.Response(404)
+
+    client = httpx.Client(base_url=SOURCE, transport=httpx.MockTransport(handler))
+    return RadarrService(url=SOURCE, api_key="key", http_client=client), calls
+
+
+def test_adding_ten_movies_fetches_metadata_once(counted_service):
+    service, calls = counted_service
+    for tmdb_id in range(1, 11):
+        service.get_root_folder_paths()
+        service.add_movie(tmdb_id, root_folder="/movies")
+
+    def count(method, path):
+        return calls.count((method, path))
+
+    assert count("GET", "/api/v3/tag") == 1
+    assert count("POST", "/api/v3/tag") == 1
+    assert count("GET", "/api/v3/qualityProfile") == 1
+    assert count("GET", "/api/v3/rootFolder") == 1
+    assert count("POST", "/api/v3/movie") == 10
+
+
+def test_outage_serves_last_known_unless_unauthorized(counted_service):
+    service, _calls = counted_service
+    assert service.get_root_folder_paths() == ["/movies"]
+    radarr_module.invalidate_radarr_metadata()
+
+    def fail(error):
+        def request(*_args, **_kwargs):
+            raise error
+
+        return request
+
+    service._make_request = fail(RadarrConnectionError("down"))
+    assert service.get_root_folder_paths() == ["/movies"]
+
+    service._make_request = fail(RadarrAuthenticationError("bad key"))
+    with pytest.raises(RadarrAuthenticationError):
+        service.get_root_folders()
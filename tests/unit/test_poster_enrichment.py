@@ -0,0 +1,77 @@
+"""Tests for batched poster enrichment in the weekly data generator."""
+
+import json
+import threading
+import time
+
+from src.core import json_generator
+from src.core.boxoffice import BoxOfficeMovie, MatchResult
+from src.core.json_generator import WeeklyDataGenerator
+
+
+class _LookupRadarr:
+    """Radarr stand-in that counts lookups and their concurrency."""
+
+    def __init__(self):
+        self.terms = []
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def get_quality_profiles(self):
+        return []
+
+    def search_movie(self, term):
+        with self._lock:
+            self.terms.append(term)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.02)
+        with self._lock:
+            self.active -= 1
+        if term == "tmdb:3":
+            raise RuntimeError("lookup failed")
+        return [{"remotePoster": f"https://image.tmdb.org/{term[5:]}.jpg"}]
+
+
+def _week(*tmdb_ids):
+    return [
+        MatchResult(
+            BoxOfficeMovie(rank=rank, title=f"Movie {tmdb_id}", tmdb_id=tmdb_id)
+        )
+        for rank, tmdb_id in enumerate(tmdb_ids, start=1)
+    ]
+
+
+def test_posters_are_looked_up_once_per_film(tmp_path, monkeypatch):
+    monkeypatch.setattr(json_generator.settings, "boxarr_data_directory", tmp_path)
+    monkeypatch.setattr(json_generator.settings, "radarr_bulk_add_concurrency", 4)
+    radarr = _LookupRadarr()
+    generator = WeeklyDataGenerator(radarr)
+
+    weeks = [(_week(1, 2, 3), 2024, 10), (_week(2, 1, 4), 2024, 11)]
+    # Already known posters are kept and not looked up again
+    weeks[1][0][2].box_office_movie.poster = "https://known/4.jpg"
+    paths = generator.generate_weeks(weeks)
+
+    assert sorted(radarr.terms) == ["tmdb:1", "tmdb:2", "tmdb:3"]
+    assert radarr.peak > 1
+    week_11 = json.loads(paths[1].read_text())
+    assert [m["poster"] for m in week_11["movies"]] == [
+        "https://image.tmdb.org/2.jpg",
+        "https://image.tmdb.org/1.jpg",
+        "https://known/4.jpg",
+    ]
+    week_10 = json.loads(paths[0].read_text())
+    assert week_10["movies"][2]["poster"] is None
+
+
+def test_single_week_generation_still_enriches(tmp_path, monkeypatch):
+    monkeypatch.setattr(json_generator.settings, "boxarr_data_directory", tmp_path)
+    radarr = _LookupRadarr()
+
+    path = WeeklyDataGenerator(radarr).generate_weekly_data(_week(5, 5), 2024, 12)
+
+    assert radarr.terms == ["tmdb:5"]
+    movies = json.loads(path.read_text())["movies"]
+    assert movies[1]["poster"] == "https://image.tmdb.org/5.jpg"
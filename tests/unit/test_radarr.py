@@ -1,5 +1,6 @@
 """Unit tests for Radarr integration - focus on error handling and critical functionality."""
 
+import json
 from unittest.mock import MagicMock, Mock, patch
 
 import httpx
@@ -19,7 +20,7 @@ class TestRadarrErrorHandling:
 
     def test_radarr_connection_failure(self):
         """Test handling when Radarr API is not accessible."""
-        with patch("httpx.Client.request") as mock_request:
+        with patch("httpx.Client.send") as mock_request:
             mock_request.side_effect = httpx.ConnectError("Connection refused")
 
             service = RadarrService(url="http://localhost:7878", api_key="test_key")
@@ -31,7 +32,8 @@ class TestRadarrErrorHandling:
 
     def test_radarr_authentication_failure(self):
         """Test handling when API key is invalid."""
-        with patch("httpx.Client.request") as mock_request:
+        # The library is streamed, so it goes through Client.send
+        with patch("httpx.Client.send") as mock_request:
             mock_response = Mock()
             mock_response.status_code = 401
             mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
@@ -150,10 +152,11 @@ class TestRadarrMovieOperations:
             },
         ]
 
-        with patch("httpx.Client.request") as mock_request:
+        with patch("httpx.Client.send") as mock_request:
             mock_response = Mock()
             mock_response.status_code = 200
-            mock_response.json.return_value = mock_movies
+            mock_response.is_error = False
+            mock_response.iter_bytes.return_value = [json.dumps(mock_movies).encode()]
             mock_request.return_value = mock_response
 
             movies = self.service.get_all_movies()
@@ -271,6 +274,57 @@ class TestRadarrMovieOperations:
 
             assert updated_movie.qualityProfileId == 5
 
+    def test_parsed_movie_is_compact(self):
+        """Parsed movies keep derived fields only, not the raw payload."""
+        movie = self.service._parse_movie(
+            {
+                "id": 1,
+                "title": "The Batman",
+                "tmdbId": 414906,
+                "genres": ["Action", "Crime"],
+                "images": [{"coverType": "poster", "remoteUrl": "https://p.jpg"}],
+                "alternateTitles": [{"title": "Batman"}],
+            }
+        )
+
+        assert not hasattr(movie, "__dict__")
+        assert not hasattr(movie, "_raw_data")
+        assert movie.poster_url == "https://p.jpg"
+        assert movie.genres == ("Action", "Crime")
+        assert movie.file_quality is None and movie.file_size_gb is None
+
+    def test_update_movie_fetches_raw_payload(self):
+        """update_movie sends the freshly fetched payload with changed fields."""
+        raw = {
+            "id": 123,
+            "title": "Test Movie",
+            "tmdbId": 111,
+            "qualityProfileId": 4,
+            "monitored": True,
+            "path": "/movies/Test Movie (2024)",
+            "tags": [2],
+        }
+        movie = RadarrMovie(id=123, title="Test Movie", tmdbId=111)
+        movie.qualityProfileId = 5
+        movie.monitored = False
+
+        with patch("httpx.Client.request") as mock_request:
+            mock_get_response = Mock(status_code=200)
+            mock_get_response.json.return_value = raw
+            mock_put_response = Mock(status_code=200)
+            mock_put_response.json.return_value = {**raw, "qualityProfileId": 5}
+            mock_request.side_effect = [mock_get_response, mock_put_response]
+
+            self.service.update_movie(movie)
+
+            method, path = mock_request.call_args_list[1].args
+            payload = mock_request.call_args_list[1].kwargs["json"]
+            assert (method, path) == ("PUT", "/api/v3/movie/123")
+            assert payload["path"] == "/movies/Test Movie (2024)"
+            assert payload["tags"] == [2]
+            assert payload["qualityProfileId"] == 5
+            assert payload["monitored"] is False
+
     def test_get_root_folders(self):
         """Test fetching root folders from Radarr."""
         mock_folders = [
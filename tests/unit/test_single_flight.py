@@ -0,0 +1,95 @@
+"""Tests for single-flight execution of the update pipeline."""
+
+import asyncio
+import fcntl
+import json
+import time
+
+import pytest
+
+from src.core.exceptions import SchedulerError
+from src.core.single_flight import SingleFlight
+
+
+@pytest.mark.asyncio
+async def test_concurrent_runs_share_one_execution(tmp_path):
+    flight = SingleFlight(lambda: tmp_path / "update.lock")
+    calls = []
+    release = asyncio.Event()
+
+    async def update():
+        calls.append(1)
+        await release.wait()
+        return {"movies_found": 10}
+
+    tasks = [asyncio.create_task(flight.run(update)) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*tasks)
+
+    assert calls == [1]
+    assert results == [{"movies_found": 10}] * 3
+    assert flight.stats() == {"runs": 1, "joined": 2, "reused": 0, "in_flight": False}
+    stored = json.loads((tmp_path / "update.result.json").read_text())
+    assert stored["result"] == {"movies_found": 10}
+
+
+@pytest.mark.asyncio
+async def test_error_propagates_to_joiners(tmp_path):
+    flight = SingleFlight(lambda: tmp_path / "update.lock")
+
+    async def update():
+        await asyncio.sleep(0)
+        raise SchedulerError("Trakt unavailable")
+
+    results = await asyncio.gather(
+        flight.run(update), flight.run(update), return_exceptions=True
+    )
+
+    assert [str(r) for r in results] == ["Trakt unavailable"] * 2
+    # The next run starts fresh instead of replaying the failure
+    assert await flight.run(lambda: asyncio.sleep(0, result="ok")) == "ok"
+
+
+@pytest.mark.asyncio
+async def test_waits_for_other_process_and_reuses_its_result(tmp_path):
+    lock_path = tmp_path / "update.lock"
+    flight = SingleFlight(lambda: lock_path, poll_interval=0.01)
+    calls = []
+
+    async def update():
+        calls.append(1)
+        return "ran here"
+
+    # Another process holds the lock while it runs the update
+    with open(lock_path, "a+") as other:
+        fcntl.flock(other, fcntl.LOCK_EX)
+        task = asyncio.create_task(flight.run(update))
+        await asyncio.sleep(0.05)
+        assert not task.done()
+        (tmp_path / "update.result.json").write_text(
+            json.dumps({"result": "ran elsewhere", "finished_at": time.time()})
+        )
+        fcntl.flock(other, fcntl.LOCK_UN)
+    result = await task
+
+    assert result == "ran elsewhere"
+    assert calls == []
+    assert flight.stats()["reused"] == 1
+
+
+@pytest.mark.asyncio
+async def test_stale_result_from_dead_process_is_not_reused(tmp_path):
+    lock_path = tmp_path / "update.lock"
+    flight = SingleFlight(lambda: lock_path, poll_interval=0.01)
+    (tmp_path / "update.result.json").write_text(
+        json.dumps({"result": "old", "finished_at": time.time() - 3600})
+    )
+
+    with open(lock_path, "a+") as other:
+        fcntl.flock(other, fcntl.LOCK_EX)
+        task = asyncio.create_task(flight.run(lambda: asyncio.sleep(0, result="new")))
+        await asyncio.sleep(0.03)
+        fcntl.flock(other, fcntl.LOCK_UN)
+
+    assert await task == "new"
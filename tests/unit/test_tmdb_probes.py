@@ -0,0 +1,92 @@
+"""Tests for targeted tmdbId probes vs full library downloads."""
+
+import httpx
+import pytest
+
+from src.core import radarr as radarr_module
+from src.core.boxoffice import (
+    BoxOfficeMovie,
+    MatchResult,
+    rematch_unmatched,
+    unmatched_tmdb_ids,
+)
+from src.core.radarr import RadarrService
+
+LIBRARY = [
+    {"id": 1, "title": "Dune", "tmdbId": 438631},
+    {"id": 2, "title": "Barbie", "tmdbId": 346698},
+    {"id": 3, "title": "Oppenheimer", "tmdbId": 872585},
+]
+
+
+def _service(calls, honor_filter=True):
+    def handler(request):
+        calls.append(str(request.url.params.get("tmdbId", "all")))
+        tmdb_id = request.url.params.get("tmdbId")
+        if tmdb_id and honor_filter:
+            return httpx.Response(
+                200, json=[m for m in LIBRARY if m["tmdbId"] == int(tmdb_id)]
+            )
+        return httpx.Response(200, json=LIBRARY)
+
+    client = httpx.Client(
+        base_url="http://radarr:7878", transport=httpx.MockTransport(handler)
+    )
+    return RadarrService(url="http://radarr:7878", api_key="key", http_client=client)
+
+
+@pytest.fixture(autouse=True)
+def _threshold(monkeypatch):
+    monkeypatch.setattr(radarr_module.settings, "radarr_probe_threshold", 2)
+
+
+@pytest.mark.parametrize("honor_filter", [True, False])
+def test_small_sets_are_probed(honor_filter):
+    calls = []
+    found = _service(calls, honor_filter).find_movies_by_tmdb_ids([346698, 1, 346698])
+
+    assert found[346698].title == "Barbie"
+    assert found[1] is None
+    assert sorted(calls) == ["1", "346698"]
+
+
+def test_large_sets_and_warm_cache_use_the_library():
+    calls = []
+    service = _service(calls)
+    found = service.find_movies_by_tmdb_ids([438631, 346698, 872585])
+    assert [m.id for m in found.values()] == [1, 2, 3]
+    assert calls == ["all"]
+
+    # A usable cached library answers without any request...
+    assert service.find_movies_by_tmdb_ids([438631])[438631].id == 1
+    assert calls == ["all"]
+    # ...unless fresh data is required
+    assert service.find_movies_by_tmdb_ids([438631], fresh=True)[438631].id == 1
+    assert calls == ["all", "438631"]
+    assert radarr_module.get_library_cache_stats()["tmdb_lookups"]["index"] >= 1
+
+
+def test_probed_movies_are_patched_into_the_cache():
+    calls = []
+    service = _service(calls)
+    service.get_library_index()
+    LIBRARY.append({"id": 4, "title": "Wonka", "tmdbId": 787699})
+    try:
+        service.find_movies_by_tmdb_ids([787699], fresh=True)
+    finally:
+        LIBRARY.pop()
+    assert service.find_movie_by_tmdb_id(787699).id == 4
+    assert calls == ["all", "787699"]
+
+
+def test_rematch_only_touches_unmatched_results():
+    matched = MatchResult(BoxOfficeMovie(rank=1, title="Dune", tmdb_id=1), object())
+    added = MatchResult(BoxOfficeMovie(rank=2, title="Wonka", tmdb_id=2))
+    no_id = MatchResult(BoxOfficeMovie(rank=3, title="Indie"))
+    results = [matched, added, no_id]
+
+    assert unmatched_tmdb_ids(results) == [2]
+    wonka = object()
+    rematched = rematch_unmatched(results, {2: wonka})
+    assert rematched[0] is matched and rematched[2] is no_id
+    assert rematched[1].radarr_movie is wonka
@@ -0,0 +1,171 @@
+"""Tests for the Radarr webhook receiver, replaying the bundled payloads."""
+
+import json
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.core import radarr as radarr_module
+from src.core.exceptions import RadarrConnectionError, RadarrNotFoundError
+from src.core.json_generator import WeeklyDataGenerator
+from src.core.models import MovieStatus
+from src.core.radarr import RadarrMovie
+
+FIXTURES = Path(__file__).parent.parent / "fixtures" / "webhooks"
+
+
+def _payload(name):
+    return json.loads((FIXTURES / f"{name}.json").read_text())
+
+
+class _FakeAsyncRadarr:
+    """Serves get_movie from a dict; missing IDs raise not found."""
+
+    def __init__(self, movies, error=None):
+        self.movies = movies
+        self.error = error
+
+    async def get_movie(self, movie_id):
+        if self.error:
+            raise self.error
+        if movie_id not in self.movies:
+            raise RadarrNotFoundError(f"Resource not found: /api/v3/movie/{movie_id}")
+        return self.movies[movie_id]
+
+
+def _movie(movie_id, title, tmdb_id, has_file=False):
+    return RadarrMovie(
+        id=movie_id,
+        title=title,
+        tmdbId=tmdb_id,
+        hasFile=has_file,
+        status=MovieStatus.RELEASED,
+        isAvailable=True,
+        qualityProfileId=1,
+    )
+
+
+@pytest.fixture
+def client(monkeypatch, tmp_path):
+    monkeypatch.setattr(radarr_module.settings, "radarr_webhook_secret", "")
+    monkeypatch.setattr(radarr_module.settings, "boxarr_data_directory", tmp_path)
+    radarr_module._library_cache.get(
+        lambda: [
+            _movie(1, "Dune: Part Two", 693134),
+            _movie(2, "Barbie", 346698, has_file=True),
+        ]
+    )
+
+    from src.api.app import create_app
+    from src.api.dependencies import get_async_radarr_service
+
+    app = create_app()
+    fake = _FakeAsyncRadarr(
+        {
+            1: _movie(1, "Dune: Part Two", 693134, has_file=True),
+            3: _movie(3, "Oppenheimer", 872585),
+        }
+    )
+    app.dependency_overrides[get_async_radarr_service] = lambda: fake
+    return TestClient(app), fake
+
+
+def test_replay_fixtures_update_library(client):
+    test_client, _ = client
+
+    for name in ("download", "movie_added", "movie_delete"):
+        response = test_client.post("/api/webhooks/radarr", json=_payload(name))
+        assert response.status_code == 200
+        assert response.json()["library_updated"] is True
+
+    index = radarr_module._library_cache.index
+    assert index.get_by_id(1).hasFile is True
+    assert index.get_by_tmdb_id(872585).title == "Oppenheimer"
+    assert index.get_by_id(2) is None
+
+
+def test_test_event_is_acknowledged(client):
+    test_client, _ = client
+    response = test_client.post("/api/webhooks/radarr", json=_payload("test"))
+    assert response.status_code == 200
+    assert response.json() == {"success": True, "event": "Test", "handled": False}
+
+
+def test_falls_back_to_payload_when_radarr_unreachable(client):
+    test_client, fake = client
+    fake.error = RadarrConnectionError("Cannot connect to Radarr")
+
+    response = test_client.post(
+        "/api/webhooks/radarr", json=_payload("movie_file_delete")
+    )
+    assert response.status_code == 200
+    movie = radarr_module._library_cache.index.get_by_id(1)
+    assert movie.hasFile is False
+    assert movie.qualityProfileId == 1  # kept from the cached record
+
+
+def test_secret_is_enforced(client, monkeypatch):
+    test_client, _ = client
+    monkeypatch.setattr(radarr_module.settings, "radarr_webhook_secret", "s3cret")
+
+    assert (
+        test_client.post("/api/webhooks/radarr", json=_payload("test")).status_code
+        == 401
+    )
+    response = test_client.post(
+        "/api/webhooks/radarr?token=s3cret", json=_payload("test")
+    )
+    assert response.status_code == 200
+
+
+def test_week_statuses_are_patched(client, tmp_path):
+    test_client, _ = client
+    weeks = tmp_path / "weekly_pages"
+    weeks.mkdir()
+    (weeks / "2024W10.json").write_text(
+        json.dumps(
+            {
+                "year": 2024,
+                "week": 10,
+                "matched_movies": 1,
+                "movies": [
+                    {
+                        "rank": 1,
+                        "title": "Dune: Part Two",
+                        "tmdb_id": 693134,
+                        "radarr_id": 1,
+                        "status": "Missing",
+                        "has_file": False,
+                    },
+                    {
+                        "rank": 2,
+                        "title": "Barbie",
+                        "tmdb_id": 346698,
+                        "radarr_id": 2,
+                        "status": "Downloaded",
+                        "has_file": True,
+                    },
+                ],
+            }
+        )
+    )
+
+    test_client.post("/api/webhooks/radarr", json=_payload("download"))
+    test_client.post("/api/webhooks/radarr", json=_payload("movie_delete"))
+
+    week = json.loads((weeks / "2024W10.json").read_text())
+    dune, barbie = week["movies"]
+    assert dune["status"] == "Downloaded" and dune["has_file"] is True
+    assert barbie["status"] == "Not in Radarr" and barbie["radarr_id"] is None
+    assert week["matched_movies"] == 1
+
+
+def test_apply_movie_update_ignores_unrelated_weeks(tmp_path, monkeypatch):
+    monkeypatch.setattr(radarr_module.settings, "boxarr_data_directory", tmp_path)
+    generator = WeeklyDataGenerator()
+    week = generator.output_dir / "2024W11.json"
+    week.write_text(json.dumps({"movies": [{"tmdb_id": 1, "radarr_id": 5}]}))
+
+    assert generator.apply_movie_update(999, None) == []
+    assert json.loads(week.read_text())["movies"][0]["radarr_id"] == 5